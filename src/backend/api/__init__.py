@@ -26,6 +26,11 @@ from .health_check import (
     get_health_status,  # Simple health status response for quick checks
     check_system_health  # Comprehensive health check of all system components
 )
+from .preload import (
+    preload_shared_state,  # Preload latest forecasts and model registry before forking
+    get_shared_state_info  # Summary of preloaded shared state
+)
+from .server import PreforkServer  # Pre-fork multi-worker WSGI server for production serving
 from .exceptions import (
     APIError,  # Base exception for API-related errors
     RequestValidationError,  # Exception for request validation failures
@@ -56,6 +61,9 @@ __all__ = [
     "SystemHealthCheck",
     "get_health_status",
     "check_system_health",
+    "preload_shared_state",
+    "get_shared_state_info",
+    "PreforkServer",
     "APIError",
     "RequestValidationError",
     "ResourceNotFoundError",
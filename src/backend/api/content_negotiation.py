@@ -0,0 +1,161 @@
+"""
+Content negotiation for forecast responses.
+
+Selects the response format from the format query parameter or, when it is absent, the
+Accept header (application/vnd.apache.arrow.stream selects the binary Arrow IPC format),
+builds the Flask response with the format's MIME type, and compresses response bodies with
+zstd or gzip according to Accept-Encoding. zstd is only offered when the optional zstandard
+package is installed. Streamed responses (batch and export endpoints) are left uncompressed
+so they are not buffered.
+"""
+
+import gzip
+from typing import Any, List, Optional
+
+from flask import Response, jsonify, request
+
+try:
+    import zstandard  # version 0.21.0+
+except ImportError:
+    zstandard = None
+
+# Internal imports
+from ..utils.logging_utils import get_logger
+from ..config.settings import (
+    RESPONSE_COMPRESSION_MIN_BYTES,
+    RESPONSE_GZIP_LEVEL,
+    RESPONSE_ZSTD_LEVEL
+)
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# MIME type of the Arrow IPC streaming format
+ARROW_STREAM_MIME_TYPE = "application/vnd.apache.arrow.stream"
+
+# MIME types of the binary and text response formats (json responses go through jsonify)
+FORMAT_MIME_TYPES = {
+    "arrow": ARROW_STREAM_MIME_TYPE,
+    "parquet": "application/vnd.apache.parquet",
+    "excel": "application/vnd.ms-excel",
+    "csv": "text/csv"
+}
+
+# Content coding of uncompressed responses
+IDENTITY_ENCODING = "identity"
+
+
+def get_supported_encodings() -> List[str]:
+    """
+    Returns the content codings this server can produce, most preferred first.
+    """
+    if zstandard is not None:
+        return ["zstd", "gzip"]
+    return ["gzip"]
+
+
+def negotiate_format(default: str = "json") -> str:
+    """
+    Selects the response format for the current request.
+
+    An explicit format query parameter wins; otherwise the Arrow format is chosen when the
+    client explicitly lists application/vnd.apache.arrow.stream with at least the quality
+    of JSON.
+
+    Args:
+        default: Format used when the request expresses no preference
+
+    Returns:
+        Format name
+    """
+    format = request.args.get("format")
+    if format:
+        return format
+
+    # Wildcards (e.g. browsers and curl sending */*) keep the default format
+    accept = request.accept_mimetypes
+    arrow_listed = any(value == ARROW_STREAM_MIME_TYPE for value in accept.values())
+    if arrow_listed and accept[ARROW_STREAM_MIME_TYPE] >= accept["application/json"]:
+        return "arrow"
+    return default
+
+
+def negotiate_encoding() -> str:
+    """
+    Selects the content coding for the current request from its Accept-Encoding header.
+
+    Returns:
+        "zstd", "gzip" or "identity"
+    """
+    accept_encodings = request.accept_encodings
+    best_encoding, best_quality = IDENTITY_ENCODING, 0
+    for encoding in get_supported_encodings():
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
+
+
+def compress_body(data: bytes, encoding: str) -> bytes:
+    """
+    Compresses a response body with a content coding.
+
+    Args:
+        data: Uncompressed body
+        encoding: "zstd" or "gzip"
+
+    Returns:
+        Compressed body
+    """
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=RESPONSE_ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=RESPONSE_GZIP_LEVEL)
+
+
+def make_forecast_response(payload: Any, format: str) -> Response:
+    """
+    Builds the response for formatted forecast data.
+
+    Args:
+        payload: Output of format_forecast_response (records for json, str or bytes otherwise)
+        format: Response format
+
+    Returns:
+        Flask response with the format's MIME type
+    """
+    if format == "json" or format not in FORMAT_MIME_TYPES:
+        return jsonify(payload)
+    return Response(payload, mimetype=FORMAT_MIME_TYPES[format])
+
+
+def compress_response(response: Response, encoding: Optional[str] = None) -> Response:
+    """
+    Compresses a complete response body according to the request's Accept-Encoding.
+
+    Streamed, already encoded, non-200 and small responses are returned unchanged.
+
+    Args:
+        response: Response to compress
+        encoding: Content coding to use, or None to negotiate it from the request
+
+    Returns:
+        The (possibly compressed) response
+    """
+    if response.status_code != 200 or response.is_streamed or response.direct_passthrough:
+        return response
+    if "Content-Encoding" in response.headers:
+        return response
+
+    encoding = encoding or negotiate_encoding()
+    if encoding == IDENTITY_ENCODING:
+        return response
+
+    data = response.get_data()
+    if len(data) < RESPONSE_COMPRESSION_MIN_BYTES:
+        return response
+
+    response.set_data(compress_body(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    logger.debug(f"Compressed response with {encoding}: {len(data)} -> {response.content_length} bytes")
+    return response
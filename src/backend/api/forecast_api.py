@@ -6,8 +6,11 @@ endpoints defined in routes.py.
 """
 
 import datetime
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, Iterator, Tuple
+import numpy as np
 import pandas as pd
+import pyarrow as pa  # version 12.0.0
+import pyarrow.ipc  # noqa: F401
 import io
 import json
 
@@ -16,6 +19,9 @@ from ..storage.storage_manager import (
     get_forecast,
     get_latest_forecast,
     get_forecasts_for_period,
+    get_forecast_batch_index_entries,
+    load_indexed_forecast,
+    get_indexed_forecast_columns,
     get_storage_info
 )
 from ..storage.exceptions import DataFrameNotFoundError
@@ -26,6 +32,8 @@ from ..models.forecast_models import (
 from ..utils.date_utils import parse_timestamp, format_timestamp
 from ..utils.logging_utils import get_logger, log_execution_time
 from ..config.settings import FORECAST_PRODUCTS
+from ..models.data_models import get_sample_columns
+from .preload import get_preloaded_latest_forecast
 from .exceptions import (
     ForecastRetrievalError,
     RequestValidationError,
@@ -37,7 +45,17 @@ from .exceptions import (
 logger = get_logger(__name__)
 
 # Define supported output formats
-SUPPORTED_FORMATS = ['json', 'csv', 'excel', 'parquet']
+SUPPORTED_FORMATS = ['json', 'csv', 'excel', 'parquet', 'arrow']
+
+# Column projections supported by the batch endpoint: point forecasts only, quantiles
+# computed from the samples, or the full sample columns
+BATCH_PROJECTIONS = ['point', 'quantiles', 'samples']
+
+# Quantiles returned by the quantiles projection when none are requested
+DEFAULT_BATCH_QUANTILES = [0.1, 0.5, 0.9]
+
+# Columns returned for every batch projection
+BATCH_BASE_COLUMNS = ['timestamp', 'product', 'point_forecast', 'generation_timestamp', 'is_fallback']
 
 
 @log_execution_time
@@ -48,7 +66,7 @@ def get_forecast_by_date(date_str: str, product: str, format: str = 'json') -> U
     Args:
         date_str: Date string in ISO format (YYYY-MM-DD)
         product: Price product identifier (e.g., DALMP, RTLMP)
-        format: Output format (json, csv, excel, parquet)
+        format: Output format (json, csv, excel, parquet, arrow)
         
     Returns:
         Forecast data in the requested format
@@ -95,7 +113,7 @@ def get_latest_forecast(product: str, format: str = 'json') -> Union[pd.DataFram
     
     Args:
         product: Price product identifier (e.g., DALMP, RTLMP)
-        format: Output format (json, csv, excel, parquet)
+        format: Output format (json, csv, excel, parquet, arrow)
         
     Returns:
         Latest forecast data in the requested format
@@ -110,8 +128,11 @@ def get_latest_forecast(product: str, format: str = 'json') -> Union[pd.DataFram
     validate_format(format)
     
     try:
-        # Get the latest forecast from storage
-        df = get_latest_forecast(product)
+        # Use the forecast preloaded before the workers forked while it is current,
+        # otherwise read the latest forecast from storage
+        df = get_preloaded_latest_forecast(product)
+        if df is None:
+            df = get_latest_forecast(product)
         
         logger.info(f"Retrieved latest forecast for {product}")
         
@@ -146,7 +167,7 @@ def get_forecasts_by_date_range(
         start_date_str: Start date string in ISO format (YYYY-MM-DD)
         end_date_str: End date string in ISO format (YYYY-MM-DD)
         product: Price product identifier (e.g., DALMP, RTLMP)
-        format: Output format (json, csv, excel, parquet)
+        format: Output format (json, csv, excel, parquet, arrow)
         
     Returns:
         Forecast data for the date range in the requested format
@@ -217,6 +238,83 @@ def get_forecasts_by_date_range(
         )
 
 
+def get_forecast_export_frames(start_date_str: str, end_date_str: str, product: str) -> Iterator[pd.DataFrame]:
+    """
+    Retrieves the forecasts within a date range for a streaming export, one forecast at a time.
+    
+    Unlike get_forecasts_by_date_range, forecasts are not combined into one dataframe: the
+    request is validated and the index queried up front, and each stored forecast is only
+    loaded when the returned iterator reaches it. Forecasts may have been generated with
+    different sample counts, so the sample columns of every forecast are read from the file
+    schemas up front and each forecast is given the union of them (missing samples are
+    empty), so the export has one schema from its first row.
+    
+    Args:
+        start_date_str: Start date string in ISO format (YYYY-MM-DD)
+        end_date_str: End date string in ISO format (YYYY-MM-DD)
+        product: Price product identifier (e.g., DALMP, RTLMP)
+        
+    Returns:
+        Iterator of forecast dataframes ordered by forecast date
+        
+    Raises:
+        RequestValidationError: If product or date range is invalid
+        ResourceNotFoundError: If no forecasts are found
+    """
+    # Validate inputs
+    validate_product(product)
+    
+    try:
+        start_date = parse_timestamp(start_date_str)
+        end_date = parse_timestamp(end_date_str)
+    except Exception as e:
+        raise RequestValidationError(
+            f"Invalid date range {start_date_str} to {end_date_str}: {str(e)}",
+            {"date_range": ["Dates must be in YYYY-MM-DD format"]}
+        )
+    
+    if end_date < start_date:
+        raise RequestValidationError(
+            f"End date {end_date_str} cannot be before start date {start_date_str}",
+            {"date_range": ["End date must be on or after start date"]}
+        )
+    
+    index_entries = get_forecast_batch_index_entries([product], [(start_date, end_date)])
+    if index_entries.empty:
+        raise ResourceNotFoundError(
+            f"No forecasts found for {product} between {start_date_str} and {end_date_str}",
+            "forecast",
+            f"{product}_{start_date_str}_to_{end_date_str}"
+        )
+    
+    logger.info(f"Exporting {len(index_entries)} forecasts for {product} between {start_date_str} and {end_date_str}")
+    
+    entries = index_entries.to_dict(orient='records')
+    sample_columns = set()
+    for entry in entries:
+        try:
+            sample_columns.update(get_sample_columns(get_indexed_forecast_columns(entry)))
+        except Exception as e:
+            # The forecast is skipped (and logged) when the iterator reaches it
+            logger.debug(f"Could not read columns of {product} forecast for {entry['timestamp']}: {str(e)}")
+    sample_columns = get_sample_columns(sample_columns)
+    
+    def load_frames() -> Iterator[pd.DataFrame]:
+        for entry in entries:
+            try:
+                df = load_indexed_forecast(entry)
+            except Exception as e:
+                logger.warning(f"Skipping {product} forecast for {entry['timestamp']} in export: {str(e)}")
+                continue
+            frame_samples = get_sample_columns(df.columns)
+            if frame_samples != sample_columns:
+                other_columns = [column for column in df.columns if column not in set(frame_samples)]
+                df = df.reindex(columns=other_columns + sample_columns)
+            yield df
+    
+    return load_frames()
+
+
 @log_execution_time
 def get_forecast_as_model(date_str: str, product: str) -> List[ProbabilisticForecast]:
     """
@@ -343,13 +441,218 @@ def get_forecast_ensemble(start_date_str: str, end_date_str: str, product: str)
         )
 
 
+def _parse_list_param(value: Union[str, List[Any], None]) -> List[Any]:
+    """
+    Normalizes a request parameter given as a comma-separated string or a list.
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def parse_batch_request(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validates and normalizes the parameters of a batch forecast request.
+    
+    Parameters may be given as lists (JSON body) or comma-separated strings (query string):
+    products (default: all products), dates (YYYY-MM-DD), ranges (START/END pairs or objects
+    with start and end), projection (point, quantiles or samples), quantiles (between 0 and 1)
+    and hours (hours of day 0-23).
+    
+    Args:
+        params: Raw request parameters
+        
+    Returns:
+        Dictionary with products, date_ranges, projection, quantiles and hours
+        
+    Raises:
+        RequestValidationError: If any parameter is invalid
+    """
+    products = _parse_list_param(params.get('products')) or list(FORECAST_PRODUCTS)
+    for product in products:
+        validate_product(product)
+    # Preserve the requested order while dropping repeated products
+    products = list(dict.fromkeys(products))
+    
+    date_ranges = []
+    try:
+        for date_str in _parse_list_param(params.get('dates')):
+            day = parse_timestamp(str(date_str)).replace(hour=0, minute=0, second=0, microsecond=0)
+            date_ranges.append((day, day + datetime.timedelta(days=1) - datetime.timedelta(microseconds=1)))
+        
+        for date_range in _parse_list_param(params.get('ranges')):
+            if isinstance(date_range, dict):
+                start_str, end_str = date_range.get('start'), date_range.get('end')
+            elif isinstance(date_range, str):
+                start_str, _, end_str = date_range.partition('/')
+            else:
+                start_str, end_str = date_range
+            start = parse_timestamp(str(start_str)).replace(hour=0, minute=0, second=0, microsecond=0)
+            end = parse_timestamp(str(end_str)).replace(hour=0, minute=0, second=0, microsecond=0)
+            if end < start:
+                raise RequestValidationError(
+                    f"End date {end_str} cannot be before start date {start_str}",
+                    {"ranges": ["End date must be on or after start date"]}
+                )
+            date_ranges.append((start, end + datetime.timedelta(days=1) - datetime.timedelta(microseconds=1)))
+    except RequestValidationError:
+        raise
+    except Exception as e:
+        raise RequestValidationError(
+            f"Invalid dates or ranges: {str(e)}",
+            {"dates": ["Dates must be YYYY-MM-DD and ranges START/END"]}
+        )
+    
+    if not date_ranges:
+        raise RequestValidationError(
+            "At least one date or range is required",
+            {"dates": ["Provide dates and/or ranges"]}
+        )
+    
+    projection = params.get('projection') or 'point'
+    if projection not in BATCH_PROJECTIONS:
+        raise RequestValidationError(
+            f"Invalid projection: {projection}",
+            {"projection": [f"Must be one of {BATCH_PROJECTIONS}"]}
+        )
+    
+    try:
+        quantiles = [float(q) for q in _parse_list_param(params.get('quantiles'))] or list(DEFAULT_BATCH_QUANTILES)
+        hours = sorted({int(hour) for hour in _parse_list_param(params.get('hours'))})
+    except (TypeError, ValueError) as e:
+        raise RequestValidationError(
+            f"Invalid quantiles or hours: {str(e)}",
+            {"quantiles": ["Must be numbers"], "hours": ["Must be integers"]}
+        )
+    
+    if any(not 0 <= q <= 1 for q in quantiles):
+        raise RequestValidationError(
+            f"Invalid quantiles: {quantiles}",
+            {"quantiles": ["Must be between 0 and 1"]}
+        )
+    if any(not 0 <= hour <= 23 for hour in hours):
+        raise RequestValidationError(
+            f"Invalid hours: {hours}",
+            {"hours": ["Must be between 0 and 23"]}
+        )
+    
+    return {
+        'products': products,
+        'date_ranges': date_ranges,
+        'projection': projection,
+        'quantiles': quantiles,
+        'hours': hours or None
+    }
+
+
+def project_forecast_columns(
+    df: pd.DataFrame,
+    projection: str,
+    quantiles: Optional[List[float]] = None,
+    hours: Optional[List[int]] = None
+) -> pd.DataFrame:
+    """
+    Applies a batch column projection and hour filter to a forecast dataframe.
+    
+    Args:
+        df: Forecast dataframe
+        projection: One of BATCH_PROJECTIONS
+        quantiles: Quantiles (0-1) computed from the samples for the quantiles projection
+        hours: Optional hours of day to keep
+        
+    Returns:
+        Projected forecast dataframe
+    """
+    if hours:
+        df = df[pd.to_datetime(df['timestamp']).dt.hour.isin(hours)]
+    
+    base_columns = [column for column in BATCH_BASE_COLUMNS if column in df.columns]
+    
+    if projection == 'samples':
+        return df[base_columns + get_sample_columns(df.columns)].reset_index(drop=True)
+    
+    projected = df[base_columns].reset_index(drop=True)
+    
+    if projection == 'quantiles':
+        sample_columns = get_sample_columns(df.columns)
+        quantiles = quantiles or DEFAULT_BATCH_QUANTILES
+        if sample_columns and not df.empty:
+            values = np.quantile(df[sample_columns].to_numpy(dtype=float), quantiles, axis=1)
+        else:
+            values = np.full((len(quantiles), len(df)), np.nan)
+        for quantile, column_values in zip(quantiles, values):
+            projected[f"quantile_{quantile:g}"] = column_values
+    
+    return projected
+
+
+def get_forecast_batch(
+    products: List[str],
+    date_ranges: List[Tuple[datetime.datetime, datetime.datetime]],
+    projection: str = 'point',
+    quantiles: Optional[List[float]] = None,
+    hours: Optional[List[int]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Retrieves forecasts for several products and dates, one forecast at a time.
+    
+    The index is queried once for all products and ranges, and forecasts are loaded lazily
+    so callers can stream each one as it is read. The point projection only reads the point
+    forecast columns from disk. A forecast that cannot be loaded yields an error entry
+    instead of failing the whole batch.
+    
+    Args:
+        products: Validated product identifiers
+        date_ranges: List of inclusive (start, end) datetime ranges
+        projection: One of BATCH_PROJECTIONS
+        quantiles: Quantiles (0-1) for the quantiles projection
+        hours: Optional hours of day to keep
+        
+    Yields:
+        Dictionary with product, date, generation_timestamp, is_fallback and forecasts
+        records, or product, date and error
+    """
+    try:
+        index_entries = get_forecast_batch_index_entries(products, date_ranges)
+    except Exception as e:
+        logger.error(f"Error querying forecast index for batch request: {str(e)}")
+        raise ForecastRetrievalError(f"Failed to query forecast index: {str(e)}", ','.join(products))
+    
+    logger.info(f"Batch request matched {len(index_entries)} forecasts for {len(products)} products")
+    
+    columns = BATCH_BASE_COLUMNS if projection == 'point' else None
+    
+    for entry in index_entries.to_dict(orient='records'):
+        result = {
+            'product': entry['product'],
+            'date': format_timestamp(entry['timestamp'], '%Y-%m-%d')
+        }
+        try:
+            df = load_indexed_forecast(entry, columns)
+            df = project_forecast_columns(df, projection, quantiles, hours)
+        except Exception as e:
+            logger.warning(f"Failed to load {entry['product']} forecast for {entry['timestamp']} in batch: {str(e)}")
+            result['error'] = str(e)
+            yield result
+            continue
+        
+        result['generation_timestamp'] = entry['generation_timestamp']
+        result['is_fallback'] = bool(entry['is_fallback'])
+        result['forecasts'] = df.to_dict(orient='records')
+        yield result
+
+
 def format_forecast_response(df: pd.DataFrame, format: str) -> Union[dict, bytes, str]:
     """
     Formats forecast data in the requested format.
     
     Args:
         df: DataFrame containing forecast data
-        format: Output format (json, csv, excel, parquet)
+        format: Output format (json, csv, excel, parquet, arrow)
         
     Returns:
         Formatted forecast data
@@ -386,6 +689,14 @@ def format_forecast_response(df: pd.DataFrame, format: str) -> Union[dict, bytes
             parquet_buffer.seek(0)
             return parquet_buffer.getvalue()
         
+        elif format == 'arrow':
+            # Convert to an Arrow IPC stream, which clients read without parsing row records
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return sink.getvalue().to_pybytes()
+        
         else:
             # This should not happen due to validate_format, but included for robustness
             raise InvalidFormatError(
@@ -486,7 +797,7 @@ class ForecastAPI:
         Args:
             date_str: Date string in ISO format (YYYY-MM-DD)
             product: Price product identifier (e.g., DALMP, RTLMP)
-            format: Output format (json, csv, excel, parquet)
+            format: Output format (json, csv, excel, parquet, arrow)
             
         Returns:
             Forecast data in the requested format
@@ -499,7 +810,7 @@ class ForecastAPI:
         
         Args:
             product: Price product identifier (e.g., DALMP, RTLMP)
-            format: Output format (json, csv, excel, parquet)
+            format: Output format (json, csv, excel, parquet, arrow)
             
         Returns:
             Latest forecast data in the requested format
@@ -514,13 +825,25 @@ class ForecastAPI:
             start_date_str: Start date string in ISO format (YYYY-MM-DD)
             end_date_str: End date string in ISO format (YYYY-MM-DD)
             product: Price product identifier (e.g., DALMP, RTLMP)
-            format: Output format (json, csv, excel, parquet)
+            format: Output format (json, csv, excel, parquet, arrow)
             
         Returns:
             Forecast data for the date range in the requested format
         """
         return get_forecasts_by_date_range(start_date_str, end_date_str, product, format)
     
+    def get_forecast_batch(self, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Retrieves forecasts for several products and dates from a single index query.
+    
+        Args:
+            params: Raw batch request parameters (see parse_batch_request)
+    
+        Returns:
+            Iterator over per-forecast results
+        """
+        return get_forecast_batch(**parse_batch_request(params))
+    
     def get_forecast_as_model(self, date_str: str, product: str) -> List[ProbabilisticForecast]:
         """
         Retrieves a forecast as ProbabilisticForecast objects.
@@ -566,7 +889,7 @@ class ForecastAPI:
         
         Args:
             df: DataFrame containing forecast data
-            format: Output format (json, csv, excel, parquet)
+            format: Output format (json, csv, excel, parquet, arrow)
             
         Returns:
             Formatted forecast data
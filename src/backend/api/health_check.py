@@ -1,3 +1,4 @@
+import threading
 import typing
 from datetime import datetime
 
@@ -10,14 +11,29 @@ from ..utils.logging_utils import get_logger  # Path: src/backend/utils/logging_
 from ..utils.decorators import log_execution_time  # Path: src/backend/utils/decorators.py
 from ..storage.storage_manager import StorageManager  # Path: src/backend/storage/storage_manager.py
 from ..pipeline.pipeline_executor import PipelineExecutor  # Path: src/backend/pipeline/pipeline_executor.py
-from ..config.settings import FORECAST_PRODUCTS, DATA_SOURCES  # Path: src/backend/config/settings.py
+from ..scheduler.job_registry import get_recent_jobs, ACTIVE_JOB_STATUSES, JOB_STATUS_COMPLETED, JOB_TYPE_FORECAST  # Path: src/backend/scheduler/job_registry.py
+from ..config.settings import FORECAST_PRODUCTS, DATA_SOURCES, HEALTH_CHECK_CACHE_TTL_SECONDS, HEALTH_CHECK_REFRESH_INTERVAL_SECONDS  # Path: src/backend/config/settings.py
+from ..config.settings import PIPELINE_HEALTH_RECENT_RUNS, PIPELINE_HEALTH_MAX_CONSECUTIVE_FAILURES  # Path: src/backend/config/settings.py
 from .exceptions import APIError  # Path: src/backend/api/exceptions.py
 
 # Initialize logger
 logger = get_logger(__name__)
 
-# Initialize storage manager
-storage_manager = StorageManager()
+# Storage manager, created on first health check rather than at import time
+_storage_manager = None
+
+
+def get_storage_manager() -> StorageManager:
+    """
+    Returns the shared storage manager used by health checks, creating it on first use
+    
+    Returns:
+        StorageManager: Shared storage manager instance
+    """
+    global _storage_manager
+    if _storage_manager is None:
+        _storage_manager = StorageManager()
+    return _storage_manager
 
 
 def get_health_status() -> dict:
@@ -96,6 +112,7 @@ def check_storage_health() -> dict:
     """
     # Initialize storage health status
     storage_health = {"status": "healthy", "details": {}}
+    storage_manager = get_storage_manager()
     
     # Get storage information using storage_manager.get_storage_info()
     try:
@@ -177,24 +194,85 @@ def check_pipeline_health() -> dict:
         pipeline_health["details"]["components_available"] = False
         pipeline_health["details"]["components_error"] = str(e)
     
+    # Check the recent forecast runs recorded in the job registry
+    try:
+        recent_runs = get_recent_jobs(limit=PIPELINE_HEALTH_RECENT_RUNS, job_type=JOB_TYPE_FORECAST)
+        pipeline_health["details"]["recent_runs"] = [summarize_job_run(job) for job in recent_runs]
+        
+        # Count the finished runs that failed (or timed out or were interrupted) since the last success
+        consecutive_failures = 0
+        for job in recent_runs:
+            if job["status"] == JOB_STATUS_COMPLETED:
+                break
+            if job["status"] not in ACTIVE_JOB_STATUSES:
+                consecutive_failures += 1
+        pipeline_health["details"]["consecutive_failures"] = consecutive_failures
+        
+        last_success = get_recent_jobs(limit=1, job_type=JOB_TYPE_FORECAST, status=JOB_STATUS_COMPLETED)
+        pipeline_health["details"]["last_successful_run"] = summarize_job_run(last_success[0]) if last_success else None
+        
+        if consecutive_failures >= PIPELINE_HEALTH_MAX_CONSECUTIVE_FAILURES:
+            pipeline_health["status"] = "unhealthy"
+            pipeline_health["details"]["runs_error"] = f"The last {consecutive_failures} forecast runs did not complete"
+    except Exception as e:
+        pipeline_health["status"] = "unhealthy"
+        pipeline_health["details"]["runs_error"] = str(e)
+    
     # Return pipeline health status with details
     return pipeline_health
 
 
+def summarize_job_run(job: dict) -> dict:
+    """
+    Summarizes a job registry entry for health responses
+    
+    Args:
+        job (dict): Job details from the job registry
+    
+    Returns:
+        dict: Job ID, status, times (ISO format), queue wait and error of the run
+    """
+    def isoformat(value):
+        return value.isoformat() if value is not None else None
+    
+    status_details = job.get("status_details") or {}
+    return {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "schedule_time": isoformat(job.get("schedule_time")),
+        "creation_time": isoformat(job.get("creation_time")),
+        "status_update_time": isoformat(job.get("status_update_time")),
+        "wait_seconds": job.get("wait_seconds"),
+        "error": status_details.get("error") if isinstance(status_details, dict) else None
+    }
+
+
 class SystemHealthCheck:
     """
     Class that provides comprehensive health check functionality
     """
     
-    def __init__(self):
+    def __init__(self, cache_ttl_seconds: int = HEALTH_CHECK_CACHE_TTL_SECONDS):
         """
         Initializes the health check system
+        
+        Args:
+            cache_ttl_seconds (int): Maximum age of a cached comprehensive check
         """
         # Initialize last_check_result as None
         self.last_check_result = None
         
         # Initialize last_check_time as None
         self.last_check_time = None
+        
+        self.cache_ttl_seconds = cache_ttl_seconds
+        
+        # Serializes recomputation so concurrent requests do not all run the expensive checks
+        self._check_lock = threading.Lock()
+        
+        # Background refresh thread state
+        self._refresh_thread = None
+        self._refresh_stop_event = threading.Event()
     
     def check_all(self) -> dict:
         """
@@ -234,6 +312,31 @@ class SystemHealthCheck:
         # Return comprehensive health status dictionary
         return self.last_check_result
     
+    def get_cached_result(self, max_age_seconds: typing.Optional[int] = None) -> dict:
+        """
+        Returns the last comprehensive health check if it is recent enough, otherwise performs a new one
+        
+        Args:
+            max_age_seconds (int, optional): Maximum acceptable age, defaults to cache_ttl_seconds
+        
+        Returns:
+            dict: Comprehensive health status
+        """
+        max_age = self.cache_ttl_seconds if max_age_seconds is None else max_age_seconds
+        
+        if self._is_fresh(max_age):
+            return self.last_check_result
+        
+        with self._check_lock:
+            # Another request may have refreshed the result while we waited for the lock
+            if self._is_fresh(max_age):
+                return self.last_check_result
+            
+            result = self.check_all()
+            self.last_check_result = result
+            self.last_check_time = datetime.now()
+            return result
+    
     def get_simple_status(self) -> dict:
         """
         Returns a simple health status response
@@ -241,16 +344,64 @@ class SystemHealthCheck:
         Returns:
             dict: Simple health status
         """
-        # If last_check_result exists and is recent (within 5 minutes):
-        if self.last_check_result and (datetime.now() - self.last_check_time).total_seconds() < 300:
-            # Return simplified status based on last check
-            return {"status": self.last_check_result["overall_status"], "timestamp": self.last_check_time.isoformat()}
-        else:
-            # Perform a new check using check_all()
-            self.check_all()
-            
-            # Return simplified status based on new check
-            return {"status": self.last_check_result["overall_status"], "timestamp": self.last_check_time.isoformat()}
+        result = self.get_cached_result()
+        return {"status": result["overall_status"], "timestamp": self.last_check_time.isoformat()}
+    
+    def start_background_refresh(self, interval_seconds: int = HEALTH_CHECK_REFRESH_INTERVAL_SECONDS) -> None:
+        """
+        Starts a daemon thread that periodically refreshes the cached health check
+        
+        Args:
+            interval_seconds (int): Seconds between refreshes
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        
+        self._refresh_stop_event.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(interval_seconds,),
+            name="health-check-refresh",
+            daemon=True
+        )
+        self._refresh_thread.start()
+        logger.info(f"Started background health check refresh every {interval_seconds}s")
+    
+    def stop_background_refresh(self) -> None:
+        """
+        Stops the background refresh thread if it is running
+        """
+        self._refresh_stop_event.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5)
+            self._refresh_thread = None
+    
+    def _refresh_loop(self, interval_seconds: int) -> None:
+        """
+        Refreshes the cached health check until stopped
+        
+        Args:
+            interval_seconds (int): Seconds between refreshes
+        """
+        while not self._refresh_stop_event.wait(interval_seconds):
+            try:
+                self.get_cached_result(max_age_seconds=0)
+            except Exception as e:
+                logger.warning(f"Background health check refresh failed: {str(e)}")
+    
+    def _is_fresh(self, max_age_seconds: int) -> bool:
+        """
+        Checks whether the cached result is younger than max_age_seconds
+        
+        Args:
+            max_age_seconds (int): Maximum acceptable age
+        
+        Returns:
+            bool: True if a cached result exists and is recent enough
+        """
+        if not self.last_check_result or self.last_check_time is None:
+            return False
+        return (datetime.now() - self.last_check_time).total_seconds() < max_age_seconds
     
     def check_component(self, component_name: str) -> dict:
         """
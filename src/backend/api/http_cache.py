@@ -0,0 +1,185 @@
+"""
+HTTP caching support for forecast endpoints.
+
+Forecast responses are validated with strong ETags derived from the storage index entry
+(file path + generation timestamp) and a Last-Modified date taken from the generation
+timestamp, so conditional GETs can be answered with 304 Not Modified from the index alone,
+without loading or reserializing the forecast dataframe. Cache-Control lets clients and the
+nginx reverse proxy reuse responses for FORECAST_CACHE_MAX_AGE_SECONDS before revalidating.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+from flask import Response, make_response, request
+
+# Internal imports
+from ..storage.storage_manager import get_forecast_index_entry, get_latest_forecast_index_entry
+from ..utils.date_utils import parse_timestamp
+from ..utils.logging_utils import get_logger
+from ..config.settings import FORECAST_CACHE_MAX_AGE_SECONDS, TIMEZONE
+from .content_negotiation import negotiate_encoding
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Request headers that select a different representation of the same forecast
+VARY_HEADERS = "Accept, Accept-Encoding"
+
+
+def compute_etag(entry: Dict, variant: str = "") -> str:
+    """
+    Computes a strong ETag for a forecast index entry.
+
+    Args:
+        entry: Index entry with file_path and generation_timestamp
+        variant: Representation discriminator (e.g. response format), so different
+            representations of the same forecast get different strong ETags
+
+    Returns:
+        ETag value without surrounding quotes
+    """
+    generation_timestamp = pd.Timestamp(entry["generation_timestamp"]).isoformat()
+    key = f"{entry['file_path']}|{generation_timestamp}|{variant}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def get_last_modified(entry: Dict) -> datetime:
+    """
+    Returns the Last-Modified time of a forecast index entry as an aware UTC datetime.
+
+    Naive generation timestamps are interpreted in the system timezone. HTTP dates have
+    one-second resolution, so microseconds are dropped.
+
+    Args:
+        entry: Index entry with generation_timestamp
+
+    Returns:
+        Last-Modified datetime in UTC
+    """
+    timestamp = pd.Timestamp(entry["generation_timestamp"])
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize(TIMEZONE)
+    return timestamp.tz_convert(timezone.utc).to_pydatetime().replace(microsecond=0)
+
+
+def is_not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Evaluates the current request's conditional headers against a forecast's validators.
+
+    If-None-Match takes precedence over If-Modified-Since, as required by RFC 9110.
+
+    Args:
+        etag: Current ETag of the forecast
+        last_modified: Current Last-Modified of the forecast
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+
+    if request.if_modified_since is not None and last_modified is not None:
+        return last_modified <= request.if_modified_since
+
+    return False
+
+
+def add_cache_headers(
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime],
+    max_age: int = FORECAST_CACHE_MAX_AGE_SECONDS
+) -> Response:
+    """
+    Adds validator and Cache-Control headers to a response.
+
+    Args:
+        response: Response to annotate
+        etag: ETag value without quotes
+        last_modified: Last-Modified datetime, or None
+        max_age: Seconds clients and proxies may reuse the response without revalidating
+
+    Returns:
+        The annotated response
+    """
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
+    response.headers["Vary"] = VARY_HEADERS
+    return response
+
+
+def conditional_forecast_response(
+    entry: Optional[Dict],
+    variant: str,
+    build_response: Callable[[], object]
+) -> Response:
+    """
+    Answers a forecast request conditionally using the forecast's index entry.
+
+    Returns 304 Not Modified when the client's validators match, without calling
+    build_response. Otherwise builds the full response and adds caching headers to it.
+    Forecasts that are not indexed are served without validators.
+
+    Args:
+        entry: Index entry for the requested forecast, or None if unknown
+        variant: Representation discriminator for the ETag
+        build_response: Callable producing the full response (any Flask return value)
+
+    Returns:
+        Flask response
+    """
+    if entry is None:
+        return make_response(build_response())
+
+    # Compressed and uncompressed bodies are different representations
+    etag = compute_etag(entry, f"{variant}|{negotiate_encoding()}")
+    last_modified = get_last_modified(entry)
+
+    if is_not_modified(etag, last_modified):
+        logger.debug(f"Forecast not modified (ETag {etag}), returning 304")
+        return add_cache_headers(Response(status=304), etag, last_modified)
+
+    response = make_response(build_response())
+    if response.status_code != 200:
+        return response
+    return add_cache_headers(response, etag, last_modified)
+
+
+def get_forecast_cache_entry(date_str: str, product: str) -> Optional[Dict]:
+    """
+    Looks up the index entry used to validate a forecast-by-date response.
+
+    Args:
+        date_str: Date string in ISO format (YYYY-MM-DD)
+        product: Price product identifier
+
+    Returns:
+        Index entry, or None if the forecast is not indexed or the lookup fails
+    """
+    try:
+        return get_forecast_index_entry(parse_timestamp(date_str), product)
+    except Exception as e:
+        logger.debug(f"No cache validators for {product} on {date_str}: {str(e)}")
+        return None
+
+
+def get_latest_forecast_cache_entry(product: str) -> Optional[Dict]:
+    """
+    Looks up the index entry used to validate a latest-forecast response.
+
+    Args:
+        product: Price product identifier
+
+    Returns:
+        Index entry, or None if no forecast is indexed or the lookup fails
+    """
+    try:
+        return get_latest_forecast_index_entry(product)
+    except Exception as e:
+        logger.debug(f"No cache validators for latest {product}: {str(e)}")
+        return None
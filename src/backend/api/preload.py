@@ -0,0 +1,127 @@
+"""
+Preloads shared read-mostly state for the API server before worker processes are forked.
+
+Loading the latest forecast for each product and the model registry in the parent process
+means every pre-forked worker starts with them already in memory, shared copy-on-write,
+instead of each worker paying the load cost on its first requests.
+"""
+
+import os
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+import pandas as pd
+
+# Internal imports
+from ..storage.storage_manager import get_latest_forecast as get_stored_latest_forecast
+from ..storage.path_resolver import get_latest_file_path
+from ..forecasting_engine.model_registry import initialize_registry
+from ..config.settings import FORECAST_PRODUCTS
+from ..utils.logging_utils import get_logger, log_execution_time
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Process-wide preloaded state, inherited by forked workers
+_shared_state: Dict[str, Any] = {
+    "latest_forecasts": {},
+    "latest_mtimes": {},
+    "model_count": 0,
+    "preloaded_at": None
+}
+
+
+@log_execution_time
+def preload_shared_state() -> Dict[str, Any]:
+    """
+    Loads the latest forecasts and model registry into process memory.
+
+    Each part is loaded independently so that a missing forecast does not prevent the
+    server from starting.
+
+    Returns:
+        Dictionary summarizing what was preloaded
+    """
+    summary = {"latest_forecasts": [], "model_count": 0, "errors": {}}
+
+    for product in FORECAST_PRODUCTS:
+        try:
+            latest_path = get_latest_file_path(product)
+            df = get_stored_latest_forecast(product)
+            _shared_state["latest_forecasts"][product] = df
+            _shared_state["latest_mtimes"][product] = os.stat(latest_path).st_mtime_ns
+            summary["latest_forecasts"].append(product)
+        except Exception as e:
+            logger.warning(f"Failed to preload latest forecast for {product}: {str(e)}")
+            summary["errors"][product] = str(e)
+
+    try:
+        _shared_state["model_count"] = len(initialize_registry())
+        summary["model_count"] = _shared_state["model_count"]
+    except Exception as e:
+        logger.warning(f"Failed to preload model registry: {str(e)}")
+        summary["errors"]["model_registry"] = str(e)
+
+    _shared_state["preloaded_at"] = datetime.now()
+    logger.info(
+        f"Preloaded shared state: {len(summary['latest_forecasts'])} latest forecasts, "
+        f"{summary['model_count']} models"
+    )
+    return summary
+
+
+def get_preloaded_latest_forecast(product: str) -> Optional[pd.DataFrame]:
+    """
+    Returns the preloaded latest forecast for a product if it is still current.
+
+    The entry is considered current while the product's latest file has not been
+    rewritten since it was preloaded; a stale entry is dropped so callers fall back
+    to storage.
+
+    Args:
+        product: Price product identifier
+
+    Returns:
+        Preloaded forecast dataframe, or None if not preloaded or stale
+    """
+    df = _shared_state["latest_forecasts"].get(product)
+    if df is None:
+        return None
+
+    try:
+        current_mtime = os.stat(get_latest_file_path(product)).st_mtime_ns
+    except OSError:
+        current_mtime = None
+
+    if current_mtime != _shared_state["latest_mtimes"].get(product):
+        logger.info(f"Preloaded latest forecast for {product} is stale, dropping it")
+        _shared_state["latest_forecasts"].pop(product, None)
+        _shared_state["latest_mtimes"].pop(product, None)
+        return None
+
+    return df
+
+
+def get_shared_state_info() -> Dict[str, Any]:
+    """
+    Returns a summary of the preloaded shared state.
+
+    Returns:
+        Dictionary with preload time, preloaded products and model count
+    """
+    preloaded_at = _shared_state["preloaded_at"]
+    return {
+        "preloaded_at": preloaded_at.isoformat() if preloaded_at else None,
+        "latest_forecasts": sorted(_shared_state["latest_forecasts"]),
+        "model_count": _shared_state["model_count"]
+    }
+
+
+def clear_shared_state() -> None:
+    """
+    Drops all preloaded state.
+    """
+    _shared_state["latest_forecasts"] = {}
+    _shared_state["latest_mtimes"] = {}
+    _shared_state["model_count"] = 0
+    _shared_state["preloaded_at"] = None
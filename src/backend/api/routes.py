@@ -1,9 +1,12 @@
 # flask==2.3.0
-from flask import Blueprint, request, jsonify # package_version: 2.3.0
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context # package_version: 2.3.0
 
 # Internal imports
-from .forecast_api import get_forecast_by_date, get_latest_forecast, get_forecasts_by_date_range, get_forecast_as_model, get_latest_forecast_as_model, format_forecast_response, get_storage_status
+from .forecast_api import get_forecast_by_date, get_latest_forecast, get_forecasts_by_date_range, get_forecast_as_model, get_latest_forecast_as_model, format_forecast_response, get_storage_status, parse_batch_request, get_forecast_batch, get_forecast_export_frames
+from .streaming import STREAMING_FORMATS, stream_forecast_export
+from .content_negotiation import negotiate_format, make_forecast_response, compress_response
 from .health_check import SystemHealthCheck # Corrected import
+from .http_cache import conditional_forecast_response, get_forecast_cache_entry, get_latest_forecast_cache_entry
 from ..utils.logging_utils import get_logger
 from ..config.settings import FORECAST_PRODUCTS, API_VERSION
 
@@ -13,8 +16,24 @@ logger = get_logger(__name__)
 # Create a Flask Blueprint for the API
 api_blueprint = Blueprint('api', __name__)
 
-# Initialize health check
-health_check = SystemHealthCheck()
+# Compress complete response bodies according to Accept-Encoding (streamed responses are skipped)
+api_blueprint.after_request(compress_response)
+
+# Shared health check, created on first use so tests and workers get their own instance
+_health_check = None
+
+
+def get_health_check() -> SystemHealthCheck:
+    """
+    Returns the shared health check instance, creating it on first use
+    
+    Returns:
+        SystemHealthCheck: Shared health check instance
+    """
+    global _health_check
+    if _health_check is None:
+        _health_check = SystemHealthCheck()
+    return _health_check
 
 @api_blueprint.route('/', methods=['GET'])
 def index():
@@ -35,6 +54,8 @@ def index():
             "/forecasts/<date>/<product>",
             "/forecasts/latest/<product>",
             "/forecasts/range/<start_date>/<end_date>/<product>",
+            "/forecasts/batch",
+            "/forecasts/export/<start_date>/<end_date>/<product>",
             "/forecasts/model/<date>/<product>",
             "/forecasts/model/latest/<product>",
             "/products"
@@ -52,8 +73,8 @@ def health():
     Returns:
         dict: Health status with timestamp
     """
-    # Get simple health status from health_check.get_simple_status()
-    status = health_check.get_simple_status()
+    # Get simple health status from the cached health check
+    status = get_health_check().get_simple_status()
     
     # Return the status as a JSON response
     return jsonify(status)
@@ -66,8 +87,8 @@ def health_detailed():
     Returns:
         dict: Detailed health status of all components
     """
-    # Get detailed health status from health_check.check_all()
-    detailed_status = health_check.check_all()
+    # Get detailed health status from the cached health check (refreshed in the background)
+    detailed_status = get_health_check().get_cached_result()
     
     # Return the detailed status as a JSON response
     return jsonify(detailed_status)
@@ -85,7 +106,7 @@ def health_component(component):
     """
     # Get component health status from health_check.check_component(component)
     try:
-        component_status = health_check.check_component(component)
+        component_status = get_health_check().check_component(component)
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     
@@ -118,26 +139,30 @@ def get_forecast(date, product):
     Returns:
         flask.Response: Forecast data in requested format
     """
-    # Get format parameter from request args (default to 'json')
-    format = request.args.get('format', 'json')
+    # Get format from the format parameter or the Accept header (default to 'json')
+    format = negotiate_format()
     
     # Log the forecast request
     logger.info(f"Request received for forecast: date={date}, product={product}, format={format}")
     
-    # Get forecast data using get_forecast_by_date(date, product, format)
-    try:
-        forecast_data = get_forecast_by_date(date, product, format)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-    
-    # Format the response using format_forecast_response()
-    try:
-        response = format_forecast_response(forecast_data, format)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-    
-    # Return the formatted response
-    return jsonify(response)
+    def build_response():
+        # Get forecast data using get_forecast_by_date(date, product, format)
+        try:
+            forecast_data = get_forecast_by_date(date, product, format)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+        
+        # Format the response using format_forecast_response()
+        try:
+            response = format_forecast_response(forecast_data, format)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+        
+        # Return the formatted response with the format's MIME type
+        return make_forecast_response(response, format)
+    
+    # Answer with 304 when the client's ETag/Last-Modified still match the indexed forecast
+    return conditional_forecast_response(get_forecast_cache_entry(date, product), format, build_response)
 
 @api_blueprint.route('/forecasts/latest/<product>', methods=['GET'])
 def get_latest_forecast(product):
@@ -150,26 +175,30 @@ def get_latest_forecast(product):
     Returns:
         flask.Response: Latest forecast data in requested format
     """
-    # Get format parameter from request args (default to 'json')
-    format = request.args.get('format', 'json')
+    # Get format from the format parameter or the Accept header (default to 'json')
+    format = negotiate_format()
     
     # Log the latest forecast request
     logger.info(f"Request received for latest forecast: product={product}, format={format}")
     
-    # Get latest forecast data using get_latest_forecast(product, format)
-    try:
-        forecast_data = get_latest_forecast(product, format)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-    
-    # Format the response using format_forecast_response()
-    try:
-        response = format_forecast_response(forecast_data, format)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-    
-    # Return the formatted response
-    return jsonify(response)
+    def build_response():
+        # Get latest forecast data using get_latest_forecast(product, format)
+        try:
+            forecast_data = get_latest_forecast(product, format)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+        
+        # Format the response using format_forecast_response()
+        try:
+            response = format_forecast_response(forecast_data, format)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+        
+        # Return the formatted response with the format's MIME type
+        return make_forecast_response(response, format)
+    
+    # Answer with 304 when the client's ETag/Last-Modified still match the latest indexed forecast
+    return conditional_forecast_response(get_latest_forecast_cache_entry(product), format, build_response)
 
 @api_blueprint.route('/forecasts/range/<start_date>/<end_date>/<product>', methods=['GET'])
 def get_forecasts_range(start_date, end_date, product):
@@ -184,8 +213,8 @@ def get_forecasts_range(start_date, end_date, product):
     Returns:
         flask.Response: Forecast data for the date range in requested format
     """
-    # Get format parameter from request args (default to 'json')
-    format = request.args.get('format', 'json')
+    # Get format from the format parameter or the Accept header (default to 'json')
+    format = negotiate_format()
     
     # Log the forecast range request
     logger.info(f"Request received for forecast range: start_date={start_date}, end_date={end_date}, product={product}, format={format}")
@@ -202,8 +231,86 @@ def get_forecasts_range(start_date, end_date, product):
     except Exception as e:
         return jsonify({"error": str(e)}), 500
     
-    # Return the formatted response
-    return jsonify(response)
+    # Return the formatted response with the format's MIME type
+    return make_forecast_response(response, format)
+
+@api_blueprint.route('/forecasts/export/<start_date>/<end_date>/<product>', methods=['GET'])
+def export_forecasts_range(start_date, end_date, product):
+    """
+    Stream forecasts for a date range and product as a downloadable export
+    
+    Forecasts are loaded and serialized one at a time, so memory use does not grow with
+    the length of the range.
+    
+    Args:
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        product (str): Product identifier (e.g., DALMP)
+    
+    Returns:
+        flask.Response: Chunked export in the requested format (csv, ndjson, arrow, parquet)
+    """
+    # Get format parameter from request args (default to 'csv')
+    format = request.args.get('format', 'csv')
+    
+    # Log the export request
+    logger.info(f"Request received for forecast export: start_date={start_date}, end_date={end_date}, product={product}, format={format}")
+    
+    if format not in STREAMING_FORMATS:
+        return jsonify({"error": f"Unsupported export format: {format}. Must be one of {list(STREAMING_FORMATS)}"}), 400
+    
+    try:
+        frames = get_forecast_export_frames(start_date, end_date, product)
+    except Exception as e:
+        return jsonify({"error": str(e)}), getattr(e, 'status_code', 500)
+    
+    filename = f"forecast_{product}_{start_date}_to_{end_date}.{format}"
+    return Response(
+        stream_with_context(stream_forecast_export(frames, format)),
+        mimetype=STREAMING_FORMATS[format],
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+@api_blueprint.route('/forecasts/batch', methods=['GET', 'POST'])
+def get_forecasts_batch():
+    """
+    Get forecasts for several products and dates in a single streamed response
+    
+    Parameters are read from the JSON body (POST) or the query string (GET, comma-separated):
+    products, dates, ranges (START/END), projection (point, quantiles, samples), quantiles
+    and hours. All forecasts are located with a single index query.
+    
+    Returns:
+        flask.Response: Newline-delimited JSON, one line per product and forecast date
+    """
+    if request.method == 'POST':
+        params = request.get_json(silent=True) or {}
+    else:
+        params = request.args.to_dict()
+    
+    # Log the batch request
+    logger.info(f"Request received for forecast batch: {params}")
+    
+    # Validate all parameters before streaming so invalid requests get a proper status code
+    try:
+        batch_request = parse_batch_request(params)
+    except Exception as e:
+        return jsonify({"error": str(e)}), getattr(e, 'status_code', 400)
+    
+    try:
+        forecasts = get_forecast_batch(**batch_request)
+        first_forecast = next(forecasts, None)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    
+    def generate():
+        if first_forecast is None:
+            return
+        yield current_app.json.dumps(first_forecast) + "\n"
+        for forecast in forecasts:
+            yield current_app.json.dumps(forecast) + "\n"
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 @api_blueprint.route('/forecasts/model/<date>/<product>', methods=['GET'])
 def get_forecast_model(date, product):
@@ -220,17 +327,20 @@ def get_forecast_model(date, product):
     # Log the forecast model request
     logger.info(f"Request received for forecast model: date={date}, product={product}")
     
-    # Get forecast model data using get_forecast_as_model(date, product)
-    try:
-        forecast_models = get_forecast_as_model(date, product)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-    
-    # Convert model objects to dictionary for JSON serialization
-    forecast_list = [model.to_dict() for model in forecast_models]
-    
-    # Return the dictionary as a JSON response
-    return jsonify(forecast_list)
+    def build_response():
+        # Get forecast model data using get_forecast_as_model(date, product)
+        try:
+            forecast_models = get_forecast_as_model(date, product)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+        
+        # Convert model objects to dictionary for JSON serialization
+        forecast_list = [model.to_dict() for model in forecast_models]
+        
+        # Return the dictionary as a JSON response
+        return jsonify(forecast_list)
+    
+    return conditional_forecast_response(get_forecast_cache_entry(date, product), "model", build_response)
 
 @api_blueprint.route('/forecasts/model/latest/<product>', methods=['GET'])
 def get_latest_forecast_model(product):
@@ -246,17 +356,20 @@ def get_latest_forecast_model(product):
     # Log the latest forecast model request
     logger.info(f"Request received for latest forecast model: product={product}")
     
-    # Get latest forecast model data using get_latest_forecast_as_model(product)
-    try:
-        forecast_models = get_latest_forecast_as_model(product)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-    
-    # Convert model objects to dictionary for JSON serialization
-    forecast_list = [model.to_dict() for model in forecast_models]
-    
-    # Return the dictionary as a JSON response
-    return jsonify(forecast_list)
+    def build_response():
+        # Get latest forecast model data using get_latest_forecast_as_model(product)
+        try:
+            forecast_models = get_latest_forecast_as_model(product)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+        
+        # Convert model objects to dictionary for JSON serialization
+        forecast_list = [model.to_dict() for model in forecast_models]
+        
+        # Return the dictionary as a JSON response
+        return jsonify(forecast_list)
+    
+    return conditional_forecast_response(get_latest_forecast_cache_entry(product), "model", build_response)
 
 @api_blueprint.route('/products', methods=['GET'])
 def get_products():
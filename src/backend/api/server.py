@@ -0,0 +1,262 @@
+"""
+Pre-fork WSGI server for production serving of the forecast API.
+
+The master process preloads shared state (latest forecasts, model registry and an
+initial health check), binds the listening socket and then forks a fixed number of
+worker processes that accept connections on the inherited socket. Workers share the
+preloaded memory copy-on-write, each runs a threaded stdlib WSGI server and refreshes the
+cached health check in the background. Dead workers are respawned until the master
+receives SIGINT or SIGTERM.
+
+The same application can be served by gunicorn with ``--preload``; this server exists so
+that the production mode can be launched from the CLI with the standard library only.
+"""
+
+import os
+import signal
+import socket
+import socketserver
+import time
+from typing import Callable, Dict, Optional
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler
+
+# Internal imports
+from .preload import preload_shared_state
+from .routes import get_health_check
+from ..config.settings import API_HOST, API_PORT, API_WORKERS
+from ..utils.logging_utils import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Pending connection queue length for the shared listening socket
+LISTEN_BACKLOG = 256
+
+# Seconds to wait for workers to exit after SIGTERM before killing them
+WORKER_SHUTDOWN_TIMEOUT = 10
+
+# Minimum seconds between respawns of the same worker slot, to avoid a crash loop
+WORKER_RESPAWN_DELAY = 1.0
+
+
+class ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    """
+    Threaded stdlib WSGI server run inside each worker process
+    """
+    daemon_threads = True
+
+
+class QuietWSGIRequestHandler(WSGIRequestHandler):
+    """
+    Request handler that routes access logs through the application logger at debug level
+    """
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class PreforkServer:
+    """
+    Pre-fork WSGI server that shares preloaded state across worker processes
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        host: str = API_HOST,
+        port: int = API_PORT,
+        workers: int = API_WORKERS,
+        preload: bool = True
+    ):
+        """
+        Initializes the pre-fork server
+
+        Args:
+            app: WSGI application to serve
+            host: Host address to bind
+            port: Port number to bind
+            workers: Number of worker processes to fork
+            preload: Whether to preload shared state in the master before forking
+        """
+        if workers < 1:
+            raise ValueError(f"Worker count must be at least 1, got {workers}")
+
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.preload = preload
+
+        self._socket: Optional[socket.socket] = None
+        self._worker_pids: Dict[int, int] = {}
+        self._shutting_down = False
+
+    def serve_forever(self) -> int:
+        """
+        Preloads shared state, forks the workers and supervises them until shutdown
+
+        Returns:
+            int: Exit code (0 for a clean shutdown)
+        """
+        if self.preload:
+            preload_shared_state()
+            # Prime the health check cache so workers start with a fresh result
+            try:
+                get_health_check().get_cached_result()
+            except Exception as e:
+                logger.warning(f"Initial health check failed: {str(e)}")
+
+        self._socket = socket.create_server((self.host, self.port), backlog=LISTEN_BACKLOG)
+        self._socket.set_inheritable(True)
+        logger.info(f"Listening on {self.host}:{self.port} with {self.workers} workers")
+
+        if not hasattr(os, "fork"):
+            logger.warning("os.fork is unavailable on this platform, serving from a single process")
+            self._run_worker(0)
+            return 0
+
+        signal.signal(signal.SIGTERM, self._handle_shutdown_signal)
+        signal.signal(signal.SIGINT, self._handle_shutdown_signal)
+
+        for slot in range(self.workers):
+            self._spawn_worker(slot)
+
+        try:
+            self._supervise()
+        except InterruptedError:
+            pass
+        finally:
+            self._stop_workers()
+            self._socket.close()
+
+        logger.info("Pre-fork server stopped")
+        return 0
+
+    def _spawn_worker(self, slot: int) -> None:
+        """
+        Forks a worker process for the given slot
+
+        Args:
+            slot: Worker slot number
+        """
+        pid = os.fork()
+        if pid == 0:
+            # Child: never return into the master's control flow
+            exit_code = 0
+            try:
+                self._run_worker(slot)
+            except Exception as e:
+                logger.error(f"Worker {slot} failed: {str(e)}")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        self._worker_pids[pid] = slot
+        logger.info(f"Started worker {slot} (pid {pid})")
+
+    def _run_worker(self, slot: int) -> None:
+        """
+        Serves requests on the inherited socket until the worker is terminated
+
+        Args:
+            slot: Worker slot number
+        """
+        signal.signal(signal.SIGTERM, _raise_system_exit)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        # Threads do not survive fork, so each worker starts its own refresher
+        get_health_check().start_background_refresh()
+
+        server = ThreadingWSGIServer(
+            (self.host, self.port), QuietWSGIRequestHandler, bind_and_activate=False
+        )
+        # Replace the server's own unbound socket with the shared listening socket
+        server.socket.close()
+        server.socket = self._socket
+        server.server_address = self._socket.getsockname()[:2]
+        # Normally set by server_bind(), which is skipped for an inherited socket
+        server.server_name = socket.getfqdn(server.server_address[0])
+        server.server_port = server.server_address[1]
+        server.setup_environ()
+        server.set_app(self.app)
+
+        try:
+            server.serve_forever()
+        except SystemExit:
+            logger.info(f"Worker {slot} (pid {os.getpid()}) shutting down")
+        finally:
+            get_health_check().stop_background_refresh()
+
+    def _supervise(self) -> None:
+        """
+        Waits for worker exits and respawns them until shutdown is requested
+        """
+        while not self._shutting_down:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+
+            slot = self._worker_pids.pop(pid, None)
+            if slot is None or self._shutting_down:
+                continue
+
+            logger.warning(f"Worker {slot} (pid {pid}) exited with status {status}, respawning")
+            time.sleep(WORKER_RESPAWN_DELAY)
+            if not self._shutting_down:
+                self._spawn_worker(slot)
+
+    def _stop_workers(self) -> None:
+        """
+        Terminates all workers, killing any that do not exit within the timeout
+        """
+        for pid in list(self._worker_pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._worker_pids.pop(pid, None)
+
+        deadline = time.monotonic() + WORKER_SHUTDOWN_TIMEOUT
+        while self._worker_pids and time.monotonic() < deadline:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                time.sleep(0.1)
+                continue
+            self._worker_pids.pop(pid, None)
+
+        for pid in list(self._worker_pids):
+            logger.warning(f"Worker pid {pid} did not exit in time, killing it")
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self._worker_pids.pop(pid, None)
+
+    def _handle_shutdown_signal(self, signum: int, frame: object) -> None:
+        """
+        Marks the server as shutting down and wakes the supervisor
+
+        Args:
+            signum: Signal number received
+            frame: Current stack frame
+        """
+        logger.info(f"Received signal {signum}, stopping workers")
+        self._shutting_down = True
+        raise InterruptedError
+
+
+def _raise_system_exit(signum: int, frame: object) -> None:
+    """
+    Signal handler that stops a worker's serve loop
+
+    Args:
+        signum: Signal number received
+        frame: Current stack frame
+    """
+    raise SystemExit(0)
@@ -0,0 +1,212 @@
+"""
+Streaming serialization of forecast exports.
+
+format_forecast_response builds the whole CSV, Excel or Parquet body in memory before the
+first byte is sent, which for multi-month ranges with all sample columns means holding the
+combined dataframe and its serialized copy at once. The writers in this module instead take
+an iterator of forecast dataframes (one stored forecast at a time) and yield the encoded body
+chunk by chunk: CSV with a single header row, newline-delimited JSON, an Arrow IPC stream
+with one record batch per forecast, or a Parquet file with one row group per forecast.
+Memory use is bounded by a single forecast regardless of the length of the range.
+"""
+
+import io
+from typing import Iterable, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa  # version 12.0.0
+import pyarrow.ipc  # noqa: F401
+import pyarrow.parquet as pq  # version 12.0.0
+
+# Internal imports
+from ..utils.logging_utils import get_logger
+from .exceptions import InvalidFormatError
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Streaming export formats and their MIME types
+STREAMING_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet"
+}
+
+# Maximum number of rows serialized per CSV/NDJSON chunk
+STREAM_CHUNK_ROWS = 1000
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file object collecting the bytes written since the last drain.
+
+    Arrow and Parquet writers write into the sink, and the generators drain it after each
+    record batch or row group so only the bytes of one forecast are buffered at a time.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        """Returns and forgets the bytes written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _iter_row_chunks(df: pd.DataFrame, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Splits a dataframe into consecutive row chunks.
+    """
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def stream_csv(frames: Iterable[pd.DataFrame], chunk_rows: int = STREAM_CHUNK_ROWS) -> Iterator[bytes]:
+    """
+    Serializes forecast dataframes as one CSV document, chunk by chunk.
+
+    The header is written once, from the columns of the first dataframe; later dataframes
+    are written in the same column order. Callers pass dataframes sharing their columns
+    (get_forecast_export_frames unifies the sample columns up front).
+
+    Args:
+        frames: Iterator of forecast dataframes
+        chunk_rows: Maximum number of rows per yielded chunk
+
+    Yields:
+        UTF-8 encoded CSV chunks
+    """
+    columns = None
+    for df in frames:
+        if columns is None:
+            columns = list(df.columns)
+            yield df.iloc[:0].to_csv(index=False).encode("utf-8")
+        for chunk in _iter_row_chunks(df.reindex(columns=columns), chunk_rows):
+            yield chunk.to_csv(index=False, header=False).encode("utf-8")
+
+
+def stream_ndjson(frames: Iterable[pd.DataFrame], chunk_rows: int = STREAM_CHUNK_ROWS) -> Iterator[bytes]:
+    """
+    Serializes forecast dataframes as newline-delimited JSON, one record per line.
+
+    Args:
+        frames: Iterator of forecast dataframes
+        chunk_rows: Maximum number of rows per yielded chunk
+
+    Yields:
+        UTF-8 encoded NDJSON chunks
+    """
+    for df in frames:
+        for chunk in _iter_row_chunks(df, chunk_rows):
+            yield (chunk.to_json(orient="records", lines=True, date_format="iso") + "\n").encode("utf-8")
+
+
+def _iter_tables(frames: Iterable[pd.DataFrame]) -> Iterator[pa.Table]:
+    """
+    Converts forecast dataframes to Arrow tables sharing the schema of the first one.
+
+    Forecasts stored with a different sample dtype (float32/float64) are cast to the first
+    schema so the whole export has a single schema. As for CSV, later dataframes are aligned
+    to the first one's columns rather than failing the stream after it has started.
+    """
+    schema: Optional[pa.Schema] = None
+    for df in frames:
+        if schema is not None and list(df.columns) != schema.names:
+            df = df.reindex(columns=schema.names)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if schema is None:
+            schema = table.schema.remove_metadata()
+        yield table.select(schema.names).cast(schema)
+
+
+def stream_arrow(frames: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """
+    Serializes forecast dataframes as an Arrow IPC stream, one forecast per record batch.
+
+    Args:
+        frames: Iterator of forecast dataframes
+
+    Yields:
+        Arrow IPC stream bytes
+    """
+    sink = _ChunkSink()
+    writer = None
+    for table in _iter_tables(frames):
+        if writer is None:
+            writer = pa.ipc.new_stream(sink, table.schema)
+        writer.write_table(table)
+        yield sink.drain()
+
+    if writer is not None:
+        writer.close()
+        yield sink.drain()
+
+
+def stream_parquet(frames: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """
+    Serializes forecast dataframes as a Parquet file, one forecast per row group.
+
+    Args:
+        frames: Iterator of forecast dataframes
+
+    Yields:
+        Parquet file bytes
+    """
+    sink = _ChunkSink()
+    writer = None
+    for table in _iter_tables(frames):
+        if writer is None:
+            writer = pq.ParquetWriter(sink, table.schema)
+        writer.write_table(table)
+        yield sink.drain()
+
+    if writer is not None:
+        # Closing writes the footer with the row group metadata
+        writer.close()
+        yield sink.drain()
+
+
+def stream_forecast_export(frames: Iterable[pd.DataFrame], format: str) -> Iterator[bytes]:
+    """
+    Serializes forecast dataframes in a streaming export format.
+
+    Args:
+        frames: Iterator of forecast dataframes, consumed lazily
+        format: One of STREAMING_FORMATS
+
+    Returns:
+        Iterator of encoded response chunks
+
+    Raises:
+        InvalidFormatError: If format is not a streaming format
+    """
+    if format not in STREAMING_FORMATS:
+        raise InvalidFormatError(
+            f"Unsupported streaming format: {format}",
+            format,
+            list(STREAMING_FORMATS)
+        )
+
+    if format == "csv":
+        return stream_csv(frames)
+    if format == "ndjson":
+        return stream_ndjson(frames)
+    if format == "arrow":
+        return stream_arrow(frames)
+    return stream_parquet(frames)
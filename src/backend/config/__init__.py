@@ -5,13 +5,14 @@ This module exports settings, logging configuration, and schema definitions for
 the application. It also initializes the logging system and ensures required directories exist.
 """
 
+import importlib
 import os
+import typing
 from pathlib import Path
 
 # Import configuration modules to expose their contents
 from . import settings
 from . import logging_config
-from . import schema_config
 
 # Direct exports for convenience
 from .logging_config import setup_logging
@@ -21,24 +22,97 @@ from .settings import (
     DEBUG, 
     TIMEZONE,
     FORECAST_SCHEDULE_TIME,
+    FORECAST_PUBLICATION_DEADLINE,
+    PIPELINE_STAGE_BUDGETS,
+    FALLBACK_PUBLICATION_RESERVE_SECONDS,
+    INGESTION_CACHE_FILE,
+    PIPELINE_EXECUTION_MODE,
+    FALLBACK_STORAGE_MODE,
+    SCHEDULER_MAX_WORKERS,
+    SCHEDULER_RESERVED_DAILY_WORKERS,
+    SCHEDULER_JOB_MEMORY_LIMIT_MB,
+    JOB_REGISTRY_DB_FILE,
+    JOB_REGISTRY_RETENTION_DAYS,
     FORECAST_PRODUCTS,
     FORECAST_HORIZON_HOURS,
     PROBABILISTIC_SAMPLE_COUNT,
+    PROBABILISTIC_SAMPLING_MODE,
+    MIN_PROBABILISTIC_SAMPLE_COUNT,
+    MAX_PROBABILISTIC_SAMPLE_COUNT,
+    SAMPLE_STORAGE_DTYPE,
     STORAGE_ROOT_DIR,
     STORAGE_LATEST_DIR,
     STORAGE_INDEX_FILE,
+    STORAGE_POINTER_FILE,
+    INDEX_REBUILD_WORKERS,
+    INDEX_REBUILD_CHECKPOINT_FILE,
+    INDEX_REBUILD_CHECKPOINT_INTERVAL,
+    CHECKSUM_CHUNK_SIZE,
+    STORAGE_VERIFY_CHECKSUMS_ON_READ,
+    STORAGE_SCRUB_ENABLED,
+    STORAGE_SCRUB_MAX_BYTES_PER_SECOND,
+    STORAGE_SCRUB_INTERVAL_SECONDS,
+    BACKFILL_WORKERS,
+    BACKFILL_CHUNK_DAYS,
+    BACKFILL_TARGET_DAYS_PER_MINUTE,
+    BACKFILL_CHECKPOINT_DIR,
+    FALLBACK_PREPARED_DIR,
     DATA_SOURCES,
     API_HOST,
-    API_PORT
+    API_PORT,
+    API_WORKERS,
+    FORECAST_CACHE_MAX_AGE_SECONDS,
+    RESPONSE_COMPRESSION_MIN_BYTES,
+    RESPONSE_GZIP_LEVEL,
+    RESPONSE_ZSTD_LEVEL,
+    HEALTH_CHECK_CACHE_TTL_SECONDS,
+    HEALTH_CHECK_REFRESH_INTERVAL_SECONDS,
+    PIPELINE_HEALTH_RECENT_RUNS,
+    PIPELINE_HEALTH_MAX_CONSECUTIVE_FAILURES
 )
-from .schema_config import (
-    FORECAST_BASE_SCHEMA,
-    FORECAST_OUTPUT_SCHEMA,
-    LOAD_FORECAST_SCHEMA,
-    HISTORICAL_PRICE_SCHEMA,
-    GENERATION_FORECAST_SCHEMA
+
+if typing.TYPE_CHECKING:
+    from . import schema_config
+    from .schema_config import (
+        FORECAST_BASE_SCHEMA,
+        FORECAST_OUTPUT_SCHEMA,
+        LOAD_FORECAST_SCHEMA,
+        HISTORICAL_PRICE_SCHEMA,
+        GENERATION_FORECAST_SCHEMA
+    )
+
+# Schema definitions pull in pandas and pandera, so they are loaded on first access
+_LAZY_SCHEMA_EXPORTS = (
+    "FORECAST_BASE_SCHEMA",
+    "FORECAST_OUTPUT_SCHEMA",
+    "LOAD_FORECAST_SCHEMA",
+    "HISTORICAL_PRICE_SCHEMA",
+    "GENERATION_FORECAST_SCHEMA"
 )
 
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Loads the schema configuration module on first access to a schema export.
+    
+    Args:
+        name: Attribute name being looked up on the package
+        
+    Returns:
+        The schema_config module or the requested schema
+        
+    Raises:
+        AttributeError: If the name is not exported by the package
+    """
+    if name != "schema_config" and name not in _LAZY_SCHEMA_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(".schema_config", __name__)
+    value = module if name == "schema_config" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
 def initialize_config():
     """
     Initializes the configuration package by setting up logging and ensuring required directories exist.
@@ -72,9 +146,20 @@ def initialize_config():
 __all__ = [
     "settings", "logging_config", "schema_config", "setup_logging", 
     "initialize_config", "BASE_DIR", "ENVIRONMENT", "DEBUG", "TIMEZONE",
-    "FORECAST_SCHEDULE_TIME", "FORECAST_PRODUCTS", "FORECAST_HORIZON_HOURS",
-    "PROBABILISTIC_SAMPLE_COUNT", "STORAGE_ROOT_DIR", "STORAGE_LATEST_DIR",
-    "STORAGE_INDEX_FILE", "DATA_SOURCES", "API_HOST", "API_PORT",
+    "FORECAST_SCHEDULE_TIME", "FORECAST_PUBLICATION_DEADLINE", "PIPELINE_STAGE_BUDGETS",
+    "FALLBACK_PUBLICATION_RESERVE_SECONDS", "INGESTION_CACHE_FILE", "PIPELINE_EXECUTION_MODE", "FALLBACK_STORAGE_MODE", "SCHEDULER_MAX_WORKERS", "SCHEDULER_RESERVED_DAILY_WORKERS",
+    "SCHEDULER_JOB_MEMORY_LIMIT_MB", "JOB_REGISTRY_DB_FILE", "JOB_REGISTRY_RETENTION_DAYS", "FORECAST_PRODUCTS", "FORECAST_HORIZON_HOURS",
+    "PROBABILISTIC_SAMPLE_COUNT", "PROBABILISTIC_SAMPLING_MODE",
+    "MIN_PROBABILISTIC_SAMPLE_COUNT", "MAX_PROBABILISTIC_SAMPLE_COUNT", "SAMPLE_STORAGE_DTYPE",
+    "STORAGE_ROOT_DIR", "STORAGE_LATEST_DIR",
+    "STORAGE_INDEX_FILE", "STORAGE_POINTER_FILE", "INDEX_REBUILD_WORKERS",
+    "INDEX_REBUILD_CHECKPOINT_FILE", "INDEX_REBUILD_CHECKPOINT_INTERVAL",
+    "CHECKSUM_CHUNK_SIZE", "STORAGE_VERIFY_CHECKSUMS_ON_READ", "STORAGE_SCRUB_ENABLED",
+    "STORAGE_SCRUB_MAX_BYTES_PER_SECOND", "STORAGE_SCRUB_INTERVAL_SECONDS", "BACKFILL_WORKERS",
+    "BACKFILL_CHUNK_DAYS", "BACKFILL_TARGET_DAYS_PER_MINUTE", "BACKFILL_CHECKPOINT_DIR", "FALLBACK_PREPARED_DIR", "DATA_SOURCES", "API_HOST", "API_PORT",
+    "API_WORKERS", "FORECAST_CACHE_MAX_AGE_SECONDS", "HEALTH_CHECK_CACHE_TTL_SECONDS", "HEALTH_CHECK_REFRESH_INTERVAL_SECONDS",
+    "PIPELINE_HEALTH_RECENT_RUNS", "PIPELINE_HEALTH_MAX_CONSECUTIVE_FAILURES",
+    "RESPONSE_COMPRESSION_MIN_BYTES", "RESPONSE_GZIP_LEVEL", "RESPONSE_ZSTD_LEVEL",
     "FORECAST_BASE_SCHEMA", "FORECAST_OUTPUT_SCHEMA", "LOAD_FORECAST_SCHEMA",
     "HISTORICAL_PRICE_SCHEMA", "GENERATION_FORECAST_SCHEMA"
 ]
@@ -5,6 +5,7 @@ definitions for input data sources, forecast outputs, and storage formats, ensur
 data consistency and quality across the system.
 """
 
+import functools
 import pandera as pa  # version 0.16.0
 import pandas as pd  # version 2.0.0
 import numpy as np  # version 1.24.0
@@ -13,9 +14,10 @@ from datetime import datetime, timedelta
 from .settings import (
     FORECAST_PRODUCTS,
     PROBABILISTIC_SAMPLE_COUNT,
+    SAMPLE_STORAGE_DTYPE,
     FORECAST_HORIZON_HOURS
 )
-from ..models.data_models import create_sample_columns
+from ..models.data_models import create_sample_columns, get_sample_columns
 
 # Version of the schema definitions
 SCHEMA_VERSION = "1.0.0"
@@ -59,10 +61,14 @@ def create_base_schema():
     return schema
 
 
-def create_forecast_schema():
+def create_forecast_schema(sample_count=PROBABILISTIC_SAMPLE_COUNT, sample_dtype=SAMPLE_STORAGE_DTYPE):
     """
     Creates a schema for forecast data with probabilistic samples.
     
+    Args:
+        sample_count (int): Number of sample columns expected (default: from settings)
+        sample_dtype (str): Dtype of sample columns, 'float64' or 'float32' (default: from settings)
+    
     Returns:
         pandera.DataFrameSchema: Schema for forecast data validation
     """
@@ -109,9 +115,10 @@ def create_forecast_schema():
     }
     
     # Add sample columns
-    for sample_col in SAMPLE_COLUMN_NAMES:
+    sample_column_dtype = pa.Float32 if sample_dtype == "float32" else pa.Float
+    for sample_col in create_sample_columns(sample_count):
         schema_dict[sample_col] = pa.Column(
-            pa.Float,
+            sample_column_dtype,
             nullable=False,
             checks=[
                 pa.Check.not_null()
@@ -125,6 +132,42 @@ def create_forecast_schema():
     return base_schema
 
 
+@functools.lru_cache(maxsize=16)
+def get_forecast_schema(sample_count=PROBABILISTIC_SAMPLE_COUNT, sample_dtype=SAMPLE_STORAGE_DTYPE):
+    """
+    Returns a cached forecast schema for a given sample count and sample dtype.
+    
+    Args:
+        sample_count (int): Number of sample columns expected
+        sample_dtype (str): Dtype of sample columns
+    
+    Returns:
+        pandera.DataFrameSchema: Schema for forecast data validation
+    """
+    if sample_count == PROBABILISTIC_SAMPLE_COUNT and sample_dtype == SAMPLE_STORAGE_DTYPE:
+        return FORECAST_OUTPUT_SCHEMA
+    
+    return create_forecast_schema(sample_count, sample_dtype)
+
+
+def get_forecast_schema_for_dataframe(df):
+    """
+    Returns the forecast schema matching the sample count and sample dtype of a dataframe.
+    
+    Args:
+        df (pandas.DataFrame): Forecast dataframe with sample columns
+    
+    Returns:
+        pandera.DataFrameSchema: Schema for forecast data validation
+    """
+    sample_columns = get_sample_columns(df.columns)
+    if not sample_columns:
+        return FORECAST_OUTPUT_SCHEMA
+    
+    sample_dtype = "float32" if df[sample_columns[0]].dtype == np.float32 else "float64"
+    return get_forecast_schema(len(sample_columns), sample_dtype)
+
+
 def create_load_forecast_schema():
     """
     Creates a schema for load forecast data.
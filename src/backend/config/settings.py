@@ -10,7 +10,6 @@ import os
 from pathlib import Path
 import datetime
 import pytz  # version: 2023.3
-from dotenv import load_dotenv  # version: 1.0.0
 
 # Base directory of the project (3 levels up from this file: src/)
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -27,6 +26,8 @@ def load_environment_variables():
         bool: True if .env file was loaded, False otherwise
     """
     if os.path.exists(ENV_FILE):
+        # Imported here so that deployments without a .env file never load dotenv
+        from dotenv import load_dotenv  # version: 1.0.0
         load_dotenv(ENV_FILE)
         return True
     return False
@@ -42,16 +43,73 @@ LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 # Timezone settings (CST for 7 AM scheduling)
 TIMEZONE = pytz.timezone('America/Chicago')
 FORECAST_SCHEDULE_TIME = datetime.time(7, 0, 0)
+# Publication deadline of the daily forecast (SLA: forecasts available by 8 AM CST)
+FORECAST_PUBLICATION_DEADLINE = datetime.time(8, 0, 0)
+# Relative time budgets of the pipeline stages (minutes of the 7-8 AM timeline), scaled to the time left
+PIPELINE_STAGE_BUDGETS = {
+    "ingest_data": 10,
+    "engineer_features": 10,
+    "generate_forecasts": 15,
+    "validate_forecasts": 5,
+    "store_forecasts": 5
+}
+# Seconds kept before the publication deadline for publishing fallback forecasts
+FALLBACK_PUBLICATION_RESERVE_SECONDS = 300
+# Last successfully ingested data, used when ingestion overruns its budget (shared by job processes)
+INGESTION_CACHE_FILE = os.getenv('INGESTION_CACHE_FILE', os.path.join(BASE_DIR, 'data', 'pipeline', 'last_ingestion.pkl'))
+# How pipeline runs are executed: 'sequential' (all products stage by stage) or 'per_product'
+# (an independent forecast, validate and store chain per product, run in parallel)
+PIPELINE_EXECUTION_MODE = os.getenv('PIPELINE_EXECUTION_MODE', 'sequential')
+# How fallback forecasts are stored: 'reference' (a reference to the source forecast with a
+# timestamp offset) or 'copy' (a full copy with shifted timestamps)
+FALLBACK_STORAGE_MODE = os.getenv('FALLBACK_STORAGE_MODE', 'reference')
+# Scheduler job processes: workers shared by ad-hoc and backfill jobs, extra workers only
+# daily runs may use, and the address space limit of a job (MB, 0 for no limit)
+SCHEDULER_MAX_WORKERS = int(os.getenv('SCHEDULER_MAX_WORKERS', os.cpu_count() or 1))
+SCHEDULER_RESERVED_DAILY_WORKERS = int(os.getenv('SCHEDULER_RESERVED_DAILY_WORKERS', 1))
+SCHEDULER_JOB_MEMORY_LIMIT_MB = int(os.getenv('SCHEDULER_JOB_MEMORY_LIMIT_MB', 8192))
+# Job registry: SQLite database of scheduler jobs (WAL mode, so the health check and dashboards
+# read while the scheduler writes) and the days finished jobs are kept
+JOB_REGISTRY_DB_FILE = os.getenv('JOB_REGISTRY_DB_FILE', os.path.join(BASE_DIR, 'data', 'scheduler', 'job_registry.db'))
+JOB_REGISTRY_RETENTION_DAYS = int(os.getenv('JOB_REGISTRY_RETENTION_DAYS', 90))
 
 # Forecasting parameters
 FORECAST_PRODUCTS = ['DALMP', 'RTLMP', 'RegUp', 'RegDown', 'RRS', 'NSRS']
 FORECAST_HORIZON_HOURS = 72
 PROBABILISTIC_SAMPLE_COUNT = 100
+# Bounds for per-run sample counts (e.g. 20-sample previews, 1000-sample risk runs)
+MIN_PROBABILISTIC_SAMPLE_COUNT = 10
+MAX_PROBABILISTIC_SAMPLE_COUNT = 10000
+# Storage dtype for sample columns: 'float64' or 'float32' (halves the sample block size)
+SAMPLE_STORAGE_DTYPE = os.getenv('SAMPLE_STORAGE_DTYPE', 'float64')
+# Sampling mode for probabilistic samples: 'random', 'antithetic', 'sobol', 'halton' or 'stratified'
+PROBABILISTIC_SAMPLING_MODE = os.getenv('PROBABILISTIC_SAMPLING_MODE', 'random')
 
 # Storage paths
 STORAGE_ROOT_DIR = os.path.join(BASE_DIR, 'data', 'forecasts')
 STORAGE_LATEST_DIR = os.path.join(STORAGE_ROOT_DIR, 'latest')
 STORAGE_INDEX_FILE = os.path.join(STORAGE_ROOT_DIR, 'index.parquet')
+# Per-product pointers to the latest and latest non-fallback forecasts
+STORAGE_POINTER_FILE = os.path.join(STORAGE_ROOT_DIR, 'latest_pointers.json')
+# Index rebuild: parallel file scans and a checkpoint of scanned files so an interrupted rebuild resumes
+INDEX_REBUILD_WORKERS = int(os.getenv('INDEX_REBUILD_WORKERS', 8))
+INDEX_REBUILD_CHECKPOINT_FILE = os.path.join(STORAGE_ROOT_DIR, 'index_rebuild_checkpoint.jsonl')
+INDEX_REBUILD_CHECKPOINT_INTERVAL = int(os.getenv('INDEX_REBUILD_CHECKPOINT_INTERVAL', 100))
+# Content checksums: bytes hashed per read, optional verification when forecasts are loaded,
+# and the background scrubber that verifies the archive at a bounded read rate
+CHECKSUM_CHUNK_SIZE = int(os.getenv('CHECKSUM_CHUNK_SIZE', 1024 * 1024))
+STORAGE_VERIFY_CHECKSUMS_ON_READ = os.getenv('STORAGE_VERIFY_CHECKSUMS_ON_READ', 'False').lower() in ('true', '1', 't')
+STORAGE_SCRUB_ENABLED = os.getenv('STORAGE_SCRUB_ENABLED', 'True').lower() in ('true', '1', 't')
+STORAGE_SCRUB_MAX_BYTES_PER_SECOND = int(os.getenv('STORAGE_SCRUB_MAX_BYTES_PER_SECOND', 8 * 1024 * 1024))
+STORAGE_SCRUB_INTERVAL_SECONDS = int(os.getenv('STORAGE_SCRUB_INTERVAL_SECONDS', 24 * 60 * 60))
+# Historical backfills: worker processes, target dates stored per index update, throughput
+# target (days per minute) and checkpoints of completed dates for resuming
+BACKFILL_WORKERS = int(os.getenv('BACKFILL_WORKERS', SCHEDULER_MAX_WORKERS))
+BACKFILL_CHUNK_DAYS = int(os.getenv('BACKFILL_CHUNK_DAYS', 30))
+BACKFILL_TARGET_DAYS_PER_MINUTE = float(os.getenv('BACKFILL_TARGET_DAYS_PER_MINUTE', 10))
+BACKFILL_CHECKPOINT_DIR = os.path.join(STORAGE_ROOT_DIR, 'backfill_checkpoints')
+# Fallback forecasts prepared ahead of a run, shared by the scheduler and job worker processes
+FALLBACK_PREPARED_DIR = os.path.join(STORAGE_ROOT_DIR, 'prepared_fallbacks')
 
 # External data source configuration
 DATA_SOURCES = {
@@ -72,6 +130,23 @@ DATA_SOURCES = {
 # API settings
 API_HOST = os.getenv('API_HOST', '0.0.0.0')
 API_PORT = int(os.getenv('API_PORT', 5000))
+# Number of pre-forked worker processes in production serving mode
+API_WORKERS = int(os.getenv('API_WORKERS', 4))
+# Cache-Control max-age for forecast responses; clients and nginx revalidate with ETags afterwards
+FORECAST_CACHE_MAX_AGE_SECONDS = int(os.getenv('FORECAST_CACHE_MAX_AGE_SECONDS', 300))
+# Forecast responses smaller than this are sent uncompressed
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', 1024))
+# Compression levels for gzip and zstd (zstd requires the optional zstandard package)
+RESPONSE_GZIP_LEVEL = int(os.getenv('RESPONSE_GZIP_LEVEL', 6))
+RESPONSE_ZSTD_LEVEL = int(os.getenv('RESPONSE_ZSTD_LEVEL', 3))
+# Maximum age of a cached comprehensive health check before it is recomputed
+HEALTH_CHECK_CACHE_TTL_SECONDS = int(os.getenv('HEALTH_CHECK_CACHE_TTL_SECONDS', 300))
+# Interval at which API workers refresh the cached health check in the background
+HEALTH_CHECK_REFRESH_INTERVAL_SECONDS = int(os.getenv('HEALTH_CHECK_REFRESH_INTERVAL_SECONDS', 60))
+# Recent forecast runs reported by the pipeline health check, and the consecutive failed runs
+# after which the pipeline is reported unhealthy
+PIPELINE_HEALTH_RECENT_RUNS = int(os.getenv('PIPELINE_HEALTH_RECENT_RUNS', 10))
+PIPELINE_HEALTH_MAX_CONSECUTIVE_FAILURES = int(os.getenv('PIPELINE_HEALTH_MAX_CONSECUTIVE_FAILURES', 3))
 
 def get_storage_path_for_date(date):
     """
@@ -28,9 +28,17 @@ from .error_detector import (
 )
 from .fallback_retriever import (
     retrieve_fallback_forecast,
+    store_fallback_reference,
     DEFAULT_MAX_SEARCH_DAYS
 )
 from .timestamp_adjuster import adjust_timestamps
+from .fallback_preparer import (
+    prepare_fallback_forecasts,
+    start_fallback_preparation,
+    has_prepared_fallback,
+    get_prepared_fallback,
+    clear_prepared_fallbacks
+)
 from .fallback_logger import (
     log_fallback_activation,
     log_fallback_retrieval,
@@ -124,7 +132,13 @@ __all__ = [
     "detect_error",
     "should_activate_fallback",
     "retrieve_fallback_forecast",
+    "store_fallback_reference",
     "adjust_timestamps",
+    "prepare_fallback_forecasts",
+    "start_fallback_preparation",
+    "has_prepared_fallback",
+    "get_prepared_fallback",
+    "clear_prepared_fallbacks",
     "log_fallback_activation",
     "log_fallback_retrieval",
     "log_timestamp_adjustment",
@@ -0,0 +1,204 @@
+"""
+Module that builds fallback forecasts ahead of time so they are ready before they are needed.
+
+retrieve_fallback_forecast searches backwards day by day for a suitable previous forecast,
+loads it and shifts its timestamps to the target date. Run inside activate_fallback, that
+search sits on the critical path of a failed forecast run. The scheduler instead calls
+start_fallback_preparation when a run starts, and for the next day as soon as a run has
+stored its forecasts, which builds the timestamp-adjusted fallback for every product in a
+background thread. Prepared fallbacks are written to FALLBACK_PREPARED_DIR, because the
+pipeline runs in a job executor worker process rather than in the scheduler process. The
+pipeline then publishes a prepared fallback with get_prepared_fallback and only searches
+when none exists. In the 'reference' FALLBACK_STORAGE_MODE fallbacks are stored as
+references to their source forecast and the prepared copies are not used, so nothing is
+prepared.
+"""
+
+import datetime
+import os
+import pathlib
+import threading
+from typing import Dict, List, Optional
+import pandas as pd  # version: 2.0.0+
+
+# Internal imports
+from .fallback_retriever import retrieve_fallback_forecast, DEFAULT_MAX_SEARCH_DAYS
+from .fallback_logger import log_fallback_error
+from ..utils.date_utils import localize_to_cst
+from ..utils.logging_utils import get_logger
+from ..utils.file_utils import save_dataframe, load_dataframe
+from ..config.settings import FORECAST_PRODUCTS, FALLBACK_PREPARED_DIR, FALLBACK_STORAGE_MODE
+
+# Configure logger
+logger = get_logger(__name__)
+
+
+def _get_target_day(target_date: datetime.datetime) -> datetime.date:
+    """
+    Returns the CST calendar day a target date refers to.
+    """
+    return localize_to_cst(target_date).date()
+
+
+def _get_prepared_path(product: str, target_day: datetime.date) -> pathlib.Path:
+    """
+    Returns the file a prepared fallback for a product and target day is stored in.
+    """
+    return pathlib.Path(FALLBACK_PREPARED_DIR) / f"{product}_{target_day:%Y%m%d}.parquet"
+
+
+def _store_prepared_fallback(fallback_df: pd.DataFrame, product: str, target_day: datetime.date) -> None:
+    """
+    Writes a prepared fallback next to its final path and renames it into place, so a
+    pipeline reading it from another process never sees a partially written file.
+    """
+    file_path = _get_prepared_path(product, target_day)
+    temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        save_dataframe(fallback_df, temp_path)
+        os.replace(temp_path, file_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def prepare_fallback_forecasts(
+    target_date: datetime.datetime,
+    products: Optional[List[str]] = None,
+    max_search_days: int = DEFAULT_MAX_SEARCH_DAYS
+) -> Dict[str, bool]:
+    """
+    Builds and stores the timestamp-adjusted fallback forecast of each product for a target date.
+
+    Products that already have a prepared fallback for the target date are skipped.
+
+    Args:
+        target_date: The target date the fallbacks are prepared for
+        products: Products to prepare, defaults to FORECAST_PRODUCTS
+        max_search_days: Maximum number of days to search backward for a fallback
+
+    Returns:
+        Dictionary mapping each product to whether a fallback is prepared for it
+    """
+    target_day = _get_target_day(target_date)
+    results = {}
+
+    for product in products or FORECAST_PRODUCTS:
+        if has_prepared_fallback(product, target_date):
+            results[product] = True
+            continue
+
+        try:
+            fallback_df = retrieve_fallback_forecast(product, target_date, max_search_days)
+        except Exception as e:
+            log_fallback_error("preparation", e, {
+                "product": product,
+                "target_date": target_day.isoformat()
+            })
+            results[product] = False
+            continue
+
+        try:
+            _store_prepared_fallback(fallback_df, product, target_day)
+        except Exception as e:
+            log_fallback_error("preparation", e, {
+                "product": product,
+                "target_date": target_day.isoformat()
+            })
+            results[product] = False
+            continue
+        results[product] = True
+
+    logger.info(
+        f"Prepared fallback forecasts for {target_day.isoformat()}: "
+        f"{sum(results.values())}/{len(results)} products"
+    )
+    return results
+
+
+def start_fallback_preparation(
+    target_date: datetime.datetime,
+    products: Optional[List[str]] = None,
+    max_search_days: int = DEFAULT_MAX_SEARCH_DAYS
+) -> Optional[threading.Thread]:
+    """
+    Starts preparing the fallback forecasts for a target date in a background thread.
+
+    Nothing is prepared when fallbacks are stored as references, which do not use the
+    prepared copies.
+
+    Args:
+        target_date: The target date the fallbacks are prepared for
+        products: Products to prepare, defaults to FORECAST_PRODUCTS
+        max_search_days: Maximum number of days to search backward for a fallback
+
+    Returns:
+        The started (daemon) thread, or None if fallbacks are stored as references
+    """
+    if FALLBACK_STORAGE_MODE == "reference":
+        logger.debug("Fallbacks are stored as references, skipping fallback preparation")
+        return None
+
+    thread = threading.Thread(
+        target=prepare_fallback_forecasts,
+        args=(target_date, products, max_search_days),
+        name=f"fallback-preparation-{_get_target_day(target_date).isoformat()}",
+        daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def has_prepared_fallback(product: str, target_date: datetime.datetime) -> bool:
+    """
+    Checks whether a fallback forecast has been prepared for a product and target date.
+    """
+    return _get_prepared_path(product, _get_target_day(target_date)).exists()
+
+
+def get_prepared_fallback(product: str, target_date: datetime.datetime) -> Optional[pd.DataFrame]:
+    """
+    Returns the prepared fallback forecast for a product and target date.
+
+    Args:
+        product: The price product
+        target_date: The target date the fallback was prepared for
+
+    Returns:
+        The prepared fallback dataframe, or None if none was prepared
+    """
+    file_path = _get_prepared_path(product, _get_target_day(target_date))
+    if not file_path.exists():
+        return None
+    try:
+        return load_dataframe(file_path)
+    except Exception as e:
+        logger.warning(f"Could not load prepared {product} fallback from {file_path}: {str(e)}")
+        return None
+
+
+def clear_prepared_fallbacks(before_date: Optional[datetime.datetime] = None) -> int:
+    """
+    Removes prepared fallback forecasts.
+
+    Args:
+        before_date: If provided, only fallbacks for target dates before this date are removed
+
+    Returns:
+        Number of prepared fallbacks removed
+    """
+    prepared_dir = pathlib.Path(FALLBACK_PREPARED_DIR)
+    if not prepared_dir.exists():
+        return 0
+
+    before_day = _get_target_day(before_date) if before_date is not None else None
+    removed = 0
+    for file_path in prepared_dir.glob("*.parquet"):
+        try:
+            target_day = datetime.datetime.strptime(file_path.stem.rsplit("_", 1)[1], "%Y%m%d").date()
+        except (IndexError, ValueError):
+            continue
+        if before_day is None or target_day < before_day:
+            file_path.unlink(missing_ok=True)
+            removed += 1
+    return removed
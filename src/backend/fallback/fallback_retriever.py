@@ -6,6 +6,7 @@ with the timestamp adjuster to prepare fallback forecasts for current use.
 
 import logging
 import datetime
+import pathlib
 from typing import Dict, List, Optional, Tuple, Union
 import time
 import pandas as pd  # version: 2.0.0+
@@ -13,8 +14,14 @@ import pandas as pd  # version: 2.0.0+
 # Internal imports
 from .exceptions import FallbackRetrievalError, NoFallbackAvailableError
 from .fallback_logger import log_fallback_retrieval, log_fallback_error
-from .timestamp_adjuster import adjust_timestamps
-from ..storage.storage_manager import get_forecast, check_forecast_availability, get_forecast_info
+from .timestamp_adjuster import adjust_timestamps, calculate_time_shift
+from ..storage.storage_manager import (
+    get_forecast,
+    check_forecast_availability,
+    get_forecast_info,
+    get_latest_forecast_index_entry,
+    save_forecast_reference
+)
 from ..utils.date_utils import get_previous_day_date, localize_to_cst
 from ..utils.logging_utils import get_logger
 from ..config.settings import FORECAST_PRODUCTS
@@ -106,6 +113,61 @@ def retrieve_fallback_forecast(
         )
 
 
+def store_fallback_reference(
+    product: str,
+    target_date: datetime.datetime,
+    max_search_days: int = DEFAULT_MAX_SEARCH_DAYS
+) -> pathlib.Path:
+    """
+    Stores the fallback forecast for a product and target date as a reference to the source
+    forecast, without loading or copying its data.
+    
+    Args:
+        product: The price product to store a fallback for
+        target_date: The target date for which a forecast is needed
+        max_search_days: Maximum number of days to search backward for a fallback
+        
+    Returns:
+        Path to the stored reference file
+        
+    Raises:
+        FallbackRetrievalError: If the fallback cannot be stored
+        NoFallbackAvailableError: If no suitable fallback can be found
+    """
+    if not validate_fallback_parameters(product, target_date):
+        raise FallbackRetrievalError(
+            "Invalid parameters for fallback retrieval", 
+            product, 
+            target_date
+        )
+    
+    source_date, metadata = find_suitable_fallback(product, target_date, max_search_days)
+    
+    try:
+        # Use the same shift the timestamp adjuster applies to copies
+        time_shift = calculate_time_shift(source_date, target_date)
+        file_path = save_forecast_reference(source_date, target_date, product, time_shift)
+    except Exception as e:
+        log_fallback_error("reference", e, {
+            "product": product,
+            "target_date": target_date.strftime('%Y-%m-%d'),
+            "source_date": source_date.strftime('%Y-%m-%d')
+        })
+        raise FallbackRetrievalError(
+            f"Failed to store fallback reference: {str(e)}", 
+            product, 
+            target_date, 
+            e
+        )
+    
+    log_fallback_retrieval(product, target_date, source_date, metadata)
+    logger.info(
+        f"Stored fallback forecast for {product} on {target_date.strftime('%Y-%m-%d')} "
+        f"as reference to {source_date.strftime('%Y-%m-%d')}"
+    )
+    return file_path
+
+
 def find_suitable_fallback(
     product: str, 
     target_date: datetime.datetime, 
@@ -128,6 +190,20 @@ def find_suitable_fallback(
     # Ensure target_date is in CST timezone
     target_date = localize_to_cst(target_date)
     
+    # The latest stored forecast, resolved through the pointer table, is usually the fallback
+    latest_entry = get_latest_forecast_index_entry(product)
+    if latest_entry is not None:
+        source_date = localize_to_cst(pd.Timestamp(latest_entry['timestamp']).to_pydatetime())
+        days_back = (target_date.date() - source_date.date()).days
+        if 1 <= days_back <= max_search_days and is_forecast_suitable(latest_entry, allow_fallback_cascading=True):
+            logger.info(
+                f"Found suitable fallback forecast for {product} "
+                f"from {source_date.strftime('%Y-%m-%d')} via the latest pointer "
+                f"({days_back} days before target)"
+            )
+            return source_date, get_fallback_metadata(latest_entry, source_date, target_date)
+    
+    # Otherwise (e.g. when re-running a past date) search backwards day by day
     # Start with the previous day
     search_date = get_previous_day_date(target_date)
     
@@ -8,10 +8,11 @@ in ensuring data quality and consistency throughout the forecasting system.
 
 import pandas as pd  # version 2.0.0
 import pandera as pa  # version 0.16.0
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 # Internal imports
-from ..config.schema_config import FORECAST_OUTPUT_SCHEMA, SCHEMA_VERSION
+from ..config.schema_config import FORECAST_OUTPUT_SCHEMA, SCHEMA_VERSION, get_forecast_schema_for_dataframe
+from ..models.data_models import get_sample_count
 from .exceptions import SchemaValidationError
 from .validation_result import (
     ValidationCategory,
@@ -26,20 +27,31 @@ from ..utils.logging_utils import get_logger
 logger = get_logger(__name__)
 
 
-def validate_forecast_schema(forecast_df: pd.DataFrame) -> ValidationResult:
+def validate_forecast_schema(forecast_df: pd.DataFrame, sample_count: Optional[int] = None) -> ValidationResult:
     """
     Validates a forecast dataframe against the predefined schema.
     
+    The schema is built for the sample count and sample dtype of the dataframe, so forecasts
+    generated with a per-run sample count validate without changing global settings.
+    
     Args:
         forecast_df: Forecast dataframe to validate
+        sample_count: Optional expected number of sample columns for this run
         
     Returns:
         ValidationResult: Validation result indicating success or failure with error details
     """
     logger.info(f"Validating forecast dataframe with shape {forecast_df.shape} against schema")
     
+    # Check the number of sample columns against the run's sample count if one was given
+    actual_sample_count = get_sample_count(forecast_df)
+    if sample_count is not None and actual_sample_count != sample_count:
+        error_message = f"Expected {sample_count} sample columns, got {actual_sample_count}"
+        logger.error(f"Forecast schema validation failed: {error_message}")
+        return create_error_result(ValidationCategory.SCHEMA, {"samples": [error_message]})
+    
     # Validate the dataframe against the schema
-    is_valid, validation_errors = validate_dataframe(forecast_df, FORECAST_OUTPUT_SCHEMA)
+    is_valid, validation_errors = validate_dataframe(forecast_df, get_forecast_schema_for_dataframe(forecast_df))
     
     if is_valid:
         logger.info("Forecast schema validation successful")
@@ -161,10 +173,10 @@ class SchemaValidator:
         Initializes a SchemaValidator with the forecast output schema.
         
         Args:
-            schema: Optional custom schema to use instead of FORECAST_OUTPUT_SCHEMA
+            schema: Optional custom schema to use instead of the schema matching each dataframe's samples
             schema_version: Optional schema version to use instead of SCHEMA_VERSION
         """
-        self._schema = schema if schema is not None else FORECAST_OUTPUT_SCHEMA
+        self._schema = schema
         self._schema_version = schema_version if schema_version is not None else SCHEMA_VERSION
         logger.info(f"Initialized SchemaValidator with schema version {self._schema_version}")
     
@@ -181,7 +193,8 @@ class SchemaValidator:
         logger.info(f"Validating forecast dataframe with shape {forecast_df.shape}")
         
         # Validate the dataframe against the schema
-        is_valid, validation_errors = validate_dataframe(forecast_df, self._schema)
+        schema = self._schema if self._schema is not None else get_forecast_schema_for_dataframe(forecast_df)
+        is_valid, validation_errors = validate_dataframe(forecast_df, schema)
         
         if is_valid:
             logger.info("Forecast schema validation successful")
@@ -248,6 +261,7 @@ class SchemaValidator:
         Returns:
             Dict: Dictionary of schema requirements
         """
+        schema = self._schema if self._schema is not None else FORECAST_OUTPUT_SCHEMA
         requirements = {
             "version": self._schema_version,
             "columns": {},
@@ -255,7 +269,7 @@ class SchemaValidator:
         }
         
         # Extract column information
-        for col_name, col_schema in self._schema.columns.items():
+        for col_name, col_schema in schema.columns.items():
             requirements["columns"][col_name] = {
                 "dtype": str(col_schema.dtype),
                 "nullable": col_schema.nullable
@@ -283,8 +297,8 @@ class SchemaValidator:
         
         # Add schema properties
         requirements["properties"] = {
-            "strict": self._schema.strict,
-            "coerce": self._schema.coerce
+            "strict": schema.strict,
+            "coerce": schema.coerce
         }
         
         logger.debug(f"Generated schema requirements with {len(requirements['columns'])} columns")
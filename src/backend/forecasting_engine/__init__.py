@@ -1,60 +1,70 @@
 """
 Initialization file for the forecasting engine module of the Electricity Market Price Forecasting System.
 This module exports the core functionality for generating probabilistic price forecasts using linear models tailored to specific market products and hours.
+
+Submodules are imported lazily on first attribute access (PEP 562) so that importing the package,
+e.g. for a health check or ``--help``, does not pay for pandas, scipy and sklearn up front.
 """
 
-from .exceptions import (
-    ForecastingEngineError,
-    ModelSelectionError,
-    ModelExecutionError,
-    UncertaintyEstimationError,
-    SampleGenerationError,
-    ModelRegistryError,
-    InvalidFeatureError,
-    ForecastGenerationError,
-)
-from .model_registry import (
-    initialize_registry,
-    register_model,
-    get_model,
-    has_model,
-    list_available_models,
-    ModelRegistry,
-)
-from .linear_model import (
-    create_linear_model,
-    train_linear_model,
-    execute_linear_model,
-    get_model_coefficients,
-    evaluate_model,
-    LinearModelExecutor,
-)
-from .model_selector import (
-    select_model_for_product_hour,
-    validate_product_hour,
-    get_model_info,
-    is_model_available,
-    ModelSelector,
-)
-from .sample_generator import (
-    generate_samples,
-    create_probabilistic_forecast,
-    SampleGenerator,
-    generate_normal_samples,
-    generate_lognormal_samples,
-    generate_truncated_normal_samples,
-    generate_skewed_normal_samples,
-)
-from .uncertainty_estimator import (
-    estimate_uncertainty,
-    UncertaintyEstimator,
-    estimate_uncertainty_from_residuals,
-    estimate_uncertainty_from_percentage,
-    estimate_uncertainty_fixed,
-    estimate_uncertainty_adaptive,
-)
+import importlib
+import typing
+
 from ..utils.logging_utils import get_logger
 
+if typing.TYPE_CHECKING:
+    from .exceptions import (
+        ForecastingEngineError,
+        ModelSelectionError,
+        ModelExecutionError,
+        UncertaintyEstimationError,
+        SampleGenerationError,
+        ModelRegistryError,
+        InvalidFeatureError,
+        ForecastGenerationError,
+    )
+    from .model_registry import (
+        initialize_registry,
+        register_model,
+        get_model,
+        has_model,
+        list_available_models,
+        ModelRegistry,
+    )
+    from .linear_model import (
+        create_linear_model,
+        train_linear_model,
+        execute_linear_model,
+        get_model_coefficients,
+        evaluate_model,
+        LinearModelExecutor,
+    )
+    from .model_selector import (
+        select_model_for_product_hour,
+        validate_product_hour,
+        get_model_info,
+        is_model_available,
+        ModelSelector,
+    )
+    from .sample_generator import (
+        generate_samples,
+        create_probabilistic_forecast,
+        SampleGenerator,
+        generate_normal_samples,
+        generate_lognormal_samples,
+        generate_truncated_normal_samples,
+        generate_skewed_normal_samples,
+        generate_quantile_samples,
+        SAMPLING_MODES,
+    )
+    from .uncertainty_estimator import (
+        estimate_uncertainty,
+        UncertaintyEstimator,
+        estimate_uncertainty_from_residuals,
+        estimate_uncertainty_from_percentage,
+        estimate_uncertainty_fixed,
+        estimate_uncertainty_adaptive,
+    )
+
 # Initialize logger
 logger = get_logger(__name__)
 
@@ -95,10 +105,93 @@ __all__ = [
     "generate_lognormal_samples",
     "generate_truncated_normal_samples",
     "generate_skewed_normal_samples",
+    "generate_quantile_samples",
+    "SAMPLING_MODES",
     "estimate_uncertainty",
     "UncertaintyEstimator",
     "estimate_uncertainty_from_residuals",
     "estimate_uncertainty_from_percentage",
     "estimate_uncertainty_fixed",
     "estimate_uncertainty_adaptive",
-]
\ No newline at end of file
+]
+
+# Mapping of exported names to the submodule that defines them
+_LAZY_IMPORTS = {
+    "ForecastingEngineError": ".exceptions",
+    "ModelSelectionError": ".exceptions",
+    "ModelExecutionError": ".exceptions",
+    "UncertaintyEstimationError": ".exceptions",
+    "SampleGenerationError": ".exceptions",
+    "ModelRegistryError": ".exceptions",
+    "InvalidFeatureError": ".exceptions",
+    "ForecastGenerationError": ".exceptions",
+
+    "initialize_registry": ".model_registry",
+    "register_model": ".model_registry",
+    "get_model": ".model_registry",
+    "has_model": ".model_registry",
+    "list_available_models": ".model_registry",
+    "ModelRegistry": ".model_registry",
+
+    "create_linear_model": ".linear_model",
+    "train_linear_model": ".linear_model",
+    "execute_linear_model": ".linear_model",
+    "get_model_coefficients": ".linear_model",
+    "evaluate_model": ".linear_model",
+    "LinearModelExecutor": ".linear_model",
+
+    "select_model_for_product_hour": ".model_selector",
+    "validate_product_hour": ".model_selector",
+    "get_model_info": ".model_selector",
+    "is_model_available": ".model_selector",
+    "ModelSelector": ".model_selector",
+
+    "generate_samples": ".sample_generator",
+    "create_probabilistic_forecast": ".sample_generator",
+    "SampleGenerator": ".sample_generator",
+    "generate_normal_samples": ".sample_generator",
+    "generate_lognormal_samples": ".sample_generator",
+    "generate_truncated_normal_samples": ".sample_generator",
+    "generate_skewed_normal_samples": ".sample_generator",
+    "generate_quantile_samples": ".sample_generator",
+    "SAMPLING_MODES": ".sample_generator",
+
+    "estimate_uncertainty": ".uncertainty_estimator",
+    "UncertaintyEstimator": ".uncertainty_estimator",
+    "estimate_uncertainty_from_residuals": ".uncertainty_estimator",
+    "estimate_uncertainty_from_percentage": ".uncertainty_estimator",
+    "estimate_uncertainty_fixed": ".uncertainty_estimator",
+    "estimate_uncertainty_adaptive": ".uncertainty_estimator",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Imports the submodule defining an exported name on first access and caches the attribute.
+    
+    Args:
+        name: Attribute name being looked up on the package
+        
+    Returns:
+        The exported object
+        
+    Raises:
+        AttributeError: If the name is not exported by the package
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    """
+    Lists module attributes including lazily exported names.
+    
+    Returns:
+        List of attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
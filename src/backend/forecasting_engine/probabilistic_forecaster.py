@@ -15,11 +15,11 @@ from .exceptions import ForecastGenerationError, ModelExecutionError, Uncertaint
 from .model_selector import select_model_for_product_hour
 from .linear_model import execute_linear_model
 from .uncertainty_estimator import estimate_uncertainty
-from .sample_generator import generate_samples, create_probabilistic_forecast
+from .sample_generator import generate_samples, create_probabilistic_forecast, DEFAULT_SAMPLING_MODE, SAMPLING_MODES
 from ..utils.logging_utils import get_logger, log_execution_time
 from ..utils.decorators import memoize, log_exceptions
 from ..models.forecast_models import ProbabilisticForecast, ForecastEnsemble
-from ..config.settings import FORECAST_PRODUCTS, FORECAST_HORIZON_HOURS
+from ..config.settings import FORECAST_PRODUCTS, FORECAST_HORIZON_HOURS, PROBABILISTIC_SAMPLE_COUNT
 
 # Global logger
 logger = get_logger(__name__)
@@ -40,7 +40,9 @@ def generate_probabilistic_forecast(
     historical_data: Dict,
     timestamp: datetime,
     uncertainty_method: str = DEFAULT_UNCERTAINTY_METHOD,
-    distribution_type: str = DEFAULT_DISTRIBUTION_TYPE
+    distribution_type: str = DEFAULT_DISTRIBUTION_TYPE,
+    sampling_mode: str = DEFAULT_SAMPLING_MODE,
+    sample_count: int = PROBABILISTIC_SAMPLE_COUNT
 ) -> ProbabilisticForecast:
     """Main function to generate a probabilistic forecast for a specific product and hour
 
@@ -52,6 +54,8 @@ def generate_probabilistic_forecast(
         timestamp (datetime): Forecast timestamp
         uncertainty_method (str): Uncertainty estimation method
         distribution_type (str): Distribution type for sample generation
+        sampling_mode (str): Sampling mode for sample generation
+        sample_count (int): Number of probabilistic samples per forecast
 
     Returns:
         ProbabilisticForecast: Probabilistic forecast for the specified product and hour
@@ -77,7 +81,9 @@ def generate_probabilistic_forecast(
 
         # 5. Generate probabilistic samples
         logger.debug(f"Generating samples for {product} at hour {hour}")
-        samples = generate_samples(point_forecast, uncertainty_params, product, hour, distribution_type=distribution_type)
+        samples = generate_samples(point_forecast, uncertainty_params, product, hour,
+                                   distribution_type=distribution_type, sampling_mode=sampling_mode,
+                                   sample_count=sample_count)
 
         # 6. Create ProbabilisticForecast object
         logger.debug(f"Creating ProbabilisticForecast object for {product} at hour {hour}")
@@ -100,7 +106,9 @@ def generate_forecast_ensemble(
     historical_data: Dict,
     start_time: datetime,
     uncertainty_method: str = DEFAULT_UNCERTAINTY_METHOD,
-    distribution_type: str = DEFAULT_DISTRIBUTION_TYPE
+    distribution_type: str = DEFAULT_DISTRIBUTION_TYPE,
+    sampling_mode: str = DEFAULT_SAMPLING_MODE,
+    sample_count: int = PROBABILISTIC_SAMPLE_COUNT
 ) -> ForecastEnsemble:
     """Generate a complete ensemble of forecasts for a product over the forecast horizon
 
@@ -111,6 +119,8 @@ def generate_forecast_ensemble(
         start_time (datetime): Start time for the forecast horizon
         uncertainty_method (str): Uncertainty estimation method
         distribution_type (str): Distribution type for sample generation
+        sampling_mode (str): Sampling mode for sample generation
+        sample_count (int): Number of probabilistic samples per forecast
 
     Returns:
         ForecastEnsemble: Ensemble of forecasts covering the forecast horizon
@@ -137,7 +147,9 @@ def generate_forecast_ensemble(
                 historical_data=historical_data,
                 timestamp=current_time,
                 uncertainty_method=uncertainty_method,
-                distribution_type=distribution_type
+                distribution_type=distribution_type,
+                sampling_mode=sampling_mode,
+                sample_count=sample_count
             )
 
             # 6. Append forecast to the list
@@ -233,7 +245,10 @@ class ProbabilisticForecaster:
         # 3. Initialize distribution types dictionary with default type
         self._distribution_types: Dict = {}
 
-        # 4. Set up logger for the class
+        # 4. Initialize sampling modes dictionary with default mode
+        self._sampling_modes: Dict = {}
+
+        # 5. Set up logger for the class
         self.logger = get_logger(__name__)
 
     @log_execution_time
@@ -268,9 +283,10 @@ class ProbabilisticForecaster:
             self.logger.debug(f"Returning cached forecast for {product} at hour {hour}")
             return self._forecast_cache[cache_key]
 
-        # 3. Get uncertainty method and distribution type for this product
+        # 3. Get uncertainty method, distribution type and sampling mode for this product
         uncertainty_method = self.get_uncertainty_method(product)
         distribution_type = self.get_distribution_type(product)
+        sampling_mode = self.get_sampling_mode(product)
 
         # 4. Generate forecast using generate_probabilistic_forecast
         forecast = generate_probabilistic_forecast(
@@ -280,7 +296,8 @@ class ProbabilisticForecaster:
             historical_data=historical_data,
             timestamp=timestamp,
             uncertainty_method=uncertainty_method,
-            distribution_type=distribution_type
+            distribution_type=distribution_type,
+            sampling_mode=sampling_mode
         )
 
         # 5. If use_cache is True, store forecast in cache
@@ -299,7 +316,8 @@ class ProbabilisticForecaster:
         features: pandas.DataFrame,
         historical_data: Dict,
         start_time: datetime,
-        use_cache: bool = True
+        use_cache: bool = True,
+        sample_count: int = PROBABILISTIC_SAMPLE_COUNT
     ) -> ForecastEnsemble:
         """Generates a complete ensemble of forecasts for a product
 
@@ -309,13 +327,15 @@ class ProbabilisticForecaster:
             historical_data (Dict): Historical data
             start_time (datetime): Start time for the forecast horizon
             use_cache (bool): Whether to use the cache
+            sample_count (int): Number of probabilistic samples per forecast
 
         Returns:
             ForecastEnsemble: Ensemble of forecasts covering the forecast horizon
         """
-        # 1. Get uncertainty method and distribution type for this product
+        # 1. Get uncertainty method, distribution type and sampling mode for this product
         uncertainty_method = self.get_uncertainty_method(product)
         distribution_type = self.get_distribution_type(product)
+        sampling_mode = self.get_sampling_mode(product)
 
         # 2. Generate ensemble using generate_forecast_ensemble
         ensemble = generate_forecast_ensemble(
@@ -324,7 +344,9 @@ class ProbabilisticForecaster:
             historical_data=historical_data,
             start_time=start_time,
             uncertainty_method=uncertainty_method,
-            distribution_type=distribution_type
+            distribution_type=distribution_type,
+            sampling_mode=sampling_mode,
+            sample_count=sample_count
         )
 
         # 3. Return the generated ensemble
@@ -364,6 +386,27 @@ class ProbabilisticForecaster:
         # 3. Log registration of distribution type for product
         self.logger.info(f"Registered distribution type '{distribution_type}' for product {product}")
 
+    def register_sampling_mode(self, product: str, sampling_mode: str) -> None:
+        """Registers a specific sampling mode for a product
+
+        Args:
+            product (str): The price product
+            sampling_mode (str): The sampling mode
+        """
+        # 1. Validate that product is in FORECAST_PRODUCTS
+        if product not in FORECAST_PRODUCTS:
+            raise ValueError(f"Invalid product: {product}. Must be one of {FORECAST_PRODUCTS}")
+
+        # 2. Validate that sampling mode is supported
+        if sampling_mode not in SAMPLING_MODES:
+            raise ValueError(f"Invalid sampling mode: {sampling_mode}. Must be one of {SAMPLING_MODES}")
+
+        # 3. Store sampling mode for the product in sampling_modes dictionary
+        self._sampling_modes[product] = sampling_mode
+
+        # 4. Log registration of sampling mode for product
+        self.logger.info(f"Registered sampling mode '{sampling_mode}' for product {product}")
+
     def get_uncertainty_method(self, product: str) -> str:
         """Gets the uncertainty method for a specific product
 
@@ -396,6 +439,22 @@ class ProbabilisticForecaster:
         # 2. Otherwise return DEFAULT_DISTRIBUTION_TYPE
         return DEFAULT_DISTRIBUTION_TYPE
 
+    def get_sampling_mode(self, product: str) -> str:
+        """Gets the sampling mode for a specific product
+
+        Args:
+            product (str): The price product
+
+        Returns:
+            str: Sampling mode for the product
+        """
+        # 1. Return mode from sampling_modes dictionary if present
+        if product in self._sampling_modes:
+            return self._sampling_modes[product]
+
+        # 2. Otherwise return DEFAULT_SAMPLING_MODE
+        return DEFAULT_SAMPLING_MODE
+
     def clear_cache(self) -> None:
         """Clears the forecast cache"""
         # 1. Clear the forecast_cache dictionary
@@ -4,8 +4,10 @@ This module is responsible for generating sample-based probabilistic forecasts f
 parameters, which is a critical component of the system's probabilistic forecasting capability.
 """
 
+import warnings
 import numpy as np  # version: 1.24.0
 import scipy.stats  # version: 1.10.0
+from scipy.stats import qmc  # version: 1.10.0
 from typing import List, Dict, Optional, Union, Tuple
 from datetime import datetime
 
@@ -14,11 +16,36 @@ from .exceptions import SampleGenerationError
 from ..utils.logging_utils import get_logger, log_execution_time
 from ..utils.decorators import validate_input
 from ..models.forecast_models import ProbabilisticForecast
-from ..config.settings import PROBABILISTIC_SAMPLE_COUNT, FORECAST_PRODUCTS
+from ..config.settings import PROBABILISTIC_SAMPLE_COUNT, PROBABILISTIC_SAMPLING_MODE, FORECAST_PRODUCTS
 
 # Global logger
 logger = get_logger(__name__)
 
+def get_degenerate_value(distribution_type: str, point_forecast: float, uncertainty_params: Dict) -> Optional[float]:
+    """
+    Returns the single value of a distribution without spread, or None if it has spread.
+    
+    A zero standard deviation (e.g. the default of 10% of a zero point forecast) or a zero
+    coefficient of variation makes the scipy distributions return NaN, so callers return
+    this value for every sample instead.
+    
+    Args:
+        distribution_type: Name of a built-in distribution type
+        point_forecast: The point forecast value
+        uncertainty_params: Dictionary containing uncertainty parameters
+    
+    Returns:
+        The value all samples take, or None if the distribution has spread
+    """
+    if distribution_type == "lognormal":
+        if uncertainty_params.get('coefficient_of_variation', 0.1) <= 0:
+            return max(0.01, point_forecast)
+        return None
+    
+    if uncertainty_params.get('std_dev', 0.1 * abs(point_forecast)) <= 0:
+        return point_forecast
+    return None
+
 def generate_normal_samples(point_forecast: float, uncertainty_params: Dict, sample_count: int) -> List[float]:
     """
     Generates samples from a normal distribution.
@@ -31,6 +58,10 @@ def generate_normal_samples(point_forecast: float, uncertainty_params: Dict, sam
     Returns:
         List of samples from normal distribution
     """
+    constant = get_degenerate_value("normal", point_forecast, uncertainty_params)
+    if constant is not None:
+        return np.full(sample_count, constant, dtype=float).tolist()
+    
     # Extract standard deviation from uncertainty_params
     std_dev = uncertainty_params.get('std_dev', 0.1 * abs(point_forecast))
     
@@ -51,6 +82,10 @@ def generate_lognormal_samples(point_forecast: float, uncertainty_params: Dict,
     Returns:
         List of samples from lognormal distribution
     """
+    constant = get_degenerate_value("lognormal", point_forecast, uncertainty_params)
+    if constant is not None:
+        return np.full(sample_count, constant, dtype=float).tolist()
+    
     # Extract parameters or use defaults
     # For lognormal, we need to convert the parameters
     cv = uncertainty_params.get('coefficient_of_variation', 0.1)
@@ -85,6 +120,10 @@ def generate_truncated_normal_samples(point_forecast: float, uncertainty_params:
     Returns:
         List of samples from truncated normal distribution
     """
+    constant = get_degenerate_value("truncated_normal", point_forecast, uncertainty_params)
+    if constant is not None:
+        return np.full(sample_count, constant, dtype=float).tolist()
+    
     # Extract parameters
     std_dev = uncertainty_params.get('std_dev', 0.1 * abs(point_forecast))
     lower_bound = uncertainty_params.get('lower_bound', point_forecast - 3 * std_dev)
@@ -111,6 +150,10 @@ def generate_skewed_normal_samples(point_forecast: float, uncertainty_params: Di
     Returns:
         List of samples from skewed normal distribution
     """
+    constant = get_degenerate_value("skewed_normal", point_forecast, uncertainty_params)
+    if constant is not None:
+        return np.full(sample_count, constant, dtype=float).tolist()
+    
     # Extract parameters
     std_dev = uncertainty_params.get('std_dev', 0.1 * abs(point_forecast))
     skewness = uncertainty_params.get('skewness', 0)  # 0 means no skew
@@ -120,6 +163,126 @@ def generate_skewed_normal_samples(point_forecast: float, uncertainty_params: Di
     
     return samples.tolist()
 
+def get_frozen_distribution(distribution_type: str, point_forecast: float,
+                            uncertainty_params: Dict) -> scipy.stats.rv_continuous:
+    """
+    Builds a frozen scipy distribution matching one of the built-in distribution types.
+    
+    The parameterisation mirrors the corresponding generate_*_samples function so that
+    quantile-based sampling modes draw from exactly the same fitted distribution. A
+    distribution without spread (see get_degenerate_value) is returned as a point mass at
+    its value.
+    
+    Args:
+        distribution_type: Name of a built-in distribution type
+        point_forecast: The point forecast value
+        uncertainty_params: Dictionary containing uncertainty parameters
+    
+    Returns:
+        Frozen scipy.stats distribution exposing a ppf method
+    
+    Raises:
+        ValueError: If the distribution type has no quantile function
+    """
+    constant = get_degenerate_value(distribution_type, point_forecast, uncertainty_params)
+    if constant is not None and distribution_type in DISTRIBUTION_TYPES:
+        return scipy.stats.rv_discrete(values=([constant], [1.0]))
+    
+    if distribution_type == "normal":
+        std_dev = uncertainty_params.get('std_dev', 0.1 * abs(point_forecast))
+        return scipy.stats.norm(loc=point_forecast, scale=std_dev)
+    
+    if distribution_type == "lognormal":
+        cv = uncertainty_params.get('coefficient_of_variation', 0.1)
+        point_forecast = max(0.01, point_forecast)
+        sigma = np.sqrt(np.log(1 + cv**2))
+        mu = np.log(point_forecast) - sigma**2 / 2
+        return scipy.stats.lognorm(s=sigma, scale=np.exp(mu))
+    
+    if distribution_type == "truncated_normal":
+        std_dev = uncertainty_params.get('std_dev', 0.1 * abs(point_forecast))
+        lower_bound = uncertainty_params.get('lower_bound', point_forecast - 3 * std_dev)
+        upper_bound = uncertainty_params.get('upper_bound', point_forecast + 3 * std_dev)
+        a = (lower_bound - point_forecast) / std_dev
+        b = (upper_bound - point_forecast) / std_dev
+        return scipy.stats.truncnorm(a, b, loc=point_forecast, scale=std_dev)
+    
+    if distribution_type == "skewed_normal":
+        std_dev = uncertainty_params.get('std_dev', 0.1 * abs(point_forecast))
+        skewness = uncertainty_params.get('skewness', 0)
+        return scipy.stats.skewnorm(a=skewness, loc=point_forecast, scale=std_dev)
+    
+    raise ValueError(f"Distribution type '{distribution_type}' does not support quantile sampling")
+
+def generate_uniform_points(sample_count: int, sampling_mode: str) -> np.ndarray:
+    """
+    Generates points in the open unit interval for quantile-based sampling.
+    
+    Args:
+        sample_count: Number of points to generate
+        sampling_mode: One of 'antithetic', 'sobol', 'halton' or 'stratified'
+    
+    Returns:
+        Array of sample_count points in (0, 1)
+    
+    Raises:
+        ValueError: If the sampling mode is not a quantile-based mode
+    """
+    if sampling_mode == "stratified":
+        # Midpoints of sample_count equal-probability strata, shuffled so that
+        # sample columns do not become perfectly correlated across hours
+        points = (np.arange(sample_count) + 0.5) / sample_count
+        points = np.random.permutation(points)
+    elif sampling_mode == "antithetic":
+        half = np.random.uniform(size=sample_count // 2)
+        points = np.concatenate([half, 1.0 - half])
+        if sample_count % 2:
+            points = np.append(points, 0.5)
+        points = np.random.permutation(points)
+    elif sampling_mode in ("sobol", "halton"):
+        seed = np.random.randint(0, 2**31 - 1)
+        if sampling_mode == "sobol":
+            sampler = qmc.Sobol(d=1, scramble=True, seed=seed)
+        else:
+            sampler = qmc.Halton(d=1, scramble=True, seed=seed)
+        with warnings.catch_warnings():
+            # Sobol balance properties warn for non power-of-two counts
+            warnings.simplefilter("ignore", UserWarning)
+            points = sampler.random(sample_count).ravel()
+    else:
+        raise ValueError(f"Invalid sampling mode: {sampling_mode}. Must be one of {SAMPLING_MODES}")
+    
+    # Keep strictly inside (0, 1) so the quantile function stays finite
+    eps = np.finfo(float).eps
+    return np.clip(points, eps, 1.0 - eps)
+
+def generate_quantile_samples(point_forecast: float, uncertainty_params: Dict, sample_count: int,
+                              distribution_type: str = "normal", sampling_mode: str = "stratified") -> List[float]:
+    """
+    Generates variance-reduced samples by mapping unit-interval points through the inverse CDF.
+    
+    Low-discrepancy (Sobol/Halton), antithetic and stratified points cover the distribution
+    far more evenly than independent draws, so percentiles estimated from the samples are
+    accurate with considerably fewer samples.
+    
+    Args:
+        point_forecast: The point forecast value
+        uncertainty_params: Dictionary containing uncertainty parameters
+        sample_count: Number of samples to generate
+        distribution_type: Built-in distribution type to sample from
+        sampling_mode: Quantile-based sampling mode
+    
+    Returns:
+        List of samples from the requested distribution
+    """
+    constant = get_degenerate_value(distribution_type, point_forecast, uncertainty_params)
+    if constant is not None:
+        return np.full(sample_count, constant, dtype=float).tolist()
+    
+    distribution = get_frozen_distribution(distribution_type, point_forecast, uncertainty_params)
+    points = generate_uniform_points(sample_count, sampling_mode)
+    return distribution.ppf(points).tolist()
+
 def apply_product_constraints(samples: List[float], product: str) -> List[float]:
     """
     Applies product-specific constraints to samples.
@@ -265,10 +428,18 @@ DISTRIBUTION_TYPES = {
 # Default distribution type
 DEFAULT_DISTRIBUTION_TYPE = "normal"
 
+# Supported sampling modes; 'random' draws independent samples, the others are quantile based
+SAMPLING_MODES = ["random", "antithetic", "sobol", "halton", "stratified"]
+
+# Default sampling mode
+DEFAULT_SAMPLING_MODE = PROBABILISTIC_SAMPLING_MODE if PROBABILISTIC_SAMPLING_MODE in SAMPLING_MODES else "random"
+
 @log_execution_time
 @validate_input([validate_point_forecast, validate_uncertainty_params, validate_product])
 def generate_samples(point_forecast: float, uncertainty_params: Dict, product: str, 
-                    hour: int, distribution_type: str = DEFAULT_DISTRIBUTION_TYPE) -> List[float]:
+                    hour: int, distribution_type: str = DEFAULT_DISTRIBUTION_TYPE,
+                    sampling_mode: str = DEFAULT_SAMPLING_MODE,
+                    sample_count: int = PROBABILISTIC_SAMPLE_COUNT) -> List[float]:
     """
     Main function to generate probabilistic samples from a point forecast and uncertainty parameters.
     
@@ -278,6 +449,8 @@ def generate_samples(point_forecast: float, uncertainty_params: Dict, product: s
         product: Price product identifier
         hour: Target hour
         distribution_type: Type of distribution to use (default: 'normal')
+        sampling_mode: Sampling mode to use (default: from settings)
+        sample_count: Number of samples to generate (default: from settings)
     
     Returns:
         List of probabilistic samples
@@ -290,11 +463,16 @@ def generate_samples(point_forecast: float, uncertainty_params: Dict, product: s
             logger.warning(f"Distribution type {distribution_type} not found, using {DEFAULT_DISTRIBUTION_TYPE}")
             distribution_type = DEFAULT_DISTRIBUTION_TYPE
         
-        # Get the corresponding generator function
-        generator_func = DISTRIBUTION_TYPES[distribution_type]
+        if sampling_mode not in SAMPLING_MODES:
+            raise ValueError(f"Invalid sampling mode: {sampling_mode}. Must be one of {SAMPLING_MODES}")
         
         # Generate samples
-        samples = generator_func(point_forecast, uncertainty_params, PROBABILISTIC_SAMPLE_COUNT)
+        if sampling_mode == "random":
+            generator_func = DISTRIBUTION_TYPES[distribution_type]
+            samples = generator_func(point_forecast, uncertainty_params, sample_count)
+        else:
+            samples = generate_quantile_samples(point_forecast, uncertainty_params, sample_count,
+                                                distribution_type, sampling_mode)
         
         # Apply product-specific constraints
         constrained_samples = apply_product_constraints(samples, product)
@@ -337,14 +515,18 @@ class SampleGenerator:
         
         # Set up logger
         self.logger = get_logger(f"{__name__}.SampleGenerator")
-        self.logger.info("SampleGenerator initialized")
+        self.logger.debug("SampleGenerator initialized")
     
     def generate_samples(self, point_forecast: float, uncertainty_params: Dict, product: str, 
                          hour: int, distribution_type: str = DEFAULT_DISTRIBUTION_TYPE, 
-                         sample_count: int = PROBABILISTIC_SAMPLE_COUNT) -> List[float]:
+                         sample_count: int = PROBABILISTIC_SAMPLE_COUNT,
+                         sampling_mode: str = DEFAULT_SAMPLING_MODE) -> List[float]:
         """
         Generates probabilistic samples for a given point forecast.
         
+        Quantile-based sampling modes are only available for the built-in distributions;
+        custom registered distributions always fall back to 'random' sampling.
+        
         Args:
             point_forecast: The point forecast value
             uncertainty_params: Dictionary containing uncertainty parameters
@@ -352,6 +534,7 @@ class SampleGenerator:
             hour: Target hour
             distribution_type: Type of distribution to use (default: 'normal')
             sample_count: Number of samples to generate (default: from settings)
+            sampling_mode: Sampling mode to use (default: from settings)
         
         Returns:
             List of probabilistic samples
@@ -367,16 +550,29 @@ class SampleGenerator:
             if not validate_product(product):
                 raise ValueError(f"Invalid product: {product}")
             
+            if sampling_mode not in SAMPLING_MODES:
+                raise ValueError(f"Invalid sampling mode: {sampling_mode}. Must be one of {SAMPLING_MODES}")
+            
             # Get the distribution function
             try:
                 distribution_func = self.get_distribution(distribution_type)
             except SampleGenerationError:
                 self.logger.warning(f"Distribution {distribution_type} not found, using {DEFAULT_DISTRIBUTION_TYPE}")
+                distribution_type = DEFAULT_DISTRIBUTION_TYPE
                 distribution_func = self.get_distribution(DEFAULT_DISTRIBUTION_TYPE)
             
+            # Only built-in distributions expose a quantile function
+            if sampling_mode != "random" and distribution_func is not DISTRIBUTION_TYPES.get(distribution_type):
+                self.logger.warning(f"Distribution {distribution_type} does not support {sampling_mode} sampling, using random")
+                sampling_mode = "random"
+            
             # Generate samples
-            self.logger.debug(f"Generating {sample_count} samples for {product}, hour {hour}")
-            samples = distribution_func(point_forecast, uncertainty_params, sample_count)
+            self.logger.debug(f"Generating {sample_count} {sampling_mode} samples for {product}, hour {hour}")
+            if sampling_mode == "random":
+                samples = distribution_func(point_forecast, uncertainty_params, sample_count)
+            else:
+                samples = generate_quantile_samples(point_forecast, uncertainty_params, sample_count,
+                                                    distribution_type, sampling_mode)
             
             # Apply constraints
             constrained_samples = self.apply_constraints(samples, product)
@@ -423,7 +423,7 @@ class UncertaintyEstimator:
         
         # Set up logger
         self._logger = get_logger(f"{__name__}.UncertaintyEstimator")
-        self._logger.info("Initialized UncertaintyEstimator")
+        self._logger.debug("Initialized UncertaintyEstimator")
     
     def estimate_uncertainty(
         self,
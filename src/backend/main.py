@@ -1,24 +1,27 @@
 import argparse
 import datetime
+import json
 import sys
 import os
 import signal
-
-from flask import Flask, jsonify
+import time
+import typing
 
 # Internal imports
-from .pipeline.pipeline_executor import execute_forecasting_pipeline, get_default_config
-from .scheduler.forecast_scheduler import start_scheduler, stop_scheduler, schedule_forecast_job, run_forecast_now
-from .api.routes import api_blueprint
+# The pipeline, scheduler and API stacks (pandas, sklearn, APScheduler, Flask) are imported
+# inside the command that needs them so that `--help` and health probes start quickly.
 from .utils.logging_utils import get_logger, setup_logging
-from .config.settings import FORECAST_SCHEDULE_TIME, TIMEZONE, API_HOST, API_PORT
+from .config.settings import (
+    FORECAST_SCHEDULE_TIME, TIMEZONE, API_HOST, API_PORT, API_WORKERS, STORAGE_SCRUB_ENABLED,
+    FORECAST_PRODUCTS, BACKFILL_WORKERS, BACKFILL_CHUNK_DAYS
+)
+
+if typing.TYPE_CHECKING:
+    from flask import Flask
 
 # Initialize logger
 logger = get_logger(__name__)
 
-# Create a Flask application instance
-app = Flask(__name__)
-
 
 def main() -> int:
     """Main entry point for the application"""
@@ -36,6 +39,8 @@ def main() -> int:
             return start_scheduler_service(args)
         elif args.command == "serve":
             return start_api_server(args)
+        elif args.command == "backfill":
+            return run_backfill_command(args)
         else:
             logger.error("Invalid command")
             return 1
@@ -54,6 +59,8 @@ def parse_args() -> argparse.Namespace:
     run_parser = subparsers.add_parser("run", help="Run a forecast immediately")
     run_parser.add_argument("--target_date", type=str, help="Target date for the forecast (YYYY-MM-DD), defaults to current date")
     run_parser.add_argument("--config_file", type=str, help="Path to a custom pipeline configuration file")
+    run_parser.add_argument("--sample_count", type=int, help="Number of probabilistic samples per forecast for this run")
+    run_parser.add_argument("--sample_dtype", type=str, choices=["float64", "float32"], help="Storage dtype for sample columns")
 
     # Configure 'schedule' command for starting scheduler service
     schedule_parser = subparsers.add_parser("schedule", help="Start the scheduler service")
@@ -62,13 +69,38 @@ def parse_args() -> argparse.Namespace:
     serve_parser = subparsers.add_parser("serve", help="Start the API server")
     serve_parser.add_argument("--host", type=str, default=API_HOST, help="Host address for the API server")
     serve_parser.add_argument("--port", type=int, default=API_PORT, help="Port number for the API server")
+    serve_parser.add_argument("--production", action="store_true", help="Serve with the pre-fork multi-worker server instead of the Flask development server")
+    serve_parser.add_argument("--workers", type=int, default=API_WORKERS, help="Number of worker processes in production mode")
+    serve_parser.add_argument("--no_preload", action="store_true", help="Skip preloading shared state before forking workers")
+
+    # Configure 'backfill' command for regenerating historical forecasts
+    backfill_parser = subparsers.add_parser("backfill", help="Regenerate forecasts for a historical date range")
+    backfill_parser.add_argument("--start_date", type=str, required=True, help="First target date (YYYY-MM-DD)")
+    backfill_parser.add_argument("--end_date", type=str, required=True, help="Last target date (YYYY-MM-DD), inclusive")
+    backfill_parser.add_argument("--products", type=str, nargs="+", choices=FORECAST_PRODUCTS, help="Products to backfill, defaults to all products")
+    backfill_parser.add_argument("--config_file", type=str, help="Path to a custom pipeline configuration file")
+    backfill_parser.add_argument("--workers", type=int, default=BACKFILL_WORKERS, help="Number of worker processes generating forecasts")
+    backfill_parser.add_argument("--chunk_days", type=int, default=BACKFILL_CHUNK_DAYS, help="Target dates stored per index update")
+    backfill_parser.add_argument("--no_resume", action="store_true", help="Regenerate dates completed by an earlier run of the same backfill")
 
     # Parse and return command-line arguments
     return parser.parse_args()
 
 
+def create_app() -> "Flask":
+    """Create the Flask application with the API blueprint registered"""
+    from flask import Flask
+    from .api.routes import api_blueprint
+
+    app = Flask(__name__)
+    app.register_blueprint(api_blueprint)
+    return app
+
+
 def run_forecast(args: argparse.Namespace) -> int:
     """Run a forecast immediately"""
+    from .pipeline.pipeline_executor import execute_forecasting_pipeline, get_default_config
+
     logger.info("Starting immediate forecast execution")
 
     # Parse target date from args if provided, otherwise use current date
@@ -79,6 +111,12 @@ def run_forecast(args: argparse.Namespace) -> int:
     config_file = args.config_file
     config = load_config_from_file(config_file) if config_file else get_default_config()
 
+    # Apply per-run sampling overrides from args if provided
+    if args.sample_count is not None:
+        config.setdefault("sampling", {})["sample_count"] = args.sample_count
+    if args.sample_dtype is not None:
+        config.setdefault("storage", {})["sample_dtype"] = args.sample_dtype
+
     # Execute forecasting pipeline with target date and config
     results = execute_forecasting_pipeline(target_date, config)
 
@@ -86,8 +124,39 @@ def run_forecast(args: argparse.Namespace) -> int:
     return 0
 
 
+def run_backfill_command(args: argparse.Namespace) -> int:
+    """Regenerate forecasts for a historical date range"""
+    from .pipeline.backfill_runner import run_backfill
+
+    start_date = datetime.datetime.strptime(args.start_date, "%Y-%m-%d").date()
+    end_date = datetime.datetime.strptime(args.end_date, "%Y-%m-%d").date()
+    config = load_config_from_file(args.config_file) if args.config_file else None
+
+    logger.info(f"Starting backfill from {start_date} to {end_date}")
+    stats = run_backfill(
+        start_date,
+        end_date,
+        products=args.products,
+        config=config,
+        max_workers=args.workers,
+        chunk_days=args.chunk_days,
+        resume=not args.no_resume
+    )
+
+    # Failed dates are not checkpointed, so running the same command again retries them
+    if stats["failed_dates"]:
+        logger.error(f"Backfill failed for {len(stats['failed_dates'])} days, rerun to retry them: {sorted(stats['failed_dates'])}")
+        return 1
+
+    logger.info(f"Backfill completed successfully: {stats}")
+    return 0
+
+
 def start_scheduler_service(args: argparse.Namespace) -> int:
     """Start the scheduler service for automated forecasts"""
+    from .scheduler.forecast_scheduler import start_scheduler, stop_scheduler, schedule_forecast_job
+    from .storage.integrity_scrubber import start_scrubber, stop_scrubber
+
     logger.info("Starting scheduler service")
 
     # Register signal handlers for graceful shutdown
@@ -100,6 +169,10 @@ def start_scheduler_service(args: argparse.Namespace) -> int:
     # Schedule the daily forecast job at 7 AM CST
     schedule_forecast_job()
 
+    # Verify the stored forecasts against their checksums in the background
+    if STORAGE_SCRUB_ENABLED:
+        start_scrubber()
+
     # Keep the service running until interrupted
     try:
         while True:
@@ -107,6 +180,7 @@ def start_scheduler_service(args: argparse.Namespace) -> int:
     except KeyboardInterrupt:
         logger.info("Scheduler service interrupted by user")
     finally:
+        stop_scrubber()
         stop_scheduler("Scheduler service stopped")
 
     return 0
@@ -116,13 +190,20 @@ def start_api_server(args: argparse.Namespace) -> int:
     """Start the API server for forecast access"""
     logger.info("Starting API server")
 
-    # Register the API blueprint with the Flask app
-    app.register_blueprint(api_blueprint)
+    # Create the Flask app with the API blueprint registered
+    app = create_app()
 
     # Configure host and port from settings or command-line args
     host = args.host or API_HOST
     port = args.port or API_PORT
 
+    # Serve with pre-forked workers sharing preloaded state in production mode
+    if getattr(args, "production", False):
+        from .api.server import PreforkServer
+
+        server = PreforkServer(app, host=host, port=port, workers=args.workers, preload=not args.no_preload)
+        return server.serve_forever()
+
     # Start the Flask development server
     app.run(host=host, port=port, debug=True)
 
@@ -131,6 +212,8 @@ def start_api_server(args: argparse.Namespace) -> int:
 
 def signal_handler(signum: int, frame: object) -> None:
     """Handle termination signals for graceful shutdown"""
+    from .scheduler.forecast_scheduler import stop_scheduler
+
     logger.info(f"Received termination signal: {signum}")
     stop_scheduler(reason=f"Received termination signal {signum}")
     sys.exit(0)
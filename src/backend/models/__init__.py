@@ -14,7 +14,11 @@ from .data_models import (
     GenerationForecast,
     PriceForecast,
     create_empty_forecast_dataframe,
-    create_sample_columns
+    create_sample_columns,
+    get_sample_columns,
+    get_sample_count,
+    cast_sample_columns,
+    validate_sample_count
 )
 
 # Import validation models
@@ -50,6 +54,10 @@ __all__ = [
     'PriceForecast',
     'create_empty_forecast_dataframe',
     'create_sample_columns',
+    'get_sample_columns',
+    'get_sample_count',
+    'cast_sample_columns',
+    'validate_sample_count',
     
     # Validation models
     'ValidationResult',
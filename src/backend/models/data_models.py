@@ -8,46 +8,154 @@ and dataframe integration for consistent data handling.
 """
 
 import dataclasses  # standard library
+import re  # standard library
 from datetime import datetime  # standard library
-from typing import Dict, List, Any, Optional, Type, TypeVar, Union, cast  # standard library
+from typing import Dict, List, Any, Iterable, Optional, Type, TypeVar, Union, cast  # standard library
 
 import numpy as np  # version: 1.24.0
 import pandas as pd  # version: 2.0.0
 
-from ..config.settings import FORECAST_PRODUCTS, PROBABILISTIC_SAMPLE_COUNT
+from ..config.settings import (
+    FORECAST_PRODUCTS,
+    PROBABILISTIC_SAMPLE_COUNT,
+    MIN_PROBABILISTIC_SAMPLE_COUNT,
+    MAX_PROBABILISTIC_SAMPLE_COUNT,
+    SAMPLE_STORAGE_DTYPE
+)
 
 # Global constants
 SAMPLE_COLUMN_PREFIX = "sample_"
+SAMPLE_COLUMN_PATTERN = re.compile(rf"^{SAMPLE_COLUMN_PREFIX}(\d+)$")
+SAMPLE_DTYPES = ["float64", "float32"]
 
 # Type variable for BaseDataModel generic methods
 T = TypeVar('T', bound='BaseDataModel')
 
 
-def create_sample_columns(count: int) -> List[str]:
+def validate_sample_count(count: int) -> int:
     """
-    Creates column names for probabilistic samples.
+    Validates a per-run sample count against the configured bounds.
     
     Args:
-        count: Number of sample columns to create
+        count: Number of probabilistic samples per forecast
         
     Returns:
-        List of column names for samples in format 'sample_001', 'sample_002', etc.
+        The validated sample count
     
     Raises:
-        ValueError: If count doesn't match the configured PROBABILISTIC_SAMPLE_COUNT
+        ValueError: If count is not an integer within the configured bounds
     """
-    if count != PROBABILISTIC_SAMPLE_COUNT:
+    if isinstance(count, bool) or not isinstance(count, (int, np.integer)):
+        raise ValueError(f"Sample count must be an integer, got {type(count).__name__}")
+    
+    if not MIN_PROBABILISTIC_SAMPLE_COUNT <= count <= MAX_PROBABILISTIC_SAMPLE_COUNT:
         raise ValueError(
-            f"Sample count {count} does not match configured count {PROBABILISTIC_SAMPLE_COUNT}"
+            f"Sample count {count} must be between {MIN_PROBABILISTIC_SAMPLE_COUNT} "
+            f"and {MAX_PROBABILISTIC_SAMPLE_COUNT}"
         )
     
+    return int(count)
+
+
+def validate_sample_dtype(dtype: str) -> str:
+    """
+    Validates a storage dtype for sample columns.
+    
+    Args:
+        dtype: Name of the dtype, 'float64' or 'float32'
+        
+    Returns:
+        The validated dtype name
+    
+    Raises:
+        ValueError: If dtype is not supported
+    """
+    if dtype not in SAMPLE_DTYPES:
+        raise ValueError(f"Invalid sample dtype: {dtype}. Must be one of {SAMPLE_DTYPES}")
+    
+    return dtype
+
+
+def create_sample_columns(count: int = PROBABILISTIC_SAMPLE_COUNT) -> List[str]:
+    """
+    Creates column names for probabilistic samples.
+    
+    Args:
+        count: Number of sample columns to create (default: from settings)
+        
+    Returns:
+        List of column names for samples in format 'sample_001', 'sample_002', etc.
+    
+    Raises:
+        ValueError: If count is not a positive integer
+    """
+    if isinstance(count, bool) or not isinstance(count, (int, np.integer)) or count < 1:
+        raise ValueError(f"Sample count must be a positive integer, got {count}")
+    
     return [f"{SAMPLE_COLUMN_PREFIX}{i:03d}" for i in range(1, count + 1)]
 
 
-def create_empty_forecast_dataframe() -> pd.DataFrame:
+def get_sample_columns(columns: Iterable[str]) -> List[str]:
+    """
+    Identifies sample columns among column names, ordered by sample number.
+    
+    Args:
+        columns: Column names, e.g. DataFrame.columns or Series.index
+        
+    Returns:
+        List of sample column names in sample order
+    """
+    matches = []
+    for column in columns:
+        match = SAMPLE_COLUMN_PATTERN.match(str(column))
+        if match:
+            matches.append((int(match.group(1)), column))
+    
+    return [column for _, column in sorted(matches)]
+
+
+def get_sample_count(df: pd.DataFrame) -> int:
+    """
+    Gets the number of probabilistic samples stored in a forecast dataframe.
+    
+    Args:
+        df: Forecast dataframe with sample columns
+        
+    Returns:
+        Number of sample columns
+    """
+    return len(get_sample_columns(df.columns))
+
+
+def cast_sample_columns(df: pd.DataFrame, dtype: str = SAMPLE_STORAGE_DTYPE) -> pd.DataFrame:
+    """
+    Casts the sample columns of a forecast dataframe to the given float dtype.
+    
+    Args:
+        df: Forecast dataframe with sample columns
+        dtype: Target dtype for sample columns (default: from settings)
+        
+    Returns:
+        DataFrame with sample columns cast to dtype
+    """
+    validate_sample_dtype(dtype)
+    
+    sample_columns = get_sample_columns(df.columns)
+    if not sample_columns or all(df[col].dtype == dtype for col in sample_columns):
+        return df
+    
+    return df.astype({col: dtype for col in sample_columns})
+
+
+def create_empty_forecast_dataframe(sample_count: int = PROBABILISTIC_SAMPLE_COUNT,
+                                    sample_dtype: str = SAMPLE_STORAGE_DTYPE) -> pd.DataFrame:
     """
     Creates an empty forecast dataframe with the correct structure.
     
+    Args:
+        sample_count: Number of sample columns (default: from settings)
+        sample_dtype: Dtype of sample columns (default: from settings)
+    
     Returns:
         Empty DataFrame with forecast structure including timestamps, product,
         point forecast, samples, and metadata columns.
@@ -60,7 +168,7 @@ def create_empty_forecast_dataframe() -> pd.DataFrame:
     ]
     
     # Add sample columns
-    sample_columns = create_sample_columns(PROBABILISTIC_SAMPLE_COUNT)
+    sample_columns = create_sample_columns(sample_count)
     columns.extend(sample_columns)
     
     # Add metadata columns
@@ -80,7 +188,7 @@ def create_empty_forecast_dataframe() -> pd.DataFrame:
     
     # Set sample columns to float type
     for col in sample_columns:
-        df[col] = df[col].astype('float64')
+        df[col] = df[col].astype(validate_sample_dtype(sample_dtype))
     
     return df
 
@@ -229,15 +337,12 @@ class PriceForecast(BaseDataModel):
         Validates the price forecast data after initialization.
         
         Raises:
-            ValueError: If product is invalid or sample count is incorrect
+            ValueError: If product is invalid or sample count is outside the configured bounds
         """
         if self.product not in FORECAST_PRODUCTS:
             raise ValueError(f"Invalid product: {self.product}. Must be one of {FORECAST_PRODUCTS}")
         
-        if len(self.samples) != PROBABILISTIC_SAMPLE_COUNT:
-            raise ValueError(
-                f"Sample count {len(self.samples)} does not match required count {PROBABILISTIC_SAMPLE_COUNT}"
-            )
+        validate_sample_count(len(self.samples))
     
     def to_dataframe_row(self) -> Dict[str, Any]:
         """
@@ -281,7 +386,7 @@ class PriceForecast(BaseDataModel):
         is_fallback = row['is_fallback']
         
         # Extract samples from sample columns
-        sample_columns = create_sample_columns(PROBABILISTIC_SAMPLE_COUNT)
+        sample_columns = get_sample_columns(row.index)
         samples = [row[col] for col in sample_columns]
         
         return cls(
@@ -13,9 +13,9 @@ import logging  # standard library
 import pandas as pd  # version: 2.0.0
 import numpy as np  # version: 1.24.0
 
-from .data_models import PriceForecast, create_sample_columns
+from .data_models import PriceForecast, get_sample_columns, validate_sample_count
 from .validation_models import ValidationResult
-from ..config.settings import FORECAST_PRODUCTS, PROBABILISTIC_SAMPLE_COUNT
+from ..config.settings import FORECAST_PRODUCTS
 
 # Standard confidence levels for forecast intervals
 CONFIDENCE_LEVELS = [0.5, 0.8, 0.9, 0.95, 0.99]
@@ -213,13 +213,15 @@ def forecasts_from_dataframe(df: pd.DataFrame) -> List['ProbabilisticForecast']:
     
     # Check for required columns
     required_columns = ['timestamp', 'product', 'point_forecast', 'generation_timestamp', 'is_fallback']
-    sample_columns = create_sample_columns(PROBABILISTIC_SAMPLE_COUNT)
-    required_columns.extend(sample_columns)
     
     missing_columns = [col for col in required_columns if col not in df.columns]
     if missing_columns:
         raise ValueError(f"DataFrame missing required columns: {missing_columns}")
     
+    # Sample count is a per-run parameter, so take it from the dataframe itself
+    if not get_sample_columns(df.columns):
+        raise ValueError("DataFrame has no sample columns")
+    
     # Create forecast objects
     forecasts = []
     for _, row in df.iterrows():
@@ -247,17 +249,11 @@ class ProbabilisticForecast(PriceForecast):
         Validates sample count and calculates statistics from samples.
         
         Raises:
-            ValueError: If sample count does not match required count
+            ValueError: If sample count is outside the configured bounds
         """
-        # Call parent's __post_init__ for basic validation
+        # Call parent's __post_init__ for basic validation, including sample count
         super().__post_init__()
         
-        # Validate sample count
-        if len(self.samples) != PROBABILISTIC_SAMPLE_COUNT:
-            raise ValueError(
-                f"Sample count {len(self.samples)} does not match required count {PROBABILISTIC_SAMPLE_COUNT}"
-            )
-        
         # Calculate statistics from samples
         self.statistics = calculate_forecast_statistics(self.samples)
     
@@ -397,7 +393,7 @@ class ProbabilisticForecast(PriceForecast):
         is_fallback = row['is_fallback']
         
         # Extract samples from sample columns
-        sample_columns = create_sample_columns(PROBABILISTIC_SAMPLE_COUNT)
+        sample_columns = get_sample_columns(row.index)
         samples = [row[col] for col in sample_columns]
         
         # Create and return instance
@@ -424,10 +420,11 @@ class ProbabilisticForecast(PriceForecast):
         if self.product not in FORECAST_PRODUCTS:
             result.add_error('product', f"Product must be one of {FORECAST_PRODUCTS}")
         
-        # Validate that samples list has length equal to PROBABILISTIC_SAMPLE_COUNT
-        if len(self.samples) != PROBABILISTIC_SAMPLE_COUNT:
-            result.add_error('samples', 
-                            f"Sample count must be {PROBABILISTIC_SAMPLE_COUNT}, got {len(self.samples)}")
+        # Validate that samples list has a length within the configured sample count bounds
+        try:
+            validate_sample_count(len(self.samples))
+        except ValueError as e:
+            result.add_error('samples', str(e))
         
         # Validate that point_forecast is a valid number
         if not isinstance(self.point_forecast, (int, float)) or np.isnan(self.point_forecast):
@@ -435,7 +432,7 @@ class ProbabilisticForecast(PriceForecast):
         
         # Validate that all samples are valid numbers
         for i, sample in enumerate(self.samples):
-            if not isinstance(sample, (int, float)) or np.isnan(sample):
+            if not isinstance(sample, (int, float, np.floating)) or np.isnan(sample):
                 result.add_error('samples', f"Sample {i} must be a valid number")
         
         # Validate that generation_timestamp is not None
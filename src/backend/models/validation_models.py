@@ -358,7 +358,7 @@ class ModelValidator:
         Returns:
             Validation result
         """
-        from ..config.settings import PROBABILISTIC_SAMPLE_COUNT
+        from .data_models import validate_sample_count
         
         errors = self.validate_common_fields(model)
         
@@ -370,12 +370,12 @@ class ModelValidator:
         
         # Validate samples list has correct length
         if hasattr(model, 'samples'):
-            if len(model.samples) != PROBABILISTIC_SAMPLE_COUNT:
+            try:
+                validate_sample_count(len(model.samples))
+            except ValueError as e:
                 if 'samples' not in errors:
                     errors['samples'] = []
-                errors['samples'].append(
-                    f"Sample count must be {PROBABILISTIC_SAMPLE_COUNT}, got {len(model.samples)}"
-                )
+                errors['samples'].append(str(e))
         
         # Validate generation_timestamp is not None
         if hasattr(model, 'generation_timestamp') and model.generation_timestamp is None:
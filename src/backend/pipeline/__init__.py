@@ -34,7 +34,17 @@ from .pipeline_executor import (  # Module: src/backend/pipeline/pipeline_execut
     PipelineExecutor,  # Class for executing the forecasting pipeline with configuration management
     execute_forecasting_pipeline,  # Main entry point for executing the forecasting pipeline
     execute_with_default_config,  # Execute pipeline with default configuration
-    get_default_config  # Get default pipeline configuration
+    get_default_config,  # Get default pipeline configuration
+    summarize_results,  # Summarize pipeline results for the job registry
+    run_pipeline_job  # Execute the pipeline for a scheduled job, returning the results summary
+)
+from .deadline_runner import (  # Module: src/backend/pipeline/deadline_runner.py
+    DeadlineRunner,  # Runs the pipeline against a publication deadline with per-stage budgets
+    get_publication_deadline,  # Get the publication deadline of a run day
+    compute_stage_budget  # Compute a stage's time budget from the time left
+)
+from .backfill_runner import (  # Module: src/backend/pipeline/backfill_runner.py
+    run_backfill  # Regenerate the forecasts of a historical date range
 )
 
 __all__ = [
@@ -62,5 +72,11 @@ __all__ = [
     "PipelineExecutor",
     "execute_forecasting_pipeline",
     "execute_with_default_config",
-    "get_default_config"
+    "get_default_config",
+    "summarize_results",
+    "run_pipeline_job",
+    "DeadlineRunner",
+    "get_publication_deadline",
+    "compute_stage_budget",
+    "run_backfill"
 ]
\ No newline at end of file
@@ -0,0 +1,332 @@
+"""Historical backfill of forecasts for a date range.
+
+Running the daily pipeline once per day of history repeats the shared work for every day:
+each run fetches its own window of every data source and builds the features again. A
+backfill instead:
+
+- ingests the history of the whole range once (every source is fetched for the range widened
+  by the daily pipeline's window) and gives each target date its own window of it
+- builds the features once and shares them between target dates (feature creation does not
+  depend on the target date)
+- generates and validates the forecasts of the target dates in forked worker processes, which
+  inherit the ingested data and features instead of receiving a copy per task
+- stores each chunk of target dates with a single index update
+
+Completed target dates are appended to a checkpoint per range and product set, so a failed or
+interrupted backfill resumes with the remaining dates. Progress (days completed, days per minute
+and estimated time left) is logged after every chunk and passed to an optional callback; the
+summary compares the throughput with the target.
+"""
+
+import datetime
+import json
+import multiprocessing
+import os
+import pathlib
+import time
+import typing
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas  # package_version: 2.0.0+
+
+# Internal imports
+from .forecasting_pipeline import ForecastingPipeline
+from .pipeline_executor import get_default_config, merge_configs
+from ..data_ingestion.api_client import APIClient
+from ..storage.storage_manager import save_forecasts_bulk
+from ..utils.logging_utils import get_logger
+from ..config.settings import (
+    FORECAST_PRODUCTS, DATA_SOURCES, BACKFILL_WORKERS, BACKFILL_CHUNK_DAYS,
+    BACKFILL_TARGET_DAYS_PER_MINUTE, BACKFILL_CHECKPOINT_DIR
+)
+
+# Global logger
+logger = get_logger(__name__)
+
+# Window of source data used for a target date, as in ForecastingPipeline.ingest_data
+HISTORY_DAYS_BEFORE = 7
+HISTORY_DAYS_AFTER = 3
+
+# Inputs shared with the forked worker processes
+_backfill_inputs: typing.Dict[str, typing.Any] = {}
+
+
+def get_backfill_dates(start_date: datetime.date, end_date: datetime.date) -> typing.List[datetime.datetime]:
+    """Get the target dates of a backfill range
+
+    Args:
+        start_date (datetime.date): First target date
+        end_date (datetime.date): Last target date (inclusive)
+
+    Returns:
+        list: Target dates at midnight
+    """
+    start = pandas.Timestamp(start_date).normalize()
+    end = pandas.Timestamp(end_date).normalize()
+    if end < start:
+        raise ValueError(f"Backfill end date {end.date()} is before start date {start.date()}")
+    return [ts.to_pydatetime() for ts in pandas.date_range(start, end, freq="D")]
+
+
+def get_backfill_checkpoint_path(start_date: datetime.date, end_date: datetime.date, products: typing.List[str]) -> pathlib.Path:
+    """Get the checkpoint file of a backfill range and product set
+
+    Args:
+        start_date (datetime.date): First target date
+        end_date (datetime.date): Last target date
+        products (list): Backfilled products
+
+    Returns:
+        pathlib.Path: Path to the checkpoint file
+    """
+    name = f"backfill_{pandas.Timestamp(start_date):%Y%m%d}_{pandas.Timestamp(end_date):%Y%m%d}_{'-'.join(sorted(products))}.jsonl"
+    return pathlib.Path(BACKFILL_CHECKPOINT_DIR) / name
+
+
+def load_backfill_checkpoint(checkpoint_path: pathlib.Path) -> typing.Set[str]:
+    """Load the target dates completed by an earlier run of a backfill
+
+    Args:
+        checkpoint_path (pathlib.Path): Path to the checkpoint file
+
+    Returns:
+        set: Completed target dates (YYYY-MM-DD)
+    """
+    if not checkpoint_path.exists():
+        return set()
+
+    completed = set()
+    with open(checkpoint_path, "r") as f:
+        for line in f:
+            try:
+                completed.add(json.loads(line)["date"])
+            except (ValueError, KeyError, TypeError):
+                # A line cut short by the interruption is backfilled again
+                continue
+    return completed
+
+
+def append_backfill_checkpoint(checkpoint_path: pathlib.Path, target_dates: typing.List[datetime.datetime]) -> None:
+    """Append completed target dates to a backfill checkpoint
+
+    Args:
+        checkpoint_path (pathlib.Path): Path to the checkpoint file
+        target_dates (list): Target dates whose forecasts were stored
+    """
+    if not target_dates:
+        return
+
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    completed_at = datetime.datetime.now().isoformat()
+    with open(checkpoint_path, "a") as f:
+        f.write("".join(
+            json.dumps({"date": target_date.date().isoformat(), "completed_at": completed_at}) + "\n"
+            for target_date in target_dates
+        ))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def ingest_backfill_history(start_date: datetime.datetime, end_date: datetime.datetime) -> dict:
+    """Fetch every data source once for the windows of all target dates of a range
+
+    Args:
+        start_date (datetime.datetime): First target date
+        end_date (datetime.datetime): Last target date
+
+    Returns:
+        dict: Ingested data by source
+    """
+    history = {}
+    for source_name in DATA_SOURCES:
+        api_client = APIClient(source_name)
+        history[source_name] = api_client.get_data(
+            start_date - pandas.Timedelta(days=HISTORY_DAYS_BEFORE),
+            end_date + pandas.Timedelta(days=HISTORY_DAYS_AFTER)
+        )
+    return history
+
+
+def _slice_source_data(data: typing.Any, start: pandas.Timestamp, end: pandas.Timestamp) -> typing.Any:
+    """Restrict a source's data to a window (data without timestamps is returned as is)"""
+    if isinstance(data, pandas.DataFrame) and "timestamp" in data.columns:
+        timestamps = pandas.to_datetime(data["timestamp"])
+        return data[(timestamps >= start) & (timestamps <= end)]
+
+    if isinstance(data, dict) and isinstance(data.get("data"), list):
+        records = [
+            record for record in data["data"]
+            if not isinstance(record, dict) or "timestamp" not in record
+            or start <= pandas.Timestamp(record["timestamp"]) <= end
+        ]
+        return dict(data, data=records)
+
+    return data
+
+
+def slice_history(history: dict, target_date: datetime.datetime) -> dict:
+    """Get a target date's window of the backfill history, as the daily pipeline would ingest it
+
+    Args:
+        history (dict): Ingested data of the backfill range by source
+        target_date (datetime.datetime): Target date
+
+    Returns:
+        dict: Ingested data of the target date's window by source
+    """
+    start = pandas.Timestamp(target_date) - pandas.Timedelta(days=HISTORY_DAYS_BEFORE)
+    end = pandas.Timestamp(target_date) + pandas.Timedelta(days=HISTORY_DAYS_AFTER)
+    return {source_name: _slice_source_data(data, start, end) for source_name, data in history.items()}
+
+
+def _forecast_target_date(target_date: datetime.datetime) -> typing.Tuple[datetime.datetime, typing.Optional[dict], typing.Optional[str]]:
+    """Generate and validate the forecasts of one target date in a worker process
+
+    Returns:
+        tuple: (target date, validated forecast dataframes by product or None, error message or None)
+    """
+    inputs = _backfill_inputs
+    try:
+        pipeline = ForecastingPipeline(target_date, inputs["config"], f"{inputs['execution_id']}-{target_date:%Y%m%d}")
+        forecasts = pipeline.generate_forecasts(inputs["features"], slice_history(inputs["history"], target_date), products=inputs["products"])
+        return target_date, pipeline.validate_forecasts(forecasts), None
+    except Exception as e:
+        # Pipeline exceptions cannot always be unpickled in the parent, so only the message is returned
+        return target_date, None, f"{type(e).__name__}: {str(e)}"
+
+
+def _report_progress(stats: dict, start_time: float, progress_callback: typing.Optional[typing.Callable[[dict], None]]) -> None:
+    """Update the throughput statistics and report progress"""
+    elapsed = time.monotonic() - start_time
+    processed = stats["days_completed"] + len(stats["failed_dates"])
+    remaining = stats["days_pending"] - processed
+    stats["elapsed_seconds"] = round(elapsed, 3)
+    stats["days_per_minute"] = round(processed / elapsed * 60, 2) if elapsed > 0 else 0.0
+    stats["eta_seconds"] = round(remaining / processed * elapsed, 1) if processed else None
+
+    logger.info(
+        f"Backfill progress: {processed}/{stats['days_pending']} days ({len(stats['failed_dates'])} failed), "
+        f"{stats['days_per_minute']} days/min, ETA {stats['eta_seconds']}s"
+    )
+    if progress_callback is not None:
+        progress_callback(dict(stats))
+
+
+def run_backfill(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    products: typing.Optional[typing.List[str]] = None,
+    config: typing.Optional[dict] = None,
+    max_workers: int = BACKFILL_WORKERS,
+    chunk_days: int = BACKFILL_CHUNK_DAYS,
+    resume: bool = True,
+    progress_callback: typing.Optional[typing.Callable[[dict], None]] = None,
+    target_days_per_minute: float = BACKFILL_TARGET_DAYS_PER_MINUTE
+) -> dict:
+    """Regenerate the forecasts of a date range
+
+    Args:
+        start_date (datetime.date): First target date
+        end_date (datetime.date): Last target date (inclusive)
+        products (list, optional): Products to backfill, defaults to the configured products
+        config (dict, optional): Pipeline configuration, merged with the default configuration
+        max_workers (int): Worker processes generating forecasts
+        chunk_days (int): Target dates stored per index update (and checkpointed together)
+        resume (bool): Whether to skip target dates completed by an earlier run of the same backfill
+        progress_callback (callable, optional): Called with the statistics after every chunk
+        target_days_per_minute (float): Throughput target the run is compared with
+
+    Returns:
+        dict: Backfill statistics, including the failed target dates and the throughput
+    """
+    merged_config = merge_configs(config or {}, get_default_config())
+    products = list(products or merged_config.get("products") or FORECAST_PRODUCTS)
+    invalid = [product for product in products if product not in FORECAST_PRODUCTS]
+    if invalid:
+        raise ValueError(f"Invalid products: {invalid}. Must be in {FORECAST_PRODUCTS}")
+
+    dates = get_backfill_dates(start_date, end_date)
+    checkpoint_path = get_backfill_checkpoint_path(start_date, end_date, products)
+    if not resume and checkpoint_path.exists():
+        checkpoint_path.unlink()
+    completed = load_backfill_checkpoint(checkpoint_path)
+    pending = [target_date for target_date in dates if target_date.date().isoformat() not in completed]
+
+    stats = {
+        "days_total": len(dates),
+        "days_resumed": len(dates) - len(pending),
+        "days_pending": len(pending),
+        "days_completed": 0,
+        "forecasts_stored": 0,
+        "failed_dates": {},
+        "elapsed_seconds": 0.0,
+        "days_per_minute": 0.0,
+        "eta_seconds": None,
+        "target_days_per_minute": target_days_per_minute,
+        "target_met": None
+    }
+    logger.info(
+        f"Backfilling {len(pending)} of {len(dates)} days ({stats['days_resumed']} completed earlier) "
+        f"for {products} with {max_workers} workers"
+    )
+    if not pending:
+        return stats
+
+    global _backfill_inputs
+    start_time = time.monotonic()
+    execution_id = str(uuid.uuid4())
+    sample_dtype = merged_config["storage"]["sample_dtype"]
+
+    # Shared work: ingest the history of the whole range and build the features once
+    history = ingest_backfill_history(pending[0], pending[-1])
+    features = ForecastingPipeline(pending[0], merged_config, execution_id).engineer_features(history)
+    logger.info(f"Ingested history and built features for the backfill in {time.monotonic() - start_time:.1f}s")
+
+    # Forked workers inherit the shared inputs set before the pool starts them
+    _backfill_inputs = {
+        "config": merged_config,
+        "execution_id": execution_id,
+        "products": products,
+        "history": history,
+        "features": features
+    }
+    try:
+        with ProcessPoolExecutor(max_workers=max(1, max_workers), mp_context=multiprocessing.get_context("fork")) as pool:
+            for chunk_start in range(0, len(pending), max(1, chunk_days)):
+                chunk = pending[chunk_start:chunk_start + max(1, chunk_days)]
+                batch, chunk_completed = [], []
+
+                for future in as_completed([pool.submit(_forecast_target_date, target_date) for target_date in chunk]):
+                    target_date, validated_forecasts, error = future.result()
+                    if error is not None:
+                        logger.error(f"Backfill failed for {target_date.date()}: {error}")
+                        stats["failed_dates"][target_date.date().isoformat()] = error
+                        continue
+                    batch.extend((forecast_df, target_date, product) for product, forecast_df in validated_forecasts.items())
+                    chunk_completed.append(target_date)
+
+                # One index update per chunk, then the chunk's dates are checkpointed
+                if batch:
+                    save_forecasts_bulk(batch, sample_dtype=sample_dtype)
+                append_backfill_checkpoint(checkpoint_path, sorted(chunk_completed))
+                stats["days_completed"] += len(chunk_completed)
+                stats["forecasts_stored"] += len(batch)
+                _report_progress(stats, start_time, progress_callback)
+    finally:
+        _backfill_inputs = {}
+
+    stats["target_met"] = stats["days_per_minute"] >= target_days_per_minute
+    if not stats["target_met"]:
+        logger.warning(
+            f"Backfill throughput {stats['days_per_minute']} days/min is below the target of "
+            f"{target_days_per_minute} days/min"
+        )
+
+    if not stats["failed_dates"]:
+        checkpoint_path.unlink(missing_ok=True)
+    logger.info(
+        f"Backfill completed: {stats['days_completed']} days, {stats['forecasts_stored']} forecasts stored, "
+        f"{len(stats['failed_dates'])} days failed in {stats['elapsed_seconds']}s"
+    )
+    return stats
@@ -0,0 +1,392 @@
+"""Deadline-aware execution of the forecasting pipeline.
+
+ForecastingPipeline.run executes every stage in the calling thread, so a stage that hangs
+(e.g. a slow external API) cannot be interrupted and the execution monitor can only log the
+timeout. DeadlineRunner instead gives each stage a time budget derived from the publication
+deadline (8 AM CST) and runs the stage in a forked worker process that is terminated when the
+budget is spent. Overruns and failures degrade the run instead of failing it:
+
+- ingestion: the most recent cached ingested data is used (kept in INGESTION_CACHE_FILE, as
+  runs execute in different job worker processes)
+- feature engineering: fallback forecasts are published for every product
+- forecast generation and validation: products finished in time are kept and fallback
+  forecasts are published for the rest
+
+Budgets are recomputed at the start of every stage from the time left before the deadline,
+keeping FALLBACK_PUBLICATION_RESERVE_SECONDS in reserve, so slack from fast stages carries over.
+Storage runs in-process because terminating a writer could leave a partial forecast file or
+index behind. Workers are started with the fork start method (Linux deployments).
+"""
+
+import typing
+import datetime
+import multiprocessing
+import os
+import pathlib
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Internal imports
+from .exceptions import PipelineStageError, PipelineTimeoutError
+from .pipeline_logger import log_stage_failure, log_fallback_trigger
+from .forecasting_pipeline import ForecastingPipeline, PIPELINE_NAME
+from ..utils.date_utils import localize_to_cst
+from ..utils.logging_utils import get_logger
+from ..config.settings import (
+    FORECAST_PRODUCTS, FORECAST_PUBLICATION_DEADLINE, PIPELINE_STAGE_BUDGETS,
+    FALLBACK_PUBLICATION_RESERVE_SECONDS, TIMEZONE, INGESTION_CACHE_FILE
+)
+
+# Global logger
+logger = get_logger(__name__)
+
+# Maximum age of cached ingested data used when ingestion overruns
+MAX_CACHED_INGESTION_AGE = datetime.timedelta(days=1)
+
+# Seconds to wait for a terminated worker process to exit
+WORKER_TERMINATE_TIMEOUT = 5
+
+# Serializes ingestion cache writes within a process (writes are atomic renames across processes)
+_ingestion_cache_lock = threading.Lock()
+
+
+def get_publication_deadline(run_date: datetime.datetime) -> datetime.datetime:
+    """Get the publication deadline of the forecast run on a given day
+
+    Args:
+        run_date (datetime.datetime): Date (and time) of the scheduled run
+
+    Returns:
+        datetime.datetime: FORECAST_PUBLICATION_DEADLINE on the run's CST calendar day
+    """
+    run_day = localize_to_cst(run_date).date()
+    return TIMEZONE.localize(datetime.datetime.combine(run_day, FORECAST_PUBLICATION_DEADLINE))
+
+
+def compute_stage_budget(stage_name: str, remaining_stages: typing.List[str], deadline: datetime.datetime,
+                         now: typing.Optional[datetime.datetime] = None) -> float:
+    """Compute the time budget of a stage from the time left before the deadline
+
+    The time left (less the fallback reserve) is shared between the remaining stages in
+    proportion to their PIPELINE_STAGE_BUDGETS weights.
+
+    Args:
+        stage_name (str): Stage about to run
+        remaining_stages (list): Stages still to run, including stage_name
+        deadline (datetime.datetime): Publication deadline
+        now (datetime.datetime, optional): Current time, defaults to the current CST time
+
+    Returns:
+        float: Budget in seconds (0 when no time is left)
+    """
+    now = now or datetime.datetime.now(TIMEZONE)
+    available = (localize_to_cst(deadline) - localize_to_cst(now)).total_seconds() - FALLBACK_PUBLICATION_RESERVE_SECONDS
+    total_weight = sum(PIPELINE_STAGE_BUDGETS[stage] for stage in remaining_stages)
+    if available <= 0 or total_weight <= 0:
+        return 0.0
+    return available * PIPELINE_STAGE_BUDGETS[stage_name] / total_weight
+
+
+def cache_ingested_data(target_date: datetime.datetime, data: dict) -> None:
+    """Remember the most recent successfully ingested data
+
+    The data is written to INGESTION_CACHE_FILE, so a later run in another job worker process
+    can use it. A failed write is logged and does not fail the run.
+    """
+    cache_path = pathlib.Path(INGESTION_CACHE_FILE)
+    temp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    with _ingestion_cache_lock:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                pickle.dump({"target_date": target_date, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not cache ingested data in {cache_path}: {str(e)}")
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+
+def get_cached_ingested_data(target_date: datetime.datetime) -> typing.Optional[dict]:
+    """Get cached ingested data for a target date
+
+    Args:
+        target_date (datetime.datetime): Target date of the current run
+
+    Returns:
+        dict: Ingested data of a run at most MAX_CACHED_INGESTION_AGE older, or None
+    """
+    cache_path = pathlib.Path(INGESTION_CACHE_FILE)
+    if not cache_path.exists():
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Could not read cached ingested data from {cache_path}: {str(e)}")
+        return None
+
+    age = localize_to_cst(target_date) - localize_to_cst(cached["target_date"])
+    if datetime.timedelta(0) <= age <= MAX_CACHED_INGESTION_AGE:
+        return cached["data"]
+    return None
+
+
+def clear_ingestion_cache() -> None:
+    """Forget the cached ingested data"""
+    with _ingestion_cache_lock:
+        pathlib.Path(INGESTION_CACHE_FILE).unlink(missing_ok=True)
+
+
+class StageOutcome:
+    """Items produced by a stage worker before it finished, failed or was terminated"""
+
+    def __init__(self, items: list, error: typing.Optional[str], timed_out: bool, elapsed: float, budget: float):
+        self.items = items
+        self.error = error
+        self.timed_out = timed_out
+        self.elapsed = elapsed
+        self.budget = budget
+
+    @property
+    def completed(self) -> bool:
+        """True if the worker produced all of its items"""
+        return self.error is None and not self.timed_out
+
+
+def _stage_worker(conn, func: typing.Callable, args: tuple) -> None:
+    """Worker process body: send every item produced by func, then a done or error message"""
+    try:
+        for item in func(*args):
+            conn.send(("item", item))
+        conn.send(("done", None))
+    except BaseException as e:
+        conn.send(("error", f"{type(e).__name__}: {str(e)}"))
+    finally:
+        conn.close()
+
+
+def run_stage_in_worker(func: typing.Callable, args: tuple, budget_seconds: float) -> StageOutcome:
+    """Run a stage in a worker process, terminating it when its budget is spent
+
+    func is a generator function; every item it yields is sent to the parent as soon as it is
+    produced, so items finished before a timeout are kept.
+
+    Args:
+        func (callable): Generator function run in the worker
+        args (tuple): Arguments of func
+        budget_seconds (float): Time budget in seconds
+
+    Returns:
+        StageOutcome: Items received, error message and whether the budget was exceeded
+    """
+    start_time = time.monotonic()
+    if budget_seconds <= 0:
+        return StageOutcome([], None, True, 0.0, budget_seconds)
+
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_stage_worker, args=(sender, func, args), daemon=True)
+    process.start()
+    sender.close()
+
+    items, error, timed_out = [], None, False
+    try:
+        while True:
+            remaining = budget_seconds - (time.monotonic() - start_time)
+            if remaining <= 0 or not receiver.poll(remaining):
+                timed_out = True
+                break
+            try:
+                kind, payload = receiver.recv()
+            except EOFError:
+                error = f"Stage worker exited unexpectedly with code {process.exitcode}"
+                break
+            if kind == "item":
+                items.append(payload)
+            elif kind == "error":
+                error = payload
+                break
+            else:
+                break
+    finally:
+        if timed_out and process.is_alive():
+            process.terminate()
+        process.join(WORKER_TERMINATE_TIMEOUT)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        receiver.close()
+
+    return StageOutcome(items, error, timed_out, time.monotonic() - start_time, budget_seconds)
+
+
+def _ingest_stage(pipeline: ForecastingPipeline):
+    yield pipeline.ingest_data()
+
+
+def _feature_stage(pipeline: ForecastingPipeline, ingested_data: dict):
+    yield pipeline.engineer_features(ingested_data)
+
+
+def _generate_stage(pipeline: ForecastingPipeline, features: dict, ingested_data: dict, products: typing.List[str]):
+    # Per product (in parallel in per_product mode) so finished products survive a timeout or a failing product
+    execution = pipeline.config.get("execution", {})
+    max_workers = execution.get("max_workers") or len(products) if execution.get("mode") == "per_product" else 1
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(products)))) as executor:
+        futures = {
+            executor.submit(pipeline.generate_forecasts, features, ingested_data, products=[product]): product
+            for product in products
+        }
+        for future in as_completed(futures):
+            product = futures[future]
+            try:
+                yield product, future.result()[product]
+            except Exception as e:
+                logger.error(f"Forecast generation failed for {product}: {str(e)}")
+
+
+def _validate_stage(pipeline: ForecastingPipeline, forecasts: dict):
+    for product, forecast in forecasts.items():
+        try:
+            yield product, pipeline.validate_forecasts({product: forecast})[product]
+        except Exception as e:
+            logger.error(f"Forecast validation failed for {product}: {str(e)}")
+
+
+class DeadlineRunner:
+    """Runs a ForecastingPipeline against a publication deadline with per-stage budgets"""
+
+    def __init__(self, pipeline: ForecastingPipeline, deadline: datetime.datetime):
+        """Initialize the runner
+
+        Args:
+            pipeline (ForecastingPipeline): Pipeline whose stages are run
+            deadline (datetime.datetime): Time by which forecasts must be published
+        """
+        self.pipeline = pipeline
+        self.deadline = localize_to_cst(deadline)
+        self.stages = list(PIPELINE_STAGE_BUDGETS)
+        self.degradations: typing.List[dict] = []
+
+    def run(self) -> bool:
+        """Execute the pipeline, degrading to cached data or fallbacks to meet the deadline
+
+        Returns:
+            bool: True if fresh forecasts were published for every product, False otherwise
+        """
+        pipeline = self.pipeline
+        products = list(pipeline.config.get("products") or FORECAST_PRODUCTS)
+        logger.info(f"Starting deadline-aware pipeline for {pipeline.target_date}, deadline {self.deadline.isoformat()}")
+
+        # Ingestion: fall back to cached ingested data on overrun or failure
+        outcome = self._run_stage("ingest_data", _ingest_stage, (pipeline,))
+        if outcome.completed:
+            ingested_data = outcome.items[0]
+            cache_ingested_data(pipeline.target_date, ingested_data)
+        else:
+            ingested_data = get_cached_ingested_data(pipeline.target_date)
+            if ingested_data is None:
+                return self._publish_fallback("ingest_data", outcome, products)
+            self._record_degradation("ingest_data", outcome, "cached_ingested_data")
+        pipeline.data_cache["ingested_data"] = ingested_data
+        pipeline.results["ingested_data"] = ingested_data
+
+        # Feature engineering: nothing to degrade to except fallbacks for every product
+        outcome = self._run_stage("engineer_features", _feature_stage, (pipeline, ingested_data))
+        if not outcome.completed:
+            return self._publish_fallback("engineer_features", outcome, products)
+        features = outcome.items[0]
+        pipeline.data_cache["features"] = features
+        pipeline.results["features"] = features
+
+        # Forecast generation and validation: keep the products finished in time
+        outcome = self._run_stage("generate_forecasts", _generate_stage, (pipeline, features, ingested_data, products))
+        forecasts = dict(outcome.items)
+        pipeline.results["forecasts"] = forecasts
+        failed_stage, failed_outcome = None, None
+        if not outcome.completed or len(forecasts) < len(products):
+            failed_stage, failed_outcome = "generate_forecasts", outcome
+
+        outcome = self._run_stage("validate_forecasts", _validate_stage, (pipeline, forecasts))
+        validated_forecasts = dict(outcome.items)
+        pipeline.results["validated_forecasts"] = validated_forecasts
+        if failed_stage is None and (not outcome.completed or len(validated_forecasts) < len(forecasts)):
+            failed_stage, failed_outcome = "validate_forecasts", outcome
+
+        # Storage runs in-process so a write is never interrupted
+        storage_results = {}
+        if validated_forecasts:
+            start_time = time.monotonic()
+            try:
+                storage_results = pipeline.store_forecasts(validated_forecasts)
+            except Exception as e:
+                failed_stage = "store_forecasts"
+                failed_outcome = StageOutcome([], str(e), False, time.monotonic() - start_time, 0.0)
+        pipeline.results["storage_results"] = storage_results
+
+        missing_products = [product for product in products if product not in storage_results]
+        if missing_products:
+            return self._publish_fallback(failed_stage or "store_forecasts", failed_outcome, missing_products)
+
+        pipeline.results["status"] = "success"
+        pipeline.results["completed_at"] = datetime.datetime.now()
+        self._record_results()
+        logger.info(f"Successfully completed deadline-aware pipeline for {pipeline.target_date}")
+        return True
+
+    def _run_stage(self, stage_name: str, func: typing.Callable, args: tuple) -> StageOutcome:
+        """Run one stage in a worker within its budget"""
+        remaining_stages = self.stages[self.stages.index(stage_name):]
+        budget = compute_stage_budget(stage_name, remaining_stages, self.deadline)
+        logger.info(f"Running stage {stage_name} with a budget of {budget:.0f}s")
+
+        outcome = run_stage_in_worker(func, args, budget)
+        if not outcome.completed:
+            log_stage_failure(PIPELINE_NAME, self.pipeline.execution_id, stage_name, time.time() - outcome.elapsed,
+                              self._stage_error(stage_name, outcome),
+                              {"budget_seconds": budget, "items_completed": len(outcome.items)})
+        return outcome
+
+    def _stage_error(self, stage_name: str, outcome: typing.Optional[StageOutcome]) -> Exception:
+        """Build the exception describing a stage overrun or failure"""
+        execution_id = self.pipeline.execution_id
+        if outcome is not None and outcome.timed_out:
+            return PipelineTimeoutError(f"Stage {stage_name} exceeded its budget", PIPELINE_NAME, execution_id,
+                                        stage_name, outcome.budget, outcome.elapsed)
+        message = outcome.error if outcome is not None and outcome.error else f"Stage {stage_name} did not produce every product"
+        return PipelineStageError(message, PIPELINE_NAME, stage_name, execution_id)
+
+    def _record_degradation(self, stage_name: str, outcome: typing.Optional[StageOutcome], mode: str,
+                            products: typing.Optional[typing.List[str]] = None) -> None:
+        """Record how the run was degraded"""
+        degradation = {
+            "stage": stage_name,
+            "mode": mode,
+            "reason": "timeout" if outcome is not None and outcome.timed_out else "error"
+        }
+        if products is not None:
+            degradation["products"] = products
+        self.degradations.append(degradation)
+        logger.warning(f"Degrading pipeline run at stage {stage_name}: {mode}")
+
+    def _publish_fallback(self, stage_name: str, outcome: typing.Optional[StageOutcome],
+                          products: typing.List[str]) -> bool:
+        """Publish fallback forecasts for the products without a fresh forecast"""
+        error = self._stage_error(stage_name, outcome)
+        mode = "full_fallback" if len(products) == len(self.pipeline.config.get("products") or FORECAST_PRODUCTS) else "partial_fallback"
+        self._record_degradation(stage_name, outcome, mode, products)
+        log_fallback_trigger(PIPELINE_NAME, self.pipeline.execution_id, stage_name, mode, error, {"products": products})
+
+        self.pipeline.activate_fallback(stage_name, error, products=products)
+        self._record_results()
+        return False
+
+    def _record_results(self) -> None:
+        """Add the deadline and degradations to the pipeline results"""
+        self.pipeline.results["deadline"] = self.deadline.isoformat()
+        self.pipeline.results["degradations"] = self.degradations
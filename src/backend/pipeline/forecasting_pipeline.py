@@ -6,6 +6,7 @@ availability even when errors occur.
 
 import typing
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import uuid
 import time
 
@@ -18,10 +19,12 @@ from ..data_ingestion.api_client import APIClient
 from ..feature_engineering.product_hour_features import ProductHourFeatureCreator
 from ..forecasting_engine.probabilistic_forecaster import ProbabilisticForecaster
 from ..forecast_validation.schema_validator import validate_forecast_schema
-from ..storage.storage_manager import save_forecast, retrieve_fallback_forecast
+from ..storage.storage_manager import save_forecast
+from ..fallback.fallback_retriever import retrieve_fallback_forecast, store_fallback_reference
+from ..fallback.fallback_preparer import get_prepared_fallback
 from ..utils.decorators import log_execution_time, log_exceptions
 from ..utils.logging_utils import get_logger
-from ..config.settings import FORECAST_PRODUCTS, FORECAST_HORIZON_HOURS, DATA_SOURCES
+from ..config.settings import FORECAST_PRODUCTS, FORECAST_HORIZON_HOURS, DATA_SOURCES, PROBABILISTIC_SAMPLE_COUNT, SAMPLE_STORAGE_DTYPE, FALLBACK_STORAGE_MODE
 
 # Global logger
 logger = get_logger(__name__)
@@ -106,7 +109,13 @@ class ForecastingPipeline:
         # 6. Initialize empty data_cache dictionary
         self.data_cache = {}
 
-        # 7. Log pipeline initialization
+        # 7. Resolve per-run sample count and sample storage dtype, recorded in the results metadata
+        self.sample_count = self.config.get("sampling", {}).get("sample_count", PROBABILISTIC_SAMPLE_COUNT)
+        self.sample_dtype = self.config.get("storage", {}).get("sample_dtype", SAMPLE_STORAGE_DTYPE)
+        self.results["sample_count"] = self.sample_count
+        self.results["sample_dtype"] = self.sample_dtype
+
+        # 8. Log pipeline initialization
         logger.info(f"Initialized forecasting pipeline for {target_date} with execution ID {execution_id}")
 
     def run(self) -> bool:
@@ -115,6 +124,10 @@ class ForecastingPipeline:
         Returns:
             bool: True if pipeline executed successfully, False otherwise
         """
+        # Run each product's forecast, validate and store chain independently if configured
+        if self.config.get("execution", {}).get("mode") == "per_product":
+            return self.run_per_product()
+
         try:
             # 1. Log start of pipeline execution
             logger.info(f"Starting forecasting pipeline for {self.target_date}")
@@ -154,6 +167,82 @@ class ForecastingPipeline:
             self.activate_fallback(failed_stage, e)
             return False
 
+    def run_per_product(self) -> bool:
+        """Execute the pipeline with an independent forecast, validate and store chain per product
+
+        Ingestion and feature engineering are shared; a failure there activates the fallback for
+        every product. The product chains then run in a thread pool: each product is stored as soon
+        as its chain completes, and a failing product only gets its own fallback.
+
+        Returns:
+            bool: True if every product published a fresh forecast, False otherwise
+        """
+        products = list(self.config.get("products") or FORECAST_PRODUCTS)
+
+        try:
+            # 1. Execute the shared data ingestion and feature engineering stages
+            ingested_data = self.ingest_data()
+            self.results["ingested_data"] = ingested_data
+            features = self.engineer_features(ingested_data)
+            self.results["features"] = features
+
+        except Exception as e:
+            logger.error(f"Pipeline failed: {str(e)}")
+            failed_stage = getattr(e, 'stage_name', 'unknown')
+            self.activate_fallback(failed_stage, e, products=products)
+            return False
+
+        # 2. Run the product chains in a worker pool, handling each product as it completes
+        for key in ("forecasts", "validated_forecasts", "storage_results", "product_status"):
+            self.results[key] = {}
+        max_workers = self.config.get("execution", {}).get("max_workers") or len(products)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(products))) as executor:
+            futures = {
+                executor.submit(self.run_product_chain, product, features, ingested_data): product
+                for product in products
+            }
+            for future in as_completed(futures):
+                product = futures[future]
+                try:
+                    future.result()
+                    self.results["product_status"][product] = "fresh"
+                except Exception as e:
+                    # 3. A failing product only gets its own fallback
+                    logger.error(f"Pipeline failed for {product}: {str(e)}")
+                    failed_stage = getattr(e, 'stage_name', 'unknown')
+                    fallback_ok = self.activate_fallback(failed_stage, e, products=[product])
+                    self.results["product_status"][product] = "fallback" if fallback_ok else "failed"
+
+        # 4. Update results with status and metadata
+        self.results["completed_at"] = datetime.now()
+        if all(status == "fresh" for status in self.results["product_status"].values()):
+            self.results["status"] = "success"
+            logger.info(f"Successfully completed forecasting pipeline for {self.target_date}")
+            return True
+        return False
+
+    def run_product_chain(self, product: str, features: dict, ingested_data: dict) -> str:
+        """Generate, validate and store the forecast of a single product
+
+        Args:
+            product (str): Product to forecast
+            features (dict): Dictionary of feature dataframes by product/hour
+            ingested_data (dict): Dictionary of ingested data by source
+
+        Returns:
+            str: Path of the stored forecast file
+        """
+        forecasts = self.generate_forecasts(features, ingested_data, products=[product])
+        self.results["forecasts"][product] = forecasts[product]
+
+        validated_forecasts = self.validate_forecasts(forecasts)
+        self.results["validated_forecasts"][product] = validated_forecasts[product]
+
+        storage_results = self.store_forecasts(validated_forecasts)
+        self.results["storage_results"][product] = storage_results[product]
+        return storage_results[product]
+
     @log_execution_time
     @log_exceptions
     def ingest_data(self) -> dict:
@@ -243,12 +332,13 @@ class ForecastingPipeline:
 
     @log_execution_time
     @log_exceptions
-    def generate_forecasts(self, features: dict, historical_data: dict) -> dict:
+    def generate_forecasts(self, features: dict, historical_data: dict, products: typing.Optional[typing.List[str]] = None) -> dict:
         """Forecast generation stage: create probabilistic forecasts
 
         Args:
             features (dict): Dictionary of feature dataframes by product/hour
             historical_data (dict): Dictionary of historical data
+            products (list, optional): Products to forecast, defaults to FORECAST_PRODUCTS
 
         Returns:
             dict: Dictionary of forecast ensembles by product
@@ -264,13 +354,14 @@ class ForecastingPipeline:
             # 3. Create ProbabilisticForecaster instance
             forecaster = ProbabilisticForecaster()
 
-            # 4. For each product in FORECAST_PRODUCTS:
-            for product in FORECAST_PRODUCTS:
+            # 4. For each requested product (all of FORECAST_PRODUCTS by default):
+            for product in products or FORECAST_PRODUCTS:
                 # 5. Get features for this product
                 product_features = features.get(product)
 
                 # 6. Generate forecast ensemble for the product
-                forecasts[product] = forecaster.generate_ensemble(product, product_features, historical_data, self.target_date)
+                forecasts[product] = forecaster.generate_ensemble(product, product_features, historical_data, self.target_date,
+                                                                  sample_count=self.sample_count)
 
             # 7. Log completion of forecast generation stage
             log_stage_completion(PIPELINE_NAME, self.execution_id, "generate_forecasts", start_time)
@@ -309,7 +400,7 @@ class ForecastingPipeline:
                 forecast_df = forecast.to_dataframe()
 
                 # 5. Validate forecast using validate_forecast_schema
-                is_valid, errors = validate_forecast_schema(forecast_df)
+                is_valid, errors = validate_forecast_schema(forecast_df, sample_count=self.sample_count)
 
                 # 6. If validation passes, add to validated_forecasts
                 if is_valid:
@@ -354,7 +445,7 @@ class ForecastingPipeline:
             # 3. For each product, forecast_df in validated_forecasts.items():
             for product, forecast_df in validated_forecasts.items():
                 # 4. Save forecast using save_forecast function
-                file_path = save_forecast(forecast_df, self.target_date, product)
+                file_path = save_forecast(forecast_df, self.target_date, product, sample_dtype=self.sample_dtype)
 
                 # 5. Store file path in storage_results
                 storage_results[product] = str(file_path)
@@ -373,15 +464,16 @@ class ForecastingPipeline:
 
     @log_execution_time
     @log_exceptions
-    def activate_fallback(self, failed_stage: str, error: Exception) -> bool:
+    def activate_fallback(self, failed_stage: str, error: Exception, products: typing.Optional[typing.List[str]] = None) -> bool:
         """Activate the fallback mechanism when a pipeline stage fails
 
         Args:
             failed_stage (str): Name of the stage that failed
             error (Exception): The exception that caused the failure
+            products (list, optional): Products to publish fallbacks for, defaults to FORECAST_PRODUCTS
 
         Returns:
-            bool: True if fallback was successful, False otherwise
+            bool: True if the fallback of every product was published, False otherwise
         """
         # 1. Log activation of fallback mechanism
         log_fallback_activation(failed_stage, str(type(error)), {"error": str(error)})
@@ -389,37 +481,54 @@ class ForecastingPipeline:
         # 2. Set fallback_used flag to True
         self.fallback_used = True
 
-        try:
-            # 3. For each product in FORECAST_PRODUCTS:
-            for product in FORECAST_PRODUCTS:
-                # 4. Retrieve fallback forecast using retrieve_fallback_forecast
-                fallback_df = retrieve_fallback_forecast(product, self.target_date)
-
-                # 5. Validate fallback forecast using validate_forecast_schema
+        # 3. For each product without a fresh forecast (all of FORECAST_PRODUCTS by default),
+        #    recording a failing product's error and continuing with the others:
+        failures = {}
+        for product in products or FORECAST_PRODUCTS:
+            try:
+                # 4. In reference mode, store the fallback as a reference to its source forecast
+                #    (no data is copied); store a copy if that fails
+                if FALLBACK_STORAGE_MODE == "reference":
+                    try:
+                        file_path = store_fallback_reference(product, self.target_date)
+                        self.results[f"fallback_{product}"] = str(file_path)
+                        continue
+                    except Exception as e:
+                        logger.warning(f"Could not store {product} fallback as reference, storing a copy: {str(e)}")
+
+                # 5. Use the fallback prepared by the scheduler, searching for one only if none was prepared
+                fallback_df = get_prepared_fallback(product, self.target_date)
+                if fallback_df is None:
+                    fallback_df = retrieve_fallback_forecast(product, self.target_date)
+
+                # 6. Validate fallback forecast using validate_forecast_schema
                 is_valid, errors = validate_forecast_schema(fallback_df)
                 if not is_valid:
                     error_msg = f"Fallback forecast validation failed for {product}: {errors}"
                     logger.error(error_msg)
                     raise PipelineStageError(error_msg, PIPELINE_NAME, "validate_forecasts", self.execution_id)
 
-                # 6. Save fallback forecast with is_fallback=True flag
-                file_path = save_forecast(fallback_df, self.target_date, product, is_fallback=True)
+                # 7. Save fallback forecast with is_fallback=True flag
+                file_path = save_forecast(fallback_df, self.target_date, product, is_fallback=True,
+                                          sample_dtype=self.sample_dtype)
 
-                # 7. Store fallback information in results
+                # 8. Store fallback information in results
                 self.results[f"fallback_{product}"] = str(file_path)
 
-            # 8. Log successful fallback activation
-            logger.info("Successfully activated fallback mechanism")
+            except Exception as e:
+                # Handle fallback failures by logging and recording them per product
+                logger.error(f"Fallback mechanism failed for {product}: {str(e)}")
+                failures[product] = str(e)
 
-            # 9. Return True if fallback was successful
-            return True
-
-        except Exception as e:
-            # Handle fallback failures by logging and returning False
-            error_msg = f"Fallback mechanism failed: {str(e)}"
-            logger.error(error_msg)
+        # 9. Return False if any product has no fallback, recording which ones failed
+        if failures:
+            self.results.setdefault("failed_fallbacks", {}).update(failures)
             return False
 
+        # 10. Log successful fallback activation
+        logger.info("Successfully activated fallback mechanism")
+        return True
+
     def get_results(self) -> dict:
         """Get the results of the pipeline execution
 
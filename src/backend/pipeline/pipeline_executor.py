@@ -13,15 +13,20 @@ from datetime import datetime
 from .exceptions import PipelineError, PipelineExecutionError, PipelineConfigurationError
 from .pipeline_logger import log_pipeline_start, log_pipeline_completion, log_pipeline_failure, log_fallback_activation
 from .forecasting_pipeline import ForecastingPipeline
+from .deadline_runner import DeadlineRunner
 from ..utils.decorators import log_execution_time, log_exceptions
 from ..utils.logging_utils import get_logger
-from ..config.settings import FORECAST_PRODUCTS, DATA_SOURCES
+from ..config.settings import FORECAST_PRODUCTS, DATA_SOURCES, PROBABILISTIC_SAMPLE_COUNT, SAMPLE_STORAGE_DTYPE, PIPELINE_EXECUTION_MODE
+from ..models.data_models import validate_sample_count, SAMPLE_DTYPES
 
 # Global logger
 logger = get_logger(__name__)
 
 # Define default configuration
-DEFAULT_CONFIG = {"data_sources": DATA_SOURCES, "products": FORECAST_PRODUCTS, "fallback": {"enabled": True, "max_search_days": 7}, "validation": {"schema": True, "completeness": True, "plausibility": True}, "storage": {"format": "parquet", "compression": "snappy"}}
+DEFAULT_CONFIG = {"data_sources": DATA_SOURCES, "products": FORECAST_PRODUCTS, "fallback": {"enabled": True, "max_search_days": 7}, "validation": {"schema": True, "completeness": True, "plausibility": True}, "storage": {"format": "parquet", "compression": "snappy", "sample_dtype": SAMPLE_STORAGE_DTYPE}, "sampling": {"sample_count": PROBABILISTIC_SAMPLE_COUNT}, "execution": {"mode": PIPELINE_EXECUTION_MODE, "max_workers": len(FORECAST_PRODUCTS)}}
+
+# Pipeline execution modes: all products stage by stage, or an independent chain per product
+EXECUTION_MODES = ["sequential", "per_product"]
 
 
 @log_execution_time
@@ -82,6 +87,65 @@ def execute_with_default_config(target_date: datetime) -> dict:
     return results
 
 
+def run_pipeline_job(target_date: datetime, config: dict) -> dict:
+    """Execute the forecasting pipeline for a scheduled job and return the summary of its results
+
+    Job worker processes run this function, so only the summary is pickled back to the
+    scheduler instead of the ingested data, features and forecast dataframes.
+
+    Args:
+        target_date (datetime.datetime): The target date for which to generate forecasts
+        config (dict): Configuration dictionary for the pipeline
+
+    Returns:
+        dict: Summary of the pipeline execution results from summarize_results
+    """
+    return summarize_results(execute_forecasting_pipeline(target_date, config))
+
+
+def summarize_results(results: dict) -> dict:
+    """Summarize pipeline execution results for the job registry and job logs
+
+    The summary only holds JSON-safe values: the ingested data, features and forecast
+    dataframes of the results are left out.
+
+    Args:
+        results (dict): Pipeline execution results from execute_forecasting_pipeline
+
+    Returns:
+        dict: Status, execution time, per-product status, degradations, fallback paths and fallback failures
+    """
+    # Collect the fallback paths stored as fallback_<product> results
+    fallbacks = {
+        key[len("fallback_"):]: str(path) for key, path in results.items() if key.startswith("fallback_")
+    }
+
+    # Per-product status: recorded by per-product runs, derived from stored forecasts and fallbacks otherwise
+    product_status = dict(results.get("product_status") or {})
+    for product in results.get("storage_results") or {}:
+        product_status.setdefault(product, "fresh")
+    for product in fallbacks:
+        product_status.setdefault(product, "fallback")
+    for product in results.get("failed_fallbacks") or {}:
+        product_status.setdefault(product, "failed")
+
+    summary = {
+        "execution_id": results.get("execution_id"),
+        "status": results.get("status"),
+        "execution_time": results.get("execution_time"),
+        "completed_at": results.get("completed_at"),
+        "sample_count": results.get("sample_count"),
+        "sample_dtype": results.get("sample_dtype"),
+        "product_status": product_status,
+        "fallbacks": fallbacks,
+        "failed_fallbacks": dict(results.get("failed_fallbacks") or {}),
+        "degradations": list(results.get("degradations") or [])
+    }
+    if results.get("deadline") is not None:
+        summary["deadline"] = results["deadline"]
+    return summary
+
+
 def get_default_config() -> dict:
     """Get the default pipeline configuration
 
@@ -158,6 +222,39 @@ def validate_config(config: dict) -> bool:
     if "compression" not in config["storage"] or not isinstance(config["storage"]["compression"], str):
         logger.error("storage.compression must be a string")
         return False
+    if "sample_dtype" in config["storage"] and config["storage"]["sample_dtype"] not in SAMPLE_DTYPES:
+        logger.error(f"storage.sample_dtype must be one of {SAMPLE_DTYPES}")
+        return False
+
+    # Validate optional sampling configuration (per-run sample count)
+    if "sampling" in config:
+        if not isinstance(config["sampling"], dict):
+            logger.error("sampling configuration must be a dictionary")
+            return False
+        if "sample_count" in config["sampling"]:
+            try:
+                validate_sample_count(config["sampling"]["sample_count"])
+            except ValueError as e:
+                logger.error(f"sampling.sample_count is invalid: {str(e)}")
+                return False
+
+    # Validate optional execution configuration (mode, worker count for per-product chains)
+    if "execution" in config:
+        if not isinstance(config["execution"], dict):
+            logger.error("execution configuration must be a dictionary")
+            return False
+        if config["execution"].get("mode", "sequential") not in EXECUTION_MODES:
+            logger.error(f"execution.mode must be one of {EXECUTION_MODES}")
+            return False
+        max_workers = config["execution"].get("max_workers")
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+            logger.error("execution.max_workers must be a positive integer")
+            return False
+
+    # Validate optional publication deadline (runs the pipeline with per-stage time budgets)
+    if config.get("deadline") is not None and not isinstance(config["deadline"], datetime):
+        logger.error("deadline must be a datetime")
+        return False
 
     # Return True if all validations pass, False otherwise
     return True
@@ -241,9 +338,12 @@ class PipelineExecutor:
         # Record start time for performance measurement
         start_time = time.time()
 
-        # Execute the pipeline by calling pipeline.run()
+        # Execute the pipeline by calling pipeline.run(), or against its publication deadline if one is configured
         try:
-            success = self.pipeline.run()
+            if self.config.get("deadline"):
+                success = DeadlineRunner(self.pipeline, self.config["deadline"]).run()
+            else:
+                success = self.pipeline.run()
         except Exception as e:
             self.results["status"] = "failure"
             log_pipeline_failure("forecasting_pipeline", self.execution_id, start_time, e, self.results)
@@ -5,6 +5,9 @@ Exports key components and functions for scheduling and executing the daily fore
 
 __version__ = "1.0.0"
 
+import importlib
+import typing
+
 from .exceptions import (
     SchedulerError,
     JobSchedulingError,
@@ -31,11 +34,17 @@ from .job_registry import (
     get_jobs_by_status,
     get_jobs_by_type,
     get_all_jobs,
+    get_queue_stats,
+    get_recent_jobs,
+    prune_registry,
+    mark_interrupted_jobs,
     JOB_STATUS_PENDING,
     JOB_STATUS_RUNNING,
     JOB_STATUS_COMPLETED,
     JOB_STATUS_FAILED,
     JOB_STATUS_TIMEOUT,
+    JOB_STATUS_INTERRUPTED,
+    JOB_TYPE_FORECAST,
 )
 from .execution_monitor import (
     start_job_monitoring,
@@ -43,20 +52,53 @@ from .execution_monitor import (
     get_monitored_jobs,
     DEFAULT_TIMEOUT_SECONDS,
 )
-from .forecast_scheduler import (
-    initialize_scheduler,
-    start_scheduler,
-    stop_scheduler,
-    is_scheduler_running,
-    schedule_forecast_job,
-    execute_forecast_job,
-    schedule_one_time_forecast,
-    run_forecast_now,
-    get_next_run_time,
-    get_scheduler_status,
-    ForecastScheduler,
-    JOB_TYPE_FORECAST,
-)
+
+# The job executor and the scheduler itself (which pulls in APScheduler) are only needed by the
+# scheduler process, so their exports are loaded on first access (API workers only read the
+# job registry)
+_LAZY_EXPORTS = {
+    "JobExecutor": "job_executor",
+    "start_job_executor": "job_executor",
+    "stop_job_executor": "job_executor",
+    "get_job_executor": "job_executor",
+    "JOB_PRIORITY_DAILY": "job_executor",
+    "JOB_PRIORITY_ADHOC": "job_executor",
+    "JOB_PRIORITY_BACKFILL": "job_executor",
+    "initialize_scheduler": "forecast_scheduler",
+    "start_scheduler": "forecast_scheduler",
+    "stop_scheduler": "forecast_scheduler",
+    "is_scheduler_running": "forecast_scheduler",
+    "schedule_forecast_job": "forecast_scheduler",
+    "execute_forecast_job": "forecast_scheduler",
+    "schedule_one_time_forecast": "forecast_scheduler",
+    "run_forecast_now": "forecast_scheduler",
+    "get_next_run_time": "forecast_scheduler",
+    "get_scheduler_status": "forecast_scheduler",
+    "ForecastScheduler": "forecast_scheduler",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Loads the job executor or forecast scheduler module on first access to one of its exports.
+
+    Args:
+        name: Attribute name being looked up on the package
+
+    Returns:
+        The requested export
+
+    Raises:
+        AttributeError: If the name is not exported by the package
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "SchedulerError",
@@ -80,15 +122,27 @@ __all__ = [
     "get_jobs_by_status",
     "get_jobs_by_type",
     "get_all_jobs",
+    "get_queue_stats",
+    "get_recent_jobs",
+    "prune_registry",
+    "mark_interrupted_jobs",
     "JOB_STATUS_PENDING",
     "JOB_STATUS_RUNNING",
     "JOB_STATUS_COMPLETED",
     "JOB_STATUS_FAILED",
     "JOB_STATUS_TIMEOUT",
+    "JOB_STATUS_INTERRUPTED",
     "start_job_monitoring",
     "stop_job_monitoring",
     "get_monitored_jobs",
     "DEFAULT_TIMEOUT_SECONDS",
+    "JobExecutor",
+    "start_job_executor",
+    "stop_job_executor",
+    "get_job_executor",
+    "JOB_PRIORITY_DAILY",
+    "JOB_PRIORITY_ADHOC",
+    "JOB_PRIORITY_BACKFILL",
     "initialize_scheduler",
     "start_scheduler",
     "stop_scheduler",
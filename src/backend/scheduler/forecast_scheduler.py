@@ -9,10 +9,13 @@ import typing  # standard library
 from apscheduler.schedulers.background import BackgroundScheduler  # version: 3.10.0
 
 from .exceptions import SchedulerError, JobSchedulingError, JobExecutionError, ScheduleConfigurationError, SchedulerInitializationError  # Module: src/backend/scheduler/exceptions.py
-from .job_registry import register_job, update_job_status, get_job, JOB_STATUS_PENDING, JOB_STATUS_RUNNING, JOB_STATUS_COMPLETED, JOB_STATUS_FAILED  # Module: src/backend/scheduler/job_registry.py
+from .job_registry import register_job, update_job_status, get_job, get_queue_stats, mark_interrupted_jobs, prune_registry, JOB_TYPE_FORECAST, JOB_STATUS_PENDING, JOB_STATUS_RUNNING, JOB_STATUS_COMPLETED, JOB_STATUS_FAILED  # Module: src/backend/scheduler/job_registry.py
+from .job_executor import start_job_executor, stop_job_executor, get_job_executor, validate_job_priority, JOB_PRIORITY_DAILY, JOB_PRIORITY_ADHOC  # Module: src/backend/scheduler/job_executor.py
 from .execution_monitor import start_job_monitoring, stop_job_monitoring, DEFAULT_TIMEOUT_SECONDS  # Module: src/backend/scheduler/execution_monitor.py
 from .scheduler_logging import log_scheduler_startup, log_scheduler_shutdown, log_scheduler_error, log_scheduler_job_added, log_job_execution_start, log_job_execution_completion, log_job_execution_failure  # Module: src/backend/scheduler/scheduler_logging.py
-from ..pipeline.pipeline_executor import execute_forecasting_pipeline, get_default_config  # Module: src/backend/pipeline/pipeline_executor.py
+from ..pipeline.pipeline_executor import run_pipeline_job, get_default_config  # Module: src/backend/pipeline/pipeline_executor.py
+from ..pipeline.deadline_runner import get_publication_deadline  # Module: src/backend/pipeline/deadline_runner.py
+from ..fallback.fallback_preparer import start_fallback_preparation, clear_prepared_fallbacks  # Module: src/backend/fallback/fallback_preparer.py
 from ..config.settings import FORECAST_SCHEDULE_TIME, TIMEZONE  # Module: src/backend/config/settings.py
 from ..utils.decorators import timing_decorator, log_exceptions  # Module: src/backend/utils/decorators.py
 from ..utils.logging_utils import get_logger  # Module: src/backend/utils/logging_utils.py
@@ -22,7 +25,8 @@ _scheduler: Optional[BackgroundScheduler] = None
 _scheduler_lock = threading.RLock()
 _scheduler_running = False
 _scheduler_job_ids: List[str] = []
-JOB_TYPE_FORECAST = "forecast"
+# APScheduler executor of daily runs, so other jobs waiting for a worker process cannot take its thread
+APS_EXECUTOR_DAILY = "daily"
 logger = get_logger(__name__)
 
 
@@ -49,6 +53,11 @@ def initialize_scheduler(config: Optional[Dict] = None) -> BackgroundScheduler:
                     'misfire_grace_time': 60,  # 1 minute
                     'coalesce': True,
                     'max_instances': 1
+                },
+                # Job threads only wait for the job executor's worker processes
+                'executors': {
+                    'default': {'type': 'threadpool', 'max_workers': 20},
+                    APS_EXECUTOR_DAILY: {'type': 'threadpool', 'max_workers': 1}
                 }
             }
 
@@ -86,7 +95,11 @@ def start_scheduler() -> bool:
             if _scheduler is None:
                 _scheduler = initialize_scheduler()
 
-            # Start the scheduler
+            # Close out the jobs of a previous scheduler process and drop expired history
+            _recover_job_registry()
+
+            # Start the worker processes jobs run in, then the scheduler
+            start_job_executor()
             _scheduler.start()
             _scheduler_running = True
 
@@ -120,8 +133,9 @@ def stop_scheduler(reason: str) -> bool:
                 logger.warning("Scheduler is not running")
                 return False
 
-            # Shutdown the scheduler
+            # Shutdown the scheduler, then the worker processes
             _scheduler.shutdown(wait=True)
+            stop_job_executor()
             _scheduler_running = False
 
             # Log scheduler shutdown
@@ -171,11 +185,16 @@ def schedule_forecast_job(job_params: Optional[Dict] = None) -> str:
             # Calculate next run time at 7 AM CST
             next_run_time = _calculate_next_run_time()
 
+            # Daily runs execute against the 8 AM CST publication deadline
+            job_params = dict(job_params)
+            job_params.setdefault("deadline", get_publication_deadline(next_run_time))
+            job_params.setdefault("priority", JOB_PRIORITY_DAILY)
+
             # Register job in registry
             job_id = register_job(job_type=JOB_TYPE_FORECAST, schedule_time=next_run_time, job_params=job_params)
 
             # Add job to scheduler
-            _scheduler.add_job(execute_forecast_job, 'date', run_date=next_run_time, args=[job_id, job_params], id=job_id)
+            _scheduler.add_job(execute_forecast_job, 'date', run_date=next_run_time, args=[job_id, job_params], id=job_id, executor=APS_EXECUTOR_DAILY)
             _scheduler_job_ids.append(job_id)
 
             # Log job addition
@@ -213,6 +232,10 @@ def schedule_one_time_forecast(run_time: datetime.datetime, job_params: Optional
             if job_params is None:
                 job_params = {}
 
+            # One-time runs are ad-hoc unless given another priority (e.g. backfill)
+            job_params = dict(job_params)
+            validate_job_priority(job_params.setdefault("priority", JOB_PRIORITY_ADHOC))
+
             # Register job in registry
             job_id = register_job(job_type=JOB_TYPE_FORECAST, schedule_time=run_time, job_params=job_params)
 
@@ -239,7 +262,7 @@ def run_forecast_now(job_params: Optional[Dict] = None) -> dict:
         job_params: Dictionary of job parameters
 
     Returns:
-        Results of the forecast execution
+        Summary of the forecast execution results
     """
     try:
         # Generate a job ID
@@ -249,6 +272,9 @@ def run_forecast_now(job_params: Optional[Dict] = None) -> dict:
         if job_params is None:
             job_params = {}
 
+        job_params = dict(job_params)
+        validate_job_priority(job_params.setdefault("priority", JOB_PRIORITY_ADHOC))
+
         # Register job in registry
         register_job(job_id=job_id, job_type=JOB_TYPE_FORECAST, schedule_time=datetime.datetime.now(), job_params=job_params)
 
@@ -272,7 +298,7 @@ def execute_forecast_job(job_id: str, job_params: Dict) -> dict:
         job_params: Dictionary of job parameters
 
     Returns:
-        Results of the forecast execution
+        Summary of the forecast execution results
     """
     try:
         # Get job details from registry
@@ -295,19 +321,38 @@ def execute_forecast_job(job_id: str, job_params: Dict) -> dict:
         # Get pipeline configuration from job parameters or use default
         pipeline_config = job_params.get("pipeline_config", get_default_config())
 
-        # Execute the forecasting pipeline
-        results = execute_forecasting_pipeline(target_date, pipeline_config)
+        # Run stages with time budgets when the job has a publication deadline
+        if job_params.get("deadline") is not None:
+            pipeline_config = dict(pipeline_config, deadline=job_params["deadline"])
+
+        # Prepare the fallback forecasts in the background while the pipeline runs
+        # (products prepared after the previous run are skipped)
+        start_fallback_preparation(target_date)
+
+        # Execute the forecasting pipeline in a worker process by priority, or in this thread
+        # when the job executor is not running (e.g. run_forecast_now without the scheduler).
+        # Only the JSON-safe summary of the results is returned from the worker
+        job_executor = get_job_executor()
+        if job_executor is not None:
+            priority = job_params.get("priority", JOB_PRIORITY_ADHOC)
+            summary = job_executor.submit(job_id, priority, run_pipeline_job, target_date, pipeline_config).result()
+        else:
+            summary = run_pipeline_job(target_date, pipeline_config)
 
-        # Update job status to completed
-        update_job_status(job_id, JOB_STATUS_COMPLETED, results)
+        # Prepare the next day's fallbacks from the forecasts just stored, and drop older ones
+        clear_prepared_fallbacks(before_date=target_date)
+        start_fallback_preparation(target_date + datetime.timedelta(days=1))
+
+        # Update job status to completed, recording the summary of the results
+        update_job_status(job_id, JOB_STATUS_COMPLETED, summary)
 
         # Stop job monitoring
-        stop_job_monitoring(job_id, success=True, execution_details=results)
+        stop_job_monitoring(job_id, success=True, execution_details=summary)
 
         # Log job execution completion
-        log_job_execution_completion(job_id, job_details["job_type"], results["execution_time"], results)
+        log_job_execution_completion(job_id, job_details["job_type"], summary["execution_time"], summary)
 
-        return results
+        return summary
 
     except Exception as e:
         # Update job status to failed
@@ -370,6 +415,11 @@ def get_scheduler_status() -> dict:
                 next_run_time = get_next_run_time()
                 status["next_run_time"] = next_run_time.isoformat() if next_run_time else None
 
+            # Worker usage and queue depth of the job executor
+            job_executor = get_job_executor()
+            status["job_executor"] = job_executor.get_status() if job_executor is not None else {"running": False}
+            status["job_queue"] = get_queue_stats()
+
             return status
 
         except Exception as e:
@@ -377,6 +427,16 @@ def get_scheduler_status() -> dict:
             return {"running": False, "error": str(e)}
 
 
+def _recover_job_registry() -> None:
+    """Mark the unfinished jobs of stopped scheduler processes as interrupted and prune the job history"""
+    interrupted = mark_interrupted_jobs()
+    if interrupted:
+        logger.warning(f"Marked {interrupted} jobs of a stopped scheduler process as interrupted")
+    pruned = prune_registry()
+    if pruned:
+        logger.info(f"Pruned {pruned} jobs past the job registry retention period")
+
+
 def _calculate_next_run_time() -> datetime.datetime:
     """Calculate the next run time for daily forecast at 7 AM CST
 
@@ -431,6 +491,8 @@ class ForecastScheduler:
         if self._scheduler is None:
             self.initialize()
 
+        _recover_job_registry()
+        start_job_executor()
         self._scheduler.start()
         self._running = True
         log_scheduler_startup(self._config)
@@ -450,6 +512,7 @@ class ForecastScheduler:
             return False
 
         self._scheduler.shutdown()
+        stop_job_executor()
         self._running = False
         log_scheduler_shutdown(reason, {})
         return True
@@ -502,7 +565,7 @@ class ForecastScheduler:
             job_params: Dictionary of job parameters
 
         Returns:
-            Forecast execution results
+            Summary of the forecast execution results
         """
         return run_forecast_now(job_params)
 
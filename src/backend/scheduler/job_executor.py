@@ -0,0 +1,333 @@
+"""
+Process pool execution of scheduler jobs for the Electricity Market Price Forecasting System.
+
+APScheduler runs jobs on threads of the scheduler process, so ad-hoc runs and backfills
+would compete with the daily 7 AM CST run under the GIL. The JobExecutor instead runs the
+pipeline of each job in a worker process of a shared pool. Jobs wait in a priority queue
+(daily before ad-hoc before backfill, first in first out within a priority) and are handed
+to a worker only when one is free. max_workers workers are shared by all jobs; the
+reserved_daily_workers extra workers are only used by daily runs, so backfills can keep
+every shared worker busy without delaying the daily forecast. Each job runs with an
+address space limit so a runaway job fails with a MemoryError instead of taking down the
+host. Queue and wait times are recorded in the job registry.
+"""
+
+import heapq
+import itertools
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+# Internal imports
+from .job_registry import mark_job_queued, mark_job_started
+from ..utils.logging_utils import get_logger
+from ..config.settings import SCHEDULER_MAX_WORKERS, SCHEDULER_RESERVED_DAILY_WORKERS, SCHEDULER_JOB_MEMORY_LIMIT_MB
+
+# Set up logger
+logger = get_logger(__name__)
+
+# Job priorities (lower values run first)
+JOB_PRIORITY_DAILY = "daily"
+JOB_PRIORITY_ADHOC = "adhoc"
+JOB_PRIORITY_BACKFILL = "backfill"
+JOB_PRIORITIES = {JOB_PRIORITY_DAILY: 0, JOB_PRIORITY_ADHOC: 1, JOB_PRIORITY_BACKFILL: 2}
+
+# Shared executor used by the scheduler
+_job_executor: Optional["JobExecutor"] = None
+_job_executor_lock = threading.Lock()
+
+
+def validate_job_priority(priority: str) -> str:
+    """
+    Validates a job priority name.
+
+    Raises:
+        ValueError: If the priority is unknown
+    """
+    if priority not in JOB_PRIORITIES:
+        raise ValueError(f"Invalid job priority: {priority}. Must be one of {list(JOB_PRIORITIES)}")
+    return priority
+
+
+def _run_job(func: Callable, args: Tuple, memory_limit_mb: int) -> Any:
+    """
+    Runs a job function in a worker process with an address space limit.
+
+    Workers are reused between jobs, so the previous limit is restored afterwards. Exceptions
+    that cannot be unpickled in the scheduler process (custom exceptions with required
+    constructor arguments) would break the pool, so they are re-raised as RuntimeError.
+    """
+    previous_limit = None
+    if resource is not None and memory_limit_mb > 0:
+        previous_limit = resource.getrlimit(resource.RLIMIT_AS)
+        limit = memory_limit_mb * 1024 * 1024
+        if previous_limit[1] != resource.RLIM_INFINITY:
+            limit = min(limit, previous_limit[1])
+        resource.setrlimit(resource.RLIMIT_AS, (limit, previous_limit[1]))
+
+    try:
+        return func(*args)
+    except Exception as e:
+        try:
+            pickle.loads(pickle.dumps(e))
+        except Exception:
+            raise RuntimeError(f"{type(e).__name__}: {str(e)}") from None
+        raise
+    finally:
+        if previous_limit is not None:
+            resource.setrlimit(resource.RLIMIT_AS, previous_limit)
+
+
+class JobExecutor:
+    """
+    Runs jobs in a process pool in priority order with workers reserved for daily runs.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = SCHEDULER_MAX_WORKERS,
+        reserved_daily_workers: int = SCHEDULER_RESERVED_DAILY_WORKERS,
+        memory_limit_mb: int = SCHEDULER_JOB_MEMORY_LIMIT_MB
+    ):
+        """
+        Initializes the executor.
+
+        Args:
+            max_workers: Worker processes shared by all jobs
+            reserved_daily_workers: Additional worker processes only used by daily runs
+            memory_limit_mb: Address space limit of a job in MB (0 for no limit)
+        """
+        self.max_workers = max(1, max_workers)
+        self.reserved_daily_workers = max(0, reserved_daily_workers)
+        self.memory_limit_mb = memory_limit_mb
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._queue: List[Tuple[int, int, str, str, Callable, Tuple, Future]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._running: Dict[str, int] = {priority: 0 for priority in JOB_PRIORITIES}
+        self._dispatcher: Optional[threading.Thread] = None
+        self._stopping = False
+
+    @property
+    def total_workers(self) -> int:
+        """
+        Number of worker processes in the pool.
+        """
+        return self.max_workers + self.reserved_daily_workers
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        # Forked like the deadline runner's stage workers, so the pipeline modules are already loaded
+        return ProcessPoolExecutor(max_workers=self.total_workers, mp_context=multiprocessing.get_context("fork"))
+
+    def start(self) -> None:
+        """
+        Starts the worker pool and the dispatcher thread (no-op if already running).
+        """
+        with self._condition:
+            if self.is_running():
+                return
+
+            self._stopping = False
+            self._pool = self._create_pool()
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="job-executor-dispatcher", daemon=True)
+            self._dispatcher.start()
+
+        logger.info(
+            f"Started job executor with {self.max_workers} shared and {self.reserved_daily_workers} "
+            f"daily-only workers, {self.memory_limit_mb} MB per job"
+        )
+
+    def is_running(self) -> bool:
+        """
+        Checks whether the executor accepts jobs.
+        """
+        return self._dispatcher is not None and self._dispatcher.is_alive() and not self._stopping
+
+    def submit(self, job_id: str, priority: str, func: Callable, *args) -> Future:
+        """
+        Queues a job for execution in a worker process.
+
+        Args:
+            job_id: ID of the job in the job registry
+            priority: JOB_PRIORITY_DAILY, JOB_PRIORITY_ADHOC or JOB_PRIORITY_BACKFILL
+            func: Module-level function run in the worker
+            *args: Picklable arguments of func
+
+        Returns:
+            Future resolved with the result of func
+
+        Raises:
+            ValueError: If the priority is unknown
+            RuntimeError: If the executor is not running
+        """
+        validate_job_priority(priority)
+        future = Future()
+
+        with self._condition:
+            if not self.is_running():
+                raise RuntimeError("Job executor is not running")
+
+            heapq.heappush(
+                self._queue,
+                (JOB_PRIORITIES[priority], next(self._sequence), job_id, priority, func, args, future)
+            )
+            mark_job_queued(job_id, priority)
+            self._condition.notify_all()
+
+        logger.debug(f"Queued job {job_id} with priority {priority}")
+        return future
+
+    def _can_start(self, priority: str) -> bool:
+        # Daily runs may use any worker, other jobs only the shared ones
+        running = sum(self._running.values())
+        if priority == JOB_PRIORITY_DAILY:
+            return running < self.total_workers
+        return running - self._running[JOB_PRIORITY_DAILY] < self.max_workers and running < self.total_workers
+
+    def _dispatch_loop(self) -> None:
+        """
+        Hands queued jobs to the pool in priority order as workers become free.
+        """
+        while True:
+            with self._condition:
+                while not self._stopping and not (self._queue and self._can_start(self._queue[0][3])):
+                    self._condition.wait()
+                if self._stopping:
+                    return
+
+                _, _, job_id, priority, func, args, future = heapq.heappop(self._queue)
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._running[priority] += 1
+                pool = self._pool
+
+            mark_job_started(job_id)
+            logger.debug(f"Starting job {job_id} ({priority}) in a worker process")
+            try:
+                pool_future = pool.submit(_run_job, func, args, self.memory_limit_mb)
+            except Exception as e:
+                self._finish(job_id, priority, future, pool, None, e)
+                continue
+            pool_future.add_done_callback(
+                lambda done, job_id=job_id, priority=priority, future=future, pool=pool: self._finish(
+                    job_id, priority, future, pool, done, None
+                )
+            )
+
+    def _finish(
+        self,
+        job_id: str,
+        priority: str,
+        future: Future,
+        pool: ProcessPoolExecutor,
+        pool_future: Optional[Future],
+        error: Optional[BaseException]
+    ) -> None:
+        """
+        Releases the job's worker and resolves its future.
+        """
+        if error is None and pool_future is not None:
+            error = CancelledError() if pool_future.cancelled() else pool_future.exception()
+
+        with self._condition:
+            self._running[priority] -= 1
+            if isinstance(error, BrokenProcessPool) and not self._stopping and pool is self._pool:
+                # A worker died (e.g. killed for memory), which breaks the whole pool
+                logger.error(f"Worker process of job {job_id} terminated abruptly, restarting the job executor pool")
+                self._pool.shutdown(wait=False)
+                self._pool = self._create_pool()
+            self._condition.notify_all()
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(pool_future.result())
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the executor, cancelling queued jobs.
+
+        Args:
+            wait: Whether to wait for running jobs to finish
+        """
+        with self._condition:
+            self._stopping = True
+            queued, self._queue = self._queue, []
+            self._condition.notify_all()
+
+        for item in queued:
+            item[-1].cancel()
+
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout=5)
+            self._dispatcher = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+        logger.info(f"Stopped job executor, cancelled {len(queued)} queued jobs")
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Gets worker usage and queue depth by priority.
+        """
+        with self._condition:
+            queued: Dict[str, int] = {priority: 0 for priority in JOB_PRIORITIES}
+            for item in self._queue:
+                queued[item[3]] += 1
+            return {
+                "running": self.is_running(),
+                "max_workers": self.max_workers,
+                "reserved_daily_workers": self.reserved_daily_workers,
+                "memory_limit_mb": self.memory_limit_mb,
+                "running_jobs": dict(self._running),
+                "queued_jobs": queued
+            }
+
+
+def start_job_executor(**kwargs) -> JobExecutor:
+    """
+    Starts the shared job executor (no-op if it is already running).
+
+    Args:
+        **kwargs: JobExecutor arguments, used when a new executor is created
+
+    Returns:
+        The shared job executor
+    """
+    global _job_executor
+
+    with _job_executor_lock:
+        if _job_executor is None or not _job_executor.is_running():
+            _job_executor = JobExecutor(**kwargs)
+            _job_executor.start()
+        return _job_executor
+
+
+def stop_job_executor(wait: bool = True) -> None:
+    """
+    Stops the shared job executor if it is running.
+    """
+    global _job_executor
+
+    with _job_executor_lock:
+        if _job_executor is not None:
+            _job_executor.shutdown(wait=wait)
+            _job_executor = None
+
+
+def get_job_executor() -> Optional[JobExecutor]:
+    """
+    Gets the shared job executor if it is running.
+    """
+    executor = _job_executor
+    return executor if executor is not None and executor.is_running() else None
@@ -3,8 +3,23 @@ Registry for managing scheduled jobs in the Electricity Market Price Forecasting
 
 This module provides functionality to register, retrieve, update, and query jobs with their
 statuses, supporting the daily forecast generation process scheduled at 7 AM CST.
+
+Jobs are stored in a SQLite database (JOB_REGISTRY_DB_FILE) so the run history survives
+restarts and is visible to other processes such as the API health check. The database runs
+in WAL mode: readers never block the scheduler's writes, and each thread and process uses its
+own connection. Jobs are indexed by status, type and creation time, so status and type
+queries and the "last N runs" query do not scan the whole history. Finished jobs older than
+JOB_REGISTRY_RETENTION_DAYS are removed by prune_registry. Each job records the instance ID
+of the process that registered it (a UUID generated when the process starts), so jobs left
+unfinished by a previous scheduler are recognized even when a restarted container reuses
+its process ID.
 """
+import contextlib
 import datetime
+import json
+import os
+import pathlib
+import sqlite3
 import uuid
 import threading
 from typing import List, Dict, Any, Optional
@@ -16,11 +31,23 @@ from .scheduler_logging import (
     log_scheduler_error
 )
 from ..utils.logging_utils import format_dict_for_logging
+from ..config.settings import JOB_REGISTRY_DB_FILE, JOB_REGISTRY_RETENTION_DAYS
 
-# Global registry dictionary and lock for thread safety
-_job_registry = {}
+# Lock serializing the registry writes of this process (other processes wait on the database lock)
 _registry_lock = threading.RLock()
 
+# Per-thread database connections, reopened in forked processes
+_connections = threading.local()
+
+# Seconds a write waits for another process's write transaction
+DB_BUSY_TIMEOUT_SECONDS = 30
+
+# ID of this process start, recorded with the jobs it registers (inherited by forked job workers)
+_instance_id = str(uuid.uuid4())
+
+# Job type of the forecast generation runs
+JOB_TYPE_FORECAST = "forecast"
+
 # Job status constants
 JOB_STATUS_PENDING = "pending"
 JOB_STATUS_RUNNING = "running"
@@ -32,27 +59,191 @@ JOB_STATUS_INTERRUPTED = "interrupted"
 VALID_JOB_STATUSES = [
     JOB_STATUS_PENDING,
     JOB_STATUS_RUNNING,
-    JOB_STATUS_COMPLETED, 
+    JOB_STATUS_COMPLETED,
     JOB_STATUS_FAILED,
     JOB_STATUS_TIMEOUT,
     JOB_STATUS_INTERRUPTED
 ]
 
+# Statuses of jobs that have not finished
+ACTIVE_JOB_STATUSES = (JOB_STATUS_PENDING, JOB_STATUS_RUNNING)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    job_type TEXT,
+    status TEXT NOT NULL,
+    schedule_time TEXT,
+    creation_time TEXT NOT NULL,
+    status_update_time TEXT,
+    status_details TEXT,
+    job_params TEXT NOT NULL,
+    priority TEXT,
+    queued_time TEXT,
+    start_time TEXT,
+    wait_seconds REAL,
+    process_id INTEGER,
+    instance_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, creation_time);
+CREATE INDEX IF NOT EXISTS idx_jobs_type ON jobs (job_type, creation_time);
+CREATE INDEX IF NOT EXISTS idx_jobs_creation_time ON jobs (creation_time);
+CREATE INDEX IF NOT EXISTS idx_jobs_queued ON jobs (priority, queued_time)
+    WHERE queued_time IS NOT NULL AND start_time IS NULL;
+"""
+
+# Key marking a datetime in the JSON job parameters and status details
+_DATETIME_KEY = "__datetime__"
+
+def _reset_after_fork() -> None:
+    # Forked children must not inherit a lock held by another thread or share the parent's
+    # connections; the inherited connections are kept referenced so they are never closed here
+    global _registry_lock
+    _registry_lock = threading.RLock()
+    _connections.inherited = getattr(_connections, "inherited", []) + list(getattr(_connections, "by_path", {}).values())
+    _connections.by_path = {}
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    Gets the calling thread's connection to the registry database, creating it on first use.
+    """
+    by_path = getattr(_connections, "by_path", None)
+    if by_path is None:
+        by_path = _connections.by_path = {}
+
+    db_path = str(JOB_REGISTRY_DB_FILE)
+    connection = by_path.get(db_path)
+    if connection is None:
+        pathlib.Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: write transactions are started explicitly by _write_transaction
+        connection = sqlite3.connect(db_path, timeout=DB_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        _migrate_schema(connection)
+        by_path[db_path] = connection
+    return connection
+
+def _migrate_schema(connection: sqlite3.Connection) -> None:
+    """
+    Adds the columns introduced after a registry database was created.
+    """
+    columns = {row["name"] for row in connection.execute("PRAGMA table_info(jobs)")}
+    if "instance_id" not in columns:
+        try:
+            connection.execute("ALTER TABLE jobs ADD COLUMN instance_id TEXT")
+        except sqlite3.OperationalError as e:
+            # Another process added it first
+            if "duplicate column" not in str(e):
+                raise
+
+@contextlib.contextmanager
+def _write_transaction():
+    """
+    Runs a read-modify-write of the registry in a transaction holding the database write lock.
+    """
+    with _registry_lock:
+        connection = _get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+def _format_time(value: Optional[datetime.datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+def _parse_time(value: Optional[str]) -> Optional[datetime.datetime]:
+    return datetime.datetime.fromisoformat(value) if value is not None else None
+
+def _json_default(value: Any) -> Any:
+    # Datetimes (e.g. publication deadlines) are restored on read, other values are stored as text
+    if isinstance(value, datetime.datetime):
+        return {_DATETIME_KEY: value.isoformat()}
+    return str(value)
+
+def _json_object_hook(value: Dict) -> Any:
+    if len(value) == 1 and _DATETIME_KEY in value:
+        return datetime.datetime.fromisoformat(value[_DATETIME_KEY])
+    return value
+
+def _dump_json(value: Any) -> str:
+    return json.dumps(value, default=_json_default)
+
+def _load_json(value: Optional[str]) -> Any:
+    return json.loads(value, object_hook=_json_object_hook) if value is not None else None
+
+def _row_to_job(row: sqlite3.Row) -> Dict:
+    """
+    Converts a database row to a job details dictionary.
+    """
+    job = {
+        "job_id": row["job_id"],
+        "job_type": row["job_type"],
+        "schedule_time": _parse_time(row["schedule_time"]),
+        "creation_time": _parse_time(row["creation_time"]),
+        "status": row["status"],
+        "job_params": _load_json(row["job_params"])
+    }
+    if row["status_update_time"] is not None:
+        job["status_update_time"] = _parse_time(row["status_update_time"])
+    if row["status_details"] is not None:
+        job["status_details"] = _load_json(row["status_details"])
+    if row["queued_time"] is not None:
+        job["priority"] = row["priority"]
+        job["queued_time"] = _parse_time(row["queued_time"])
+        job["start_time"] = _parse_time(row["start_time"])
+        job["wait_seconds"] = row["wait_seconds"]
+    return job
+
+def _query_jobs(where: str = "", params: tuple = (), order: str = "creation_time, rowid", limit: Optional[int] = None) -> List[Dict]:
+    """
+    Selects jobs matching a WHERE clause as job details dictionaries.
+    """
+    query = "SELECT * FROM jobs"
+    if where:
+        query += f" WHERE {where}"
+    query += f" ORDER BY {order}"
+    if limit is not None:
+        query += " LIMIT ?"
+        params = params + (limit,)
+    return [_row_to_job(row) for row in _get_connection().execute(query, params)]
+
+def _is_process_alive(pid: Optional[int]) -> bool:
+    """
+    Checks whether a process with the given ID exists on this host.
+    """
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
 def register_job(job_id: str = None, job_type: str = None,
                schedule_time: datetime.datetime = None,
                job_params: Dict = None) -> str:
     """
     Registers a new job in the registry with initial status.
-    
+
     Args:
         job_id: Optional ID for the job, will be generated if not provided
         job_type: Type of job (e.g., 'forecast_generation')
         schedule_time: When the job is scheduled to run
         job_params: Additional parameters for the job
-        
+
     Returns:
         ID of the registered job
-        
+
     Raises:
         JobRegistryError: If job registration fails or job_id already exists
     """
@@ -60,44 +251,47 @@ def register_job(job_id: str = None, job_type: str = None,
         # Generate job_id if not provided
         if job_id is None:
             job_id = str(uuid.uuid4())
-            
-        with _registry_lock:
+
+        with _write_transaction() as connection:
             # Check if job with same ID already exists
-            if job_id in _job_registry:
+            if connection.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone() is not None:
                 raise JobRegistryError(
                     f"Job with ID {job_id} already exists in registry",
                     "register_job",
                     job_id
                 )
-            
-            # Create job entry
-            job_entry = {
-                "job_id": job_id,
-                "job_type": job_type,
-                "schedule_time": schedule_time,
-                "creation_time": datetime.datetime.now(),
-                "status": JOB_STATUS_PENDING,
-                "job_params": job_params or {}
-            }
-            
-            # Add to registry
-            _job_registry[job_id] = job_entry
-            
-            # Log registration
-            log_job_registration(
-                job_id, 
-                job_type,
-                schedule_time, 
-                job_params or {}
+
+            # Add the job entry to the registry
+            connection.execute(
+                "INSERT INTO jobs (job_id, job_type, status, schedule_time, creation_time, job_params, process_id, instance_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    job_type,
+                    JOB_STATUS_PENDING,
+                    _format_time(schedule_time),
+                    _format_time(datetime.datetime.now()),
+                    _dump_json(job_params or {}),
+                    os.getpid(),
+                    _instance_id
+                )
             )
-            
-            return job_id
+
+        # Log registration
+        log_job_registration(
+            job_id,
+            job_type,
+            schedule_time,
+            job_params or {}
+        )
+
+        return job_id
     except Exception as e:
         if not isinstance(e, JobRegistryError):
             error_msg = f"Failed to register job: {str(e)}"
             log_scheduler_error(
-                error_msg, 
-                e, 
+                error_msg,
+                e,
                 {"operation": "register_job", "job_id": job_id}
             )
             raise JobRegistryError(error_msg, "register_job", job_id)
@@ -106,45 +300,41 @@ def register_job(job_id: str = None, job_type: str = None,
 def get_job(job_id: str) -> Dict:
     """
     Retrieves job details by ID.
-    
+
     Args:
         job_id: ID of the job to retrieve
-        
+
     Returns:
         Job details dictionary or None if not found
-        
+
     Raises:
         JobRegistryError: If retrieval operation fails
     """
     try:
-        with _registry_lock:
-            if job_id in _job_registry:
-                # Return a copy to prevent modification of registry data
-                return dict(_job_registry[job_id])
-            else:
-                return None
+        jobs = _query_jobs("job_id = ?", (job_id,))
+        return jobs[0] if jobs else None
     except Exception as e:
         error_msg = f"Failed to retrieve job {job_id}: {str(e)}"
         log_scheduler_error(
-            error_msg, 
-            e, 
+            error_msg,
+            e,
             {"operation": "get_job", "job_id": job_id}
         )
         raise JobRegistryError(error_msg, "get_job", job_id)
 
-def update_job_status(job_id: str, status: str, 
+def update_job_status(job_id: str, status: str,
                      status_details: Dict = None) -> bool:
     """
     Updates the status of a registered job.
-    
+
     Args:
         job_id: ID of the job to update
         status: New status value (must be from VALID_JOB_STATUSES)
         status_details: Additional details about the status change
-        
+
     Returns:
         True if update successful, False if job not found
-        
+
     Raises:
         ValueError: If status is not valid
         JobRegistryError: If update operation fails
@@ -153,53 +343,166 @@ def update_job_status(job_id: str, status: str,
         raise ValueError(f"Invalid job status: {status}. "
                          f"Must be one of {VALID_JOB_STATUSES}")
     try:
-        with _registry_lock:
-            if job_id not in _job_registry:
+        with _write_transaction() as connection:
+            row = connection.execute("SELECT status FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
                 return False
-            
+
             # Store previous status for logging
-            previous_status = _job_registry[job_id]["status"]
-            
-            # Update status
-            _job_registry[job_id]["status"] = status
-            
-            # Add status update timestamp
-            _job_registry[job_id]["status_update_time"] = datetime.datetime.now()
-            
-            # Add status details if provided
-            if status_details:
-                _job_registry[job_id]["status_details"] = status_details
-            
-            # Log status update
-            log_job_status_update(
-                job_id, 
-                previous_status, 
-                status, 
-                status_details
+            previous_status = row["status"]
+
+            # Update status with the status update timestamp, and the status details if provided
+            connection.execute(
+                "UPDATE jobs SET status = ?, status_update_time = ?, "
+                "status_details = COALESCE(?, status_details) WHERE job_id = ?",
+                (
+                    status,
+                    _format_time(datetime.datetime.now()),
+                    _dump_json(status_details) if status_details else None,
+                    job_id
+                )
             )
-            
-            return True
+
+        # Log status update
+        log_job_status_update(
+            job_id,
+            previous_status,
+            status,
+            status_details
+        )
+
+        return True
     except Exception as e:
         if not isinstance(e, ValueError):
             error_msg = f"Failed to update job status for {job_id}: {str(e)}"
             log_scheduler_error(
-                error_msg, 
-                e, 
+                error_msg,
+                e,
                 {"operation": "update_job_status", "job_id": job_id}
             )
             raise JobRegistryError(error_msg, "update_job_status", job_id)
         raise
 
+def mark_job_queued(job_id: str, priority: str) -> bool:
+    """
+    Records that a job was queued for execution in the job executor.
+
+    Args:
+        job_id: ID of the queued job
+        priority: Priority name the job was queued with
+
+    Returns:
+        True if recorded, False if job not found
+
+    Raises:
+        JobRegistryError: If update operation fails
+    """
+    try:
+        with _write_transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET priority = ?, queued_time = ?, start_time = NULL, wait_seconds = NULL "
+                "WHERE job_id = ?",
+                (priority, _format_time(datetime.datetime.now()), job_id)
+            )
+            return cursor.rowcount > 0
+    except Exception as e:
+        error_msg = f"Failed to mark job {job_id} as queued: {str(e)}"
+        log_scheduler_error(
+            error_msg,
+            e,
+            {"operation": "mark_job_queued", "job_id": job_id}
+        )
+        raise JobRegistryError(error_msg, "mark_job_queued", job_id)
+
+def mark_job_started(job_id: str) -> bool:
+    """
+    Records that a queued job was handed to a worker process, and its wait time.
+
+    Args:
+        job_id: ID of the started job
+
+    Returns:
+        True if recorded, False if job not found
+
+    Raises:
+        JobRegistryError: If update operation fails
+    """
+    try:
+        with _write_transaction() as connection:
+            row = connection.execute("SELECT queued_time FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return False
+
+            start_time = datetime.datetime.now()
+            queued_time = _parse_time(row["queued_time"])
+            wait_seconds = (start_time - queued_time).total_seconds() if queued_time is not None else None
+            connection.execute(
+                "UPDATE jobs SET start_time = ?, wait_seconds = COALESCE(?, wait_seconds) WHERE job_id = ?",
+                (_format_time(start_time), wait_seconds, job_id)
+            )
+            return True
+    except Exception as e:
+        error_msg = f"Failed to mark job {job_id} as started: {str(e)}"
+        log_scheduler_error(
+            error_msg,
+            e,
+            {"operation": "mark_job_started", "job_id": job_id}
+        )
+        raise JobRegistryError(error_msg, "mark_job_started", job_id)
+
+def get_queue_stats() -> Dict[str, Any]:
+    """
+    Gets queue depth and wait times of jobs run through the job executor.
+
+    Returns:
+        Dictionary with queue_depth, queue_depth_by_priority, oldest_wait_seconds (of the
+        jobs still queued) and average_wait_seconds/max_wait_seconds by priority (of the
+        jobs started within the retention period)
+
+    Raises:
+        JobRegistryError: If operation fails
+    """
+    try:
+        now = datetime.datetime.now()
+        connection = _get_connection()
+        queued_rows = connection.execute(
+            "SELECT priority, COUNT(*) AS depth, MIN(queued_time) AS oldest_queued_time FROM jobs "
+            "WHERE queued_time IS NOT NULL AND start_time IS NULL AND status IN (?, ?) GROUP BY priority",
+            ACTIVE_JOB_STATUSES
+        ).fetchall()
+        wait_rows = connection.execute(
+            "SELECT priority, AVG(wait_seconds) AS average_wait, MAX(wait_seconds) AS max_wait FROM jobs "
+            "WHERE wait_seconds IS NOT NULL GROUP BY priority"
+        ).fetchall()
+
+        return {
+            "queue_depth": sum(row["depth"] for row in queued_rows),
+            "queue_depth_by_priority": {row["priority"]: row["depth"] for row in queued_rows},
+            "oldest_wait_seconds": max(
+                ((now - _parse_time(row["oldest_queued_time"])).total_seconds() for row in queued_rows), default=0.0
+            ),
+            "average_wait_seconds": {row["priority"]: row["average_wait"] for row in wait_rows},
+            "max_wait_seconds": {row["priority"]: row["max_wait"] for row in wait_rows}
+        }
+    except Exception as e:
+        error_msg = f"Failed to get queue statistics: {str(e)}"
+        log_scheduler_error(
+            error_msg,
+            e,
+            {"operation": "get_queue_stats"}
+        )
+        raise JobRegistryError(error_msg, "get_queue_stats", "")
+
 def get_jobs_by_status(status: str) -> List[Dict]:
     """
     Gets all jobs with a specific status.
-    
+
     Args:
         status: Status to filter by (must be from VALID_JOB_STATUSES)
-        
+
     Returns:
         List of job details dictionaries
-        
+
     Raises:
         ValueError: If status is not valid
         JobRegistryError: If operation fails
@@ -208,97 +511,201 @@ def get_jobs_by_status(status: str) -> List[Dict]:
         raise ValueError(f"Invalid job status: {status}. "
                          f"Must be one of {VALID_JOB_STATUSES}")
     try:
-        with _registry_lock:
-            matching_jobs = []
-            for job_id, job_data in _job_registry.items():
-                if job_data["status"] == status:
-                    # Return copies to prevent modification of registry data
-                    matching_jobs.append(dict(job_data))
-            return matching_jobs
+        return _query_jobs("status = ?", (status,))
     except Exception as e:
-        if not isinstance(e, ValueError):
-            error_msg = f"Failed to get jobs by status {status}: {str(e)}"
-            log_scheduler_error(
-                error_msg, 
-                e, 
-                {"operation": "get_jobs_by_status", "status": status}
-            )
-            raise JobRegistryError(error_msg, "get_jobs_by_status", "")
-        raise
+        error_msg = f"Failed to get jobs by status {status}: {str(e)}"
+        log_scheduler_error(
+            error_msg,
+            e,
+            {"operation": "get_jobs_by_status", "status": status}
+        )
+        raise JobRegistryError(error_msg, "get_jobs_by_status", "")
 
 def get_jobs_by_type(job_type: str) -> List[Dict]:
     """
     Gets all jobs of a specific type.
-    
+
     Args:
         job_type: Job type to filter by
-        
+
     Returns:
         List of job details dictionaries
-        
+
     Raises:
         JobRegistryError: If operation fails
     """
     try:
-        with _registry_lock:
-            matching_jobs = []
-            for job_id, job_data in _job_registry.items():
-                if job_data["job_type"] == job_type:
-                    # Return copies to prevent modification of registry data
-                    matching_jobs.append(dict(job_data))
-            return matching_jobs
+        return _query_jobs("job_type = ?", (job_type,))
     except Exception as e:
         error_msg = f"Failed to get jobs by type {job_type}: {str(e)}"
         log_scheduler_error(
-            error_msg, 
-            e, 
+            error_msg,
+            e,
             {"operation": "get_jobs_by_type", "job_type": job_type}
         )
         raise JobRegistryError(error_msg, "get_jobs_by_type", "")
 
+def get_recent_jobs(limit: int = 10, job_type: Optional[str] = None,
+                    status: Optional[str] = None) -> List[Dict]:
+    """
+    Gets the most recently registered jobs, newest first (e.g. the last runs for the health check).
+
+    Args:
+        limit: Maximum number of jobs to return
+        job_type: Optional job type to filter by
+        status: Optional status to filter by (must be from VALID_JOB_STATUSES)
+
+    Returns:
+        List of job details dictionaries
+
+    Raises:
+        ValueError: If status is not valid
+        JobRegistryError: If operation fails
+    """
+    if status is not None and status not in VALID_JOB_STATUSES:
+        raise ValueError(f"Invalid job status: {status}. "
+                         f"Must be one of {VALID_JOB_STATUSES}")
+    try:
+        conditions, params = [], ()
+        if job_type is not None:
+            conditions.append("job_type = ?")
+            params += (job_type,)
+        if status is not None:
+            conditions.append("status = ?")
+            params += (status,)
+        return _query_jobs(" AND ".join(conditions), params, order="creation_time DESC, rowid DESC", limit=limit)
+    except Exception as e:
+        error_msg = f"Failed to get recent jobs: {str(e)}"
+        log_scheduler_error(
+            error_msg,
+            e,
+            {"operation": "get_recent_jobs", "job_type": job_type, "status": status}
+        )
+        raise JobRegistryError(error_msg, "get_recent_jobs", "")
+
 def get_all_jobs() -> List[Dict]:
     """
     Gets all jobs in the registry.
-    
+
     Returns:
         List of all job details dictionaries
-        
+
     Raises:
         JobRegistryError: If operation fails
     """
     try:
-        with _registry_lock:
-            # Return copies to prevent modification of registry data
-            return [dict(job_data) for job_data in _job_registry.values()]
+        return _query_jobs()
     except Exception as e:
         error_msg = f"Failed to get all jobs: {str(e)}"
         log_scheduler_error(
-            error_msg, 
-            e, 
+            error_msg,
+            e,
             {"operation": "get_all_jobs"}
         )
         raise JobRegistryError(error_msg, "get_all_jobs", "")
 
+def prune_registry(retention_days: int = None) -> int:
+    """
+    Removes finished jobs registered before the retention period.
+
+    Args:
+        retention_days: Days finished jobs are kept, defaults to JOB_REGISTRY_RETENTION_DAYS
+            (0 or less keeps all jobs)
+
+    Returns:
+        Number of jobs removed
+
+    Raises:
+        JobRegistryError: If operation fails
+    """
+    if retention_days is None:
+        retention_days = JOB_REGISTRY_RETENTION_DAYS
+    if retention_days <= 0:
+        return 0
+    try:
+        cutoff = datetime.datetime.now() - datetime.timedelta(days=retention_days)
+        with _write_transaction() as connection:
+            cursor = connection.execute(
+                "DELETE FROM jobs WHERE creation_time < ? AND status NOT IN (?, ?)",
+                (_format_time(cutoff),) + ACTIVE_JOB_STATUSES
+            )
+            return cursor.rowcount
+    except Exception as e:
+        error_msg = f"Failed to prune registry: {str(e)}"
+        log_scheduler_error(
+            error_msg,
+            e,
+            {"operation": "prune_registry", "retention_days": retention_days}
+        )
+        raise JobRegistryError(error_msg, "prune_registry", "")
+
+def mark_interrupted_jobs() -> int:
+    """
+    Marks pending and running jobs of processes that no longer exist as interrupted.
+
+    Called when the scheduler starts, so jobs of a previous scheduler process that stopped
+    before they finished are not reported as pending or running forever. Jobs are matched by
+    instance ID rather than process ID, since a restarted container usually runs the
+    scheduler under the same PID. Jobs of another instance whose process is still running
+    (e.g. run_forecast_now from a separate process) are left alone.
+
+    Returns:
+        Number of jobs marked as interrupted
+
+    Raises:
+        JobRegistryError: If operation fails
+    """
+    try:
+        current_pid = os.getpid()
+        with _write_transaction() as connection:
+            rows = connection.execute(
+                "SELECT job_id, status, process_id, instance_id FROM jobs WHERE status IN (?, ?)",
+                ACTIVE_JOB_STATUSES
+            ).fetchall()
+            interrupted = [
+                row for row in rows
+                if row["instance_id"] != _instance_id
+                and (row["process_id"] == current_pid or not _is_process_alive(row["process_id"]))
+            ]
+            status_details = {"reason": "Scheduler process stopped before the job finished"}
+            connection.executemany(
+                "UPDATE jobs SET status = ?, status_update_time = ?, status_details = ? WHERE job_id = ?",
+                [
+                    (JOB_STATUS_INTERRUPTED, _format_time(datetime.datetime.now()), _dump_json(status_details), row["job_id"])
+                    for row in interrupted
+                ]
+            )
+
+        for row in interrupted:
+            log_job_status_update(row["job_id"], row["status"], JOB_STATUS_INTERRUPTED, status_details)
+        return len(interrupted)
+    except Exception as e:
+        error_msg = f"Failed to mark interrupted jobs: {str(e)}"
+        log_scheduler_error(
+            error_msg,
+            e,
+            {"operation": "mark_interrupted_jobs"}
+        )
+        raise JobRegistryError(error_msg, "mark_interrupted_jobs", "")
+
 def clear_registry() -> int:
     """
     Clears all jobs from the registry.
-    
+
     Returns:
         Number of jobs cleared
-        
+
     Raises:
         JobRegistryError: If operation fails
     """
     try:
-        with _registry_lock:
-            job_count = len(_job_registry)
-            _job_registry.clear()
-            return job_count
+        with _write_transaction() as connection:
+            return connection.execute("DELETE FROM jobs").rowcount
     except Exception as e:
         error_msg = f"Failed to clear registry: {str(e)}"
         log_scheduler_error(
-            error_msg, 
-            e, 
+            error_msg,
+            e,
             {"operation": "clear_registry"}
         )
         raise JobRegistryError(error_msg, "clear_registry", "")
@@ -306,28 +713,24 @@ def clear_registry() -> int:
 def remove_job(job_id: str) -> bool:
     """
     Removes a specific job from the registry.
-    
+
     Args:
         job_id: ID of the job to remove
-        
+
     Returns:
         True if job was removed, False if not found
-        
+
     Raises:
         JobRegistryError: If operation fails
     """
     try:
-        with _registry_lock:
-            if job_id not in _job_registry:
-                return False
-            
-            del _job_registry[job_id]
-            return True
+        with _write_transaction() as connection:
+            return connection.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,)).rowcount > 0
     except Exception as e:
         error_msg = f"Failed to remove job {job_id}: {str(e)}"
         log_scheduler_error(
-            error_msg, 
-            e, 
+            error_msg,
+            e,
             {"operation": "remove_job", "job_id": job_id}
         )
         raise JobRegistryError(error_msg, "remove_job", job_id)
@@ -335,21 +738,20 @@ def remove_job(job_id: str) -> bool:
 def get_job_count() -> int:
     """
     Gets the total number of jobs in the registry.
-    
+
     Returns:
         Number of jobs in the registry
-        
+
     Raises:
         JobRegistryError: If operation fails
     """
     try:
-        with _registry_lock:
-            return len(_job_registry)
+        return _get_connection().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
     except Exception as e:
         error_msg = f"Failed to get job count: {str(e)}"
         log_scheduler_error(
-            error_msg, 
-            e, 
+            error_msg,
+            e,
             {"operation": "get_job_count"}
         )
-        raise JobRegistryError(error_msg, "get_job_count", "")
\ No newline at end of file
+        raise JobRegistryError(error_msg, "get_job_count", "")
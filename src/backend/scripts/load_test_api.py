@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+Simple closed-loop load generator for the forecast API.
+
+Runs a fixed number of concurrent clients against an endpoint for a fixed duration and
+reports throughput and latency percentiles. Run it against the server started with
+different ``--workers`` values to compare throughput scaling, e.g.:
+
+    python -m src.backend.main serve --production --workers 1 --port 5000
+    python src/backend/scripts/load_test_api.py --url http://localhost:5000/forecasts/latest/DALMP
+
+    python -m src.backend.main serve --production --workers 4 --port 5000
+    python src/backend/scripts/load_test_api.py --url http://localhost:5000/forecasts/latest/DALMP
+"""
+
+import argparse
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+# Default load test parameters
+DEFAULT_URL = "http://localhost:5000/health"
+DEFAULT_CONCURRENCY = 16
+DEFAULT_DURATION_SECONDS = 10.0
+REQUEST_TIMEOUT_SECONDS = 30
+
+
+def run_client(url: str, deadline: float, latencies: List[float], errors: List[str], lock: threading.Lock) -> None:
+    """
+    Issues requests back-to-back until the deadline, recording latencies and errors
+
+    Args:
+        url: Endpoint to request
+        deadline: time.monotonic() value at which to stop
+        latencies: Shared list of request latencies in seconds
+        errors: Shared list of error descriptions
+        lock: Lock guarding the shared lists
+    """
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=REQUEST_TIMEOUT_SECONDS) as response:
+                response.read()
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+        except (urllib.error.URLError, OSError) as e:
+            with lock:
+                errors.append(str(e))
+
+
+def run_load_test(url: str, concurrency: int, duration: float) -> Dict[str, float]:
+    """
+    Runs the load test and summarizes the results
+
+    Args:
+        url: Endpoint to request
+        concurrency: Number of concurrent clients
+        duration: Test duration in seconds
+
+    Returns:
+        Dictionary with request count, error count, throughput and latency percentiles (ms)
+    """
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    started = time.monotonic()
+    deadline = started + duration
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(run_client, url, deadline, latencies, errors, lock)
+    elapsed = time.monotonic() - started
+
+    summary = {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "throughput_rps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+    }
+    if len(latencies) >= 2:
+        cuts = statistics.quantiles(latencies, n=100)
+        summary.update({
+            "p50_ms": cuts[49] * 1000,
+            "p95_ms": cuts[94] * 1000,
+            "p99_ms": cuts[98] * 1000,
+        })
+    return summary
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Load test the forecast API")
+    parser.add_argument("--url", type=str, default=DEFAULT_URL, help="Endpoint to request")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Number of concurrent clients")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION_SECONDS, help="Test duration in seconds")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the load test and print a summary"""
+    args = parse_args()
+    summary = run_load_test(args.url, args.concurrency, args.duration)
+
+    print(f"URL:         {args.url}")
+    print(f"Concurrency: {args.concurrency}")
+    print(f"Requests:    {summary['requests']} ({summary['errors']} errors)")
+    print(f"Throughput:  {summary['throughput_rps']:.1f} req/s")
+    if "p50_ms" in summary:
+        print(f"Latency:     p50 {summary['p50_ms']:.1f} ms, p95 {summary['p95_ms']:.1f} ms, p99 {summary['p99_ms']:.1f} ms")
+    return 0 if summary["requests"] > 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,8 @@ functionality for handling fallback scenarios when forecast generation fails.
 # Re-export storage manager functions
 from .storage_manager import (
     save_forecast,
+    save_forecast_reference,
+    save_forecasts_bulk,
     get_forecast,
     get_latest_forecast,
     get_forecasts_for_period,
@@ -22,12 +24,26 @@ from .storage_manager import (
     duplicate_forecast,
     get_forecast_info,
     get_latest_forecasts_info,
+    get_forecast_index_entry,
+    get_latest_forecast_index_entry,
+    get_forecast_batch_index_entries,
+    load_indexed_forecast,
+    get_indexed_forecast_columns,
     maintain_storage,
     rebuild_storage_index,
     get_storage_info,
     initialize_storage
 )
 
+# Re-export integrity verification functions
+from .checksums import verify_file_checksums
+from .integrity_scrubber import (
+    scrub_storage,
+    start_scrubber,
+    stop_scrubber,
+    get_last_scrub_stats
+)
+
 # Re-export exception classes
 from .exceptions import (
     StorageError,
@@ -0,0 +1,232 @@
+"""
+Content checksums for stored forecast files in the Electricity Market Price Forecasting System.
+
+A checksum of the whole file and one per Parquet row group is computed when a forecast is
+stored and recorded in the index. Checksums are computed by streaming the file in chunks,
+so a corrupt or truncated file is detected (and localized to a row group) without loading
+it into a dataframe. xxHash is used when the optional xxhash package is installed, CRC32
+otherwise; each checksum carries its algorithm name so it can be verified either way.
+"""
+
+import os
+import json
+import pathlib
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd  # version: 2.0.0
+import pyarrow.parquet as pq  # version 12.0.0
+
+try:
+    import xxhash  # version 3.0.0+
+except ImportError:
+    xxhash = None
+
+# Internal imports
+from ..config.settings import CHECKSUM_CHUNK_SIZE
+from ..utils.logging_utils import get_logger
+
+# Set up logger
+logger = get_logger(__name__)
+
+# Checksum algorithm used for newly stored files
+CHECKSUM_ALGORITHM = "xxh64" if xxhash is not None else "crc32"
+
+# Index fields holding the checksums
+CHECKSUM_FIELDS = ["checksum", "row_group_checksums", "file_size"]
+
+
+class _Crc32:
+    """
+    Incremental CRC32 with the same interface as the xxhash objects.
+    """
+
+    def __init__(self):
+        self._value = 0
+
+    def update(self, data: bytes) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def hexdigest(self) -> str:
+        return f"{self._value:08x}"
+
+
+def _new_hasher(algorithm: str):
+    """
+    Creates an incremental hasher for a checksum algorithm.
+
+    Raises:
+        ValueError: If the algorithm is unknown or its package is not installed
+    """
+    if algorithm == "crc32":
+        return _Crc32()
+    if algorithm == "xxh64" and xxhash is not None:
+        return xxhash.xxh64()
+    raise ValueError(f"Checksum algorithm not available: {algorithm}")
+
+
+def _row_group_ranges(file_path: pathlib.Path) -> List[Tuple[int, int]]:
+    """
+    Gets the byte range of each row group of a Parquet file from its footer.
+    """
+    metadata = pq.read_metadata(file_path)
+    ranges = []
+    for rg_index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg_index)
+        start, end = None, None
+        for col_index in range(row_group.num_columns):
+            column = row_group.column(col_index)
+            col_start = column.dictionary_page_offset if column.has_dictionary_page else column.data_page_offset
+            col_end = col_start + column.total_compressed_size
+            start = col_start if start is None else min(start, col_start)
+            end = col_end if end is None else max(end, col_end)
+        ranges.append((start or 0, end or 0))
+    return ranges
+
+
+def compute_checksums(
+    file_path: Union[str, pathlib.Path],
+    algorithm: str = CHECKSUM_ALGORITHM,
+    row_group_ranges: Optional[List[Tuple[int, int]]] = None,
+    on_read: Optional[Callable[[int], None]] = None,
+    chunk_size: int = CHECKSUM_CHUNK_SIZE
+) -> Tuple[str, List[str]]:
+    """
+    Computes the checksum of a file and of each of its row groups in one streaming pass.
+
+    Args:
+        file_path: Path to the file
+        algorithm: Checksum algorithm
+        row_group_ranges: Byte ranges of the row groups (read from the footer of Parquet files
+            if not given)
+        on_read: Called with the number of bytes of every chunk read (e.g. to throttle I/O)
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        tuple: (file checksum, list of row group checksums), formatted as "algorithm:hex"
+    """
+    path = pathlib.Path(file_path)
+    if row_group_ranges is None:
+        row_group_ranges = _row_group_ranges(path) if path.suffix == ".parquet" else []
+
+    file_hasher = _new_hasher(algorithm)
+    row_group_hashers = [_new_hasher(algorithm) for _ in row_group_ranges]
+
+    offset = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            if on_read is not None:
+                on_read(len(chunk))
+
+            file_hasher.update(chunk)
+            chunk_end = offset + len(chunk)
+            for (start, end), hasher in zip(row_group_ranges, row_group_hashers):
+                if start < chunk_end and end > offset:
+                    hasher.update(chunk[max(start, offset) - offset:min(end, chunk_end) - offset])
+            offset = chunk_end
+
+    return (
+        f"{algorithm}:{file_hasher.hexdigest()}",
+        [f"{algorithm}:{hasher.hexdigest()}" for hasher in row_group_hashers]
+    )
+
+
+def compute_file_checksums(file_path: Union[str, pathlib.Path]) -> Dict[str, Union[str, int]]:
+    """
+    Computes the checksum fields recorded in the index for a stored file.
+
+    Args:
+        file_path: Path to the stored file
+
+    Returns:
+        dict: checksum, row_group_checksums (JSON list) and file_size
+    """
+    path = pathlib.Path(file_path)
+    checksum, row_group_checksums = compute_checksums(path)
+    return {
+        "checksum": checksum,
+        "row_group_checksums": json.dumps(row_group_checksums),
+        "file_size": os.path.getsize(path)
+    }
+
+
+def _is_missing(value) -> bool:
+    """
+    Checks whether an index value is missing (None, or NaN/NA for rows indexed without it).
+    """
+    return value is None or (not isinstance(value, str) and bool(pd.isna(value)))
+
+
+def has_checksums(entry: Optional[Dict]) -> bool:
+    """
+    Checks whether an index entry has a recorded checksum (entries indexed before checksums
+    were introduced do not).
+    """
+    if not entry:
+        return False
+    checksum = entry.get("checksum")
+    return isinstance(checksum, str) and ":" in checksum
+
+
+def verify_file_checksums(
+    file_path: Union[str, pathlib.Path],
+    entry: Dict,
+    on_read: Optional[Callable[[int], None]] = None
+) -> List[str]:
+    """
+    Verifies a stored file against the checksums recorded in its index entry.
+
+    The file size is compared first, so truncation is reported without reading the file.
+    Otherwise the file is streamed once; a mismatch is localized to the row groups whose
+    checksums differ.
+
+    Args:
+        file_path: Path to the stored file
+        entry: Index entry with the recorded checksum fields
+        on_read: Called with the number of bytes of every chunk read
+
+    Returns:
+        list: Problems found (empty if the file matches its checksums)
+    """
+    path = pathlib.Path(file_path)
+    if not path.exists():
+        return [f"file not found: {path}"]
+
+    expected_size = entry.get("file_size")
+    actual_size = os.path.getsize(path)
+    if not _is_missing(expected_size) and int(expected_size) != actual_size:
+        return [f"file size {actual_size} differs from recorded size {int(expected_size)}"]
+
+    algorithm = entry["checksum"].split(":", 1)[0]
+    row_group_field = entry.get("row_group_checksums")
+    expected_row_groups = [] if _is_missing(row_group_field) else json.loads(row_group_field)
+
+    row_group_ranges = None
+    if path.suffix == ".parquet":
+        try:
+            row_group_ranges = _row_group_ranges(path)
+        except Exception as e:
+            return [f"unreadable Parquet footer: {str(e)}"]
+    else:
+        row_group_ranges = []
+
+    try:
+        checksum, row_group_checksums = compute_checksums(path, algorithm, row_group_ranges, on_read)
+    except ValueError as e:
+        logger.warning(f"Cannot verify {path}: {str(e)}")
+        return []
+
+    if checksum == entry["checksum"]:
+        return []
+
+    problems = [f"file checksum {checksum} differs from recorded {entry['checksum']}"]
+    if len(row_group_checksums) != len(expected_row_groups):
+        problems.append(f"{len(row_group_checksums)} row groups, {len(expected_row_groups)} recorded")
+    else:
+        for rg_index, (actual, expected) in enumerate(zip(row_group_checksums, expected_row_groups)):
+            if actual != expected:
+                problems.append(f"row group {rg_index} checksum {actual} differs from recorded {expected}")
+    return problems
@@ -13,10 +13,12 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd  # version: 2.0.0
 import pandera as pa  # version: 0.16.0
+import pyarrow.parquet as pq  # version: 12.0.0
 
 # Internal imports
 from .path_resolver import (
     get_forecast_file_path,
+    get_index_file_path,
     get_latest_file_path,
     validate_product
 )
@@ -25,23 +27,42 @@ from .schema_definitions import (
     add_storage_metadata,
     check_storage_integrity,
     extract_storage_metadata,
-    upgrade_schema_if_needed
+    upgrade_schema_if_needed,
+    STORAGE_METADATA_FIELDS
 )
 from .index_manager import (
     add_forecast_to_index,
+    add_forecasts_to_index,
     remove_forecast_from_index,
     update_latest_links,
+    get_latest_index_entry,
+    get_index_entry,
+    get_referencing_entries,
+    load_index,
     query_index_by_date,
     get_forecast_file_paths
 )
+from .checksums import compute_file_checksums, has_checksums, verify_file_checksums
+from .forecast_references import (
+    REFERENCE_EXTENSION,
+    is_reference_path,
+    write_reference_file,
+    read_reference_file,
+    load_reference,
+    get_reference_fields
+)
 from ..utils.file_utils import save_dataframe, load_dataframe
+from ..models.data_models import cast_sample_columns
+from ..utils.date_utils import get_current_time_cst
+from ..config.settings import SAMPLE_STORAGE_DTYPE, STORAGE_VERIFY_CHECKSUMS_ON_READ
 from ..utils.logging_utils import get_logger, log_execution_time, log_exceptions
 from .exceptions import (
     StorageError,
     SchemaValidationError,
     FileOperationError,
     DataFrameNotFoundError,
-    DataIntegrityError
+    DataIntegrityError,
+    IndexUpdateError
 )
 
 # Configure logger
@@ -51,36 +72,25 @@ logger = get_logger(__name__)
 DEFAULT_FORMAT = 'parquet'
 
 
-@log_execution_time
-@log_exceptions
-def store_forecast(
+def _write_forecast_file(
     df: pd.DataFrame,
     forecast_timestamp: datetime.datetime,
     product: str,
-    is_fallback: bool = False,
-    format: str = DEFAULT_FORMAT
-) -> pathlib.Path:
+    format: str,
+    sample_dtype: str
+) -> Tuple[pathlib.Path, datetime.datetime]:
     """
-    Stores a forecast dataframe with validation and indexing.
+    Validates a forecast dataframe and writes it with storage metadata, without indexing it.
     
-    Args:
-        df: DataFrame to store
-        forecast_timestamp: Timestamp of the forecast
-        product: Price product identifier
-        is_fallback: Whether this is a fallback forecast
-        format: File format (default: 'parquet')
-        
     Returns:
-        Path to the stored forecast file
-        
-    Raises:
-        SchemaValidationError: If dataframe fails schema validation
-        FileOperationError: If file operation fails
-        StorageError: For other storage-related errors
+        tuple: (path to the written file, generation timestamp)
     """
     # Validate the product name
     validate_product(product)
     
+    # Cast sample columns to the storage dtype before validation so the stored file matches
+    df = cast_sample_columns(df, sample_dtype)
+    
     # Validate the forecast dataframe against schema
     is_valid, validation_errors = validate_forecast_schema(df)
     if not is_valid:
@@ -93,6 +103,10 @@ def store_forecast(
     # Get the file path for the forecast
     file_path = get_forecast_file_path(forecast_timestamp, product, format)
     
+    # Fallbacks stored as references to the file being replaced keep their data
+    if file_path.exists():
+        materialize_references_to(file_path)
+    
     # Save the dataframe to the file
     try:
         success = save_dataframe(df_with_metadata, file_path, format)
@@ -102,24 +116,271 @@ def store_forecast(
         logger.error(f"Failed to save dataframe to {file_path}: {str(e)}")
         raise FileOperationError(f"Failed to save dataframe: {str(e)}", file_path, "write")
     
-    # Add the forecast to the index
     generation_timestamp = df["generation_timestamp"].iloc[0] if "generation_timestamp" in df.columns else datetime.datetime.now()
+    return file_path, generation_timestamp
+
+
+def _remove_replaced_reference(forecast_timestamp: datetime.datetime, product: str) -> None:
+    """
+    Removes a reference previously stored for a day that now has a forecast file.
+    """
+    reference_path = get_forecast_file_path(forecast_timestamp, product, REFERENCE_EXTENSION)
+    if reference_path.exists():
+        os.remove(reference_path)
+
+
+@log_execution_time
+@log_exceptions
+def store_forecast(
+    df: pd.DataFrame,
+    forecast_timestamp: datetime.datetime,
+    product: str,
+    is_fallback: bool = False,
+    format: str = DEFAULT_FORMAT,
+    sample_dtype: str = SAMPLE_STORAGE_DTYPE
+) -> pathlib.Path:
+    """
+    Stores a forecast dataframe with validation and indexing.
+    
+    Args:
+        df: DataFrame to store
+        forecast_timestamp: Timestamp of the forecast
+        product: Price product identifier
+        is_fallback: Whether this is a fallback forecast
+        format: File format (default: 'parquet')
+        sample_dtype: Storage dtype for sample columns, 'float64' or 'float32' (default: from settings)
+        
+    Returns:
+        Path to the stored forecast file
+        
+    Raises:
+        SchemaValidationError: If dataframe fails schema validation
+        FileOperationError: If file operation fails
+        StorageError: For other storage-related errors
+    """
+    file_path, generation_timestamp = _write_forecast_file(df, forecast_timestamp, product, format, sample_dtype)
     
+    # Add the forecast to the index with the checksums of the written file
     add_forecast_to_index(
         file_path,
         forecast_timestamp,
         product,
         generation_timestamp,
-        is_fallback
+        is_fallback,
+        checksums=compute_file_checksums(file_path)
     )
     
-    # Update the latest links
-    update_latest_links()
+    # A reference previously stored for this day is replaced by the file
+    _remove_replaced_reference(forecast_timestamp, product)
+    
+    # Update the stored product's latest link
+    update_latest_links([product])
     
     logger.info(f"Successfully stored {product} forecast for {forecast_timestamp} at {file_path}")
     return file_path
 
 
+@log_execution_time
+@log_exceptions
+def store_forecasts_bulk(
+    forecasts: List[Tuple[pd.DataFrame, datetime.datetime, str]],
+    is_fallback: bool = False,
+    format: str = DEFAULT_FORMAT,
+    sample_dtype: str = SAMPLE_STORAGE_DTYPE
+) -> Dict[Tuple[datetime.datetime, str], pathlib.Path]:
+    """
+    Stores many forecasts with a single index update and latest link update (e.g. a backfill).
+    
+    The files are written one by one; the index is only updated once all of them were written,
+    so a failure leaves no partially indexed batch behind.
+    
+    Args:
+        forecasts: Tuples of (dataframe, forecast timestamp, product)
+        is_fallback: Whether these are fallback forecasts
+        format: File format (default: 'parquet')
+        sample_dtype: Storage dtype for sample columns, 'float64' or 'float32' (default: from settings)
+        
+    Returns:
+        dict: Paths of the stored files by (forecast timestamp, product)
+        
+    Raises:
+        SchemaValidationError: If a dataframe fails schema validation
+        FileOperationError: If a file operation fails
+        IndexUpdateError: If the index cannot be updated
+    """
+    stored = {}
+    entries = []
+    for df, forecast_timestamp, product in forecasts:
+        file_path, generation_timestamp = _write_forecast_file(df, forecast_timestamp, product, format, sample_dtype)
+        stored[(forecast_timestamp, product)] = file_path
+        entries.append({
+            "timestamp": forecast_timestamp,
+            "product": product,
+            "file_path": str(file_path),
+            "generation_timestamp": generation_timestamp,
+            "is_fallback": is_fallback,
+            **compute_file_checksums(file_path)
+        })
+    
+    if not add_forecasts_to_index(entries):
+        raise IndexUpdateError(f"Failed to index {len(entries)} stored forecasts", get_index_file_path())
+    
+    for forecast_timestamp, product in stored:
+        _remove_replaced_reference(forecast_timestamp, product)
+    
+    products = sorted({product for _, product in stored})
+    if products:
+        update_latest_links(products)
+    
+    logger.info(f"Successfully stored {len(stored)} forecasts for {len(products)} products")
+    return stored
+
+
+@log_execution_time
+@log_exceptions
+def store_forecast_reference(
+    source_timestamp: datetime.datetime,
+    target_timestamp: datetime.datetime,
+    product: str,
+    time_shift: Optional[datetime.timedelta] = None
+) -> pathlib.Path:
+    """
+    Stores a fallback forecast as a reference to a stored forecast instead of a copy.
+    
+    Only a small reference file is written; readers load the source forecast and shift its
+    timestamps to the target day.
+    
+    Args:
+        source_timestamp: Timestamp of the forecast the fallback is taken from
+        target_timestamp: Timestamp of the fallback forecast
+        product: Price product identifier
+        time_shift: Offset applied to the source timestamps (default: target - source)
+        
+    Returns:
+        Path to the reference file
+        
+    Raises:
+        DataFrameNotFoundError: If the source forecast is not indexed or its file is missing
+        FileOperationError: If file operation fails
+    """
+    # Validate the product name
+    validate_product(product)
+    
+    source_entry = get_index_entry(source_timestamp, product)
+    if source_entry is None or not pathlib.Path(source_entry["file_path"]).exists():
+        raise DataFrameNotFoundError(f"Source forecast not found for {product} at {source_timestamp}", product, source_timestamp)
+    
+    if time_shift is None:
+        time_shift = pd.Timestamp(target_timestamp) - pd.Timestamp(source_timestamp)
+    reference = get_reference_fields(source_entry, time_shift)
+    
+    # A file stored for the target day is replaced by the reference
+    file_path = get_forecast_file_path(target_timestamp, product, DEFAULT_FORMAT)
+    if file_path.exists():
+        materialize_references_to(file_path)
+        os.remove(file_path)
+    
+    generation_timestamp = get_current_time_cst()
+    reference_path = write_reference_file(
+        get_forecast_file_path(target_timestamp, product, REFERENCE_EXTENSION),
+        reference["source_file_path"],
+        datetime.timedelta(seconds=reference["timestamp_offset_seconds"]),
+        product,
+        target_timestamp,
+        generation_timestamp
+    )
+    
+    # The index records generation times without timezone
+    add_forecast_to_index(
+        reference_path,
+        target_timestamp,
+        product,
+        pd.Timestamp(generation_timestamp).tz_localize(None),
+        True,
+        checksums=compute_file_checksums(reference_path),
+        reference=reference
+    )
+    
+    # Update the stored product's latest link
+    update_latest_links([product])
+    
+    logger.info(
+        f"Stored {product} fallback for {target_timestamp} as reference to {reference['source_file_path']}"
+    )
+    return reference_path
+
+
+def materialize_references_to(file_path: pathlib.Path) -> int:
+    """
+    Replaces the references to a stored file with full copies, before the file is
+    overwritten or deleted.
+    
+    Args:
+        file_path: Path of the stored file
+        
+    Returns:
+        Number of references materialized
+    """
+    entries = get_referencing_entries(file_path)
+    for entry in entries:
+        materialize_reference(entry)
+    return len(entries)
+
+
+def materialize_reference(entry: Dict) -> pathlib.Path:
+    """
+    Replaces a stored reference with a full copy of the forecast it resolves to.
+    
+    Args:
+        entry: Index entry of the reference
+        
+    Returns:
+        Path to the stored forecast file
+    """
+    reference_path = pathlib.Path(entry["file_path"])
+    df = load_reference(reference_path)
+    
+    # Storing the forecast replaces the reference file and its index entry
+    file_path = store_forecast(df, pd.Timestamp(entry["timestamp"]).to_pydatetime(), entry["product"], is_fallback=True)
+    
+    logger.info(f"Materialized reference {reference_path} as {file_path}")
+    return file_path
+
+
+@log_exceptions
+def materialize_expiring_references(cutoff_date: datetime.datetime) -> int:
+    """
+    Materializes the references whose source file is older than a retention cutoff while
+    the reference itself is not, so removing old files does not break newer fallbacks.
+    
+    Args:
+        cutoff_date: Files modified before this time are about to be removed
+        
+    Returns:
+        Number of references materialized
+    """
+    cutoff_timestamp = cutoff_date.timestamp()
+    materialized = 0
+    
+    index_df = load_index()
+    if "source_file_path" not in index_df.columns:
+        return 0
+    
+    for entry in index_df[index_df["source_file_path"].notna()].to_dict("records"):
+        reference_path = pathlib.Path(entry["file_path"])
+        source_path = pathlib.Path(entry["source_file_path"])
+        try:
+            if reference_path.stat().st_mtime >= cutoff_timestamp and source_path.stat().st_mtime < cutoff_timestamp:
+                materialize_reference(entry)
+                materialized += 1
+        except OSError as e:
+            logger.warning(f"Could not check reference {reference_path}: {str(e)}")
+    
+    if materialized:
+        logger.info(f"Materialized {materialized} references to forecasts past retention")
+    return materialized
+
+
 @log_execution_time
 @log_exceptions
 def load_forecast(
@@ -146,17 +407,129 @@ def load_forecast(
     # Validate the product name
     validate_product(product)
     
-    # Get the file path for the forecast
-    file_path = get_forecast_file_path(forecast_timestamp, product, format)
+    # Get the file path for the forecast (a fallback may be stored as a reference)
+    file_path = resolve_stored_file_path(forecast_timestamp, product, format)
     
     # Check if the file exists
     if not file_path.exists():
         logger.error(f"Forecast file not found: {file_path}")
         raise DataFrameNotFoundError(f"Forecast not found for {product} at {forecast_timestamp}", product, forecast_timestamp)
     
-    # Load the dataframe from the file
+    # Look up the recorded checksums only when they are verified
+    index_entry = get_index_entry(forecast_timestamp, product) if STORAGE_VERIFY_CHECKSUMS_ON_READ else None
+    
+    # Load, check and upgrade the stored dataframe
+    df = load_forecast_file(file_path, index_entry=index_entry)
+    
+    logger.info(f"Successfully loaded {product} forecast for {forecast_timestamp}")
+    return df
+
+
+def resolve_stored_file_path(
+    forecast_timestamp: datetime.datetime,
+    product: str,
+    format: str = DEFAULT_FORMAT
+) -> pathlib.Path:
+    """
+    Gets the path of the stored forecast for a day: the data file, or the reference file
+    if the forecast is a fallback stored as a reference.
+    
+    Args:
+        forecast_timestamp: Timestamp of the forecast
+        product: Price product identifier
+        format: File format (default: 'parquet')
+        
+    Returns:
+        Path to the stored file (the data file path if neither exists)
+    """
+    file_path = get_forecast_file_path(forecast_timestamp, product, format)
+    if not file_path.exists():
+        reference_path = get_forecast_file_path(forecast_timestamp, product, REFERENCE_EXTENSION)
+        if reference_path.exists():
+            return reference_path
+    return file_path
+
+
+def load_stored_file(file_path: pathlib.Path, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Loads a stored forecast file, resolving references to the forecast they point to.
+    
+    Args:
+        file_path: Path to the stored file
+        columns: Optional columns to load
+        
+    Returns:
+        Loaded dataframe, or None if the file does not exist
+    """
+    if is_reference_path(file_path):
+        return load_reference(file_path, columns)
+    return load_dataframe(file_path, file_path.suffix.lstrip('.'), columns=columns)
+
+
+def read_stored_columns(file_path: pathlib.Path) -> List[str]:
+    """
+    Reads the column names of a stored forecast file, resolving references to their source.
+    
+    Parquet files are not loaded: the names are read from the file's schema.
+    
+    Args:
+        file_path: Path to the stored file
+        
+    Returns:
+        Column names of the stored forecast
+        
+    Raises:
+        FileOperationError: If the file cannot be read
+    """
+    if is_reference_path(file_path):
+        file_path = pathlib.Path(read_reference_file(file_path)["source_file_path"])
+    
     try:
-        df = load_dataframe(file_path, format)
+        if file_path.suffix == '.parquet':
+            return list(pq.read_schema(file_path).names)
+        df = load_dataframe(file_path, file_path.suffix.lstrip('.'))
+        if df is None:
+            raise FileOperationError(f"Failed to read columns", file_path, "read")
+        return list(df.columns)
+    except FileOperationError:
+        raise
+    except Exception as e:
+        raise FileOperationError(f"Failed to read columns: {str(e)}", file_path, "read")
+
+
+def load_forecast_file(
+    file_path: pathlib.Path,
+    columns: Optional[List[str]] = None,
+    index_entry: Optional[Dict] = None,
+    verify_checksum: Optional[bool] = None
+) -> pd.DataFrame:
+    """
+    Loads a stored forecast file, checking its integrity and upgrading its schema.
+    
+    Args:
+        file_path: Path to the forecast file
+        columns: Optional columns to load; the storage metadata fields are always loaded
+        index_entry: Optional index entry of the file, whose recorded checksums are verified
+        verify_checksum: Whether to verify the file against the checksums of index_entry
+            before loading it (default: STORAGE_VERIFY_CHECKSUMS_ON_READ)
+        
+    Returns:
+        Loaded forecast dataframe
+        
+    Raises:
+        DataIntegrityError: If forecast data fails integrity or checksum check
+        FileOperationError: If file operation fails
+    """
+    if verify_checksum is None:
+        verify_checksum = STORAGE_VERIFY_CHECKSUMS_ON_READ
+    if verify_checksum:
+        verify_forecast_checksum(file_path, index_entry)
+    
+    if columns is not None:
+        columns = list(dict.fromkeys(list(columns) + list(STORAGE_METADATA_FIELDS)))
+    
+    try:
+        df = load_stored_file(file_path, columns=columns)
         if df is None:
             raise FileOperationError(f"Failed to load dataframe", file_path, "read")
     except Exception as e:
@@ -166,14 +539,35 @@ def load_forecast(
     # Check storage integrity
     is_valid, integrity_issues = check_storage_integrity(df)
     if not is_valid:
-        logger.warning(f"Integrity check failed for {product} forecast at {forecast_timestamp}")
+        logger.warning(f"Integrity check failed for forecast file {file_path}")
         raise DataIntegrityError("Forecast data failed integrity check", file_path, integrity_issues)
     
     # Upgrade schema if needed
-    df = upgrade_schema_if_needed(df)
+    return upgrade_schema_if_needed(df)
+
+
+def verify_forecast_checksum(file_path: pathlib.Path, index_entry: Optional[Dict]) -> None:
+    """
+    Verifies a stored forecast file against the checksums recorded in its index entry.
     
-    logger.info(f"Successfully loaded {product} forecast for {forecast_timestamp}")
-    return df
+    The file is streamed in chunks rather than loaded. Entries without recorded checksums
+    (indexed before checksums were introduced) are not verified.
+    
+    Args:
+        file_path: Path to the forecast file
+        index_entry: Index entry of the file
+        
+    Raises:
+        DataIntegrityError: If the file does not match its checksums
+    """
+    if not has_checksums(index_entry):
+        logger.debug(f"No recorded checksum for {file_path}, skipping verification")
+        return
+    
+    problems = verify_file_checksums(file_path, index_entry)
+    if problems:
+        logger.error(f"Checksum verification failed for forecast file {file_path}: {problems}")
+        raise DataIntegrityError("Forecast file failed checksum verification", file_path, {"checksum_mismatch": problems})
 
 
 @log_execution_time
@@ -200,17 +594,24 @@ def load_latest_forecast(
     # Validate the product name
     validate_product(product)
     
-    # Get the latest file path
-    latest_path = get_latest_file_path(product, format)
+    # Resolve the latest file through the pointer table, falling back to the latest link
+    latest_entry = get_latest_index_entry(product)
+    if latest_entry is not None:
+        latest_path = pathlib.Path(latest_entry["file_path"])
+    else:
+        latest_path = get_latest_file_path(product, format)
     
     # Check if the file exists
     if not latest_path.exists():
         logger.error(f"Latest forecast file not found: {latest_path}")
         raise DataFrameNotFoundError(f"Latest forecast not found for {product}", product, datetime.datetime.now())
     
+    if STORAGE_VERIFY_CHECKSUMS_ON_READ:
+        verify_forecast_checksum(latest_path, latest_entry)
+    
     # Load the dataframe from the file
     try:
-        df = load_dataframe(latest_path, format)
+        df = load_stored_file(latest_path)
         if df is None:
             raise FileOperationError(f"Failed to load dataframe", latest_path, "read")
     except Exception as e:
@@ -250,13 +651,16 @@ def delete_forecast(
     validate_product(product)
     
     # Get the file path for the forecast
-    file_path = get_forecast_file_path(forecast_timestamp, product)
+    file_path = resolve_stored_file_path(forecast_timestamp, product)
     
     # Check if the file exists
     if not file_path.exists():
         logger.warning(f"Cannot delete forecast - file not found: {file_path}")
         return False
     
+    # Fallbacks stored as references to this file keep their data
+    materialize_references_to(file_path)
+    
     # Remove the file
     try:
         os.remove(file_path)
@@ -267,8 +671,8 @@ def delete_forecast(
     # Remove the forecast from the index
     remove_forecast_from_index(forecast_timestamp, product)
     
-    # Update the latest links
-    update_latest_links()
+    # Update the deleted product's latest link
+    update_latest_links([product])
     
     logger.info(f"Successfully deleted {product} forecast for {forecast_timestamp}")
     return True
@@ -308,11 +712,8 @@ def get_forecasts_by_date_range(
     # Load each forecast dataframe
     for timestamp, path in file_paths.items():
         try:
-            # Extract format from file extension
-            format = path.suffix.lstrip('.')
-            
-            # Load the dataframe
-            df = load_dataframe(path, format)
+            # Load the dataframe (resolving references)
+            df = load_stored_file(path)
             
             # Check integrity
             is_valid, _ = check_storage_integrity(df)
@@ -353,7 +754,7 @@ def get_forecast_metadata(
     validate_product(product)
     
     # Get the file path for the forecast
-    file_path = get_forecast_file_path(forecast_timestamp, product)
+    file_path = resolve_stored_file_path(forecast_timestamp, product)
     
     # Check if the file exists
     if not file_path.exists():
@@ -362,7 +763,7 @@ def get_forecast_metadata(
     
     # Load the dataframe from the file
     try:
-        df = load_dataframe(file_path)
+        df = load_stored_file(file_path)
         if df is None:
             raise FileOperationError(f"Failed to load dataframe", file_path, "read")
     except Exception as e:
@@ -399,7 +800,7 @@ def check_forecast_exists(
     validate_product(product)
     
     # Get the file path for the forecast
-    file_path = get_forecast_file_path(forecast_timestamp, product)
+    file_path = resolve_stored_file_path(forecast_timestamp, product)
     
     # Check if the file exists
     exists = file_path.exists()
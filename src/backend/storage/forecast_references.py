@@ -0,0 +1,178 @@
+"""
+Reference storage of fallback forecasts for the Electricity Market Price Forecasting System.
+
+A fallback forecast is a previous forecast with its timestamps shifted to the target day.
+Instead of writing a full copy of the source data (including all sample columns), the
+fallback can be stored as a small reference file (day_product.ref) that records the source
+file and the timestamp offset. Readers load the source file and apply the shift and the
+fallback metadata lazily. References always point to a file with data: a fallback of a
+fallback points to the original source with the offsets added up.
+"""
+
+import os
+import json
+import pathlib
+import datetime
+from typing import Dict, List, Optional, Union
+
+import pandas as pd  # version: 2.0.0
+
+# Internal imports
+from .exceptions import FileOperationError
+from ..utils.file_utils import ensure_directory_exists, load_dataframe
+from ..utils.logging_utils import get_logger
+
+# Set up logger
+logger = get_logger(__name__)
+
+# File extension of reference files
+REFERENCE_EXTENSION = "ref"
+
+# Index fields describing a reference
+REFERENCE_FIELDS = ["source_file_path", "timestamp_offset_seconds"]
+
+
+def is_reference_path(file_path: Union[str, pathlib.Path]) -> bool:
+    """
+    Checks whether a stored forecast path is a reference file.
+    """
+    return pathlib.Path(file_path).suffix == f".{REFERENCE_EXTENSION}"
+
+
+def is_reference_entry(entry: Optional[Dict]) -> bool:
+    """
+    Checks whether an index entry describes a stored reference.
+    """
+    return bool(entry) and isinstance(entry.get("source_file_path"), str) and is_reference_path(entry["file_path"])
+
+
+def write_reference_file(
+    file_path: pathlib.Path,
+    source_file_path: Union[str, pathlib.Path],
+    time_shift: datetime.timedelta,
+    product: str,
+    timestamp: datetime.datetime,
+    generation_timestamp: datetime.datetime
+) -> pathlib.Path:
+    """
+    Atomically writes a reference file.
+
+    Args:
+        file_path: Path of the reference file
+        source_file_path: Path of the file holding the forecast data
+        time_shift: Offset applied to the source timestamps
+        product: Product identifier
+        timestamp: Forecast timestamp (target day) of the reference
+        generation_timestamp: When the fallback was published
+
+    Returns:
+        Path to the reference file
+
+    Raises:
+        FileOperationError: If the file cannot be written
+    """
+    reference = {
+        "source_file_path": str(source_file_path),
+        "timestamp_offset_seconds": time_shift.total_seconds(),
+        "product": product,
+        "timestamp": pd.Timestamp(timestamp).isoformat(),
+        "generation_timestamp": pd.Timestamp(generation_timestamp).isoformat(),
+        "is_fallback": True
+    }
+
+    ensure_directory_exists(file_path.parent)
+    temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "w") as f:
+            json.dump(reference, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except OSError as e:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise FileOperationError(f"Failed to write reference: {str(e)}", file_path, "write")
+
+    logger.debug(f"Wrote reference {file_path} -> {source_file_path} ({time_shift})")
+    return file_path
+
+
+def read_reference_file(file_path: Union[str, pathlib.Path]) -> Dict:
+    """
+    Reads a reference file.
+
+    Args:
+        file_path: Path of the reference file
+
+    Returns:
+        dict: source_file_path, timestamp_offset_seconds, product, timestamp,
+            generation_timestamp and is_fallback
+
+    Raises:
+        FileOperationError: If the file cannot be read
+    """
+    try:
+        with open(file_path, "r") as f:
+            reference = json.load(f)
+        reference["timestamp"] = pd.Timestamp(reference["timestamp"])
+        reference["generation_timestamp"] = pd.Timestamp(reference["generation_timestamp"])
+        return reference
+    except (OSError, ValueError, KeyError) as e:
+        raise FileOperationError(f"Failed to read reference: {str(e)}", pathlib.Path(file_path), "read")
+
+
+def load_reference(file_path: Union[str, pathlib.Path], columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Loads the forecast a reference points to, with its timestamps shifted to the reference's day.
+
+    Args:
+        file_path: Path of the reference file
+        columns: Optional columns to load from the source file
+
+    Returns:
+        Forecast dataframe marked as fallback
+
+    Raises:
+        FileOperationError: If the reference or its source cannot be read
+    """
+    reference = read_reference_file(file_path)
+    source_path = pathlib.Path(reference["source_file_path"])
+
+    df = load_dataframe(source_path, source_path.suffix.lstrip('.'), columns=columns)
+    if df is None:
+        raise FileOperationError(f"Referenced source file not found: {source_path}", pathlib.Path(file_path), "read")
+
+    # Apply the shift and the fallback metadata the copy would have been written with
+    if "timestamp" in df.columns:
+        df["timestamp"] = df["timestamp"] + pd.Timedelta(seconds=reference["timestamp_offset_seconds"])
+    if "is_fallback" in df.columns or columns is None:
+        df["is_fallback"] = True
+    if "generation_timestamp" in df.columns or columns is None:
+        df["generation_timestamp"] = reference["generation_timestamp"]
+
+    return df
+
+
+def get_reference_fields(source_entry: Dict, time_shift: datetime.timedelta) -> Dict:
+    """
+    Gets the reference fields for a new reference to an indexed forecast.
+
+    A reference to a forecast that is itself a reference points to the original source,
+    with the offsets added up, so readers never follow chains of references.
+
+    Args:
+        source_entry: Index entry of the forecast the fallback is taken from
+        time_shift: Offset from the source forecast to the target day
+
+    Returns:
+        dict: source_file_path and timestamp_offset_seconds
+    """
+    source_file_path = source_entry["file_path"]
+    offset_seconds = time_shift.total_seconds()
+
+    if is_reference_path(source_file_path):
+        reference = read_reference_file(source_file_path)
+        source_file_path = reference["source_file_path"]
+        offset_seconds += reference["timestamp_offset_seconds"]
+
+    return {"source_file_path": str(source_file_path), "timestamp_offset_seconds": offset_seconds}
@@ -9,11 +9,19 @@ product, and other criteria while maintaining links to the latest forecasts.
 import os
 import pathlib
 import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd  # version: 2.0.0
 import shutil  # standard library
 
+try:
+    import fcntl  # Unix only
+except ImportError:
+    fcntl = None
+
 # Internal imports
 from .path_resolver import (
     get_index_file_path,
@@ -23,22 +31,104 @@ from .path_resolver import (
     create_backup_path
 )
 from .exceptions import IndexUpdateError, StorageError
+from .pointer_table import (
+    POINTER_LATEST,
+    POINTER_LATEST_NON_FALLBACK,
+    load_pointer_table,
+    advance_pointers,
+    refresh_product_pointers,
+    rebuild_pointer_table
+)
+from .index_scanner import (
+    SCAN_INDEXED,
+    SCAN_SKIPPED,
+    SCAN_CORRUPT,
+    find_forecast_files,
+    scan_forecast_file,
+    load_rebuild_checkpoint,
+    append_rebuild_checkpoint,
+    clear_rebuild_checkpoint,
+    is_record_current
+)
 from ..utils.file_utils import save_dataframe, load_dataframe, update_latest_link
 from ..utils.logging_utils import get_logger, log_execution_time, log_exceptions
-from ..config.settings import FORECAST_PRODUCTS, STORAGE_INDEX_FILE
+from ..config.settings import (
+    FORECAST_PRODUCTS,
+    STORAGE_INDEX_FILE,
+    INDEX_REBUILD_WORKERS,
+    INDEX_REBUILD_CHECKPOINT_INTERVAL
+)
 
 # Set up logger
 logger = get_logger(__name__)
 
+
+class _IndexLock:
+    """
+    Reentrant lock serializing read-modify-write updates of the index.
+
+    Threads of a process (e.g. products stored in parallel) are serialized by an RLock, and
+    processes (e.g. scheduler jobs run in worker processes) by an exclusive lock on a file
+    next to the index, taken by the outermost acquisition.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        # Also run in forked children, which must not inherit a lock held by another thread
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._lock_file = None
+
+    def __enter__(self):
+        self._lock.acquire()
+        self._depth += 1
+        if self._depth == 1 and fcntl is not None:
+            try:
+                index_path = get_index_file_path()
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                self._lock_file = open(index_path.with_suffix(".lock"), "a")
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            except OSError as e:
+                logger.warning(f"Could not lock the index across processes: {str(e)}")
+                if self._lock_file is not None:
+                    self._lock_file.close()
+                    self._lock_file = None
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._depth -= 1
+        if self._depth == 0 and self._lock_file is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+        self._lock.release()
+        return False
+
+
+# Serializes read-modify-write updates of the index across threads and processes
+_index_lock = _IndexLock()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_index_lock._reset)
+
 # Define the schema for the index DataFrame
 INDEX_SCHEMA = {
     "timestamp": "datetime64[ns]",
     "product": "str",
     "file_path": "str",
     "generation_timestamp": "datetime64[ns]",
-    "is_fallback": "bool"
+    "is_fallback": "bool",
+    "checksum": "str",
+    "row_group_checksums": "str",
+    "file_size": "Int64",
+    "source_file_path": "str",
+    "timestamp_offset_seconds": "float64"
 }
 
+# Optional fields, cleared when an entry is replaced by a forecast without them
+OPTIONAL_INDEX_FIELDS = ["checksum", "row_group_checksums", "file_size", "source_file_path", "timestamp_offset_seconds"]
+
 @log_exceptions
 def initialize_index() -> bool:
     """
@@ -130,7 +220,9 @@ def add_forecast_to_index(
     timestamp: datetime.datetime,
     product: str,
     generation_timestamp: datetime.datetime,
-    is_fallback: bool
+    is_fallback: bool,
+    checksums: Optional[Dict] = None,
+    reference: Optional[Dict] = None
 ) -> bool:
     """
     Adds a forecast to the index.
@@ -141,6 +233,10 @@ def add_forecast_to_index(
         product: Product identifier
         generation_timestamp: When the forecast was generated
         is_fallback: Whether this is a fallback forecast
+        checksums: Optional checksum fields of the stored file (checksum, row_group_checksums
+            and file_size, see compute_file_checksums)
+        reference: Optional reference fields if the file is a reference to another forecast
+            (source_file_path and timestamp_offset_seconds)
         
     Returns:
         bool: True if successful, False otherwise
@@ -148,36 +244,95 @@ def add_forecast_to_index(
     # Validate product
     validate_product(product)
     
-    # Load the current index
-    index_df = load_index()
+    with _index_lock:
+        # Load the current index
+        index_df = load_index()
+    
+        # Create a new entry
+        new_entry = {
+            "timestamp": timestamp,
+            "product": product,
+            "file_path": str(file_path),
+            "generation_timestamp": generation_timestamp,
+            "is_fallback": is_fallback,
+            **{field: None for field in OPTIONAL_INDEX_FIELDS}
+        }
+        new_entry.update(checksums or {})
+        new_entry.update(reference or {})
+    
+        # Check if an entry for this timestamp and product already exists
+        mask = (index_df["timestamp"] == timestamp) & (index_df["product"] == product)
+    
+        if mask.any():
+            # Update existing entry
+            logger.debug(f"Updating existing index entry for {product} at {timestamp}")
+            for key, value in new_entry.items():
+                index_df.loc[mask, key] = value
+        else:
+            # Add new entry
+            logger.debug(f"Adding new index entry for {product} at {timestamp}")
+            index_df = pd.concat([index_df, pd.DataFrame([new_entry])], ignore_index=True)
+    
+        # Save the updated index and advance the product's latest pointers
+        success = save_index(index_df)
+        if success:
+            advance_pointers(new_entry, index_df)
     
-    # Create a new entry
-    new_entry = {
-        "timestamp": timestamp,
-        "product": product,
-        "file_path": str(file_path),
-        "generation_timestamp": generation_timestamp,
-        "is_fallback": is_fallback
-    }
+    if success:
+        logger.info(f"Added forecast to index: {product} at {timestamp}")
     
-    # Check if an entry for this timestamp and product already exists
-    mask = (index_df["timestamp"] == timestamp) & (index_df["product"] == product)
+    return success
+
+@log_execution_time
+@log_exceptions
+def add_forecasts_to_index(entries: List[Dict]) -> bool:
+    """
+    Adds many forecasts to the index with a single index update (e.g. a backfill).
     
-    if mask.any():
-        # Update existing entry
-        logger.debug(f"Updating existing index entry for {product} at {timestamp}")
-        for key, value in new_entry.items():
-            index_df.loc[mask, key] = value
-    else:
-        # Add new entry
-        logger.debug(f"Adding new index entry for {product} at {timestamp}")
-        index_df = pd.concat([index_df, pd.DataFrame([new_entry])], ignore_index=True)
+    Entries replace indexed forecasts for the same timestamp and product. The pointers of
+    each stored product are recomputed once instead of advanced per entry.
     
-    # Save the updated index
-    success = save_index(index_df)
+    Args:
+        entries: Index entries with timestamp, product, file_path, generation_timestamp,
+            is_fallback and optionally the checksum and reference fields
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not entries:
+        return True
+    
+    for entry in entries:
+        validate_product(entry["product"])
+    
+    new_df = pd.DataFrame([
+        {**{field: None for field in OPTIONAL_INDEX_FIELDS}, **entry, "file_path": str(entry["file_path"])}
+        for entry in entries
+    ])
+    new_df["timestamp"] = pd.to_datetime(new_df["timestamp"])
+    # The index records generation times without timezone
+    new_df["generation_timestamp"] = [
+        pd.Timestamp(ts).tz_localize(None) if pd.Timestamp(ts).tzinfo is not None else pd.Timestamp(ts)
+        for ts in new_df["generation_timestamp"]
+    ]
+    new_df = new_df.drop_duplicates(["timestamp", "product"], keep="last")
+    
+    with _index_lock:
+        # Load the current index and replace the entries of the stored forecasts
+        index_df = load_index()
+        replaced = pd.MultiIndex.from_frame(index_df[["timestamp", "product"]]).isin(
+            pd.MultiIndex.from_frame(new_df[["timestamp", "product"]])
+        )
+        index_df = pd.concat([index_df[~replaced], new_df], ignore_index=True)
+    
+        # Save the updated index and recompute the stored products' latest pointers
+        success = save_index(index_df)
+        if success:
+            for product in new_df["product"].unique():
+                refresh_product_pointers(index_df, product)
     
     if success:
-        logger.info(f"Added forecast to index: {product} at {timestamp}")
+        logger.info(f"Added {len(new_df)} forecasts to index ({int(replaced.sum())} replaced)")
     
     return success
 
@@ -196,21 +351,24 @@ def remove_forecast_from_index(timestamp: datetime.datetime, product: str) -> bo
     # Validate product
     validate_product(product)
     
-    # Load the current index
-    index_df = load_index()
+    with _index_lock:
+        # Load the current index
+        index_df = load_index()
     
-    # Check if an entry for this timestamp and product exists
-    mask = (index_df["timestamp"] == timestamp) & (index_df["product"] == product)
+        # Check if an entry for this timestamp and product exists
+        mask = (index_df["timestamp"] == timestamp) & (index_df["product"] == product)
     
-    if not mask.any():
-        logger.warning(f"No index entry found for {product} at {timestamp}")
-        return False
+        if not mask.any():
+            logger.warning(f"No index entry found for {product} at {timestamp}")
+            return False
     
-    # Remove the entry
-    index_df = index_df[~mask]
+        # Remove the entry
+        index_df = index_df[~mask]
     
-    # Save the updated index
-    success = save_index(index_df)
+        # Save the updated index and recompute the product's latest pointers
+        success = save_index(index_df)
+        if success:
+            refresh_product_pointers(index_df, product)
     
     if success:
         logger.info(f"Removed forecast from index: {product} at {timestamp}")
@@ -258,6 +416,131 @@ def query_index_by_date(
     
     return result_df
 
+@log_exceptions
+def query_index_batch(
+    products: List[str],
+    date_ranges: List[Tuple[datetime.datetime, datetime.datetime]]
+) -> pd.DataFrame:
+    """
+    Queries the index for several products and date ranges with a single index load.
+
+    Args:
+        products: Products to include
+        date_ranges: List of (start_date, end_date) ranges, both inclusive; a single
+            date is given as a range starting and ending on that date
+
+    Returns:
+        pandas.DataFrame: Matching forecast entries ordered by product and timestamp
+    """
+    for product in products:
+        validate_product(product)
+
+    # Load the current index once for all products and ranges
+    index_df = load_index()
+
+    # Compare in the index's timezone convention (stored timestamps are naive)
+    index_is_naive = getattr(index_df["timestamp"].dt, "tz", None) is None
+    
+    def to_index_time(value: datetime.datetime) -> pd.Timestamp:
+        bound = pd.Timestamp(value)
+        if bound.tzinfo is not None and index_is_naive:
+            bound = bound.tz_localize(None)
+        return bound
+    
+    date_mask = pd.Series(False, index=index_df.index)
+    for start_date, end_date in date_ranges:
+        date_mask |= (
+            (index_df["timestamp"] >= to_index_time(start_date))
+            & (index_df["timestamp"] <= to_index_time(end_date))
+        )
+
+    result_df = index_df[date_mask & index_df["product"].isin(products)]
+
+    # Keep the latest entry for each forecast, then order by the requested products
+    result_df = result_df.drop_duplicates(subset=["timestamp", "product"], keep="last")
+    product_order = {product: position for position, product in enumerate(products)}
+    result_df = result_df.sort_values(
+        ["product", "timestamp"],
+        key=lambda column: column.map(product_order) if column.name == "product" else column
+    )
+
+    logger.debug(
+        f"Batch query returned {len(result_df)} forecasts for {len(products)} products "
+        f"and {len(date_ranges)} date ranges"
+    )
+
+    return result_df
+
+@log_exceptions
+def get_referencing_entries(source_file_path: Union[str, pathlib.Path]) -> List[Dict]:
+    """
+    Gets the index entries of the references that point to a stored forecast file.
+    
+    Args:
+        source_file_path: Path of the forecast file
+        
+    Returns:
+        list: Index entries of the references to the file
+    """
+    index_df = load_index()
+    if "source_file_path" not in index_df.columns:
+        return []
+    
+    return index_df[index_df["source_file_path"] == str(source_file_path)].to_dict("records")
+
+@log_exceptions
+def get_index_entry(timestamp: datetime.datetime, product: str) -> Optional[Dict]:
+    """
+    Gets the index entry for a forecast timestamp and product.
+    
+    Args:
+        timestamp: Timestamp of the forecast
+        product: Product identifier
+        
+    Returns:
+        dict: Index entry with file_path, generation_timestamp and is_fallback, or None if not indexed
+    """
+    validate_product(product)
+    
+    index_df = load_index()
+    
+    # Compare in the index's timezone convention (stored timestamps are naive)
+    target = pd.Timestamp(timestamp)
+    if target.tzinfo is not None and getattr(index_df["timestamp"].dt, "tz", None) is None:
+        target = target.tz_localize(None)
+    
+    matches = index_df[(index_df["timestamp"] == target) & (index_df["product"] == product)]
+    
+    if matches.empty:
+        return None
+    
+    return matches.iloc[-1].to_dict()
+
+@log_exceptions
+def get_latest_index_entry(product: str, include_fallback: bool = True) -> Optional[Dict]:
+    """
+    Gets the index entry for the latest forecast of a product (by target date, then generation time).
+    
+    Resolved through the pointer table, without loading the index.
+    
+    Args:
+        product: Product identifier
+        include_fallback: Whether a fallback forecast may be returned (False returns the latest
+            non-fallback forecast)
+        
+    Returns:
+        dict: Index entry with file_path, generation_timestamp and is_fallback, or None if not indexed
+    """
+    validate_product(product)
+    
+    table = load_pointer_table()
+    if table is None:
+        # Storage written before the pointer table existed is migrated on first use
+        table = rebuild_pointer_table(load_index())
+    
+    entry = table.get(product, {}).get(POINTER_LATEST if include_fallback else POINTER_LATEST_NON_FALLBACK)
+    return dict(entry) if entry is not None else None
+
 @log_exceptions
 def get_forecast_file_paths(query_result: pd.DataFrame) -> Dict[datetime.datetime, pathlib.Path]:
     """
@@ -286,30 +569,27 @@ def get_forecast_file_paths(query_result: pd.DataFrame) -> Dict[datetime.datetim
 
 @log_execution_time
 @log_exceptions
-def update_latest_links() -> Dict[str, pathlib.Path]:
+def update_latest_links(products: Optional[List[str]] = None) -> Dict[str, pathlib.Path]:
     """
     Updates symbolic links to the latest forecasts.
     
+    Args:
+        products: Products whose links to update (default: all products)
+    
     Returns:
         dict: Dictionary of products and their latest forecast paths
     """
-    # Load the current index
-    index_df = load_index()
-    
     result = {}
     
     # Process each product
-    for product in FORECAST_PRODUCTS:
-        # Filter index for this product
-        product_df = index_df[index_df["product"] == product]
+    for product in products or FORECAST_PRODUCTS:
+        # Resolve the latest forecast (by target date, then generation time) through the pointer table
+        latest = get_latest_index_entry(product)
         
-        if product_df.empty:
+        if latest is None:
             logger.warning(f"No forecasts found for product {product}")
             continue
         
-        # Get the most recent forecast by generation time
-        latest = product_df.loc[product_df["generation_timestamp"].idxmax()]
-        
         # Get the file path
         file_path_str = latest["file_path"]
         file_path = pathlib.Path(file_path_str)
@@ -318,6 +598,13 @@ def update_latest_links() -> Dict[str, pathlib.Path]:
         if update_latest_link(file_path, product):
             result[product] = file_path
             logger.debug(f"Updated latest link for {product} to {file_path}")
+
+            # Drop links of the other format (a fallback reference replaces a Parquet latest
+            # and vice versa), so readers of a stale link do not see an outdated forecast
+            link_path = get_latest_file_path(product, file_path.suffix.lstrip('.'))
+            for stale_link in link_path.parent.glob(f"{product}.*"):
+                if stale_link != link_path and stale_link.is_symlink():
+                    stale_link.unlink()
         
     logger.info(f"Updated latest links for {len(result)} products")
     return result
@@ -330,23 +617,17 @@ def get_latest_forecast_metadata() -> Dict[str, Dict]:
     Returns:
         dict: Dictionary of products and their latest forecast metadata
     """
-    # Load the current index
-    index_df = load_index()
-    
     result = {}
     
     # Process each product
     for product in FORECAST_PRODUCTS:
-        # Filter index for this product
-        product_df = index_df[index_df["product"] == product]
+        # Resolve the latest forecast (by target date, then generation time) through the pointer table
+        latest = get_latest_index_entry(product)
         
-        if product_df.empty:
+        if latest is None:
             logger.warning(f"No forecasts found for product {product}")
             continue
         
-        # Get the most recent forecast by generation time
-        latest = product_df.loc[product_df["generation_timestamp"].idxmax()]
-        
         # Extract metadata
         result[product] = {
             "timestamp": latest["timestamp"],
@@ -373,26 +654,22 @@ def clean_index() -> Dict[str, int]:
     total_entries = len(index_df)
     removed_entries = 0
     
-    # Create a mask for rows to keep
-    rows_to_remove = []
+    # Check file existence in parallel; on network storage each check is a round trip
+    with ThreadPoolExecutor(max_workers=INDEX_REBUILD_WORKERS) as executor:
+        exists = list(executor.map(os.path.exists, index_df["file_path"].tolist()))
     
-    # Check each row
-    for idx, row in index_df.iterrows():
-        file_path_str = row["file_path"]
-        file_path = pathlib.Path(file_path_str)
-        
-        # Check if file exists
-        if not file_path.exists():
-            rows_to_remove.append(idx)
-            logger.debug(f"Marking for removal: {file_path} (not found)")
+    rows_to_remove = index_df.index[[not file_exists for file_exists in exists]].tolist()
+    for file_path_str in index_df.loc[rows_to_remove, "file_path"]:
+        logger.debug(f"Marking for removal: {file_path_str} (not found)")
     
     # Remove the rows
     if rows_to_remove:
         index_df = index_df.drop(rows_to_remove)
         removed_entries = len(rows_to_remove)
         
-        # Save the updated index
+        # Save the updated index and recompute the latest pointers
         save_index(index_df)
+        rebuild_pointer_table(index_df)
         
         # Update latest links
         update_latest_links()
@@ -412,10 +689,19 @@ def clean_index() -> Dict[str, int]:
 
 @log_execution_time
 @log_exceptions
-def rebuild_index() -> Dict[str, int]:
+def rebuild_index(max_workers: Optional[int] = None, resume: bool = True) -> Dict[str, Union[int, float, List[str]]]:
     """
     Rebuilds the entire index by scanning the storage directory.
     
+    Files are scanned in parallel from their Parquet footers and verified in the same pass,
+    against the checksums recorded in the previous index where available.
+    Scan results are checkpointed, so a rebuild that is interrupted resumes with the files
+    that were not scanned yet (or changed since).
+    
+    Args:
+        max_workers: Number of scanning threads (defaults to INDEX_REBUILD_WORKERS)
+        resume: Whether to reuse the checkpoint of an interrupted rebuild
+    
     Returns:
         dict: Dictionary with rebuild statistics
     """
@@ -432,119 +718,95 @@ def rebuild_index() -> Dict[str, int]:
         except Exception as e:
             logger.warning(f"Failed to create backup of index: {str(e)}")
     
-    # Initialize counters
-    files_found = 0
-    files_processed = 0
-    files_skipped = 0
-    
-    # Create a new empty DataFrame for the index
+    # Files last modified before the previous index was saved are verified against its checksums
+    recorded_entries = {}
+    index_mtime_ns = 0
+    if index_path.exists():
+        try:
+            index_mtime_ns = index_path.stat().st_mtime_ns
+            recorded_entries = {entry["file_path"]: entry for entry in load_index().to_dict("records")}
+        except Exception as e:
+            logger.warning(f"Previous index could not be read, checksums will be recomputed: {str(e)}")
+    
+    if not resume:
+        clear_rebuild_checkpoint()
+    checkpoint = load_rebuild_checkpoint()
+    
+    start_time = time.monotonic()
+    files = find_forecast_files(base_path)
+    
+    # Reuse the scans of files that are unchanged since they were checkpointed
+    records = []
+    pending = []
+    for file_path, year, month, size, mtime_ns in files:
+        record = checkpoint.get(str(file_path))
+        if is_record_current(record, size, mtime_ns):
+            records.append(record)
+        else:
+            pending.append((file_path, year, month, size, mtime_ns))
+    files_resumed = len(records)
+    
+    # Scan the remaining files in parallel, checkpointing results as they complete
+    unsaved = []
+    with ThreadPoolExecutor(max_workers=max_workers or INDEX_REBUILD_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                scan_forecast_file, file_path, year, month, size, mtime_ns,
+                recorded_entries.get(str(file_path)) if mtime_ns <= index_mtime_ns else None
+            )
+            for file_path, year, month, size, mtime_ns in pending
+        ]
+        for future in as_completed(futures):
+            record = future.result()
+            records.append(record)
+            unsaved.append(record)
+            if len(unsaved) >= INDEX_REBUILD_CHECKPOINT_INTERVAL:
+                append_rebuild_checkpoint(unsaved)
+                unsaved = []
+    append_rebuild_checkpoint(unsaved)
+    
+    elapsed = time.monotonic() - start_time
+    
+    for record in records:
+        if record["status"] == SCAN_SKIPPED:
+            logger.warning(f"Skipping file {record['file_path']}: {record['reason']}")
+        elif record["status"] == SCAN_CORRUPT:
+            logger.error(f"Corrupt forecast file {record['file_path']}: {record['reason']}")
+    
+    # Build the new index in one step
+    entries = [record["entry"] for record in records if record["status"] == SCAN_INDEXED]
     new_index = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in INDEX_SCHEMA.items()})
+    if entries:
+        new_index = pd.DataFrame(entries).sort_values(["timestamp", "product"], ignore_index=True)
     
-    # Walk through the directory structure
-    for year_dir in base_path.glob('[0-9][0-9][0-9][0-9]'):
-        if not year_dir.is_dir():
-            continue
-            
-        for month_dir in year_dir.glob('[0-9][0-9]'):
-            if not month_dir.is_dir():
-                continue
-                
-            # Look for forecast files
-            for file_path in month_dir.glob('*.*'):
-                if not file_path.is_file() or file_path.is_symlink():
-                    continue
-                
-                files_found += 1
-                
-                try:
-                    # Parse the filename to get day and product
-                    filename = file_path.name
-                    if '_' not in filename:
-                        logger.warning(f"Skipping file with unexpected name format: {filename}")
-                        files_skipped += 1
-                        continue
-                    
-                    # Expected format: day_product.extension
-                    day_str, rest = filename.split('_', 1)
-                    if '.' not in rest:
-                        logger.warning(f"Skipping file with unexpected name format: {filename}")
-                        files_skipped += 1
-                        continue
-                    
-                    product, extension = rest.rsplit('.', 1)
-                    
-                    # Validate product
-                    try:
-                        validate_product(product)
-                    except StorageError:
-                        logger.warning(f"Skipping file with invalid product: {filename}")
-                        files_skipped += 1
-                        continue
-                    
-                    # Extract year, month, day
-                    year = year_dir.name
-                    month = month_dir.name
-                    day = day_str
-                    
-                    # Create timestamp
-                    try:
-                        timestamp = datetime.datetime.strptime(f"{year}-{month}-{day} 00:00:00", "%Y-%m-%d %H:%M:%S")
-                    except ValueError:
-                        logger.warning(f"Skipping file with invalid date: {filename}")
-                        files_skipped += 1
-                        continue
-                    
-                    # Load the forecast file to extract metadata
-                    forecast_df = load_dataframe(file_path)
-                    
-                    if forecast_df is None:
-                        logger.warning(f"Skipping file that could not be loaded: {file_path}")
-                        files_skipped += 1
-                        continue
-                    
-                    # Extract generation timestamp and fallback status
-                    if "generation_timestamp" in forecast_df.columns:
-                        generation_timestamp = forecast_df["generation_timestamp"].iloc[0]
-                    else:
-                        # Use file modification time as fallback
-                        mod_time = file_path.stat().st_mtime
-                        generation_timestamp = datetime.datetime.fromtimestamp(mod_time)
-                    
-                    is_fallback = False
-                    if "is_fallback" in forecast_df.columns:
-                        is_fallback = forecast_df["is_fallback"].iloc[0]
-                    
-                    # Add to the new index
-                    new_entry = {
-                        "timestamp": timestamp,
-                        "product": product,
-                        "file_path": str(file_path),
-                        "generation_timestamp": generation_timestamp,
-                        "is_fallback": is_fallback
-                    }
-                    
-                    new_index = pd.concat([new_index, pd.DataFrame([new_entry])], ignore_index=True)
-                    files_processed += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error processing file {file_path}: {str(e)}")
-                    files_skipped += 1
-    
-    # Save the rebuilt index
+    # Save the rebuilt index and recompute the latest pointers
     save_index(new_index)
+    rebuild_pointer_table(new_index)
+    clear_rebuild_checkpoint()
     
     # Update latest links
     update_latest_links()
     
     # Compile statistics
+    corrupt_files = sorted(record["file_path"] for record in records if record["status"] == SCAN_CORRUPT)
+    files_scanned = len(pending)
     stats = {
-        "files_found": files_found,
-        "files_processed": files_processed,
-        "files_skipped": files_skipped,
-        "index_entries": len(new_index)
+        "files_found": len(files),
+        "files_processed": len(entries),
+        "files_skipped": sum(1 for record in records if record["status"] == SCAN_SKIPPED),
+        "files_corrupt": len(corrupt_files),
+        "files_resumed": files_resumed,
+        "corrupt_files": corrupt_files,
+        "index_entries": len(new_index),
+        "scan_seconds": round(elapsed, 3),
+        "files_per_second": round(files_scanned / elapsed, 1) if elapsed > 0 else float(files_scanned)
     }
     
-    logger.info(f"Rebuilt index with {stats['index_entries']} entries from {stats['files_processed']} files")
+    logger.info(
+        f"Rebuilt index with {stats['index_entries']} entries from {stats['files_processed']} files "
+        f"({files_scanned} scanned at {stats['files_per_second']} files/sec, {files_resumed} resumed, "
+        f"{stats['files_corrupt']} corrupt)"
+    )
     return stats
 
 @log_exceptions
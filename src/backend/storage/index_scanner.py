@@ -0,0 +1,387 @@
+"""
+Storage scanning for index rebuilds in the Electricity Market Price Forecasting System.
+
+Rebuilding the index has to visit every stored forecast file. This module lists the
+storage tree, extracts each file's index entry from its Parquet footer (the row group
+statistics hold the generation time and fallback flag, so no data pages are parsed) and
+verifies the file in the same pass: its layout, and its content against the checksums
+recorded in the previous index (the checksums are recomputed by streaming the file when
+none were recorded). Fallbacks stored as references are indexed from the reference file,
+which must point to an existing source file. Scan results are appended to a checkpoint so that an interrupted
+rebuild resumes with the files that were not scanned yet.
+"""
+
+import os
+import json
+import pathlib
+import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd  # version: 2.0.0
+import pyarrow.parquet as pq  # version 12.0.0
+
+# Internal imports
+from .path_resolver import get_rebuild_checkpoint_path, validate_product
+from .exceptions import StorageError, FileOperationError
+from .checksums import CHECKSUM_FIELDS, compute_file_checksums, has_checksums, verify_file_checksums
+from .forecast_references import REFERENCE_EXTENSION, REFERENCE_FIELDS, read_reference_file
+from ..utils.file_utils import load_dataframe
+from ..utils.logging_utils import get_logger
+from ..config.settings import TIMEZONE
+
+# Set up logger
+logger = get_logger(__name__)
+
+# Scan statuses
+SCAN_INDEXED = "indexed"
+SCAN_SKIPPED = "skipped"
+SCAN_CORRUPT = "corrupt"
+
+# Parquet files start and end with this magic number
+PARQUET_MAGIC = b"PAR1"
+
+# Columns holding the metadata recorded in the index
+METADATA_COLUMNS = ["generation_timestamp", "is_fallback"]
+
+
+def find_forecast_files(base_path: pathlib.Path) -> List[Tuple[pathlib.Path, str, str, int, int]]:
+    """
+    Lists the forecast files in the year/month storage tree.
+
+    Args:
+        base_path: Base storage directory
+
+    Returns:
+        list: Tuples of (file path, year, month, size in bytes, modification time in ns)
+    """
+    files = []
+    for year_dir in sorted(base_path.glob('[0-9][0-9][0-9][0-9]')):
+        if not year_dir.is_dir():
+            continue
+
+        for month_dir in sorted(year_dir.glob('[0-9][0-9]')):
+            if not month_dir.is_dir():
+                continue
+
+            # scandir returns the file type and stat without a separate call per file
+            with os.scandir(month_dir) as entries:
+                for entry in entries:
+                    if '.' not in entry.name or entry.is_symlink() or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    files.append((pathlib.Path(entry.path), year_dir.name, month_dir.name, stat.st_size, stat.st_mtime_ns))
+
+    return sorted(files)
+
+
+def parse_forecast_filename(filename: str, year: str, month: str) -> Tuple[datetime.datetime, str, str]:
+    """
+    Parses a forecast file name of the form day_product.extension.
+
+    Args:
+        filename: File name
+        year: Year directory name
+        month: Month directory name
+
+    Returns:
+        tuple: (forecast timestamp, product, extension)
+
+    Raises:
+        ValueError: If the name, date or product is invalid
+    """
+    if '_' not in filename:
+        raise ValueError(f"unexpected name format: {filename}")
+
+    day_str, rest = filename.split('_', 1)
+    if '.' not in rest:
+        raise ValueError(f"unexpected name format: {filename}")
+
+    product, extension = rest.rsplit('.', 1)
+
+    try:
+        validate_product(product)
+    except StorageError:
+        raise ValueError(f"invalid product: {filename}")
+
+    try:
+        timestamp = datetime.datetime.strptime(f"{year}-{month}-{day_str} 00:00:00", "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        raise ValueError(f"invalid date: {filename}")
+
+    return timestamp, product, extension
+
+
+def verify_parquet_layout(file_path: pathlib.Path, metadata: pq.FileMetaData, file_size: int) -> Optional[str]:
+    """
+    Verifies that a Parquet file's column chunks lie within the file.
+
+    A file truncated after its footer was written, or whose footer does not match its
+    data, is detected without reading any data pages.
+
+    Args:
+        file_path: Path to the file
+        metadata: Parsed footer of the file
+        file_size: Size of the file in bytes
+
+    Returns:
+        str: Description of the problem, or None if the layout is consistent
+    """
+    with open(file_path, "rb") as f:
+        if f.read(len(PARQUET_MAGIC)) != PARQUET_MAGIC:
+            return "missing Parquet header"
+
+    # Column chunks must end before the footer (footer, its length and the magic number)
+    data_end = file_size - metadata.serialized_size - 8
+    for rg_index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg_index)
+        for col_index in range(row_group.num_columns):
+            column = row_group.column(col_index)
+            start = column.dictionary_page_offset if column.has_dictionary_page else column.data_page_offset
+            if start + column.total_compressed_size > data_end:
+                return f"column chunk {column.path_in_schema} of row group {rg_index} extends past the data"
+
+    return None
+
+
+def _metadata_from_statistics(metadata: pq.FileMetaData) -> Optional[Dict]:
+    """
+    Reads the generation timestamp and fallback flag from the first row group's statistics.
+
+    Returns:
+        dict: Metadata values, or None if the statistics are not available
+    """
+    if metadata.num_row_groups == 0:
+        return None
+
+    names = metadata.schema.names
+    row_group = metadata.row_group(0)
+    values = {}
+    for column_name in METADATA_COLUMNS:
+        if column_name not in names:
+            continue
+        statistics = row_group.column(names.index(column_name)).statistics
+        if statistics is None or not statistics.has_min_max:
+            return None
+        values[column_name] = statistics.min
+
+    return values
+
+
+def _index_generation_timestamp(value) -> pd.Timestamp:
+    """
+    Converts a generation time to the index's representation: naive CST wall time.
+
+    Row group statistics of a timezone-aware column hold UTC times and loaded columns hold
+    CST times, so aware values are converted to CST before the timezone is dropped. Naive
+    values are already wall times and are kept as they are.
+    """
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert(TIMEZONE).tz_localize(None)
+    return timestamp
+
+
+def _read_metadata_columns(file_path: pathlib.Path, extension: str, available_columns: List[str]) -> Dict:
+    """
+    Reads the generation timestamp and fallback flag by loading only those columns.
+    """
+    columns = [column for column in METADATA_COLUMNS if column in available_columns]
+    if not columns:
+        return {}
+
+    forecast_df = load_dataframe(file_path, format=extension, columns=columns)
+    if forecast_df is None or forecast_df.empty:
+        return {}
+    return forecast_df.iloc[0].to_dict()
+
+
+def scan_forecast_file(
+    file_path: pathlib.Path,
+    year: str,
+    month: str,
+    file_size: int,
+    mtime_ns: int,
+    recorded_entry: Optional[Dict] = None
+) -> Dict:
+    """
+    Scans one stored forecast file for its index entry and verifies its integrity.
+
+    Args:
+        file_path: Path to the file
+        year: Year directory name
+        month: Month directory name
+        file_size: Size of the file in bytes
+        mtime_ns: Modification time of the file in ns
+        recorded_entry: Optional entry of the file in the previous index, whose recorded
+            checksums the file is verified against
+
+    Returns:
+        dict: Scan record with file_path, size, mtime_ns, status (SCAN_INDEXED, SCAN_SKIPPED or
+            SCAN_CORRUPT), entry (the index entry, or None) and reason
+    """
+    record = {
+        "file_path": str(file_path),
+        "size": file_size,
+        "mtime_ns": mtime_ns,
+        "status": SCAN_SKIPPED,
+        "entry": None,
+        "reason": None
+    }
+
+    try:
+        timestamp, product, extension = parse_forecast_filename(file_path.name, year, month)
+    except ValueError as e:
+        record["reason"] = str(e)
+        return record
+
+    reference = {}
+    try:
+        if extension == REFERENCE_EXTENSION:
+            try:
+                values = read_reference_file(file_path)
+            except FileOperationError as e:
+                record["status"] = SCAN_CORRUPT
+                record["reason"] = f"unreadable reference: {str(e)}"
+                return record
+
+            if not pathlib.Path(values["source_file_path"]).exists():
+                record["status"] = SCAN_CORRUPT
+                record["reason"] = f"referenced source file missing: {values['source_file_path']}"
+                return record
+
+            # The index records generation times without timezone
+            values["generation_timestamp"] = _index_generation_timestamp(values["generation_timestamp"])
+            reference = {field: values[field] for field in REFERENCE_FIELDS}
+        elif extension.lower() == "parquet":
+            try:
+                metadata = pq.read_metadata(file_path)
+            except Exception as e:
+                record["status"] = SCAN_CORRUPT
+                record["reason"] = f"unreadable Parquet footer: {str(e)}"
+                return record
+
+            problem = verify_parquet_layout(file_path, metadata, file_size)
+            if problem is not None:
+                record["status"] = SCAN_CORRUPT
+                record["reason"] = problem
+                return record
+
+            values = _metadata_from_statistics(metadata)
+            if values is None:
+                values = _read_metadata_columns(file_path, extension, metadata.schema.names)
+        else:
+            values = _read_metadata_columns(file_path, extension, METADATA_COLUMNS)
+    except Exception as e:
+        record["reason"] = f"could not read metadata: {str(e)}"
+        return record
+
+    # Verify against the recorded checksums, or record new ones, with one streaming read
+    if has_checksums(recorded_entry):
+        problems = verify_file_checksums(file_path, recorded_entry)
+        if problems:
+            record["status"] = SCAN_CORRUPT
+            record["reason"] = "; ".join(problems)
+            return record
+        checksums = {field: recorded_entry.get(field) for field in CHECKSUM_FIELDS}
+        checksums["file_size"] = file_size
+    else:
+        checksums = compute_file_checksums(file_path)
+
+    generation_timestamp = values.get("generation_timestamp")
+    if generation_timestamp is None:
+        # Use file modification time as fallback
+        generation_timestamp = datetime.datetime.fromtimestamp(mtime_ns / 1e9)
+
+    record["status"] = SCAN_INDEXED
+    record["entry"] = {
+        "timestamp": timestamp,
+        "product": product,
+        "file_path": str(file_path),
+        "generation_timestamp": _index_generation_timestamp(generation_timestamp),
+        "is_fallback": bool(values.get("is_fallback", False)),
+        **checksums,
+        **reference
+    }
+    return record
+
+
+def _serialize_record(record: Dict) -> str:
+    """
+    Converts a scan record to a checkpoint line.
+    """
+    data = dict(record)
+    if data["entry"] is not None:
+        entry = dict(data["entry"])
+        entry["timestamp"] = pd.Timestamp(entry["timestamp"]).isoformat()
+        entry["generation_timestamp"] = pd.Timestamp(entry["generation_timestamp"]).isoformat()
+        data["entry"] = entry
+    return json.dumps(data)
+
+
+def _deserialize_record(line: str) -> Dict:
+    """
+    Converts a checkpoint line back to a scan record.
+    """
+    record = json.loads(line)
+    if record["entry"] is not None:
+        record["entry"]["timestamp"] = pd.Timestamp(record["entry"]["timestamp"]).to_pydatetime()
+        record["entry"]["generation_timestamp"] = pd.Timestamp(record["entry"]["generation_timestamp"])
+    return record
+
+
+def load_rebuild_checkpoint() -> Dict[str, Dict]:
+    """
+    Loads the scan records of an interrupted rebuild.
+
+    Returns:
+        dict: Scan records keyed by file path (empty if there is no checkpoint)
+    """
+    checkpoint_path = get_rebuild_checkpoint_path()
+    if not checkpoint_path.exists():
+        return {}
+
+    records = {}
+    with open(checkpoint_path, "r") as f:
+        for line in f:
+            try:
+                record = _deserialize_record(line)
+            except (ValueError, KeyError, TypeError):
+                # A line cut short by the interruption is scanned again
+                continue
+            records[record["file_path"]] = record
+
+    logger.info(f"Loaded {len(records)} scanned files from rebuild checkpoint {checkpoint_path}")
+    return records
+
+
+def append_rebuild_checkpoint(records: List[Dict]) -> None:
+    """
+    Appends scan records to the rebuild checkpoint.
+
+    Args:
+        records: Scan records to append
+    """
+    if not records:
+        return
+
+    checkpoint_path = get_rebuild_checkpoint_path()
+    with open(checkpoint_path, "a") as f:
+        f.write("".join(_serialize_record(record) + "\n" for record in records))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def clear_rebuild_checkpoint() -> None:
+    """
+    Removes the rebuild checkpoint after a completed rebuild.
+    """
+    checkpoint_path = get_rebuild_checkpoint_path()
+    if checkpoint_path.exists():
+        checkpoint_path.unlink()
+
+
+def is_record_current(record: Optional[Dict], file_size: int, mtime_ns: int) -> bool:
+    """
+    Checks whether a checkpointed scan record still matches the file on disk.
+    """
+    return record is not None and record["size"] == file_size and record["mtime_ns"] == mtime_ns
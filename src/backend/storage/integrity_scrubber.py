@@ -0,0 +1,192 @@
+"""
+Background integrity scrubber for the Electricity Market Price Forecasting System.
+
+The scrubber periodically verifies every indexed forecast file against the checksums
+recorded in the index, so corruption of archived forecasts (which may not be read for
+months) is detected before the forecast is needed, e.g. as a fallback. Files are streamed
+in chunks at a bounded read rate so a scrub does not compete with forecast generation or
+the API for disk bandwidth.
+"""
+
+import time
+import threading
+from typing import Dict, List, Optional, Union
+
+# Internal imports
+from .index_manager import load_index
+from .checksums import has_checksums, verify_file_checksums
+from ..utils.logging_utils import get_logger
+from ..config.settings import STORAGE_SCRUB_MAX_BYTES_PER_SECOND, STORAGE_SCRUB_INTERVAL_SECONDS
+
+# Set up logger
+logger = get_logger(__name__)
+
+# Background scrubber thread and its stop signal
+_scrubber_thread: Optional[threading.Thread] = None
+_scrubber_stop_event = threading.Event()
+
+# Statistics of the most recent completed scrub
+_last_scrub_stats: Dict[str, Union[int, float, List[str]]] = {}
+
+
+class IORateLimiter:
+    """
+    Throttles reads to a maximum number of bytes per second by sleeping once reads get ahead.
+    """
+
+    def __init__(self, max_bytes_per_second: int, stop_event: Optional[threading.Event] = None):
+        """
+        Initializes the rate limiter.
+
+        Args:
+            max_bytes_per_second: Maximum read rate (0 disables throttling)
+            stop_event: Optional event that interrupts throttling sleeps
+        """
+        self.max_bytes_per_second = max_bytes_per_second
+        self.stop_event = stop_event
+        self.bytes_read = 0
+        self._start = time.monotonic()
+
+    def consume(self, num_bytes: int) -> None:
+        """
+        Records bytes read, sleeping until the read rate is within the limit.
+
+        Args:
+            num_bytes: Number of bytes just read
+        """
+        self.bytes_read += num_bytes
+        if self.max_bytes_per_second <= 0:
+            return
+
+        ahead = self.bytes_read / self.max_bytes_per_second - (time.monotonic() - self._start)
+        if ahead > 0:
+            if self.stop_event is not None:
+                self.stop_event.wait(ahead)
+            else:
+                time.sleep(ahead)
+
+
+def scrub_storage(
+    max_bytes_per_second: int = STORAGE_SCRUB_MAX_BYTES_PER_SECOND,
+    products: Optional[List[str]] = None,
+    stop_event: Optional[threading.Event] = None
+) -> Dict[str, Union[int, float, List[str]]]:
+    """
+    Verifies indexed forecast files against their recorded checksums at a bounded read rate.
+
+    Args:
+        max_bytes_per_second: Maximum read rate (0 disables throttling)
+        products: Optional products to scrub, defaults to all indexed products
+        stop_event: Optional event that stops the scrub early
+
+    Returns:
+        dict: Scrub statistics, including the list of corrupt files
+    """
+    index_df = load_index()
+    if products is not None:
+        index_df = index_df[index_df["product"].isin(products)]
+
+    limiter = IORateLimiter(max_bytes_per_second, stop_event)
+    start_time = time.monotonic()
+    files_checked = 0
+    files_unverified = 0
+    corrupt_files = []
+
+    for entry in index_df.to_dict("records"):
+        if stop_event is not None and stop_event.is_set():
+            logger.info("Storage scrub stopped before completion")
+            break
+
+        if not has_checksums(entry):
+            files_unverified += 1
+            continue
+
+        problems = verify_file_checksums(entry["file_path"], entry, on_read=limiter.consume)
+        files_checked += 1
+        if problems:
+            corrupt_files.append(entry["file_path"])
+            logger.error(f"Scrub found corrupt forecast file {entry['file_path']} ({entry['product']}): {problems}")
+
+    elapsed = time.monotonic() - start_time
+    stats = {
+        "files_checked": files_checked,
+        "files_unverified": files_unverified,
+        "files_corrupt": len(corrupt_files),
+        "corrupt_files": corrupt_files,
+        "bytes_read": limiter.bytes_read,
+        "scrub_seconds": round(elapsed, 3)
+    }
+
+    logger.info(
+        f"Storage scrub checked {files_checked} files ({limiter.bytes_read} bytes in {stats['scrub_seconds']}s), "
+        f"{len(corrupt_files)} corrupt, {files_unverified} without checksums"
+    )
+    return stats
+
+
+def _scrub_loop(interval_seconds: int, max_bytes_per_second: int) -> None:
+    """
+    Scrubs the storage every interval until stopped.
+    """
+    global _last_scrub_stats
+
+    while not _scrubber_stop_event.is_set():
+        try:
+            stats = scrub_storage(max_bytes_per_second, stop_event=_scrubber_stop_event)
+            if not _scrubber_stop_event.is_set():
+                _last_scrub_stats = stats
+        except Exception as e:
+            logger.warning(f"Storage scrub failed: {str(e)}")
+
+        if _scrubber_stop_event.wait(interval_seconds):
+            break
+
+
+def start_scrubber(
+    interval_seconds: int = STORAGE_SCRUB_INTERVAL_SECONDS,
+    max_bytes_per_second: int = STORAGE_SCRUB_MAX_BYTES_PER_SECOND
+) -> threading.Thread:
+    """
+    Starts the background scrubber in a daemon thread (no-op if it is already running).
+
+    Args:
+        interval_seconds: Seconds between the end of one scrub and the start of the next
+        max_bytes_per_second: Maximum read rate of a scrub
+
+    Returns:
+        The scrubber thread
+    """
+    global _scrubber_thread
+
+    if _scrubber_thread is not None and _scrubber_thread.is_alive():
+        return _scrubber_thread
+
+    _scrubber_stop_event.clear()
+    _scrubber_thread = threading.Thread(
+        target=_scrub_loop,
+        args=(interval_seconds, max_bytes_per_second),
+        name="storage-scrubber",
+        daemon=True
+    )
+    _scrubber_thread.start()
+    logger.info(f"Started storage scrubber every {interval_seconds}s at up to {max_bytes_per_second} bytes/s")
+    return _scrubber_thread
+
+
+def stop_scrubber() -> None:
+    """
+    Stops the background scrubber if it is running.
+    """
+    global _scrubber_thread
+
+    _scrubber_stop_event.set()
+    if _scrubber_thread is not None:
+        _scrubber_thread.join(timeout=5)
+        _scrubber_thread = None
+
+
+def get_last_scrub_stats() -> Dict[str, Union[int, float, List[str]]]:
+    """
+    Gets the statistics of the most recent completed scrub (empty if none has completed).
+    """
+    return dict(_last_scrub_stats)
@@ -17,6 +17,8 @@ from ..config.settings import (
     STORAGE_ROOT_DIR,
     STORAGE_LATEST_DIR,
     STORAGE_INDEX_FILE,
+    STORAGE_POINTER_FILE,
+    INDEX_REBUILD_CHECKPOINT_FILE,
     FORECAST_PRODUCTS
 )
 from .exceptions import StoragePathError
@@ -147,6 +149,38 @@ def get_index_file_path() -> pathlib.Path:
     return index_path
 
 
+@log_exceptions
+def get_pointer_file_path() -> pathlib.Path:
+    """
+    Gets the path to the latest-forecast pointer table.
+    
+    Returns:
+        pathlib.Path: Path to the pointer table file
+    """
+    pointer_path = pathlib.Path(STORAGE_POINTER_FILE)
+    
+    # Ensure parent directory exists
+    ensure_directory_exists(pointer_path.parent)
+    
+    return pointer_path
+
+
+@log_exceptions
+def get_rebuild_checkpoint_path() -> pathlib.Path:
+    """
+    Gets the path to the index rebuild checkpoint.
+    
+    Returns:
+        pathlib.Path: Path to the rebuild checkpoint file
+    """
+    checkpoint_path = pathlib.Path(INDEX_REBUILD_CHECKPOINT_FILE)
+    
+    # Ensure parent directory exists
+    ensure_directory_exists(checkpoint_path.parent)
+    
+    return checkpoint_path
+
+
 @log_exceptions
 def create_backup_path(file_path: pathlib.Path) -> pathlib.Path:
     """
@@ -0,0 +1,300 @@
+"""
+Latest-forecast pointer table for the Electricity Market Price Forecasting System.
+
+The pointer table records, per product, the index entry of the latest forecast and of the
+latest non-fallback forecast (by target date, then generation time, so a backfill of past
+dates does not replace the current forecast). It is advanced together with the index on
+every store, so the latest links, the latest-forecast API and the fallback search resolve a
+product's latest forecast with one small read instead of scanning the whole index. The table
+is written to a temporary file that is atomically renamed over it, so readers never see a
+partially written table.
+"""
+
+import os
+import json
+import threading
+from typing import Dict, Optional
+
+import pandas as pd  # version: 2.0.0
+
+# Internal imports
+from .path_resolver import get_pointer_file_path
+from .checksums import has_checksums
+from ..utils.logging_utils import get_logger
+
+# Set up logger
+logger = get_logger(__name__)
+
+# Pointer names
+POINTER_LATEST = "latest"
+POINTER_LATEST_NON_FALLBACK = "latest_non_fallback"
+
+# Timestamp fields of a pointer entry
+_TIMESTAMP_FIELDS = ("timestamp", "generation_timestamp")
+
+# Parsed table, reused until the file's modification time changes
+_pointer_lock = threading.RLock()
+_pointer_cache: Dict[str, object] = {"mtime": None, "table": None}
+
+
+def _serialize_entry(entry: Dict) -> Dict:
+    """
+    Converts an index entry to its JSON representation.
+    """
+    data = {
+        "timestamp": pd.Timestamp(entry["timestamp"]).isoformat(),
+        "product": entry["product"],
+        "file_path": str(entry["file_path"]),
+        "generation_timestamp": pd.Timestamp(entry["generation_timestamp"]).isoformat(),
+        "is_fallback": bool(entry["is_fallback"])
+    }
+
+    # Keep the recorded checksums so the latest forecast can be verified without an index scan
+    if has_checksums(entry):
+        data["checksum"] = entry["checksum"]
+        data["row_group_checksums"] = entry.get("row_group_checksums")
+        if not pd.isna(entry.get("file_size")):
+            data["file_size"] = int(entry["file_size"])
+    return data
+
+
+def _deserialize_entry(data: Dict) -> Dict:
+    """
+    Converts a JSON pointer entry back to an index entry with pandas timestamps.
+    """
+    entry = dict(data)
+    for field in _TIMESTAMP_FIELDS:
+        entry[field] = pd.Timestamp(entry[field])
+    return entry
+
+
+def _naive(timestamp) -> pd.Timestamp:
+    """
+    Converts a timestamp to a naive timestamp, so naive and aware timestamps are comparable.
+    """
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert(None)
+    return timestamp
+
+
+def _recency_key(entry: Dict) -> tuple:
+    """
+    Returns the ordering key of an entry: its target timestamp, then its generation time.
+    """
+    return _naive(entry["timestamp"]), _naive(entry["generation_timestamp"])
+
+
+def _is_newer(entry: Dict, current: Optional[Dict]) -> bool:
+    """
+    Checks whether an entry is at least as recent as the current pointer (ties go to the new entry).
+    """
+    return current is None or _recency_key(entry) >= _recency_key(current)
+
+
+def _is_same_forecast(entry: Dict, other: Optional[Dict]) -> bool:
+    """
+    Checks whether two entries refer to the same stored forecast (timestamp and product).
+    """
+    return (
+        other is not None
+        and other["product"] == entry["product"]
+        and pd.Timestamp(other["timestamp"]) == pd.Timestamp(entry["timestamp"])
+    )
+
+
+def load_pointer_table() -> Optional[Dict[str, Dict[str, Dict]]]:
+    """
+    Loads the pointer table.
+
+    Returns:
+        dict: Mapping of product to pointer name to index entry, or None if no table exists
+            or it cannot be read
+    """
+    pointer_path = get_pointer_file_path()
+    try:
+        mtime = pointer_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    with _pointer_lock:
+        if _pointer_cache["mtime"] == mtime:
+            return _pointer_cache["table"]
+
+        try:
+            with open(pointer_path, "r") as f:
+                raw_table = json.load(f)
+            table = {
+                product: {name: _deserialize_entry(entry) for name, entry in pointers.items()}
+                for product, pointers in raw_table.items()
+            }
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Failed to read pointer table at {pointer_path}: {str(e)}")
+            return None
+
+        _pointer_cache["mtime"] = mtime
+        _pointer_cache["table"] = table
+        return table
+
+
+def save_pointer_table(table: Dict[str, Dict[str, Dict]]) -> bool:
+    """
+    Atomically replaces the pointer table.
+
+    Args:
+        table: Mapping of product to pointer name to index entry
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    pointer_path = get_pointer_file_path()
+    temp_path = pointer_path.with_name(f".{pointer_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    raw_table = {
+        product: {name: _serialize_entry(entry) for name, entry in pointers.items()}
+        for product, pointers in table.items()
+    }
+
+    with _pointer_lock:
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(raw_table, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, pointer_path)
+        except OSError as e:
+            logger.error(f"Failed to save pointer table to {pointer_path}: {str(e)}")
+            if temp_path.exists():
+                temp_path.unlink()
+            return False
+
+        _pointer_cache["mtime"] = pointer_path.stat().st_mtime_ns
+        _pointer_cache["table"] = table
+
+    logger.debug(f"Saved pointer table for {len(table)} products")
+    return True
+
+
+def compute_product_pointers(index_df: pd.DataFrame, product: str) -> Dict[str, Dict]:
+    """
+    Computes a product's pointers from the full index.
+
+    Args:
+        index_df: Forecast index
+        product: Product identifier
+
+    Returns:
+        dict: Pointer name to index entry (pointers without a matching forecast are omitted)
+    """
+    pointers = {}
+    product_df = index_df[index_df["product"] == product]
+
+    if not product_df.empty:
+        # Latest by target date, then generation time (a backfilled past date is generated later)
+        product_df = product_df.sort_values(["timestamp", "generation_timestamp"], kind="stable")
+        pointers[POINTER_LATEST] = product_df.iloc[-1].to_dict()
+
+        non_fallback_df = product_df[~product_df["is_fallback"].astype(bool)]
+        if not non_fallback_df.empty:
+            pointers[POINTER_LATEST_NON_FALLBACK] = non_fallback_df.iloc[-1].to_dict()
+
+    return pointers
+
+
+def rebuild_pointer_table(index_df: pd.DataFrame) -> Dict[str, Dict[str, Dict]]:
+    """
+    Rebuilds the whole pointer table from the index.
+
+    Args:
+        index_df: Forecast index
+
+    Returns:
+        dict: The rebuilt pointer table
+    """
+    table = {}
+    for product in index_df["product"].unique():
+        pointers = compute_product_pointers(index_df, product)
+        if pointers:
+            table[product] = pointers
+
+    save_pointer_table(table)
+    logger.info(f"Rebuilt pointer table for {len(table)} products")
+    return table
+
+
+def refresh_product_pointers(index_df: pd.DataFrame, product: str) -> Dict[str, Dict]:
+    """
+    Recomputes one product's pointers from the index (e.g. after a forecast was removed).
+
+    Args:
+        index_df: Forecast index
+        product: Product identifier
+
+    Returns:
+        dict: The product's pointers
+    """
+    with _pointer_lock:
+        table = dict(load_pointer_table() or {})
+        pointers = compute_product_pointers(index_df, product)
+        if pointers:
+            table[product] = pointers
+        else:
+            table.pop(product, None)
+        save_pointer_table(table)
+    return pointers
+
+
+def advance_pointers(entry: Dict, index_df: pd.DataFrame) -> Dict[str, Dict]:
+    """
+    Advances a product's pointers to a newly indexed forecast.
+
+    Only the stored product's pointers are compared against the new entry. The index is only
+    scanned when a fallback overwrites the file the non-fallback pointer refers to.
+
+    Args:
+        entry: Index entry of the stored forecast
+        index_df: Forecast index including the entry
+
+    Returns:
+        dict: The product's pointers
+    """
+    product = entry["product"]
+
+    with _pointer_lock:
+        table = load_pointer_table()
+        if table is None:
+            return rebuild_pointer_table(index_df).get(product, {})
+
+        table = dict(table)
+        pointers = dict(table.get(product, {}))
+
+        if _is_newer(entry, pointers.get(POINTER_LATEST)) or _is_same_forecast(entry, pointers.get(POINTER_LATEST)):
+            pointers[POINTER_LATEST] = entry
+
+        if not entry["is_fallback"]:
+            if _is_newer(entry, pointers.get(POINTER_LATEST_NON_FALLBACK)):
+                pointers[POINTER_LATEST_NON_FALLBACK] = entry
+        elif _is_same_forecast(entry, pointers.get(POINTER_LATEST_NON_FALLBACK)):
+            # The non-fallback forecast was overwritten by a fallback for the same day
+            return refresh_product_pointers(index_df, product)
+
+        table[product] = pointers
+        save_pointer_table(table)
+
+    return pointers
+
+
+def get_pointer(product: str, name: str = POINTER_LATEST) -> Optional[Dict]:
+    """
+    Gets a product's pointer from the table.
+
+    Args:
+        product: Product identifier
+        name: POINTER_LATEST or POINTER_LATEST_NON_FALLBACK
+
+    Returns:
+        dict: Index entry, or None if the table or pointer does not exist
+    """
+    table = load_pointer_table()
+    if table is None:
+        return None
+    return table.get(product, {}).get(name)
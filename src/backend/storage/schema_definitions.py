@@ -10,7 +10,8 @@ from datetime import datetime  # standard library
 import logging  # standard library
 from typing import Dict, List, Tuple, Optional, Any, Union  # standard library
 
-from ..config.schema_config import FORECAST_OUTPUT_SCHEMA, SCHEMA_VERSION
+from ..config.schema_config import FORECAST_OUTPUT_SCHEMA, SCHEMA_VERSION, get_forecast_schema_for_dataframe
+from ..models.data_models import get_sample_count
 from .exceptions import SchemaValidationError, DataIntegrityError
 from ..utils.validation_utils import validate_dataframe, format_validation_errors
 
@@ -24,6 +25,9 @@ STORAGE_METADATA_FIELDS = {
     "schema_version": "str"
 }
 
+# Optional metadata field recording the per-run number of probabilistic samples
+SAMPLE_COUNT_METADATA_FIELD = "num_samples"
+
 
 def validate_forecast_schema(df: pd.DataFrame) -> Tuple[bool, Dict[str, List[str]]]:
     """
@@ -37,8 +41,9 @@ def validate_forecast_schema(df: pd.DataFrame) -> Tuple[bool, Dict[str, List[str
     """
     logger.info("Starting schema validation for forecast dataframe")
     
-    # Use validate_dataframe from validation_utils to check against FORECAST_OUTPUT_SCHEMA
-    is_valid, validation_errors = validate_dataframe(df, FORECAST_OUTPUT_SCHEMA)
+    # Use validate_dataframe from validation_utils to check against the output schema
+    # matching the dataframe's sample count and sample dtype
+    is_valid, validation_errors = validate_dataframe(df, get_forecast_schema_for_dataframe(df))
     
     if is_valid:
         logger.info("Schema validation successful")
@@ -70,6 +75,9 @@ def add_storage_metadata(df: pd.DataFrame) -> pd.DataFrame:
     # Add schema version
     df_copy["schema_version"] = SCHEMA_VERSION
     
+    # Record the number of samples so readers need not infer it from the columns
+    df_copy[SAMPLE_COUNT_METADATA_FIELD] = get_sample_count(df)
+    
     return df_copy
 
 
@@ -115,25 +123,23 @@ def check_storage_integrity(df: pd.DataFrame) -> Tuple[bool, Dict[str, List[str]
         sample_cols = [col for col in df.columns if col.startswith("sample_")]
         
         if sample_cols:
-            # Check if point_forecast is within the range of samples for each row
-            for idx, row in df.iterrows():
-                point_forecast = row["point_forecast"]
-                samples = [row[col] for col in sample_cols]
-                min_sample = min(samples)
-                max_sample = max(samples)
+            # Check if point_forecast is within the range of samples, for all rows at once
+            point_forecast = df["point_forecast"]
+            min_sample = df[sample_cols].min(axis=1)
+            max_sample = df[sample_cols].max(axis=1)
+            
+            # If point forecast is significantly outside the range of samples, flag it
+            outside = (point_forecast < min_sample * 0.9) | (point_forecast > max_sample * 1.1)
+            if outside.any():
+                flagged = outside[outside].index
+                issues["data_consistency_issues"] = [
+                    f"Row {idx}: point_forecast ({point_forecast[idx]}) outside sample range ({min_sample[idx]:.2f}, {max_sample[idx]:.2f})"
+                    for idx in flagged[:5]
+                ]
                 
-                # If point forecast is significantly outside the range of samples, flag it
-                if point_forecast < min_sample * 0.9 or point_forecast > max_sample * 1.1:
-                    if "data_consistency_issues" not in issues:
-                        issues["data_consistency_issues"] = []
-                    issues["data_consistency_issues"].append(
-                        f"Row {idx}: point_forecast ({point_forecast}) outside sample range ({min_sample:.2f}, {max_sample:.2f})"
-                    )
-                    
-                    # Limit the number of reported issues to avoid very long error messages
-                    if len(issues.get("data_consistency_issues", [])) >= 5:
-                        issues["data_consistency_issues"].append("... and more issues (showing only first 5)")
-                        break
+                # Limit the number of reported issues to avoid very long error messages
+                if len(flagged) > 5:
+                    issues["data_consistency_issues"].append("... and more issues (showing only first 5)")
     
     # Return True if no issues, otherwise False with the issues dict
     if not issues:
@@ -155,7 +161,7 @@ def extract_storage_metadata(df: pd.DataFrame) -> Dict[str, Any]:
     metadata = {}
     
     # Extract standard metadata fields if they exist
-    for field in STORAGE_METADATA_FIELDS:
+    for field in list(STORAGE_METADATA_FIELDS) + [SAMPLE_COUNT_METADATA_FIELD]:
         if field in df.columns:
             # Convert timestamp to ISO format string if it's a timestamp
             if field == "storage_timestamp" and pd.api.types.is_datetime64_dtype(df[field]):
@@ -9,7 +9,7 @@ data integrity and availability.
 import os
 import pathlib
 import datetime
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd  # version: 2.0.0
 
@@ -20,9 +20,14 @@ from .dataframe_store import (
     load_latest_forecast,
     delete_forecast,
     get_forecasts_by_date_range,
+    load_forecast_file,
+    read_stored_columns,
     get_forecast_metadata,
     check_forecast_exists,
     copy_forecast,
+    store_forecast_reference,
+    store_forecasts_bulk,
+    materialize_expiring_references,
     get_storage_statistics
 )
 from .path_resolver import (
@@ -34,7 +39,10 @@ from .index_manager import (
     clean_index,
     rebuild_index,
     get_index_statistics,
-    get_latest_forecast_metadata
+    get_latest_forecast_metadata,
+    get_index_entry,
+    get_latest_index_entry,
+    query_index_batch
 )
 from .schema_definitions import (
     get_schema_info
@@ -47,7 +55,8 @@ from ..utils.file_utils import clean_old_forecasts
 from ..utils.logging_utils import get_logger, log_execution_time, log_exceptions
 from ..config.settings import (
     FORECAST_PRODUCTS,
-    STORAGE_ROOT_DIR
+    STORAGE_ROOT_DIR,
+    SAMPLE_STORAGE_DTYPE
 )
 
 # Configure logger
@@ -62,7 +71,8 @@ DEFAULT_RETENTION_DAYS = 90
 def save_forecast(df: pd.DataFrame, 
                   forecast_timestamp: datetime.datetime, 
                   product: str,
-                  is_fallback: bool = False) -> pathlib.Path:
+                  is_fallback: bool = False,
+                  sample_dtype: str = SAMPLE_STORAGE_DTYPE) -> pathlib.Path:
     """
     Saves a forecast dataframe to storage with validation.
     
@@ -71,6 +81,7 @@ def save_forecast(df: pd.DataFrame,
         forecast_timestamp: Timestamp of the forecast
         product: Forecast product identifier
         is_fallback: Whether this is a fallback forecast
+        sample_dtype: Storage dtype for sample columns (default: from settings)
         
     Returns:
         Path to the stored forecast file
@@ -84,12 +95,72 @@ def save_forecast(df: pd.DataFrame,
     validate_product(product)
     
     # Delegate to dataframe_store implementation
-    file_path = store_forecast(df, forecast_timestamp, product, is_fallback)
+    file_path = store_forecast(df, forecast_timestamp, product, is_fallback, sample_dtype=sample_dtype)
     
     logger.info(f"Successfully saved {product} forecast for {forecast_timestamp}")
     return file_path
 
 
+@log_execution_time
+@log_exceptions
+def save_forecasts_bulk(forecasts: List[Tuple[pd.DataFrame, datetime.datetime, str]],
+                        is_fallback: bool = False,
+                        sample_dtype: str = SAMPLE_STORAGE_DTYPE) -> Dict[Tuple[datetime.datetime, str], pathlib.Path]:
+    """
+    Saves many forecast dataframes to storage with a single index update.
+    
+    Args:
+        forecasts: Tuples of (dataframe, forecast timestamp, product)
+        is_fallback: Whether these are fallback forecasts
+        sample_dtype: Storage dtype for sample columns (default: from settings)
+        
+    Returns:
+        Paths of the stored forecast files by (forecast timestamp, product)
+        
+    Raises:
+        StorageError: If storage operation fails
+    """
+    logger.info(f"Saving {len(forecasts)} forecasts")
+    
+    # Validate inputs
+    for _, _, product in forecasts:
+        validate_product(product)
+    
+    # Delegate to dataframe_store implementation
+    return store_forecasts_bulk(forecasts, is_fallback, sample_dtype=sample_dtype)
+
+
+@log_execution_time
+@log_exceptions
+def save_forecast_reference(source_timestamp: datetime.datetime,
+                            target_timestamp: datetime.datetime,
+                            product: str,
+                            time_shift: Optional[datetime.timedelta] = None) -> pathlib.Path:
+    """
+    Saves a fallback forecast as a reference to a stored forecast instead of a copy.
+    
+    Args:
+        source_timestamp: Timestamp of the forecast the fallback is taken from
+        target_timestamp: Timestamp of the fallback forecast
+        product: Forecast product identifier
+        time_shift: Offset applied to the source timestamps (default: target - source)
+        
+    Returns:
+        Path to the stored reference file
+        
+    Raises:
+        DataFrameNotFoundError: If the source forecast does not exist
+        StorageError: If storage operation fails
+    """
+    logger.info(f"Saving {product} fallback for {target_timestamp} as reference to {source_timestamp}")
+    
+    # Validate inputs
+    validate_product(product)
+    
+    # Delegate to dataframe_store implementation
+    return store_forecast_reference(source_timestamp, target_timestamp, product, time_shift)
+
+
 @log_execution_time
 @log_exceptions
 def get_forecast(forecast_timestamp: datetime.datetime, product: str) -> pd.DataFrame:
@@ -294,6 +365,115 @@ def get_latest_forecasts_info() -> Dict:
     return get_latest_forecast_metadata()
 
 
+@log_exceptions
+def get_forecast_index_entry(forecast_timestamp: datetime.datetime, product: str) -> Optional[Dict]:
+    """
+    Retrieves the index entry for a specific forecast without loading the forecast itself.
+    
+    Args:
+        forecast_timestamp: Timestamp of the forecast
+        product: Forecast product identifier
+        
+    Returns:
+        Index entry (file_path, generation_timestamp, is_fallback), or None if not indexed
+    """
+    # Validate inputs
+    validate_product(product)
+    
+    # Delegate to index_manager implementation
+    return get_index_entry(forecast_timestamp, product)
+
+
+@log_exceptions
+def get_forecast_batch_index_entries(
+    products: List[str],
+    date_ranges: List[Tuple[datetime.datetime, datetime.datetime]]
+) -> pd.DataFrame:
+    """
+    Retrieves the index entries for several products and date ranges without loading the forecasts.
+    
+    Args:
+        products: Forecast product identifiers
+        date_ranges: List of inclusive (start_date, end_date) ranges
+        
+    Returns:
+        DataFrame of index entries (timestamp, product, file_path, generation_timestamp,
+        is_fallback) ordered by product and timestamp
+    """
+    # Delegate to index_manager implementation, which loads the index once
+    return query_index_batch(products, date_ranges)
+
+
+@log_exceptions
+def load_indexed_forecast(index_entry: Dict, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Loads a forecast from the file recorded in its index entry, without another index lookup.
+    
+    Args:
+        index_entry: Index entry with timestamp, product and file_path
+        columns: Optional columns to load
+        
+    Returns:
+        Forecast dataframe
+        
+    Raises:
+        DataFrameNotFoundError: If the forecast file does not exist
+    """
+    path = pathlib.Path(index_entry["file_path"])
+    if not path.exists():
+        raise DataFrameNotFoundError(
+            f"Indexed forecast file not found: {path}",
+            index_entry["product"],
+            index_entry["timestamp"]
+        )
+    
+    # The entry carries the recorded checksums, verified when enabled
+    return load_forecast_file(path, columns, index_entry=index_entry)
+
+
+def get_indexed_forecast_columns(index_entry: Dict) -> List[str]:
+    """
+    Reads the column names of an indexed forecast without loading its data.
+    
+    Args:
+        index_entry: Index entry with timestamp, product and file_path
+        
+    Returns:
+        Column names of the stored forecast
+        
+    Raises:
+        DataFrameNotFoundError: If the forecast file does not exist
+    """
+    path = pathlib.Path(index_entry["file_path"])
+    if not path.exists():
+        raise DataFrameNotFoundError(
+            f"Indexed forecast file not found: {path}",
+            index_entry["product"],
+            index_entry["timestamp"]
+        )
+    return read_stored_columns(path)
+
+
+@log_exceptions
+def get_latest_forecast_index_entry(product: str, include_fallback: bool = True) -> Optional[Dict]:
+    """
+    Retrieves the index entry for the latest forecast of a product without loading it.
+    
+    Args:
+        product: Forecast product identifier
+        include_fallback: Whether a fallback forecast may be returned (False returns the latest
+            non-fallback forecast)
+        
+    Returns:
+        Index entry (file_path, generation_timestamp, is_fallback), or None if not indexed
+    """
+    # Validate inputs
+    validate_product(product)
+    
+    # Delegate to index_manager implementation, which resolves it through the pointer table
+    return get_latest_index_entry(product, include_fallback)
+
+
 @log_execution_time
 @log_exceptions
 def maintain_storage(retention_days: Optional[int] = None) -> Dict:
@@ -312,7 +492,8 @@ def maintain_storage(retention_days: Optional[int] = None) -> Dict:
     if retention_days is None:
         retention_days = DEFAULT_RETENTION_DAYS
     
-    # Clean old forecast files
+    # Keep fallbacks stored as references to files past retention, then clean old forecast files
+    materialize_expiring_references(datetime.datetime.now() - datetime.timedelta(days=retention_days))
     removed_count = clean_old_forecasts(retention_days)
     
     # Clean index to remove entries for deleted files
@@ -332,19 +513,26 @@ def maintain_storage(retention_days: Optional[int] = None) -> Dict:
 
 @log_execution_time
 @log_exceptions
-def rebuild_storage_index() -> Dict:
+def rebuild_storage_index(max_workers: Optional[int] = None, resume: bool = True) -> Dict:
     """
     Rebuilds the storage index from scratch.
     
+    Args:
+        max_workers: Number of scanning threads (defaults to INDEX_REBUILD_WORKERS)
+        resume: Whether to resume an interrupted rebuild from its checkpoint
+    
     Returns:
         Dictionary with rebuild statistics
     """
     logger.info("Starting storage index rebuild")
     
     # Delegate to index_manager implementation
-    stats = rebuild_index()
+    stats = rebuild_index(max_workers=max_workers, resume=resume)
     
-    logger.info(f"Rebuild complete: indexed {stats.get('files_processed', 0)} files")
+    logger.info(
+        f"Rebuild complete: indexed {stats.get('files_processed', 0)} files "
+        f"({stats.get('files_per_second', 0)} files/sec, {stats.get('files_corrupt', 0)} corrupt)"
+    )
     return stats
 
 
@@ -9,6 +9,9 @@ import pathlib  # package_version: standard library
 import tempfile  # package_version: standard library
 import os  # package_version: standard library
 
+# Keep the job registry of test runs out of the data directory (set before settings are imported)
+os.environ.setdefault('JOB_REGISTRY_DB_FILE', os.path.join(tempfile.mkdtemp(), 'job_registry.db'))
+
 from .fixtures.load_forecast_fixtures import create_mock_load_forecast_data  # Create mock load forecast data for tests
 from .fixtures.load_forecast_fixtures import MockLoadForecastClient  # Mock client for load forecast API testing
 from .fixtures.historical_prices_fixtures import create_mock_historical_price_data  # Create mock historical price data for tests
@@ -8,6 +8,8 @@ import unittest.mock  # standard library
 import pandas as pd  # pandas: 2.0.0+
 from datetime import datetime  # standard library
 import io  # standard library
+import pyarrow.ipc  # pyarrow: 12.0.0
+import pyarrow.parquet  # pyarrow: 12.0.0
 
 # Internal imports
 from src.backend.api.forecast_api import (  # Function to retrieve forecast by date
@@ -19,9 +21,15 @@ from src.backend.api.forecast_api import (  # Function to retrieve forecast by d
     get_forecast_ensemble,  # Function to retrieve forecast ensemble
     format_forecast_response,  # Function to format forecast response
     get_storage_status,  # Function to get storage status
+    parse_batch_request,  # Function to validate batch request parameters
+    project_forecast_columns,  # Function to apply batch column projections
+    get_forecast_batch,  # Function to retrieve forecasts for several products and dates
+    get_forecast_export_frames,  # Function to retrieve the forecasts of a range for a streaming export
     ForecastAPI,  # Class that encapsulates forecast API functionality
     SUPPORTED_FORMATS  # List of supported output formats
 )
+from src.backend.api.streaming import stream_forecast_export  # Streaming export serialization
+from src.backend.models.data_models import get_sample_columns  # Sample column identification
 from src.backend.api.exceptions import (  # Exception for request validation failures
     RequestValidationError,
     ResourceNotFoundError,  # Exception for resource not found errors
@@ -453,6 +461,18 @@ class TestForecastAPI:
         # Assert that the bytes represent a valid Parquet file
         # This is difficult to validate without a full Parquet parsing library
 
+    def test_format_forecast_response_arrow(self):
+        """Tests formatting forecast response as an Arrow IPC stream"""
+        mock_forecast_df = create_mock_forecast_data(start_time=self.test_date)
+
+        result = format_forecast_response(mock_forecast_df, format='arrow')
+
+        # The stream reads back to the same rows and columns
+        assert isinstance(result, bytes)
+        restored_df = pyarrow.ipc.open_stream(result).read_all().to_pandas()
+        assert list(restored_df.columns) == list(mock_forecast_df.columns)
+        pd.testing.assert_series_equal(restored_df['point_forecast'], mock_forecast_df['point_forecast'])
+
     def test_format_forecast_response_invalid(self):
         """Tests that format_forecast_response raises InvalidFormatError for invalid format"""
         # Create a mock forecast dataframe using create_mock_forecast_data
@@ -524,4 +544,108 @@ class TestForecastAPI:
         assert result_get_latest_forecast_as_model == 'get_latest_forecast_as_model'
         assert result_get_forecast_ensemble == 'get_forecast_ensemble'
         assert result_format_forecast_response == 'format_forecast_response'
-        assert result_get_storage_status == 'get_storage_status'
\ No newline at end of file
+        assert result_get_storage_status == 'get_storage_status'
+
+    def test_parse_batch_request(self):
+        """Tests normalizing batch parameters given as comma-separated strings"""
+        batch_request = parse_batch_request({
+            'products': 'DALMP,RTLMP,DALMP',
+            'dates': '2023-01-01',
+            'ranges': '2023-01-05/2023-01-07',
+            'projection': 'quantiles',
+            'quantiles': '0.05,0.95',
+            'hours': '8,7'
+        })
+
+        assert batch_request['products'] == ['DALMP', 'RTLMP']
+        assert len(batch_request['date_ranges']) == 2
+        first_start, first_end = batch_request['date_ranges'][0]
+        assert first_start.date() == first_end.date()
+        assert batch_request['date_ranges'][1][1].day == 7
+        assert batch_request['quantiles'] == [0.05, 0.95]
+        assert batch_request['hours'] == [7, 8]
+
+    @pytest.mark.parametrize('params', [
+        {'products': ['InvalidProduct'], 'dates': ['2023-01-01']},
+        {'products': ['DALMP']},
+        {'dates': ['2023-01-01'], 'projection': 'invalid'},
+        {'dates': ['2023-01-01'], 'hours': [24]},
+        {'ranges': [{'start': '2023-01-07', 'end': '2023-01-05'}]}
+    ])
+    def test_parse_batch_request_invalid(self, params):
+        """Tests that invalid batch parameters raise RequestValidationError"""
+        with pytest.raises(RequestValidationError):
+            parse_batch_request(params)
+
+    def test_project_forecast_columns(self):
+        """Tests the point and quantile projections and the hour filter"""
+        mock_forecast_df = create_mock_forecast_data(start_time=self.test_date, hours=24)
+
+        point_df = project_forecast_columns(mock_forecast_df, 'point', hours=[7, 8])
+        assert len(point_df) == 2
+        assert not any(column.startswith('sample_') for column in point_df.columns)
+
+        quantile_df = project_forecast_columns(mock_forecast_df, 'quantiles', quantiles=[0.1, 0.9])
+        assert len(quantile_df) == 24
+        assert (quantile_df['quantile_0.1'] <= quantile_df['quantile_0.9']).all()
+
+    def test_get_forecast_batch_single_index_query(self, mocker):
+        """Tests that a batch is served from one index query and reports per-forecast errors"""
+        index_entries = pd.DataFrame({
+            'timestamp': [self.test_date, self.test_date],
+            'product': ['DALMP', 'RTLMP'],
+            'file_path': ['/tmp/01_DALMP.parquet', '/tmp/01_RTLMP.parquet'],
+            'generation_timestamp': [self.test_date, self.test_date],
+            'is_fallback': [False, True]
+        })
+        mock_query = mocker.patch('src.backend.api.forecast_api.get_forecast_batch_index_entries', return_value=index_entries)
+        mock_load = mocker.patch(
+            'src.backend.api.forecast_api.load_indexed_forecast',
+            side_effect=[self.mock_forecast_df, DataFrameNotFoundError("missing", 'RTLMP', self.test_date)]
+        )
+
+        batch_request = parse_batch_request({'products': ['DALMP', 'RTLMP'], 'dates': ['2023-01-01']})
+        results = list(get_forecast_batch(**batch_request))
+
+        mock_query.assert_called_once()
+        assert mock_load.call_count == 2
+        assert results[0]['product'] == 'DALMP'
+        assert len(results[0]['forecasts']) == len(self.mock_forecast_df)
+        assert results[1]['product'] == 'RTLMP'
+        assert 'error' in results[1]
+
+    @pytest.mark.parametrize("format", ['csv', 'arrow', 'parquet'])
+    def test_get_forecast_export_frames_mixed_sample_counts(self, format, mocker):
+        """Tests that forecasts with fewer samples than the first one are exported whole"""
+        full_df = self.mock_forecast_df
+        sample_columns = get_sample_columns(full_df.columns)
+        reduced_df = full_df.drop(columns=sample_columns[20:])
+        index_entries = pd.DataFrame({
+            'timestamp': [self.test_date, datetime(2023, 1, 2)],
+            'product': ['DALMP', 'DALMP'],
+            'file_path': ['/tmp/01_DALMP.parquet', '/tmp/02_DALMP.parquet'],
+            'generation_timestamp': [self.test_date, datetime(2023, 1, 2)],
+            'is_fallback': [False, False]
+        })
+        frames = {'/tmp/01_DALMP.parquet': full_df, '/tmp/02_DALMP.parquet': reduced_df}
+        mocker.patch('src.backend.api.forecast_api.get_forecast_batch_index_entries', return_value=index_entries)
+        mocker.patch('src.backend.api.forecast_api.get_indexed_forecast_columns',
+                     side_effect=lambda entry: list(frames[entry['file_path']].columns))
+        mocker.patch('src.backend.api.forecast_api.load_indexed_forecast',
+                     side_effect=lambda entry: frames[entry['file_path']].copy())
+
+        export_frames = get_forecast_export_frames('2023-01-01', '2023-01-02', 'DALMP')
+        body = b''.join(stream_forecast_export(export_frames, format))
+
+        if format == 'csv':
+            exported = pd.read_csv(io.BytesIO(body))
+        elif format == 'arrow':
+            exported = pyarrow.ipc.open_stream(body).read_all().to_pandas()
+        else:
+            exported = pyarrow.parquet.read_table(io.BytesIO(body)).to_pandas()
+
+        assert len(exported) == len(full_df) + len(reduced_df)
+        assert get_sample_columns(exported.columns) == sample_columns
+        reduced_rows = exported.iloc[len(full_df):]
+        assert reduced_rows[sample_columns[:20]].notna().all().all()
+        assert reduced_rows[sample_columns[20:]].isna().all().all()
@@ -1,4 +1,5 @@
 import pytest
+import time
 from unittest import mock
 from datetime import datetime
 import requests  # package_version: 2.28.0+
@@ -248,4 +249,61 @@ def test_check_pipeline_health():
         result = check_pipeline_health()
 
         # Assert that the pipeline status is 'unhealthy'
-        assert result["status"] == "unhealthy"
\ No newline at end of file
+        assert result["status"] == "unhealthy"
+def test_check_pipeline_health_recent_runs():
+    """Test that check_pipeline_health reports recent runs and fails after consecutive failed runs"""
+    def make_run(job_id, status):
+        return {"job_id": job_id, "status": status, "creation_time": datetime(2023, 6, 1), "status_details": {"error": "Test error"}}
+
+    def recent_jobs(limit, job_type, status=None):
+        runs = [make_run("run-4", "running"), make_run("run-3", "failed"), make_run("run-2", "timeout"),
+                make_run("run-1", "interrupted"), make_run("run-0", "completed")]
+        return [run for run in runs if status is None or run["status"] == status][:limit]
+
+    with mock.patch('src.backend.api.health_check.PipelineExecutor._validate_execution_state', return_value=True), \
+            mock.patch('src.backend.api.health_check.get_recent_jobs', side_effect=recent_jobs):
+        result = check_pipeline_health()
+
+    # The running job does not count, the completed run ends the failure streak
+    assert [run["job_id"] for run in result["details"]["recent_runs"]] == ["run-4", "run-3", "run-2", "run-1", "run-0"]
+    assert result["details"]["recent_runs"][1]["error"] == "Test error"
+    assert result["details"]["consecutive_failures"] == 3
+    assert result["details"]["last_successful_run"]["job_id"] == "run-0"
+    assert result["details"]["last_successful_run"]["creation_time"] == "2023-06-01T00:00:00"
+    assert result["status"] == "unhealthy"
+
+def test_system_health_check_cached_result_reused():
+    """Test that get_cached_result reuses a recent result instead of re-running the checks"""
+    health_check = SystemHealthCheck(cache_ttl_seconds=60)
+
+    with mock.patch.object(health_check, 'check_all') as mock_check_all:
+        mock_check_all.return_value = {"overall_status": "healthy"}
+
+        first = health_check.get_cached_result()
+        second = health_check.get_cached_result()
+
+        # Only the first call performs the expensive checks
+        mock_check_all.assert_called_once()
+        assert first == second == {"overall_status": "healthy"}
+
+        # A zero max age forces a recomputation
+        health_check.get_cached_result(max_age_seconds=0)
+        assert mock_check_all.call_count == 2
+
+def test_system_health_check_background_refresh():
+    """Test that the background refresh thread recomputes the cached result"""
+    health_check = SystemHealthCheck()
+
+    with mock.patch.object(health_check, 'check_all') as mock_check_all:
+        mock_check_all.return_value = {"overall_status": "healthy"}
+
+        health_check.start_background_refresh(interval_seconds=0.01)
+        try:
+            deadline = time.monotonic() + 2
+            while mock_check_all.call_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            health_check.stop_background_refresh()
+
+        assert mock_check_all.call_count >= 2
+        assert health_check.last_check_result == {"overall_status": "healthy"}
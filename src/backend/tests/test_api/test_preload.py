@@ -0,0 +1,71 @@
+"""
+Unit tests for the preload module which loads shared API state before workers are forked.
+"""
+
+import os
+import pytest  # pytest: 7.0.0+
+import pandas as pd  # pandas: 2.0.0+
+
+# Internal imports
+from src.backend.api.preload import (
+    preload_shared_state,
+    get_preloaded_latest_forecast,
+    get_shared_state_info,
+    clear_shared_state
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    """Clears preloaded state before and after each test"""
+    clear_shared_state()
+    yield
+    clear_shared_state()
+
+
+@pytest.fixture
+def preloaded_dalmp(tmp_path, mocker):
+    """Preloads a DALMP latest forecast backed by a temporary file"""
+    latest_file = tmp_path / "DALMP.parquet"
+    latest_file.write_bytes(b"placeholder")
+    forecast_df = pd.DataFrame({"product": ["DALMP"], "point_forecast": [42.0]})
+
+    mocker.patch('src.backend.api.preload.FORECAST_PRODUCTS', ['DALMP'])
+    mocker.patch('src.backend.api.preload.get_latest_file_path', return_value=latest_file)
+    mocker.patch('src.backend.api.preload.get_stored_latest_forecast', return_value=forecast_df)
+    mocker.patch('src.backend.api.preload.initialize_registry', return_value={("DALMP", 0): {}})
+
+    summary = preload_shared_state()
+    return latest_file, forecast_df, summary
+
+
+def test_preload_shared_state(preloaded_dalmp):
+    """Tests that preloading records the latest forecasts and model registry"""
+    _, _, summary = preloaded_dalmp
+
+    assert summary["latest_forecasts"] == ["DALMP"]
+    assert summary["model_count"] == 1
+
+    info = get_shared_state_info()
+    assert info["latest_forecasts"] == ["DALMP"]
+    assert info["preloaded_at"] is not None
+
+
+def test_preloaded_latest_forecast_current(preloaded_dalmp):
+    """Tests that the preloaded forecast is served while the latest file is unchanged"""
+    _, forecast_df, _ = preloaded_dalmp
+
+    pd.testing.assert_frame_equal(get_preloaded_latest_forecast("DALMP"), forecast_df)
+    assert get_preloaded_latest_forecast("RTLMP") is None
+
+
+def test_preloaded_latest_forecast_stale(preloaded_dalmp):
+    """Tests that the preloaded forecast is dropped once the latest file is rewritten"""
+    latest_file, _, _ = preloaded_dalmp
+
+    # Move the file's modification time forward to simulate a new latest forecast
+    stat = os.stat(latest_file)
+    os.utime(latest_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert get_preloaded_latest_forecast("DALMP") is None
+    assert get_shared_state_info()["latest_forecasts"] == []
@@ -5,6 +5,8 @@ from unittest.mock import patch
 import flask # flask==2.3.0
 import json # standard library
 import datetime # standard library
+import gzip # standard library
+import pyarrow.ipc # pyarrow==12.0.0
 import pandas # pandas==2.0.0+
 
 # Internal imports
@@ -37,7 +39,12 @@ class TestAPIRoutes:
         self.mock_get_forecast_model = patch('src.backend.api.routes.get_forecast_as_model').start()
         self.mock_get_latest_forecast_model = patch('src.backend.api.routes.get_latest_forecast_as_model').start()
         self.mock_get_storage_status = patch('src.backend.api.routes.get_storage_status').start()
+        self.mock_get_forecast_batch = patch('src.backend.api.routes.get_forecast_batch').start()
+        self.mock_get_forecast_export_frames = patch('src.backend.api.routes.get_forecast_export_frames').start()
         self.mock_health_check = patch('src.backend.api.routes.SystemHealthCheck').start()
+        patch('src.backend.api.routes._health_check', None).start()
+        self.mock_forecast_cache_entry = patch('src.backend.api.routes.get_forecast_cache_entry', return_value=None).start()
+        self.mock_latest_cache_entry = patch('src.backend.api.routes.get_latest_forecast_cache_entry', return_value=None).start()
 
     def teardown_method(self, method):
         """Clean up after each test"""
@@ -65,7 +72,7 @@ class TestAPIRoutes:
 
     def test_health_detailed_endpoint(self):
         """Test the detailed health check endpoint"""
-        self.mock_health_check.return_value.check_all.return_value = {'component1': 'ok', 'component2': 'degraded'}
+        self.mock_health_check.return_value.get_cached_result.return_value = {'component1': 'ok', 'component2': 'degraded'}
         response = self.client.get('/health/detailed')
         assert response.status_code == 200
         data = json.loads(response.data)
@@ -123,6 +130,31 @@ class TestAPIRoutes:
         assert response_excel.status_code == 200
         assert response_excel.content_type == 'application/vnd.ms-excel'
 
+    def test_get_forecast_arrow_negotiation(self):
+        """Test that the Arrow format is selected from the Accept header and gzip-compressed"""
+        test_data = create_test_forecast_dataframe()
+        self.mock_get_forecast_by_date.return_value = test_data
+        response = self.client.get('/forecasts/2023-06-01/DALMP', headers={
+            'Accept': 'application/vnd.apache.arrow.stream, application/json;q=0.9',
+            'Accept-Encoding': 'gzip'
+        })
+        assert response.status_code == 200
+        assert response.mimetype == 'application/vnd.apache.arrow.stream'
+        self.mock_get_forecast_by_date.assert_called_once_with('2023-06-01', 'DALMP', 'arrow')
+        body = response.data
+        if response.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        restored = pyarrow.ipc.open_stream(body).read_all().to_pandas()
+        assert len(restored) == len(test_data)
+
+    def test_get_forecast_default_is_json_for_wildcard_accept(self):
+        """Test that clients accepting any type still get JSON"""
+        test_data = create_test_forecast_dataframe()
+        self.mock_get_forecast_by_date.return_value = test_data.to_dict(orient='records')
+        response = self.client.get('/forecasts/2023-06-01/DALMP', headers={'Accept': '*/*'})
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+
     def test_get_forecast_not_found(self):
         """Test the forecast endpoint when forecast is not found"""
         self.mock_get_forecast_by_date.side_effect = ResourceNotFoundError("Forecast not found", "forecast", "DALMP_2023-06-01")
@@ -142,6 +174,47 @@ class TestAPIRoutes:
         assert isinstance(data, list)
         assert len(data) == len(test_data)
 
+    def test_get_latest_forecast_cache_headers(self):
+        """Test that forecast responses carry ETag, Last-Modified and Cache-Control headers"""
+        self.mock_latest_cache_entry.return_value = {
+            'file_path': '/data/forecasts/2023/06/20230601_DALMP.parquet',
+            'generation_timestamp': pandas.Timestamp('2023-06-01 07:00:00')
+        }
+        patch('src.backend.api.routes.format_forecast_response', return_value=[{'point_forecast': 42.0}]).start()
+
+        response = self.client.get('/forecasts/latest/DALMP')
+        assert response.status_code == 200
+        assert response.headers.get('ETag')
+        assert response.headers.get('Last-Modified')
+        assert 'max-age=' in response.headers.get('Cache-Control')
+
+    def test_get_latest_forecast_not_modified(self):
+        """Test that a matching If-None-Match or If-Modified-Since yields 304 without loading the forecast"""
+        self.mock_latest_cache_entry.return_value = {
+            'file_path': '/data/forecasts/2023/06/20230601_DALMP.parquet',
+            'generation_timestamp': pandas.Timestamp('2023-06-01 07:00:00')
+        }
+        patch('src.backend.api.routes.format_forecast_response', return_value=[{'point_forecast': 42.0}]).start()
+        first = self.client.get('/forecasts/latest/DALMP')
+        self.mock_get_latest_forecast.reset_mock()
+
+        response = self.client.get('/forecasts/latest/DALMP', headers={'If-None-Match': first.headers['ETag']})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == first.headers['ETag']
+        self.mock_get_latest_forecast.assert_not_called()
+
+        response = self.client.get('/forecasts/latest/DALMP', headers={'If-Modified-Since': first.headers['Last-Modified']})
+        assert response.status_code == 304
+
+        # A new generation timestamp changes the ETag, so the stale validator gets the full body
+        self.mock_latest_cache_entry.return_value = {
+            'file_path': '/data/forecasts/2023/06/20230601_DALMP.parquet',
+            'generation_timestamp': pandas.Timestamp('2023-06-02 07:00:00')
+        }
+        response = self.client.get('/forecasts/latest/DALMP', headers={'If-None-Match': first.headers['ETag']})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != first.headers['ETag']
+
     def test_get_forecasts_range_endpoint(self):
         """Test the endpoint for retrieving forecasts within a date range"""
         test_data = create_test_forecast_dataframe()
@@ -152,6 +225,52 @@ class TestAPIRoutes:
         assert isinstance(data, list)
         assert len(data) == len(test_data)
 
+    def test_export_forecasts_range_endpoint(self):
+        """Test that the export endpoint streams the forecasts of a range as CSV"""
+        test_data = create_test_forecast_dataframe()
+        self.mock_get_forecast_export_frames.return_value = iter([test_data, test_data])
+        response = self.client.get('/forecasts/export/2023-06-01/2023-06-02/DALMP?format=csv')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+        assert 'attachment' in response.headers['Content-Disposition']
+        lines = response.data.decode().splitlines()
+        assert len(lines) == 2 * len(test_data) + 1
+
+    def test_export_forecasts_range_invalid_format(self):
+        """Test that non-streaming formats are rejected by the export endpoint"""
+        response = self.client.get('/forecasts/export/2023-06-01/2023-06-02/DALMP?format=excel')
+        assert response.status_code == 400
+        self.mock_get_forecast_export_frames.assert_not_called()
+
+    def test_get_forecasts_batch_endpoint(self):
+        """Test that the batch endpoint streams one JSON line per product and date"""
+        test_data = create_test_forecast_dataframe()
+        self.mock_get_forecast_batch.return_value = iter([
+            {'product': product, 'date': '2023-06-01', 'forecasts': test_data.to_dict(orient='records')}
+            for product in ['DALMP', 'RTLMP']
+        ])
+        response = self.client.post('/forecasts/batch', json={
+            'products': ['DALMP', 'RTLMP'],
+            'dates': ['2023-06-01'],
+            'projection': 'point',
+            'hours': [7, 8]
+        })
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        lines = [json.loads(line) for line in response.data.decode().splitlines()]
+        assert [line['product'] for line in lines] == ['DALMP', 'RTLMP']
+        assert len(lines[0]['forecasts']) == len(test_data)
+        batch_kwargs = self.mock_get_forecast_batch.call_args.kwargs
+        assert batch_kwargs['products'] == ['DALMP', 'RTLMP']
+        assert batch_kwargs['hours'] == [7, 8]
+
+    def test_get_forecasts_batch_invalid_request(self):
+        """Test that invalid batch parameters are rejected before streaming"""
+        response = self.client.get('/forecasts/batch?products=InvalidProduct&dates=2023-06-01')
+        assert response.status_code == 400
+        assert 'error' in json.loads(response.data)
+        self.mock_get_forecast_batch.assert_not_called()
+
     def test_get_forecast_model_endpoint(self):
         """Test the endpoint for retrieving a forecast as model objects"""
         mock_forecast = create_mock_probabilistic_forecast()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the streaming export writers, which serialize forecast dataframes one
+forecast at a time as CSV, NDJSON, Arrow IPC streams or Parquet row groups.
+"""
+
+import io  # standard library
+from datetime import datetime, timedelta  # standard library
+
+import pandas as pd  # pandas: 2.0.0+
+import pyarrow as pa  # pyarrow: 12.0.0
+import pyarrow.ipc  # pyarrow: 12.0.0
+import pyarrow.parquet as pq  # pyarrow: 12.0.0
+import pytest  # pytest: 7.0.0+
+
+# Internal imports
+from src.backend.api.streaming import stream_forecast_export, STREAMING_FORMATS  # Functions under test
+from src.backend.api.exceptions import InvalidFormatError  # Exception for unsupported formats
+from src.backend.tests.fixtures.forecast_fixtures import create_mock_forecast_data  # Create mock forecast data for testing
+
+NUM_FORECASTS = 3
+
+
+def create_forecast_frames():
+    """Creates one mock forecast dataframe per day, as stored for a date range"""
+    start = datetime(2023, 1, 1)
+    return [
+        create_mock_forecast_data(start_time=start + timedelta(days=day), hours=24)
+        for day in range(NUM_FORECASTS)
+    ]
+
+
+def read_export(body: bytes, format: str) -> pd.DataFrame:
+    """Reads a complete export body back into a dataframe"""
+    if format == 'csv':
+        return pd.read_csv(io.BytesIO(body))
+    if format == 'ndjson':
+        return pd.read_json(io.BytesIO(body), lines=True)
+    if format == 'arrow':
+        return pa.ipc.open_stream(body).read_all().to_pandas()
+    return pq.read_table(io.BytesIO(body)).to_pandas()
+
+
+@pytest.mark.parametrize('format', list(STREAMING_FORMATS))
+def test_stream_roundtrip(format):
+    """Tests that a streamed export contains every row of every forecast"""
+    frames = create_forecast_frames()
+    expected = pd.concat(frames, ignore_index=True)
+
+    chunks = list(stream_forecast_export(iter(frames), format))
+    exported = read_export(b''.join(chunks), format)
+
+    assert len(chunks) > 1
+    assert len(exported) == len(expected)
+    assert list(exported.columns) == list(expected.columns)
+    pd.testing.assert_series_equal(exported['point_forecast'], expected['point_forecast'], check_dtype=False)
+
+
+def test_stream_consumes_frames_lazily():
+    """Tests that forecasts are only read as the response is consumed"""
+    consumed = []
+
+    def frames():
+        for df in create_forecast_frames():
+            consumed.append(df)
+            yield df
+
+    stream = stream_forecast_export(frames(), 'parquet')
+    assert consumed == []
+
+    next(stream)
+    assert len(consumed) == 1
+
+
+def test_parquet_row_group_per_forecast():
+    """Tests that each forecast is written as its own Parquet row group"""
+    body = b''.join(stream_forecast_export(iter(create_forecast_frames()), 'parquet'))
+
+    assert pq.ParquetFile(io.BytesIO(body)).num_row_groups == NUM_FORECASTS
+
+
+def test_csv_header_written_once():
+    """Tests that the CSV header is only written before the first forecast"""
+    body = b''.join(stream_forecast_export(iter(create_forecast_frames()), 'csv')).decode('utf-8')
+
+    assert body.count('point_forecast') == 1
+
+
+def test_unsupported_streaming_format():
+    """Tests that non-streaming formats are rejected"""
+    with pytest.raises(InvalidFormatError):
+        stream_forecast_export(iter([]), 'excel')
@@ -0,0 +1,153 @@
+"""
+Unit tests for the fallback_preparer module, which builds timestamp-adjusted fallback
+forecasts ahead of a forecast run so a failed run can publish them without searching.
+"""
+
+import pytest  # pytest: 7.0.0+
+import unittest.mock  # standard library
+import datetime  # standard library
+import pathlib  # standard library
+
+# Internal imports
+from ...fallback.fallback_preparer import (
+    prepare_fallback_forecasts,
+    start_fallback_preparation,
+    has_prepared_fallback,
+    get_prepared_fallback,
+    clear_prepared_fallbacks
+)
+from ...fallback.exceptions import NoFallbackAvailableError
+from ...scheduler.job_executor import JobExecutor, JOB_PRIORITY_DAILY
+from ...scheduler.job_registry import register_job, clear_registry
+from ...utils.date_utils import localize_to_cst
+from ..fixtures.forecast_fixtures import create_mock_forecast_data
+
+TARGET_DATE = localize_to_cst(datetime.datetime(2023, 1, 2))
+
+
+@pytest.fixture(autouse=True)
+def clean_prepared_fallbacks(tmp_path):
+    """Stores prepared fallbacks in a temporary directory for each test"""
+    with unittest.mock.patch('src.backend.fallback.fallback_preparer.FALLBACK_PREPARED_DIR', str(tmp_path)):
+        yield tmp_path
+
+
+def load_prepared_product(product, target_date):
+    """Job run in a job executor worker process, as the forecasting pipeline is"""
+    prepared = get_prepared_fallback(product, target_date)
+    return None if prepared is None else prepared['product'].unique().tolist()
+
+
+def test_prepare_fallback_forecasts_stores_each_product():
+    """Tests that a fallback is prepared for every requested product"""
+    products = ['DALMP', 'RTLMP']
+
+    with unittest.mock.patch('src.backend.fallback.fallback_preparer.retrieve_fallback_forecast') as mock_retrieve:
+        mock_retrieve.side_effect = lambda product, target_date, max_days: create_mock_forecast_data(
+            product=product, start_time=target_date)
+
+        results = prepare_fallback_forecasts(TARGET_DATE, products)
+
+    assert results == {'DALMP': True, 'RTLMP': True}
+    assert mock_retrieve.call_count == 2
+    for product in products:
+        prepared = get_prepared_fallback(product, TARGET_DATE)
+        assert prepared is not None
+        assert (prepared['product'] == product).all()
+
+
+def test_prepare_fallback_forecasts_skips_prepared_products():
+    """Tests that already prepared products are not searched again"""
+    with unittest.mock.patch('src.backend.fallback.fallback_preparer.retrieve_fallback_forecast') as mock_retrieve:
+        mock_retrieve.return_value = create_mock_forecast_data(product='DALMP', start_time=TARGET_DATE)
+
+        prepare_fallback_forecasts(TARGET_DATE, ['DALMP'])
+        prepare_fallback_forecasts(TARGET_DATE, ['DALMP'])
+
+    mock_retrieve.assert_called_once()
+
+
+def test_prepare_fallback_forecasts_records_failures():
+    """Tests that a product without a fallback does not stop the other products"""
+    def retrieve(product, target_date, max_days):
+        if product == 'RTLMP':
+            raise NoFallbackAvailableError("No fallback", product, target_date, max_days)
+        return create_mock_forecast_data(product=product, start_time=target_date)
+
+    with unittest.mock.patch('src.backend.fallback.fallback_preparer.retrieve_fallback_forecast', side_effect=retrieve):
+        results = prepare_fallback_forecasts(TARGET_DATE, ['RTLMP', 'DALMP'])
+
+    assert results == {'RTLMP': False, 'DALMP': True}
+    assert not has_prepared_fallback('RTLMP', TARGET_DATE)
+    assert has_prepared_fallback('DALMP', TARGET_DATE)
+
+
+def test_get_prepared_fallback_matches_target_day():
+    """Tests that prepared fallbacks are looked up by CST calendar day and returned as copies"""
+    with unittest.mock.patch('src.backend.fallback.fallback_preparer.retrieve_fallback_forecast') as mock_retrieve:
+        mock_retrieve.return_value = create_mock_forecast_data(product='DALMP', start_time=TARGET_DATE)
+        prepare_fallback_forecasts(TARGET_DATE, ['DALMP'])
+
+    # Naive datetimes later on the same day resolve to the same target day
+    prepared = get_prepared_fallback('DALMP', datetime.datetime(2023, 1, 2, 7, 0))
+    assert prepared is not None
+    prepared['point_forecast'] = 0.0
+    assert not (get_prepared_fallback('DALMP', TARGET_DATE)['point_forecast'] == 0.0).all()
+
+    assert get_prepared_fallback('DALMP', datetime.datetime(2023, 1, 3)) is None
+
+
+def test_start_fallback_preparation_runs_in_background():
+    """Tests that preparation runs in a daemon thread"""
+    with unittest.mock.patch('src.backend.fallback.fallback_preparer.FALLBACK_STORAGE_MODE', 'copy'), \
+            unittest.mock.patch('src.backend.fallback.fallback_preparer.retrieve_fallback_forecast') as mock_retrieve:
+        mock_retrieve.return_value = create_mock_forecast_data(product='DALMP', start_time=TARGET_DATE)
+
+        thread = start_fallback_preparation(TARGET_DATE, ['DALMP'])
+        thread.join(timeout=10)
+
+    assert thread.daemon
+    assert has_prepared_fallback('DALMP', TARGET_DATE)
+
+
+def test_start_fallback_preparation_skipped_for_references():
+    """Tests that nothing is prepared when fallbacks are stored as references"""
+    with unittest.mock.patch('src.backend.fallback.fallback_preparer.FALLBACK_STORAGE_MODE', 'reference'), \
+            unittest.mock.patch('src.backend.fallback.fallback_preparer.retrieve_fallback_forecast') as mock_retrieve:
+        assert start_fallback_preparation(TARGET_DATE, ['DALMP']) is None
+
+    mock_retrieve.assert_not_called()
+    assert not has_prepared_fallback('DALMP', TARGET_DATE)
+
+
+def test_clear_prepared_fallbacks_before_date():
+    """Tests that only fallbacks for earlier target dates are cleared"""
+    next_date = TARGET_DATE + datetime.timedelta(days=1)
+    with unittest.mock.patch('src.backend.fallback.fallback_preparer.retrieve_fallback_forecast') as mock_retrieve:
+        mock_retrieve.return_value = create_mock_forecast_data(product='DALMP', start_time=TARGET_DATE)
+        prepare_fallback_forecasts(TARGET_DATE, ['DALMP'])
+        prepare_fallback_forecasts(next_date, ['DALMP'])
+
+    assert clear_prepared_fallbacks(before_date=next_date) == 1
+    assert not has_prepared_fallback('DALMP', TARGET_DATE)
+    assert has_prepared_fallback('DALMP', next_date)
+
+
+def test_prepared_fallback_is_read_by_job_executor_worker(clean_prepared_fallbacks):
+    """Tests that a fallback prepared in the scheduler process is found by the pipeline's worker process"""
+    with unittest.mock.patch('src.backend.fallback.fallback_preparer.retrieve_fallback_forecast') as mock_retrieve:
+        mock_retrieve.return_value = create_mock_forecast_data(product='DALMP', start_time=TARGET_DATE)
+        prepare_fallback_forecasts(TARGET_DATE, ['DALMP'])
+
+    clear_registry()
+    executor = JobExecutor(max_workers=1, reserved_daily_workers=0, memory_limit_mb=0)
+    executor.start()
+    try:
+        job_id = register_job(job_type="forecast", schedule_time=datetime.datetime.now())
+        future = executor.submit(job_id, JOB_PRIORITY_DAILY, load_prepared_product, 'DALMP', TARGET_DATE)
+        assert future.result(timeout=30) == ['DALMP']
+    finally:
+        executor.shutdown()
+        clear_registry()
+
+    assert [path.name for path in pathlib.Path(clean_prepared_fallbacks).glob('*.parquet')] == ['DALMP_20230102.parquet']
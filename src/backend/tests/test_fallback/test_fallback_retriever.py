@@ -24,6 +24,13 @@ from ...utils.date_utils import get_previous_day_date, localize_to_cst
 from ..fixtures.forecast_fixtures import create_mock_forecast_data
 
 
+@pytest.fixture(autouse=True)
+def no_latest_pointer():
+    """Disables the latest-pointer lookup so the day-by-day search is exercised"""
+    with unittest.mock.patch('src.backend.fallback.fallback_retriever.get_latest_forecast_index_entry', return_value=None):
+        yield
+
+
 @pytest.mark.parametrize('product', ['DALMP', 'RTLMP', 'RegUp'])
 def test_retrieve_fallback_forecast_success(product, unittest):
     """Tests successful retrieval of a fallback forecast"""
@@ -212,6 +219,50 @@ def test_find_suitable_fallback_max_search_days(max_days, unittest):
         assert mock_check_availability.call_count == max_days
 
 
+def test_find_suitable_fallback_uses_latest_pointer():
+    """Tests that the latest forecast from the pointer table is used without a day-by-day search"""
+    # Arrange
+    target_date = localize_to_cst(datetime.datetime(2023, 1, 5))
+    latest_entry = {
+        'timestamp': pd.Timestamp(datetime.datetime(2023, 1, 3)),
+        'product': 'DALMP',
+        'file_path': '/forecasts/2023/01/03_DALMP.parquet',
+        'generation_timestamp': pd.Timestamp(datetime.datetime(2023, 1, 3, 7)),
+        'is_fallback': False
+    }
+
+    with unittest.mock.patch('src.backend.fallback.fallback_retriever.get_latest_forecast_index_entry', return_value=latest_entry):
+        with unittest.mock.patch('src.backend.fallback.fallback_retriever.check_forecast_availability') as mock_check_availability:
+            # Act
+            source_date, metadata = find_suitable_fallback('DALMP', target_date, DEFAULT_MAX_SEARCH_DAYS)
+
+            # Assert
+            assert source_date.date() == datetime.date(2023, 1, 3)
+            assert metadata['fallback_age_days'] == 2
+            mock_check_availability.assert_not_called()
+
+
+def test_find_suitable_fallback_searches_when_latest_is_not_before_target():
+    """Tests that the day-by-day search is used when the latest forecast is not before the target date"""
+    # Arrange
+    target_date = localize_to_cst(datetime.datetime(2023, 1, 2))
+    latest_entry = {
+        'timestamp': pd.Timestamp(datetime.datetime(2023, 1, 10)),
+        'product': 'DALMP',
+        'file_path': '/forecasts/2023/01/10_DALMP.parquet',
+        'generation_timestamp': pd.Timestamp(datetime.datetime(2023, 1, 10, 7)),
+        'is_fallback': False
+    }
+
+    with unittest.mock.patch('src.backend.fallback.fallback_retriever.get_latest_forecast_index_entry', return_value=latest_entry):
+        with unittest.mock.patch('src.backend.fallback.fallback_retriever.check_forecast_availability', return_value=False) as mock_check_availability:
+            # Act & Assert
+            with pytest.raises(NoFallbackAvailableError):
+                find_suitable_fallback('DALMP', target_date, DEFAULT_MAX_SEARCH_DAYS)
+
+            assert mock_check_availability.call_count == DEFAULT_MAX_SEARCH_DAYS
+
+
 @pytest.mark.parametrize('product,target_date,expected', [
     ('DALMP', datetime.datetime.now(), True),
     (None, datetime.datetime.now(), False),
@@ -6,10 +6,11 @@ for different distribution types and product constraints.
 
 import pytest  # package_version: 7.0.0+
 import numpy as np  # package_version: 1.24.0+
+import scipy.stats  # package_version: 1.10.0+
 from datetime import datetime  # package_version: standard library
 
 # Internal imports
-from src.backend.forecasting_engine.sample_generator import generate_samples, SampleGenerator, generate_normal_samples, generate_lognormal_samples, generate_truncated_normal_samples, generate_skewed_normal_samples, create_probabilistic_forecast  # Module: src/backend/forecasting_engine/sample_generator.py
+from src.backend.forecasting_engine.sample_generator import generate_samples, SampleGenerator, generate_normal_samples, generate_lognormal_samples, generate_truncated_normal_samples, generate_skewed_normal_samples, create_probabilistic_forecast, generate_quantile_samples, SAMPLING_MODES, DISTRIBUTION_TYPES  # Module: src/backend/forecasting_engine/sample_generator.py
 from src.backend.forecasting_engine.exceptions import SampleGenerationError  # Module: src/backend/forecasting_engine/exceptions.py
 from src.backend.models.forecast_models import ProbabilisticForecast  # Module: src/backend/models/forecast_models.py
 from src.backend.config.settings import FORECAST_PRODUCTS, PROBABILISTIC_SAMPLE_COUNT  # Module: src/backend/config/settings.py
@@ -186,4 +187,82 @@ class TestSampleGenerator:
         # Assert that the forecast has the correct properties (point_forecast, samples, product)
         assert forecast.point_forecast == self.point_forecast
         assert forecast.samples == samples
-        assert forecast.product == self.product
\ No newline at end of file
+        assert forecast.product == self.product
+
+    @pytest.mark.parametrize('sampling_mode', ['antithetic', 'sobol', 'halton', 'stratified'])
+    def test_generate_quantile_samples(self, sampling_mode):
+        """Tests that quantile-based sampling modes produce well-spread samples"""
+        # Generate a small sample set using the quantile-based sampling mode
+        samples = generate_quantile_samples(self.point_forecast, {'std_dev': 5.0}, 20,
+                                            distribution_type='normal', sampling_mode=sampling_mode)
+
+        # Assert correct number of finite samples is returned
+        assert len(samples) == 20
+        assert np.all(np.isfinite(samples))
+
+        # Assert the sample median is close to the point forecast even with few samples
+        assert np.isclose(np.median(samples), self.point_forecast, atol=2.0)
+
+    def test_stratified_samples_match_distribution_quantiles(self):
+        """Tests that stratified samples are the midpoint quantiles of the fitted distribution"""
+        samples = generate_quantile_samples(self.point_forecast, {'std_dev': 5.0}, 4,
+                                            distribution_type='normal', sampling_mode='stratified')
+
+        expected = self.point_forecast + 5.0 * np.array([-1.15034938, -0.31863936, 0.31863936, 1.15034938])
+        assert np.allclose(sorted(samples), expected)
+
+    @pytest.mark.parametrize('sampling_mode, tolerance', [
+        ('antithetic', 1.5),
+        ('sobol', 0.1),
+        ('halton', 0.1),
+        ('stratified', 0.1)
+    ])
+    def test_quantile_samples_match_distribution_percentiles(self, sampling_mode, tolerance):
+        """Tests that percentiles estimated from quantile-based samples match the fitted distribution"""
+        samples = generate_quantile_samples(self.point_forecast, {'std_dev': 5.0}, 1000,
+                                            distribution_type='normal', sampling_mode=sampling_mode)
+
+        probabilities = [0.05, 0.25, 0.5, 0.75, 0.95]
+        expected = scipy.stats.norm(loc=self.point_forecast, scale=5.0).ppf(probabilities)
+        assert np.allclose(np.quantile(samples, probabilities), expected, atol=tolerance)
+
+    @pytest.mark.parametrize('sampling_mode', SAMPLING_MODES)
+    @pytest.mark.parametrize('distribution_type, uncertainty_params, expected', [
+        ('normal', {'std_dev': 0.0}, 50.0),
+        ('truncated_normal', {'std_dev': 0.0}, 50.0),
+        ('skewed_normal', {'std_dev': 0.0, 'skewness': 2.0}, 50.0),
+        ('lognormal', {'coefficient_of_variation': 0.0}, 50.0)
+    ])
+    def test_zero_spread_returns_point_forecast(self, sampling_mode, distribution_type, uncertainty_params, expected):
+        """Tests that a distribution without spread yields the point forecast instead of NaN in every mode"""
+        if sampling_mode == 'random':
+            samples = DISTRIBUTION_TYPES[distribution_type](self.point_forecast, uncertainty_params, 10)
+        else:
+            samples = generate_quantile_samples(self.point_forecast, uncertainty_params, 10,
+                                                distribution_type=distribution_type, sampling_mode=sampling_mode)
+
+        assert samples == [expected] * 10
+
+    def test_zero_point_forecast_with_default_std_dev(self):
+        """Tests that a zero point forecast (default std_dev of zero) gives zero samples in every mode"""
+        for sampling_mode in SAMPLING_MODES:
+            samples = self.sample_generator.generate_samples(0.0, {}, 'RegUp', self.hour, sample_count=8,
+                                                             sampling_mode=sampling_mode)
+            assert samples == [0.0] * 8
+
+    def test_sampling_mode_in_class_and_function(self):
+        """Tests that sampling_mode is honoured by generate_samples and SampleGenerator"""
+        for sampling_mode in SAMPLING_MODES:
+            samples = generate_samples(self.point_forecast, self.uncertainty_params, self.product, self.hour,
+                                       sampling_mode=sampling_mode)
+            assert len(samples) == PROBABILISTIC_SAMPLE_COUNT
+
+            samples = self.sample_generator.generate_samples(self.point_forecast, self.uncertainty_params,
+                                                             self.product, self.hour, sample_count=16,
+                                                             sampling_mode=sampling_mode)
+            assert len(samples) == 16
+
+        # Invalid sampling modes are rejected
+        with pytest.raises(SampleGenerationError):
+            self.sample_generator.generate_samples(self.point_forecast, self.uncertainty_params,
+                                                   self.product, self.hour, sampling_mode='invalid')
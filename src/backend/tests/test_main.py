@@ -2,6 +2,9 @@ import pytest
 from unittest.mock import patch
 import sys
 import os
+import re
+import subprocess
+from pathlib import Path
 from datetime import datetime
 
 from flask import Flask
@@ -12,6 +15,15 @@ from src.backend.pipeline.pipeline_executor import execute_with_default_config
 from src.backend.scheduler.forecast_scheduler import run_forecast_now
 from src.backend.api.routes import api_blueprint
 
+# Repository root, from which the backend is imported as src.backend
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Cumulative import-time budget for the CLI entry point, in microseconds
+MAIN_IMPORT_BUDGET_US = 500_000
+
+# Heavy dependencies that must not be loaded just to import the CLI
+HEAVY_MODULES = ['pandas', 'pandera', 'sklearn', 'joblib', 'scipy', 'flask', 'apscheduler', 'dotenv']
+
 
 def test_parse_arguments_forecast_command():
     """Test that the argument parser correctly handles the forecast command"""
@@ -151,4 +163,30 @@ def test_main_error_handling():
             result = main()
 
             # Verify that the function returns a non-zero exit code
-            assert result == 1
\ No newline at end of file
+            assert result == 1
+
+
+def test_main_import_does_not_load_heavy_dependencies():
+    """Test that importing the CLI entry point does not import the pipeline, scheduler or API stacks"""
+    code = (
+        "import sys, src.backend.main; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+    # The last stdout line lists any heavy modules that were imported
+    loaded = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ''
+    assert loaded == ''
+
+
+def test_main_import_time_budget():
+    """Test that the CLI entry point imports within the cold-start budget using python -X importtime"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import src.backend.main'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+
+    # importtime lines are "import time: <self us> | <cumulative us> | <module>"
+    match = re.search(r'import time:\s+\d+ \|\s+(\d+) \| src\.backend\.main$', result.stderr, re.MULTILINE)
+    assert match is not None
+    assert int(match.group(1)) < MAIN_IMPORT_BUDGET_US
@@ -18,8 +18,11 @@ from src.backend.models.data_models import (
     PriceForecast,
     create_sample_columns,
     create_empty_forecast_dataframe,
+    get_sample_columns,
+    cast_sample_columns,
+    validate_sample_count,
 )
-from src.backend.config.settings import FORECAST_PRODUCTS, PROBABILISTIC_SAMPLE_COUNT
+from src.backend.config.settings import FORECAST_PRODUCTS, PROBABILISTIC_SAMPLE_COUNT, MAX_PROBABILISTIC_SAMPLE_COUNT
 from src.backend.tests.fixtures.load_forecast_fixtures import create_mock_load_forecast_models
 from src.backend.tests.fixtures.historical_prices_fixtures import create_mock_historical_price_models
 from src.backend.tests.fixtures.forecast_fixtures import create_mock_price_samples
@@ -263,7 +266,7 @@ def test_price_forecast_initialization_with_invalid_samples_length():
             timestamp=test_datetime,
             product="DALMP",
             point_forecast=50.0,
-            samples=[1.0] * (PROBABILISTIC_SAMPLE_COUNT + 1),
+            samples=[1.0] * (MAX_PROBABILISTIC_SAMPLE_COUNT + 1),
             generation_timestamp=test_datetime,
             is_fallback=False,
         )
@@ -271,8 +274,8 @@ def test_price_forecast_initialization_with_invalid_samples_length():
     # Assert that a ValueError is raised
     assert "Sample count" in str(excinfo.value)
 
-    # Assert that the error message mentions sample count
-    assert "does not match required count" in str(excinfo.value)
+    # Assert that the error message mentions the allowed sample count range
+    assert "must be between" in str(excinfo.value)
 
 
 def test_price_forecast_to_dataframe_row():
@@ -471,6 +474,54 @@ def test_create_empty_forecast_dataframe():
     assert sample_columns == create_sample_columns(PROBABILISTIC_SAMPLE_COUNT)
 
 
+def test_create_empty_forecast_dataframe_with_sample_count_and_dtype():
+    """Tests create_empty_forecast_dataframe with a per-run sample count and float32 samples"""
+    df = create_empty_forecast_dataframe(sample_count=20, sample_dtype="float32")
+
+    sample_columns = get_sample_columns(df.columns)
+    assert sample_columns == create_sample_columns(20)
+    for col in sample_columns:
+        assert df[col].dtype == "float32"
+
+    # Unsupported dtypes are rejected
+    with pytest.raises(ValueError):
+        create_empty_forecast_dataframe(sample_count=20, sample_dtype="int64")
+
+
+def test_get_sample_columns():
+    """Tests that get_sample_columns returns only sample columns in sample order"""
+    columns = ["timestamp", "sample_1000", "sample_002", "num_samples", "sample_001", "point_forecast"]
+
+    assert get_sample_columns(columns) == ["sample_001", "sample_002", "sample_1000"]
+
+
+def test_validate_sample_count():
+    """Tests the configured bounds on per-run sample counts"""
+    assert validate_sample_count(20) == 20
+    assert validate_sample_count(1000) == 1000
+
+    with pytest.raises(ValueError):
+        validate_sample_count(MAX_PROBABILISTIC_SAMPLE_COUNT + 1)
+
+    with pytest.raises(ValueError):
+        validate_sample_count(1)
+
+
+def test_cast_sample_columns():
+    """Tests casting sample columns to float32 storage"""
+    df = pandas.DataFrame({
+        "point_forecast": [1.0, 2.0],
+        "sample_001": [1.0, 2.0],
+        "sample_002": [3.0, 4.0],
+    })
+
+    result = cast_sample_columns(df, "float32")
+
+    assert result["sample_001"].dtype == "float32"
+    assert result["sample_002"].dtype == "float32"
+    assert result["point_forecast"].dtype == "float64"
+
+
 @pytest.mark.parametrize(
     "model_class,test_data",
     [
@@ -0,0 +1,132 @@
+"""
+Unit tests for the backfill runner, which regenerates the forecasts of a date range with
+shared ingestion and features, forked forecast workers, bulk storage and a resumable checkpoint.
+"""
+
+import datetime  # standard library
+import unittest.mock  # standard library
+
+import pandas as pd  # pandas: 2.0.0+
+import pytest  # pytest: 7.0.0+
+
+# Internal imports
+from src.backend.pipeline.backfill_runner import (
+    run_backfill,
+    get_backfill_dates,
+    slice_history,
+    load_backfill_checkpoint,
+    append_backfill_checkpoint
+)
+
+PRODUCTS = ['DALMP', 'RTLMP']
+
+# Target date whose forecast generation fails in FakePipeline
+FAILING_DATE = None
+
+
+class FakePipeline:
+    """Pipeline double whose forecasts are small picklable dataframes"""
+
+    def __init__(self, target_date, config, execution_id):
+        self.target_date = target_date
+
+    def engineer_features(self, ingested_data):
+        return {'features': 'shared'}
+
+    def generate_forecasts(self, features, ingested_data, products=None):
+        if self.target_date == FAILING_DATE:
+            raise RuntimeError('generation failed')
+        return {product: pd.DataFrame({'timestamp': [self.target_date], 'point_forecast': [1.0]}) for product in products}
+
+    def validate_forecasts(self, forecasts):
+        return dict(forecasts)
+
+
+@pytest.fixture
+def backfill_env(tmp_path):
+    """Patches ingestion, the pipeline and storage, and stores checkpoints in a temporary directory"""
+    global FAILING_DATE
+    FAILING_DATE = None
+    with unittest.mock.patch('src.backend.pipeline.backfill_runner.BACKFILL_CHECKPOINT_DIR', str(tmp_path)), \
+            unittest.mock.patch('src.backend.pipeline.backfill_runner.ForecastingPipeline', FakePipeline), \
+            unittest.mock.patch('src.backend.pipeline.backfill_runner.ingest_backfill_history', return_value={'load_forecast': {}}) as ingest, \
+            unittest.mock.patch('src.backend.pipeline.backfill_runner.save_forecasts_bulk') as save:
+        yield ingest, save
+    FAILING_DATE = None
+
+
+def test_get_backfill_dates():
+    """Tests that the range is inclusive and invalid ranges are rejected"""
+    dates = get_backfill_dates(datetime.date(2023, 1, 30), datetime.date(2023, 2, 2))
+
+    assert dates == [datetime.datetime(2023, 1, 30) + datetime.timedelta(days=i) for i in range(4)]
+    with pytest.raises(ValueError):
+        get_backfill_dates(datetime.date(2023, 2, 2), datetime.date(2023, 1, 30))
+
+
+def test_slice_history():
+    """Tests that each target date gets the daily pipeline's window of the history"""
+    history = {
+        'historical_prices': pd.DataFrame({'timestamp': pd.date_range('2023-01-01', '2023-02-28', freq='D')}),
+        'load_forecast': {'data': [{'timestamp': '2023-01-01'}, {'timestamp': '2023-01-20'}]},
+        'generation_forecast': 'unsliced'
+    }
+
+    sliced = slice_history(history, datetime.datetime(2023, 1, 20))
+
+    assert sliced['historical_prices']['timestamp'].min() == pd.Timestamp('2023-01-13')
+    assert sliced['historical_prices']['timestamp'].max() == pd.Timestamp('2023-01-23')
+    assert sliced['load_forecast']['data'] == [{'timestamp': '2023-01-20'}]
+    assert sliced['generation_forecast'] == 'unsliced'
+
+
+def test_run_backfill_stores_chunks_with_one_update_each(backfill_env):
+    """Tests that history is ingested once and each chunk is stored with one bulk save"""
+    ingest, save = backfill_env
+    progress = []
+
+    stats = run_backfill(datetime.date(2023, 1, 1), datetime.date(2023, 1, 5), products=PRODUCTS,
+                         max_workers=2, chunk_days=2, progress_callback=progress.append)
+
+    ingest.assert_called_once()
+    assert save.call_count == 3
+    stored = [(target_date, product) for call in save.call_args_list for _, target_date, product in call.args[0]]
+    assert len(stored) == 10
+    assert {target_date.day for target_date, _ in stored} == {1, 2, 3, 4, 5}
+    assert stats['days_completed'] == 5
+    assert stats['forecasts_stored'] == 10
+    assert [p['days_completed'] for p in progress] == [2, 4, 5]
+    assert stats['days_per_minute'] > 0
+
+
+def test_run_backfill_resumes_failed_dates(backfill_env, tmp_path):
+    """Tests that failed dates are not checkpointed and a rerun only regenerates them"""
+    global FAILING_DATE
+    ingest, save = backfill_env
+    FAILING_DATE = datetime.datetime(2023, 1, 2)
+
+    stats = run_backfill(datetime.date(2023, 1, 1), datetime.date(2023, 1, 3), products=PRODUCTS, max_workers=2)
+    assert list(stats['failed_dates']) == ['2023-01-02']
+    assert stats['days_completed'] == 2
+    checkpoints = list(tmp_path.glob('backfill_*.jsonl'))
+    assert len(checkpoints) == 1
+    assert load_backfill_checkpoint(checkpoints[0]) == {'2023-01-01', '2023-01-03'}
+
+    FAILING_DATE = None
+    save.reset_mock()
+    stats = run_backfill(datetime.date(2023, 1, 1), datetime.date(2023, 1, 3), products=PRODUCTS, max_workers=2)
+
+    assert stats['days_resumed'] == 2
+    assert stats['days_completed'] == 1
+    assert {target_date for _, target_date, _ in save.call_args.args[0]} == {datetime.datetime(2023, 1, 2)}
+    assert not checkpoints[0].exists()
+
+
+def test_backfill_checkpoint_ignores_partial_lines(tmp_path):
+    """Tests that a line cut short by an interruption is ignored"""
+    path = tmp_path / 'backfill.jsonl'
+    append_backfill_checkpoint(path, [datetime.datetime(2023, 1, 1)])
+    with open(path, 'a') as f:
+        f.write('{"date": "2023-01-0')
+
+    assert load_backfill_checkpoint(path) == {'2023-01-01'}
@@ -0,0 +1,189 @@
+"""
+Unit tests for the deadline runner, which executes pipeline stages in killable worker
+processes with time budgets derived from the publication deadline.
+"""
+
+import datetime  # standard library
+import time  # standard library
+import unittest.mock  # standard library
+
+import pytest  # pytest: 7.0.0+
+
+# Internal imports
+from src.backend.pipeline.deadline_runner import (
+    DeadlineRunner,
+    get_publication_deadline,
+    compute_stage_budget,
+    run_stage_in_worker,
+    cache_ingested_data,
+    get_cached_ingested_data,
+    clear_ingestion_cache
+)
+from src.backend.config.settings import TIMEZONE, PIPELINE_STAGE_BUDGETS, FALLBACK_PUBLICATION_RESERVE_SECONDS
+
+PRODUCTS = ['DALMP', 'RTLMP', 'RegUp']
+
+
+class FakePipeline:
+    """Pipeline double whose stages return picklable placeholders"""
+
+    def __init__(self, slow_stage=None, slow_product=None, failing_stage=None):
+        self.config = {'products': PRODUCTS}
+        self.target_date = datetime.datetime(2023, 1, 2)
+        self.execution_id = 'test-execution'
+        self.results = {}
+        self.data_cache = {}
+        self.slow_stage = slow_stage
+        self.slow_product = slow_product
+        self.failing_stage = failing_stage
+        self.fallback_calls = []
+
+    def _run(self, stage, product=None):
+        if stage == self.failing_stage:
+            raise RuntimeError(f'{stage} failed')
+        if stage == self.slow_stage and product in (None, self.slow_product):
+            time.sleep(60)
+
+    def ingest_data(self):
+        self._run('ingest_data')
+        return {'load_forecast': 'fresh'}
+
+    def engineer_features(self, ingested_data):
+        self._run('engineer_features')
+        return {'features': ingested_data['load_forecast']}
+
+    def generate_forecasts(self, features, ingested_data, products=None):
+        self._run('generate_forecasts', products[0])
+        return {products[0]: f'{products[0]}-forecast'}
+
+    def validate_forecasts(self, forecasts):
+        return dict(forecasts)
+
+    def store_forecasts(self, validated_forecasts):
+        return {product: f'/forecasts/{product}.parquet' for product in validated_forecasts}
+
+    def activate_fallback(self, failed_stage, error, products=None):
+        self.fallback_calls.append((failed_stage, products))
+        return True
+
+
+def _deadline_in(seconds):
+    return datetime.datetime.now(TIMEZONE) + datetime.timedelta(seconds=FALLBACK_PUBLICATION_RESERVE_SECONDS + seconds)
+
+
+@pytest.fixture(autouse=True)
+def clean_ingestion_cache(tmp_path):
+    with unittest.mock.patch('src.backend.pipeline.deadline_runner.INGESTION_CACHE_FILE', str(tmp_path / 'last_ingestion.pkl')):
+        yield
+
+
+def test_get_publication_deadline():
+    deadline = get_publication_deadline(TIMEZONE.localize(datetime.datetime(2023, 1, 2, 7, 0)))
+
+    assert deadline.date() == datetime.date(2023, 1, 2)
+    assert deadline.hour == 8
+    assert deadline.tzinfo is not None
+
+
+def test_compute_stage_budget_shares_time_left():
+    now = TIMEZONE.localize(datetime.datetime(2023, 1, 2, 7, 0))
+    deadline = TIMEZONE.localize(datetime.datetime(2023, 1, 2, 8, 0))
+    stages = list(PIPELINE_STAGE_BUDGETS)
+
+    budgets = [compute_stage_budget(stage, stages, deadline, now) for stage in stages]
+    available = 3600 - FALLBACK_PUBLICATION_RESERVE_SECONDS
+
+    assert sum(budgets) == pytest.approx(available)
+    # With only the last stage left it receives all of the remaining time
+    assert compute_stage_budget(stages[-1], stages[-1:], deadline, now) == pytest.approx(available)
+    assert compute_stage_budget(stages[0], stages, deadline, deadline) == 0.0
+
+
+def test_run_stage_in_worker_returns_items():
+    def produce():
+        yield 1
+        yield 2
+
+    outcome = run_stage_in_worker(produce, (), 10)
+
+    assert outcome.completed
+    assert outcome.items == [1, 2]
+
+
+def test_run_stage_in_worker_terminates_overrun():
+    def produce():
+        yield 'done in time'
+        time.sleep(60)
+        yield 'too late'
+
+    start = time.monotonic()
+    outcome = run_stage_in_worker(produce, (), 1)
+
+    assert time.monotonic() - start < 10
+    assert outcome.timed_out
+    assert outcome.items == ['done in time']
+
+
+def test_run_stage_in_worker_reports_error():
+    def produce():
+        raise ValueError('bad input')
+        yield
+
+    outcome = run_stage_in_worker(produce, (), 10)
+
+    assert not outcome.completed
+    assert 'bad input' in outcome.error
+
+
+def test_cached_ingested_data_age_limit():
+    cache_ingested_data(datetime.datetime(2023, 1, 1), {'load_forecast': 'cached'})
+
+    assert get_cached_ingested_data(datetime.datetime(2023, 1, 2)) == {'load_forecast': 'cached'}
+    assert get_cached_ingested_data(datetime.datetime(2023, 1, 5)) is None
+
+
+def test_cached_ingested_data_is_shared_between_processes():
+    def ingest_in_worker():
+        cache_ingested_data(datetime.datetime(2023, 1, 1), {'load_forecast': 'cached'})
+        yield 'ingested'
+
+    assert run_stage_in_worker(ingest_in_worker, (), 10).completed
+    assert get_cached_ingested_data(datetime.datetime(2023, 1, 2)) == {'load_forecast': 'cached'}
+
+    clear_ingestion_cache()
+    assert get_cached_ingested_data(datetime.datetime(2023, 1, 2)) is None
+
+
+def test_deadline_runner_success():
+    pipeline = FakePipeline()
+
+    assert DeadlineRunner(pipeline, _deadline_in(60)).run() is True
+    assert set(pipeline.results['storage_results']) == set(PRODUCTS)
+    assert pipeline.results['degradations'] == []
+    assert pipeline.fallback_calls == []
+
+
+def test_deadline_runner_partial_fallback_on_forecast_overrun():
+    pipeline = FakePipeline(slow_stage='generate_forecasts', slow_product='RTLMP')
+
+    assert DeadlineRunner(pipeline, _deadline_in(4)).run() is False
+    assert list(pipeline.results['storage_results']) == ['DALMP']
+    assert pipeline.fallback_calls == [('generate_forecasts', ['RTLMP', 'RegUp'])]
+    assert pipeline.results['degradations'][0]['mode'] == 'partial_fallback'
+
+
+def test_deadline_runner_uses_cached_ingestion():
+    cache_ingested_data(datetime.datetime(2023, 1, 1), {'load_forecast': 'cached'})
+    pipeline = FakePipeline(failing_stage='ingest_data')
+
+    assert DeadlineRunner(pipeline, _deadline_in(60)).run() is True
+    assert pipeline.results['ingested_data'] == {'load_forecast': 'cached'}
+    assert pipeline.results['degradations'][0]['mode'] == 'cached_ingested_data'
+
+
+def test_deadline_runner_full_fallback_without_cached_ingestion():
+    pipeline = FakePipeline(failing_stage='ingest_data')
+
+    assert DeadlineRunner(pipeline, _deadline_in(60)).run() is False
+    assert pipeline.fallback_calls == [('ingest_data', PRODUCTS)]
+    assert pipeline.results['degradations'][0]['mode'] == 'full_fallback'
@@ -0,0 +1,112 @@
+"""
+Unit tests for the forecasting pipeline's per-product execution mode, in which each
+product's forecast, validate and store chain runs independently in a worker pool.
+"""
+
+import datetime  # standard library
+import unittest.mock  # standard library
+
+import pytest  # pytest: 7.0.0+
+
+# Internal imports
+from src.backend.pipeline.forecasting_pipeline import ForecastingPipeline
+from src.backend.pipeline.exceptions import PipelineStageError
+
+PRODUCTS = ['DALMP', 'RTLMP', 'RegUp']
+
+
+@pytest.fixture
+def pipeline():
+    """Creates a per-product pipeline whose stages are mocked"""
+    config = {'products': PRODUCTS, 'execution': {'mode': 'per_product', 'max_workers': 3}}
+    pipeline = ForecastingPipeline(datetime.datetime(2023, 1, 2), config, 'test-execution')
+
+    def generate_forecasts(features, ingested_data, products=None):
+        product = products[0]
+        if product == 'RTLMP':
+            raise PipelineStageError('Forecast generation failed', 'forecasting_pipeline',
+                                     'generate_forecasts', 'test-execution')
+        return {product: f'{product}-forecast'}
+
+    pipeline.ingest_data = unittest.mock.MagicMock(return_value={})
+    pipeline.engineer_features = unittest.mock.MagicMock(return_value={})
+    pipeline.generate_forecasts = unittest.mock.MagicMock(side_effect=generate_forecasts)
+    pipeline.validate_forecasts = unittest.mock.MagicMock(side_effect=lambda forecasts: dict(forecasts))
+    pipeline.store_forecasts = unittest.mock.MagicMock(
+        side_effect=lambda validated: {product: f'/forecasts/{product}.parquet' for product in validated})
+    pipeline.activate_fallback = unittest.mock.MagicMock(return_value=True)
+    return pipeline
+
+
+def test_run_dispatches_to_per_product_mode(pipeline):
+    """Tests that run() uses the per-product chains when configured"""
+    with unittest.mock.patch.object(pipeline, 'run_per_product', return_value=True) as mock_run_per_product:
+        assert pipeline.run() is True
+
+    mock_run_per_product.assert_called_once()
+
+
+def test_failing_product_only_gets_its_own_fallback(pipeline):
+    """Tests that one failing product does not discard the fresh forecasts of the others"""
+    assert pipeline.run_per_product() is False
+
+    pipeline.activate_fallback.assert_called_once()
+    args, kwargs = pipeline.activate_fallback.call_args
+    assert args[0] == 'generate_forecasts'
+    assert kwargs['products'] == ['RTLMP']
+
+    assert set(pipeline.results['storage_results']) == {'DALMP', 'RegUp'}
+    assert pipeline.results['product_status'] == {'DALMP': 'fresh', 'RTLMP': 'fallback', 'RegUp': 'fresh'}
+
+
+def test_each_product_is_stored_separately(pipeline):
+    """Tests that products are stored as their chains complete instead of in one batch"""
+    pipeline.run_per_product()
+
+    stored = [call.args[0] for call in pipeline.store_forecasts.call_args_list]
+    assert sorted(list(batch) for batch in stored) == [['DALMP'], ['RegUp']]
+
+
+def test_shared_stage_failure_falls_back_for_all_products(pipeline):
+    """Tests that an ingestion failure publishes fallbacks for every product"""
+    pipeline.ingest_data.side_effect = PipelineStageError('Data ingestion failed', 'forecasting_pipeline',
+                                                          'ingest_data', 'test-execution')
+
+    assert pipeline.run_per_product() is False
+
+    pipeline.activate_fallback.assert_called_once()
+    assert pipeline.activate_fallback.call_args.kwargs['products'] == PRODUCTS
+    pipeline.generate_forecasts.assert_not_called()
+
+
+def test_all_products_fresh(pipeline):
+    """Tests that the run succeeds when every product chain completes"""
+    pipeline.generate_forecasts.side_effect = lambda features, ingested_data, products=None: {
+        products[0]: f'{products[0]}-forecast'}
+
+    assert pipeline.run_per_product() is True
+    assert pipeline.results['status'] == 'success'
+    pipeline.activate_fallback.assert_not_called()
+
+
+def test_failing_fallback_does_not_stop_other_products():
+    """Tests that a product whose fallback fails does not keep the others from getting theirs"""
+    pipeline = ForecastingPipeline(datetime.datetime(2023, 1, 2), {'products': PRODUCTS}, 'test-execution')
+
+    def save_forecast(df, target_date, product, is_fallback=False, sample_dtype=None):
+        if product == 'DALMP':
+            raise OSError('Disk full')
+        return f'/forecasts/{product}.parquet'
+
+    module = 'src.backend.pipeline.forecasting_pipeline'
+    with unittest.mock.patch(f'{module}.FALLBACK_STORAGE_MODE', 'copy'), \
+            unittest.mock.patch(f'{module}.log_fallback_activation'), \
+            unittest.mock.patch(f'{module}.get_prepared_fallback', return_value='fallback-forecast'), \
+            unittest.mock.patch(f'{module}.validate_forecast_schema', return_value=(True, [])), \
+            unittest.mock.patch(f'{module}.save_forecast', side_effect=save_forecast):
+        assert pipeline.activate_fallback('generate_forecasts', Exception('failed'), products=PRODUCTS) is False
+
+    assert pipeline.results['fallback_RTLMP'] == '/forecasts/RTLMP.parquet'
+    assert pipeline.results['fallback_RegUp'] == '/forecasts/RegUp.parquet'
+    assert 'fallback_DALMP' not in pipeline.results
+    assert pipeline.results['failed_fallbacks'] == {'DALMP': 'Disk full'}
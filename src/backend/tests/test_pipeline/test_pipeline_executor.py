@@ -9,7 +9,7 @@ from datetime import datetime  # package_version: standard library
 import copy  # package_version: standard library
 
 # Internal imports
-from src.backend.pipeline.pipeline_executor import PipelineExecutor, execute_forecasting_pipeline, execute_with_default_config, get_default_config, validate_config, merge_configs  # Module: src/backend/pipeline/pipeline_executor.py
+from src.backend.pipeline.pipeline_executor import PipelineExecutor, execute_forecasting_pipeline, execute_with_default_config, get_default_config, validate_config, merge_configs, run_pipeline_job  # Module: src/backend/pipeline/pipeline_executor.py
 from src.backend.pipeline.forecasting_pipeline import ForecastingPipeline  # Module: src/backend/pipeline/forecasting_pipeline.py
 from src.backend.pipeline.exceptions import PipelineError, PipelineExecutionError, PipelineConfigurationError  # Module: src/backend/pipeline/exceptions.py
 from src.backend.config.settings import FORECAST_PRODUCTS, DATA_SOURCES  # Module: src/backend/config/settings.py
@@ -257,6 +257,8 @@ def test_get_default_config():
     assert "fallback" in config1
     assert "validation" in config1
     assert "storage" in config1
+    # Assert that products run sequentially unless per-product execution is configured
+    assert config1["execution"]["mode"] == "sequential"
 
     # Modify the returned dictionary
     config1["products"].append("NewProduct")
@@ -335,4 +337,31 @@ def test_merge_configs():
     assert result["fallback"]["enabled"] is True
     # Assert that nested dictionaries are properly merged
     assert result["validation"] == {"schema": True, "completeness": True, "plausibility": True}
-    assert result["storage"] == {"format": "parquet", "compression": "snappy"}
\ No newline at end of file
+    assert result["storage"] == {"format": "parquet", "compression": "snappy"}
+
+
+def test_run_pipeline_job_returns_summary():
+    """Test that run_pipeline_job returns only the JSON-safe summary of the pipeline results"""
+    # Create a test target date and pipeline results holding forecast data keyed by (product, hour)
+    target_date = datetime(2023, 1, 1)
+    forecast_ensemble = create_mock_forecast_ensemble("DALMP", target_date)
+    results = {
+        "execution_id": "execution-1",
+        "status": "success",
+        "execution_time": 3.5,
+        "features": {("DALMP", 0): forecast_ensemble},
+        "forecasts": {"DALMP": forecast_ensemble},
+        "storage_results": {"DALMP": "/forecasts/DALMP.parquet"}
+    }
+    # Mock the execute_forecasting_pipeline function
+    with unittest.mock.patch("src.backend.pipeline.pipeline_executor.execute_forecasting_pipeline", return_value=results) as MockExecute:
+        # Call run_pipeline_job as a job worker does
+        summary = run_pipeline_job(target_date, get_default_config())
+
+        MockExecute.assert_called_once_with(target_date, get_default_config())
+    # Assert that the summary keeps the status and drops the forecast data
+    assert summary["status"] == "success"
+    assert summary["execution_time"] == 3.5
+    assert summary["product_status"] == {"DALMP": "fresh"}
+    assert "features" not in summary
+    assert "forecasts" not in summary
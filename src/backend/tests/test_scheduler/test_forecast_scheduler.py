@@ -350,7 +350,7 @@ class TestJobExecution:
         mock_stop_job_monitoring = mocker.patch("src.backend.scheduler.forecast_scheduler.stop_job_monitoring")
 
         # Mock execute_forecasting_pipeline to return success result
-        mock_execute_forecasting_pipeline = mocker.patch("src.backend.scheduler.forecast_scheduler.execute_forecasting_pipeline", return_value={"result": "success"})
+        mock_execute_forecasting_pipeline = mocker.patch("src.backend.pipeline.pipeline_executor.execute_forecasting_pipeline", return_value={"result": "success"})
 
         # Create job parameters
         job_params = {"param1": "value1"}
@@ -380,7 +380,7 @@ class TestJobExecution:
         mock_stop_job_monitoring = mocker.patch("src.backend.scheduler.forecast_scheduler.stop_job_monitoring")
 
         # Mock execute_forecasting_pipeline to raise an exception
-        mock_execute_forecasting_pipeline = mocker.patch("src.backend.scheduler.forecast_scheduler.execute_forecasting_pipeline", side_effect=Exception("Execution failed"))
+        mock_execute_forecasting_pipeline = mocker.patch("src.backend.pipeline.pipeline_executor.execute_forecasting_pipeline", side_effect=Exception("Execution failed"))
 
         # Create job parameters
         job_params = {"param1": "value1"}
@@ -447,7 +447,7 @@ class TestSchedulerIntegration:
     def test_scheduler_full_lifecycle(self, mocker):
         """Test the full lifecycle of the scheduler from initialization to job execution"""
         # Mock execute_forecasting_pipeline to return success result
-        mock_execute_forecasting_pipeline = mocker.patch("src.backend.scheduler.forecast_scheduler.execute_forecasting_pipeline", return_value={"result": "success"})
+        mock_execute_forecasting_pipeline = mocker.patch("src.backend.pipeline.pipeline_executor.execute_forecasting_pipeline", return_value={"result": "success"})
 
         # Initialize scheduler
         initialize_scheduler()
@@ -522,4 +522,51 @@ class TestSchedulerIntegration:
         forecast_scheduler.stop("Test complete")
 
         # Verify scheduler is stopped
-        assert not forecast_scheduler.is_running()
\ No newline at end of file
+        assert not forecast_scheduler.is_running()
+
+def test_execute_forecast_job_records_pipeline_results(mocker, tmp_path):
+    """Test that a run with real pipeline results is recorded as completed with a JSON-safe summary"""
+    import pandas as pd
+
+    # Point the job registry at an empty database and stub out monitoring and fallback preparation
+    mocker.patch("src.backend.scheduler.job_registry.JOB_REGISTRY_DB_FILE", str(tmp_path / "job_registry.db"))
+    mocker.patch("src.backend.scheduler.forecast_scheduler.start_job_monitoring")
+    mocker.patch("src.backend.scheduler.forecast_scheduler.stop_job_monitoring")
+    mocker.patch("src.backend.scheduler.forecast_scheduler.start_fallback_preparation")
+    mocker.patch("src.backend.scheduler.forecast_scheduler.clear_prepared_fallbacks")
+    mocker.patch("src.backend.scheduler.forecast_scheduler.get_job_executor", return_value=None)
+
+    # Pipeline results as produced by a per-product run: features are keyed by (product, hour)
+    forecast_df = pd.DataFrame({"timestamp": pd.date_range("2024-01-01", periods=24, freq="h"), "point_forecast": 50.0})
+    results = {
+        "execution_id": "execution-1",
+        "status": "pending",
+        "sample_count": 100,
+        "sample_dtype": "float64",
+        "ingested_data": {"load_forecast": forecast_df},
+        "features": {("DALMP", 0): forecast_df, ("RTLMP", 0): forecast_df},
+        "forecasts": {"DALMP": forecast_df},
+        "validated_forecasts": {"DALMP": forecast_df},
+        "storage_results": {"DALMP": "/forecasts/DALMP.parquet"},
+        "product_status": {"DALMP": "fresh", "RTLMP": "fallback"},
+        "fallback_RTLMP": "/forecasts/RTLMP.parquet",
+        "degradations": [{"stage": "forecast_generation", "mode": "fallback", "reason": "timeout", "products": ["RTLMP"]}],
+        "completed_at": datetime.datetime(2024, 1, 1, 7, 5),
+        "execution_time": 12.5
+    }
+    mocker.patch("src.backend.pipeline.pipeline_executor.execute_forecasting_pipeline", return_value=results)
+
+    job_id = register_job(job_type=JOB_TYPE_FORECAST, schedule_time=datetime.datetime(2024, 1, 1, 7), job_params={})
+    summary = execute_forecast_job(job_id, {"target_date": datetime.datetime(2024, 1, 1)})
+
+    # The job is completed and its status details hold the summary, not the dataframes
+    job = get_job(job_id)
+    assert job["status"] == JOB_STATUS_COMPLETED
+    assert job["status_details"] == summary
+    assert summary["status"] == "pending"
+    assert summary["product_status"] == {"DALMP": "fresh", "RTLMP": "fallback"}
+    assert summary["fallbacks"] == {"RTLMP": "/forecasts/RTLMP.parquet"}
+    assert summary["degradations"] == results["degradations"]
+    assert summary["execution_time"] == 12.5
+    assert summary["completed_at"] == datetime.datetime(2024, 1, 1, 7, 5)
+    assert "features" not in summary
@@ -0,0 +1,135 @@
+"""
+Unit tests for the job executor of the scheduler component, which runs jobs in a process
+pool in priority order with workers reserved for daily runs.
+"""
+import datetime
+import time
+
+import pytest
+
+from src.backend.scheduler.job_executor import (
+    JobExecutor,
+    resource,
+    JOB_PRIORITY_DAILY,
+    JOB_PRIORITY_ADHOC,
+    JOB_PRIORITY_BACKFILL
+)
+from src.backend.scheduler.job_registry import register_job, get_job, get_queue_stats, clear_registry
+
+
+def sleep_job(seconds):
+    """Job run in a worker process"""
+    time.sleep(seconds)
+    return seconds
+
+
+def allocate_job(num_bytes):
+    """Job allocating memory in a worker process"""
+    return len(bytearray(num_bytes))
+
+
+class UnpicklableError(Exception):
+    """Exception that cannot be unpickled (required constructor arguments)"""
+
+    def __init__(self, message, stage):
+        super().__init__(message)
+        self.stage = stage
+
+
+def failing_job():
+    """Job raising an exception that cannot be sent back to the scheduler process"""
+    raise UnpicklableError("stage failed", "generate")
+
+
+def new_job():
+    """Registers a forecast job"""
+    return register_job(job_type="forecast", schedule_time=datetime.datetime.now())
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Clears the job registry around each test"""
+    clear_registry()
+    yield
+    clear_registry()
+
+
+def wait_until_started(job_id, timeout=10):
+    """Waits until a queued job was handed to a worker"""
+    deadline = time.monotonic() + timeout
+    while get_job(job_id).get("start_time") is None:
+        assert time.monotonic() < deadline, f"job {job_id} did not start"
+        time.sleep(0.01)
+
+
+def test_jobs_run_in_priority_order():
+    """Tests that a daily job queued after a backfill job starts first"""
+    executor = JobExecutor(max_workers=1, reserved_daily_workers=0, memory_limit_mb=0)
+    executor.start()
+    try:
+        blocker, backfill, daily = (new_job() for _ in range(3))
+        blocker_future = executor.submit(blocker, JOB_PRIORITY_ADHOC, sleep_job, 0.5)
+        wait_until_started(blocker)
+
+        backfill_future = executor.submit(backfill, JOB_PRIORITY_BACKFILL, sleep_job, 0)
+        daily_future = executor.submit(daily, JOB_PRIORITY_DAILY, sleep_job, 0)
+
+        stats = get_queue_stats()
+        assert stats["queue_depth"] == 2
+        assert stats["queue_depth_by_priority"] == {JOB_PRIORITY_BACKFILL: 1, JOB_PRIORITY_DAILY: 1}
+
+        assert [f.result(timeout=10) for f in (blocker_future, backfill_future, daily_future)] == [0.5, 0, 0]
+        assert get_job(daily)["start_time"] < get_job(backfill)["start_time"]
+        assert get_queue_stats()["queue_depth"] == 0
+    finally:
+        executor.shutdown()
+
+
+def test_reserved_worker_runs_daily_job_while_backfills_saturate_pool():
+    """Tests that a daily job does not wait for backfill jobs using every shared worker"""
+    executor = JobExecutor(max_workers=1, reserved_daily_workers=1, memory_limit_mb=0)
+    executor.start()
+    try:
+        first, second, daily = (new_job() for _ in range(3))
+        first_future = executor.submit(first, JOB_PRIORITY_BACKFILL, sleep_job, 1.0)
+        wait_until_started(first)
+        executor.submit(second, JOB_PRIORITY_BACKFILL, sleep_job, 0)
+
+        daily_future = executor.submit(daily, JOB_PRIORITY_DAILY, sleep_job, 0)
+        assert daily_future.result(timeout=10) == 0
+        assert not first_future.done()
+        assert get_job(second)["start_time"] is None
+        assert get_job(daily)["wait_seconds"] < 1.0
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.skipif(resource is None, reason="memory limits require the resource module")
+def test_memory_limit_fails_job():
+    """Tests that a job exceeding its memory limit fails without breaking the pool"""
+    executor = JobExecutor(max_workers=1, reserved_daily_workers=0, memory_limit_mb=4096)
+    executor.start()
+    try:
+        job_id = new_job()
+        with pytest.raises(MemoryError):
+            executor.submit(job_id, JOB_PRIORITY_BACKFILL, allocate_job, 8 * 1024 ** 3).result(timeout=30)
+
+        job_id = new_job()
+        assert executor.submit(job_id, JOB_PRIORITY_BACKFILL, allocate_job, 1024).result(timeout=10) == 1024
+    finally:
+        executor.shutdown()
+
+
+def test_unpicklable_exception_is_reported():
+    """Tests that an exception that cannot be unpickled is re-raised as RuntimeError"""
+    executor = JobExecutor(max_workers=1, reserved_daily_workers=0, memory_limit_mb=0)
+    executor.start()
+    try:
+        job_id = new_job()
+        with pytest.raises(RuntimeError, match="UnpicklableError: stage failed"):
+            executor.submit(job_id, JOB_PRIORITY_ADHOC, failing_job).result(timeout=10)
+
+        with pytest.raises(ValueError):
+            executor.submit(job_id, "urgent", sleep_job, 0)
+    finally:
+        executor.shutdown()
@@ -6,6 +6,12 @@ and querying jobs with their statuses, ensuring the reliability of the daily
 forecast generation process.
 """
 import datetime
+import os
+import pathlib
+import sqlite3
+import subprocess
+import sys
+import threading
 import uuid
 from unittest import mock
 
@@ -21,10 +27,15 @@ from ...scheduler.job_registry import (
     clear_registry,
     remove_job,
     get_job_count,
+    get_recent_jobs,
+    prune_registry,
+    mark_interrupted_jobs,
+    _get_connection,
     JOB_STATUS_PENDING,
     JOB_STATUS_RUNNING,
     JOB_STATUS_COMPLETED,
     JOB_STATUS_FAILED,
+    JOB_STATUS_INTERRUPTED,
     VALID_JOB_STATUSES
 )
 from ...scheduler.exceptions import JobRegistryError
@@ -407,4 +418,196 @@ def test_error_handling():
         with pytest.raises(JobRegistryError) as excinfo:
             register_job(job_type="error_test")
         assert "Failed to register job" in str(excinfo.value)
-        assert "Test error" in str(excinfo.value)
\ No newline at end of file
+        assert "Test error" in str(excinfo.value)
+
+
+def new_job(job_type):
+    """
+    Registers a job scheduled to run now.
+    """
+    return register_job(job_type=job_type, schedule_time=datetime.datetime.now())
+
+
+@pytest.fixture
+def registry_db(tmp_path):
+    """
+    Fixture pointing the job registry at an empty database file.
+    """
+    db_file = tmp_path / "job_registry.db"
+    with mock.patch('src.backend.scheduler.job_registry.JOB_REGISTRY_DB_FILE', str(db_file)):
+        yield db_file
+
+
+def test_jobs_persist_in_database(registry_db):
+    """
+    Test that jobs are stored in the database file and readable over another connection.
+    """
+    # Arrange
+    deadline = datetime.datetime(2023, 6, 1, 8, 0)
+    job_id = register_job(job_type="forecast", schedule_time=datetime.datetime.now(), job_params={"deadline": deadline, "priority": "daily"})
+    update_job_status(job_id, JOB_STATUS_FAILED, {"error": "Test error"})
+
+    # Act - read from a new thread, which opens its own connection
+    jobs = []
+    reader = threading.Thread(target=lambda: jobs.append(get_job(job_id)))
+    reader.start()
+    reader.join()
+
+    # Assert
+    assert registry_db.exists()
+    assert jobs[0]["status"] == JOB_STATUS_FAILED
+    assert jobs[0]["job_params"] == {"deadline": deadline, "priority": "daily"}
+    assert jobs[0]["status_details"] == {"error": "Test error"}
+    assert isinstance(jobs[0]["creation_time"], datetime.datetime)
+
+
+def test_get_recent_jobs(registry_db):
+    """
+    Test that the most recent jobs are returned newest first, filtered by type and status.
+    """
+    # Arrange
+    forecast_jobs = [new_job("forecast") for _ in range(4)]
+    new_job("data_collection")
+    update_job_status(forecast_jobs[1], JOB_STATUS_COMPLETED)
+
+    # Act & Assert
+    assert [job["job_id"] for job in get_recent_jobs(limit=2, job_type="forecast")] == forecast_jobs[:1:-1]
+    assert len(get_recent_jobs(limit=10)) == 5
+    assert [job["job_id"] for job in get_recent_jobs(job_type="forecast", status=JOB_STATUS_COMPLETED)] == [forecast_jobs[1]]
+    with pytest.raises(ValueError):
+        get_recent_jobs(status="invalid_status")
+
+
+def test_prune_registry(registry_db):
+    """
+    Test that finished jobs older than the retention period are removed.
+    """
+    # Arrange
+    old_finished = new_job("forecast")
+    old_running = new_job("forecast")
+    recent_finished = new_job("forecast")
+    update_job_status(old_finished, JOB_STATUS_COMPLETED)
+    update_job_status(old_running, JOB_STATUS_RUNNING)
+    update_job_status(recent_finished, JOB_STATUS_COMPLETED)
+    old_time = (datetime.datetime.now() - datetime.timedelta(days=100)).isoformat()
+    _get_connection().execute(
+        "UPDATE jobs SET creation_time = ? WHERE job_id IN (?, ?)", (old_time, old_finished, old_running)
+    )
+
+    # Act
+    removed = prune_registry(retention_days=90)
+
+    # Assert
+    assert removed == 1
+    assert get_job(old_finished) is None
+    assert get_job(old_running) is not None
+    assert get_job(recent_finished) is not None
+    assert prune_registry(retention_days=0) == 0
+
+
+def test_mark_interrupted_jobs(registry_db):
+    """
+    Test that unfinished jobs of processes that no longer exist are marked as interrupted.
+    """
+    # Arrange
+    stale_job = new_job("forecast")
+    current_job = new_job("forecast")
+    update_job_status(stale_job, JOB_STATUS_RUNNING)
+    update_job_status(current_job, JOB_STATUS_RUNNING)
+    exited = subprocess.Popen(["true"])
+    exited.wait()
+    _get_connection().execute(
+        "UPDATE jobs SET process_id = ?, instance_id = ? WHERE job_id = ?",
+        (exited.pid, str(uuid.uuid4()), stale_job)
+    )
+
+    # Act
+    interrupted = mark_interrupted_jobs()
+
+    # Assert
+    assert interrupted == 1
+    assert get_job(stale_job)["status"] == JOB_STATUS_INTERRUPTED
+    assert get_job(current_job)["status"] == JOB_STATUS_RUNNING
+
+
+def test_mark_interrupted_jobs_after_restart_with_same_pid(registry_db):
+    """
+    Test that jobs of a previous scheduler are interrupted even when the restarted process has its PID.
+    """
+    # Arrange: a container restart runs the new scheduler under the PID of the old one
+    previous_job = new_job("forecast")
+    other_process_job = new_job("forecast")
+    update_job_status(previous_job, JOB_STATUS_RUNNING)
+    update_job_status(other_process_job, JOB_STATUS_RUNNING)
+    _get_connection().execute(
+        "UPDATE jobs SET process_id = ?, instance_id = ? WHERE job_id = ?",
+        (os.getpid(), str(uuid.uuid4()), previous_job)
+    )
+    running = subprocess.Popen(["sleep", "30"])
+    try:
+        _get_connection().execute(
+            "UPDATE jobs SET process_id = ?, instance_id = ? WHERE job_id = ?",
+            (running.pid, str(uuid.uuid4()), other_process_job)
+        )
+
+        # Act
+        interrupted = mark_interrupted_jobs()
+    finally:
+        running.kill()
+        running.wait()
+
+    # Assert: the live process's job is kept
+    assert interrupted == 1
+    assert get_job(previous_job)["status"] == JOB_STATUS_INTERRUPTED
+    assert get_job(other_process_job)["status"] == JOB_STATUS_RUNNING
+
+
+def test_mark_interrupted_jobs_in_database_without_instance_ids(registry_db):
+    """
+    Test that a database created before jobs recorded instance IDs is migrated on first use.
+    """
+    # Arrange
+    connection = sqlite3.connect(str(registry_db))
+    connection.execute(
+        "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, job_type TEXT, status TEXT NOT NULL, schedule_time TEXT, "
+        "creation_time TEXT NOT NULL, status_update_time TEXT, status_details TEXT, job_params TEXT NOT NULL, "
+        "priority TEXT, queued_time TEXT, start_time TEXT, wait_seconds REAL, process_id INTEGER)"
+    )
+    connection.execute(
+        "INSERT INTO jobs (job_id, job_type, status, creation_time, job_params, process_id) VALUES (?, ?, ?, ?, ?, ?)",
+        ("old_job", "forecast", JOB_STATUS_RUNNING, datetime.datetime.now().isoformat(), "{}", os.getpid())
+    )
+    connection.commit()
+    connection.close()
+
+    # Act
+    interrupted = mark_interrupted_jobs()
+
+    # Assert
+    assert interrupted == 1
+    assert get_job("old_job")["status"] == JOB_STATUS_INTERRUPTED
+    new_job_id = new_job("forecast")
+    assert mark_interrupted_jobs() == 0
+    assert get_job(new_job_id)["status"] == JOB_STATUS_PENDING
+
+
+def test_job_registry_import_does_not_load_scheduler():
+    """
+    Test that reading the job registry (as the API health check does) does not load the scheduler.
+    """
+    # Arrange: import the registry in a fresh interpreter from the repository root
+    repo_root = pathlib.Path(__file__).resolve().parents[4]
+    script = (
+        "import sys\n"
+        "from src.backend.scheduler.job_registry import JOB_TYPE_FORECAST\n"
+        "loaded = [name for name in ('apscheduler', 'src.backend.scheduler.forecast_scheduler',\n"
+        "          'src.backend.scheduler.job_executor') if name in sys.modules]\n"
+        "print(JOB_TYPE_FORECAST, loaded)\n"
+    )
+
+    # Act
+    result = subprocess.run([sys.executable, "-c", script], cwd=repo_root, capture_output=True, text=True)
+
+    # Assert
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "forecast []"
@@ -0,0 +1,80 @@
+"""
+Unit tests for the checksums module, which computes per-file and per-row-group checksums of
+stored forecasts and verifies files against them by streaming.
+"""
+
+import json  # standard library
+import pytest  # pytest: 7.0.0+
+import pandas as pd  # pandas: 2.0.0+
+
+# Internal imports
+from src.backend.storage.checksums import (
+    compute_checksums,
+    compute_file_checksums,
+    has_checksums,
+    verify_file_checksums
+)
+
+
+@pytest.fixture
+def forecast_file(tmp_path):
+    """Writes a forecast file with three row groups"""
+    path = tmp_path / "01_DALMP.parquet"
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2023-01-01", periods=72, freq="h"),
+        "point_forecast": [float(i) for i in range(72)]
+    })
+    df.to_parquet(path, index=False, row_group_size=24)
+    return path
+
+
+def test_compute_file_checksums(forecast_file):
+    """Tests that a checksum is recorded for the file and each row group"""
+    checksums = compute_file_checksums(forecast_file)
+
+    assert has_checksums(checksums)
+    assert len(json.loads(checksums["row_group_checksums"])) == 3
+    assert checksums["file_size"] == forecast_file.stat().st_size
+
+
+def test_checksums_do_not_depend_on_chunk_size(forecast_file):
+    """Tests that streaming in small chunks gives the same checksums"""
+    assert compute_checksums(forecast_file, chunk_size=7) == compute_checksums(forecast_file)
+
+
+def test_verify_unchanged_file(forecast_file):
+    """Tests that an unchanged file passes verification"""
+    entry = compute_file_checksums(forecast_file)
+
+    assert verify_file_checksums(forecast_file, entry) == []
+
+
+def test_verify_localizes_corruption_to_row_group(forecast_file):
+    """Tests that a flipped byte in the data is reported for its row group"""
+    entry = compute_file_checksums(forecast_file)
+    data = bytearray(forecast_file.read_bytes())
+    data[10] ^= 0xFF
+    forecast_file.write_bytes(bytes(data))
+
+    problems = verify_file_checksums(forecast_file, entry)
+
+    assert problems
+    assert any("row group 0" in problem for problem in problems)
+
+
+def test_verify_detects_truncation_from_size(forecast_file):
+    """Tests that a truncated file is reported without hashing it"""
+    entry = compute_file_checksums(forecast_file)
+    forecast_file.write_bytes(forecast_file.read_bytes()[:-100])
+
+    problems = verify_file_checksums(forecast_file, entry)
+
+    assert len(problems) == 1
+    assert "file size" in problems[0]
+
+
+def test_has_checksums_for_entries_indexed_without_them():
+    """Tests that entries indexed before checksums were introduced are recognized"""
+    assert not has_checksums(None)
+    assert not has_checksums({"checksum": float("nan")})
+    assert has_checksums({"checksum": "crc32:0000abcd"})
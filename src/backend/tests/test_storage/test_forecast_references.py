@@ -0,0 +1,96 @@
+"""
+Unit tests for the forecast_references module, which stores fallback forecasts as references
+to their source forecast with the timestamp shift applied on read.
+"""
+
+import pytest  # pytest: 7.0.0+
+import pandas as pd  # pandas: 2.0.0+
+from datetime import datetime, timedelta  # standard library
+
+# Internal imports
+from src.backend.storage.forecast_references import (
+    is_reference_path,
+    write_reference_file,
+    read_reference_file,
+    load_reference,
+    get_reference_fields
+)
+from src.backend.storage.exceptions import FileOperationError
+
+
+def write_source(path):
+    """Writes a small source forecast file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2023-01-01", periods=24, freq="h"),
+        "point_forecast": [float(i) for i in range(24)],
+        "generation_timestamp": [pd.Timestamp("2023-01-01 07:00")] * 24,
+        "is_fallback": [False] * 24
+    })
+    df.to_parquet(path, index=False)
+    return path
+
+
+def write_reference(path, source_path, days=1):
+    """Writes a reference to a source file shifted by a number of days"""
+    return write_reference_file(
+        path,
+        source_path,
+        timedelta(days=days),
+        "DALMP",
+        datetime(2023, 1, 1) + timedelta(days=days),
+        pd.Timestamp("2023-01-02 07:00", tz="America/Chicago")
+    )
+
+
+def test_reference_file_roundtrip(tmp_path):
+    """Tests that a written reference is read back with its fields"""
+    source = write_source(tmp_path / "2023" / "01" / "01_DALMP.parquet")
+    path = write_reference(tmp_path / "2023" / "01" / "02_DALMP.ref", source)
+
+    reference = read_reference_file(path)
+
+    assert is_reference_path(path)
+    assert not is_reference_path(source)
+    assert reference["source_file_path"] == str(source)
+    assert reference["timestamp_offset_seconds"] == 86400.0
+    assert reference["timestamp"] == pd.Timestamp("2023-01-02")
+    assert reference["is_fallback"] is True
+    assert list(tmp_path.glob("2023/01/.*.tmp")) == []
+
+
+def test_load_reference_applies_shift(tmp_path):
+    """Tests that the source data is loaded shifted and marked as fallback"""
+    source = write_source(tmp_path / "2023" / "01" / "01_DALMP.parquet")
+    path = write_reference(tmp_path / "2023" / "01" / "02_DALMP.ref", source)
+
+    df = load_reference(path)
+
+    assert df["timestamp"].iloc[0] == pd.Timestamp("2023-01-02 00:00")
+    assert df["point_forecast"].tolist() == [float(i) for i in range(24)]
+    assert df["is_fallback"].all()
+    assert (df["generation_timestamp"] == pd.Timestamp("2023-01-02 07:00", tz="America/Chicago")).all()
+
+
+def test_load_reference_missing_source(tmp_path):
+    """Tests that a reference to a removed source raises an error"""
+    source = write_source(tmp_path / "2023" / "01" / "01_DALMP.parquet")
+    path = write_reference(tmp_path / "2023" / "01" / "02_DALMP.ref", source)
+    source.unlink()
+
+    with pytest.raises(FileOperationError):
+        load_reference(path)
+
+
+def test_get_reference_fields_flattens_chains(tmp_path):
+    """Tests that a reference to a reference points to the original source"""
+    source = write_source(tmp_path / "2023" / "01" / "01_DALMP.parquet")
+    first = write_reference(tmp_path / "2023" / "01" / "02_DALMP.ref", source)
+
+    fields = get_reference_fields({"file_path": str(first)}, timedelta(days=1))
+
+    assert fields == {"source_file_path": str(source), "timestamp_offset_seconds": 172800.0}
+    assert get_reference_fields({"file_path": str(source)}, timedelta(days=1)) == {
+        "source_file_path": str(source),
+        "timestamp_offset_seconds": 86400.0
+    }
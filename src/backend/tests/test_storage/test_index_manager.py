@@ -18,17 +18,20 @@ from src.backend.storage.index_manager import (
     load_index,
     save_index,
     add_forecast_to_index,
+    add_forecasts_to_index,
     remove_forecast_from_index,
     query_index_by_date,
     get_forecast_file_paths,
     update_latest_links,
     get_latest_forecast_metadata,
+    get_index_entry,
+    get_latest_index_entry,
     clean_index,
     rebuild_index,
     get_index_statistics,
 )
 from src.backend.storage.path_resolver import get_index_file_path, get_latest_file_path, get_base_storage_path
-from src.backend.storage.exceptions import IndexUpdateError
+from src.backend.storage.exceptions import IndexUpdateError, StoragePathError
 from src.backend.config.settings import FORECAST_PRODUCTS
 from src.backend.tests.fixtures.forecast_fixtures import create_mock_forecast_data
 
@@ -163,6 +166,57 @@ def test_add_forecast_to_index(temp_storage_path: pathlib.Path):
         add_forecast_to_index(file_path, timestamp, "InvalidProduct", generation_timestamp, False)
 
 
+def test_add_forecasts_to_index(temp_storage_path: pathlib.Path):
+    """Tests adding many forecasts to the index with one update"""
+    initialize_index()
+    generation_timestamp = datetime(2023, 1, 3, 6, 0, 0)
+    add_forecast_to_index(temp_storage_path / "old.parquet", datetime(2023, 1, 3), "DALMP", generation_timestamp, True)
+
+    entries = [
+        {
+            "timestamp": datetime(2023, 1, day),
+            "product": product,
+            "file_path": temp_storage_path / f"{product}_{day}.parquet",
+            "generation_timestamp": generation_timestamp,
+            "is_fallback": False
+        }
+        for day in (3, 4) for product in ("DALMP", "RTLMP")
+    ]
+    assert add_forecasts_to_index(entries)
+
+    # The existing entry for the same timestamp and product is replaced
+    index_df = load_index()
+    assert len(index_df) == 4
+    replaced = index_df[(index_df["timestamp"] == datetime(2023, 1, 3)) & (index_df["product"] == "DALMP")]
+    assert replaced["file_path"].tolist() == [str(temp_storage_path / "DALMP_3.parquet")]
+    assert not replaced["is_fallback"].iloc[0]
+
+    with pytest.raises(StoragePathError):
+        add_forecasts_to_index([{**entries[0], "product": "InvalidProduct"}])
+
+
+def test_add_forecasts_to_index_backfill_keeps_latest(temp_storage_path: pathlib.Path):
+    """Tests that backfilling past dates after the current forecast does not change the latest"""
+    initialize_index()
+    current_path = temp_storage_path / "current.parquet"
+    add_forecast_to_index(current_path, datetime(2023, 6, 1), "DALMP", datetime(2023, 6, 1, 7), False)
+
+    # Backfilled forecasts are generated now, after the current forecast
+    assert add_forecasts_to_index([
+        {
+            "timestamp": datetime(2023, 1, day),
+            "product": "DALMP",
+            "file_path": temp_storage_path / f"backfill_{day}.parquet",
+            "generation_timestamp": datetime(2023, 6, 2, 12),
+            "is_fallback": False
+        }
+        for day in (1, 2)
+    ])
+
+    assert get_latest_index_entry("DALMP")["file_path"] == str(current_path)
+    assert get_latest_index_entry("DALMP", include_fallback=False)["file_path"] == str(current_path)
+
+
 def test_remove_forecast_from_index(temp_storage_path: pathlib.Path):
     """Tests removing a forecast from the index"""
     # Create a test index with multiple forecast entries
@@ -356,6 +410,30 @@ def test_get_latest_forecast_metadata(temp_storage_path: pathlib.Path):
     assert len(metadata) == 0
 
 
+def test_get_index_entry(temp_storage_path: pathlib.Path):
+    """Tests looking up single index entries by timestamp and for the latest forecast"""
+    test_data = {
+        "timestamp": [datetime(2023, 1, 1), datetime(2023, 1, 2)],
+        "product": ["DALMP", "DALMP"],
+        "file_path": ["/path/to/dalmp1", "/path/to/dalmp2"],
+        "generation_timestamp": [datetime(2023, 1, 1, 6, 0, 0), datetime(2023, 1, 2, 6, 0, 0)],
+        "is_fallback": [False, True]
+    }
+    save_index(pd.DataFrame(test_data))
+
+    entry = get_index_entry(datetime(2023, 1, 1), "DALMP")
+    assert entry["file_path"] == "/path/to/dalmp1"
+    assert entry["generation_timestamp"] == datetime(2023, 1, 1, 6, 0, 0)
+
+    latest = get_latest_index_entry("DALMP")
+    assert latest["file_path"] == "/path/to/dalmp2"
+    assert latest["is_fallback"] == True
+
+    # Missing entries return None rather than raising
+    assert get_index_entry(datetime(2023, 1, 5), "DALMP") is None
+    assert get_latest_index_entry("RTLMP") is None
+
+
 def test_clean_index(temp_storage_path: pathlib.Path):
     """Tests cleaning the index by removing entries for non-existent files"""
     # Create a test index with multiple forecast entries
@@ -0,0 +1,138 @@
+"""
+Unit tests for the index_scanner module, which extracts index entries from Parquet footers,
+verifies file layout and checkpoints scan results for resumable index rebuilds.
+"""
+
+import pytest  # pytest: 7.0.0+
+import pandas as pd  # pandas: 2.0.0+
+from datetime import datetime  # standard library
+import unittest.mock  # standard library
+
+# Internal imports
+from src.backend.storage.index_scanner import (
+    SCAN_INDEXED,
+    SCAN_SKIPPED,
+    SCAN_CORRUPT,
+    find_forecast_files,
+    scan_forecast_file,
+    load_rebuild_checkpoint,
+    append_rebuild_checkpoint,
+    clear_rebuild_checkpoint,
+    is_record_current
+)
+
+
+def write_forecast(path, is_fallback=False):
+    """Writes a small forecast file with storage metadata columns"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2023-01-01", periods=24, freq="h"),
+        "point_forecast": [float(i) for i in range(24)],
+        "generation_timestamp": [pd.Timestamp("2023-01-01 07:00")] * 24,
+        "is_fallback": [is_fallback] * 24
+    })
+    df.to_parquet(path, index=False)
+    return path
+
+
+def scan(path):
+    """Scans a file using its current size and modification time"""
+    stat = path.stat()
+    return scan_forecast_file(path, path.parent.parent.name, path.parent.name, stat.st_size, stat.st_mtime_ns)
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_file(tmp_path):
+    """Stores the rebuild checkpoint in a temporary directory"""
+    path = tmp_path / "index_rebuild_checkpoint.jsonl"
+    with unittest.mock.patch("src.backend.storage.index_scanner.get_rebuild_checkpoint_path", return_value=path):
+        yield path
+
+
+def test_find_forecast_files(tmp_path):
+    """Tests that only regular files in year/month directories are listed"""
+    forecast = write_forecast(tmp_path / "2023" / "01" / "01_DALMP.parquet")
+    (tmp_path / "latest").mkdir()
+    (tmp_path / "latest" / "DALMP.parquet").symlink_to(forecast)
+
+    files = find_forecast_files(tmp_path)
+
+    assert [(path, year, month) for path, year, month, _, _ in files] == [(forecast, "2023", "01")]
+
+
+def test_scan_forecast_file_reads_footer_metadata(tmp_path):
+    """Tests that the index entry is taken from the footer statistics without loading data"""
+    path = write_forecast(tmp_path / "2023" / "01" / "02_DALMP.parquet", is_fallback=True)
+
+    with unittest.mock.patch("src.backend.storage.index_scanner.load_dataframe") as mock_load:
+        record = scan(path)
+        mock_load.assert_not_called()
+
+    assert record["status"] == SCAN_INDEXED
+    assert record["entry"]["timestamp"] == datetime(2023, 1, 2)
+    assert record["entry"]["product"] == "DALMP"
+    assert record["entry"]["generation_timestamp"] == pd.Timestamp("2023-01-01 07:00")
+    assert record["entry"]["is_fallback"] is True
+
+
+def test_scan_forecast_file_statistics_match_column_read(tmp_path):
+    """Tests that timezone-aware generation times from the statistics match a column read"""
+    path = tmp_path / "2023" / "01" / "02_DALMP.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({
+        "timestamp": pd.date_range("2023-01-02", periods=24, freq="h", tz="America/Chicago"),
+        "point_forecast": [float(i) for i in range(24)],
+        "generation_timestamp": [pd.Timestamp("2023-01-01 07:00", tz="America/Chicago")] * 24,
+        "is_fallback": [False] * 24
+    }).to_parquet(path, index=False)
+
+    from_statistics = scan(path)
+    with unittest.mock.patch("src.backend.storage.index_scanner._metadata_from_statistics", return_value=None):
+        from_columns = scan(path)
+
+    # The index records naive CST wall times, as stored when the forecast was saved
+    assert from_statistics["entry"]["generation_timestamp"] == pd.Timestamp("2023-01-01 07:00")
+    assert from_statistics["entry"] == from_columns["entry"]
+
+
+def test_scan_forecast_file_detects_truncation(tmp_path):
+    """Tests that a truncated file is reported as corrupt"""
+    path = write_forecast(tmp_path / "2023" / "01" / "01_DALMP.parquet")
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+
+    record = scan(path)
+
+    assert record["status"] == SCAN_CORRUPT
+    assert record["entry"] is None
+
+
+def test_scan_forecast_file_skips_invalid_names(tmp_path):
+    """Tests that files with an unknown product are skipped"""
+    path = write_forecast(tmp_path / "2023" / "01" / "01_UNKNOWN.parquet")
+
+    record = scan(path)
+
+    assert record["status"] == SCAN_SKIPPED
+    assert "invalid product" in record["reason"]
+
+
+def test_checkpoint_roundtrip(tmp_path, checkpoint_file):
+    """Tests that checkpointed records are restored and matched against the file on disk"""
+    path = write_forecast(tmp_path / "2023" / "01" / "01_DALMP.parquet")
+    record = scan(path)
+
+    append_rebuild_checkpoint([record])
+    with open(checkpoint_file, "a") as f:
+        f.write('{"file_path": "interrupted')
+
+    records = load_rebuild_checkpoint()
+    restored = records[str(path)]
+    assert restored["entry"] == record["entry"]
+
+    stat = path.stat()
+    assert is_record_current(restored, stat.st_size, stat.st_mtime_ns)
+    assert not is_record_current(restored, stat.st_size + 1, stat.st_mtime_ns)
+
+    clear_rebuild_checkpoint()
+    assert load_rebuild_checkpoint() == {}
@@ -0,0 +1,48 @@
+"""
+Unit tests for the integrity_scrubber module, which verifies the stored forecasts against
+their recorded checksums in the background at a bounded read rate.
+"""
+
+import time  # standard library
+import unittest.mock  # standard library
+import pytest  # pytest: 7.0.0+
+import pandas as pd  # pandas: 2.0.0+
+
+# Internal imports
+from src.backend.storage.checksums import compute_file_checksums
+from src.backend.storage.integrity_scrubber import IORateLimiter, scrub_storage
+
+
+def write_indexed_forecast(path, product):
+    """Writes a forecast file and returns its index entry with checksums"""
+    pd.DataFrame({"point_forecast": [float(i) for i in range(1000)]}).to_parquet(path, index=False)
+    return {"file_path": str(path), "product": product, **compute_file_checksums(path)}
+
+
+def test_scrub_storage_reports_corrupt_files(tmp_path):
+    """Tests that corrupt files are reported and entries without checksums are counted"""
+    good = write_indexed_forecast(tmp_path / "01_DALMP.parquet", "DALMP")
+    bad = write_indexed_forecast(tmp_path / "01_RTLMP.parquet", "RTLMP")
+    data = bytearray((tmp_path / "01_RTLMP.parquet").read_bytes())
+    data[20] ^= 0xFF
+    (tmp_path / "01_RTLMP.parquet").write_bytes(bytes(data))
+    legacy = {"file_path": str(tmp_path / "01_RegUp.parquet"), "product": "RegUp", "checksum": None}
+
+    with unittest.mock.patch("src.backend.storage.integrity_scrubber.load_index",
+                             return_value=pd.DataFrame([good, bad, legacy])):
+        stats = scrub_storage(max_bytes_per_second=0)
+
+    assert stats["files_checked"] == 2
+    assert stats["files_unverified"] == 1
+    assert stats["corrupt_files"] == [bad["file_path"]]
+
+
+def test_io_rate_limiter_bounds_read_rate():
+    """Tests that reads ahead of the rate limit are delayed"""
+    limiter = IORateLimiter(max_bytes_per_second=10000)
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.consume(1000)
+
+    assert time.monotonic() - start == pytest.approx(0.5, abs=0.2)
@@ -0,0 +1,147 @@
+"""
+Unit tests for the pointer_table module, which keeps per-product pointers to the latest
+and latest non-fallback forecasts so they resolve without scanning the index.
+"""
+
+import pytest  # pytest: 7.0.0+
+import pandas as pd  # pandas: 2.0.0+
+from datetime import datetime  # standard library
+import unittest.mock  # standard library
+
+# Internal imports
+from src.backend.storage.pointer_table import (
+    POINTER_LATEST,
+    POINTER_LATEST_NON_FALLBACK,
+    load_pointer_table,
+    save_pointer_table,
+    compute_product_pointers,
+    rebuild_pointer_table,
+    refresh_product_pointers,
+    advance_pointers,
+    get_pointer
+)
+
+
+def make_entry(day: int, product: str = "DALMP", is_fallback: bool = False, generation_day: int = None) -> dict:
+    """Creates an index entry for a forecast of the given January 2023 day"""
+    return {
+        "timestamp": pd.Timestamp(datetime(2023, 1, day)),
+        "product": product,
+        "file_path": f"/forecasts/2023/01/{day:02d}_{product}.parquet",
+        "generation_timestamp": pd.Timestamp(datetime(2023, 1, generation_day or day, 7)),
+        "is_fallback": is_fallback
+    }
+
+
+def make_index(entries: list) -> pd.DataFrame:
+    """Creates an index dataframe from entries"""
+    return pd.DataFrame(entries)
+
+
+@pytest.fixture(autouse=True)
+def pointer_file(tmp_path):
+    """Stores the pointer table in a temporary directory"""
+    path = tmp_path / "latest_pointers.json"
+    with unittest.mock.patch("src.backend.storage.pointer_table.get_pointer_file_path", return_value=path):
+        yield path
+
+
+def test_load_pointer_table_missing(pointer_file):
+    """Tests that a missing table is reported as None"""
+    assert load_pointer_table() is None
+
+
+def test_save_and_load_roundtrip(pointer_file):
+    """Tests that pointers survive a save and load with pandas timestamps"""
+    entry = make_entry(1)
+    assert save_pointer_table({"DALMP": {POINTER_LATEST: entry}})
+
+    loaded = load_pointer_table()["DALMP"][POINTER_LATEST]
+    assert loaded == entry
+    assert not list(pointer_file.parent.glob("*.tmp"))
+
+
+def test_compute_product_pointers():
+    """Tests that pointers are computed from the latest target date"""
+    index_df = make_index([make_entry(1), make_entry(2), make_entry(3, is_fallback=True), make_entry(3, product="RTLMP")])
+
+    pointers = compute_product_pointers(index_df, "DALMP")
+
+    assert pointers[POINTER_LATEST]["timestamp"] == pd.Timestamp(datetime(2023, 1, 3))
+    assert pointers[POINTER_LATEST_NON_FALLBACK]["timestamp"] == pd.Timestamp(datetime(2023, 1, 2))
+
+
+def test_advance_pointers_with_newer_forecasts():
+    """Tests that storing newer forecasts advances only the matching pointers"""
+    rebuild_pointer_table(make_index([make_entry(1)]))
+
+    advance_pointers(make_entry(2), make_index([make_entry(1), make_entry(2)]))
+    assert get_pointer("DALMP")["timestamp"] == pd.Timestamp(datetime(2023, 1, 2))
+
+    advance_pointers(make_entry(3, is_fallback=True), make_index([make_entry(1), make_entry(2), make_entry(3, is_fallback=True)]))
+    assert get_pointer("DALMP", POINTER_LATEST)["is_fallback"]
+    assert get_pointer("DALMP", POINTER_LATEST_NON_FALLBACK)["timestamp"] == pd.Timestamp(datetime(2023, 1, 2))
+
+
+def test_advance_pointers_ignores_older_forecasts():
+    """Tests that backfilling an older forecast does not move the latest pointer"""
+    rebuild_pointer_table(make_index([make_entry(5)]))
+
+    advance_pointers(make_entry(1), make_index([make_entry(5), make_entry(1)]))
+
+    assert get_pointer("DALMP")["timestamp"] == pd.Timestamp(datetime(2023, 1, 5))
+
+
+def test_backfilled_forecasts_do_not_move_latest():
+    """Tests that a past date generated after the current forecast (a backfill) is not the latest"""
+    current = make_entry(5)
+    backfilled = make_entry(1, generation_day=6)
+    rebuild_pointer_table(make_index([current]))
+
+    advance_pointers(backfilled, make_index([current, backfilled]))
+    assert get_pointer("DALMP")["timestamp"] == pd.Timestamp(datetime(2023, 1, 5))
+
+    pointers = compute_product_pointers(make_index([current, backfilled]), "DALMP")
+    assert pointers[POINTER_LATEST]["timestamp"] == pd.Timestamp(datetime(2023, 1, 5))
+    assert pointers[POINTER_LATEST_NON_FALLBACK]["timestamp"] == pd.Timestamp(datetime(2023, 1, 5))
+
+
+def test_rerun_of_latest_date_replaces_latest():
+    """Tests that a re-run of the latest date (generated later) becomes the latest"""
+    rebuild_pointer_table(make_index([make_entry(5)]))
+    rerun = dict(make_entry(5, generation_day=6), file_path="/forecasts/2023/01/05_DALMP_rerun.parquet")
+
+    advance_pointers(rerun, make_index([rerun]))
+
+    assert get_pointer("DALMP")["file_path"] == rerun["file_path"]
+
+
+def test_advance_pointers_fallback_overwrites_non_fallback():
+    """Tests that a fallback replacing the non-fallback forecast of a day recomputes the pointer"""
+    rebuild_pointer_table(make_index([make_entry(1), make_entry(2)]))
+
+    overwritten = make_entry(2, is_fallback=True, generation_day=3)
+    advance_pointers(overwritten, make_index([make_entry(1), overwritten]))
+
+    assert get_pointer("DALMP", POINTER_LATEST)["is_fallback"]
+    assert get_pointer("DALMP", POINTER_LATEST_NON_FALLBACK)["timestamp"] == pd.Timestamp(datetime(2023, 1, 1))
+
+
+def test_advance_pointers_without_table_rebuilds():
+    """Tests that the table is rebuilt from the index when it does not exist yet"""
+    index_df = make_index([make_entry(1), make_entry(1, product="RTLMP")])
+
+    pointers = advance_pointers(make_entry(1), index_df)
+
+    assert pointers[POINTER_LATEST]["product"] == "DALMP"
+    assert get_pointer("RTLMP") is not None
+
+
+def test_refresh_product_pointers_after_removal():
+    """Tests that removing a product's last forecast drops its pointers"""
+    rebuild_pointer_table(make_index([make_entry(1), make_entry(1, product="RTLMP")]))
+
+    refresh_product_pointers(make_index([make_entry(1, product="RTLMP")]), "DALMP")
+
+    assert get_pointer("DALMP") is None
+    assert get_pointer("RTLMP") is not None
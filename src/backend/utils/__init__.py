@@ -3,80 +3,168 @@ Initialization module for the backend utilities package in the Electricity Marke
 
 Exports commonly used utility functions and classes from the various utility modules,
 providing a centralized access point for utility functionality throughout the application.
+Utility modules are imported lazily on first attribute access so that lightweight callers
+(e.g. the CLI importing only logging utilities) do not load pandas and numpy.
 Follows the functional programming approach specified in the requirements.
 """
 
+import importlib
+import typing
+
 __version__ = "1.0.0"
 
-# Date and Time Utilities
-from .date_utils import (  # version: N/A
-    get_current_time_cst,
-    localize_to_cst,
-    convert_to_utc,
-    get_next_execution_time,
-    get_forecast_start_date,
-    generate_forecast_datetimes,
-    generate_forecast_date_range,
-    format_timestamp,
-    parse_timestamp,
-    shift_timestamps,
-    get_previous_day_date,
-    calculate_date_difference,
-)
+if typing.TYPE_CHECKING:
+    from .date_utils import (
+        get_current_time_cst,
+        localize_to_cst,
+        convert_to_utc,
+        get_next_execution_time,
+        get_forecast_start_date,
+        generate_forecast_datetimes,
+        generate_forecast_date_range,
+        format_timestamp,
+        parse_timestamp,
+        shift_timestamps,
+        get_previous_day_date,
+        calculate_date_difference,
+    )
+    from .file_utils import (
+        ensure_directory_exists,
+        get_forecast_directory,
+        get_forecast_file_path,
+        save_dataframe,
+        load_dataframe,
+        list_forecast_files,
+        get_latest_forecast_file,
+        update_latest_link,
+        clean_old_forecasts,
+    )
+    from .logging_utils import (
+        get_logger,
+        log_execution_time,
+        log_method_execution_time,
+        format_exception,
+        format_dict_for_logging,
+        configure_component_logger,
+        ContextAdapter,
+        ComponentLogger,
+    )
+    from .metrics_utils import (
+        calculate_rmse,
+        calculate_mae,
+        calculate_mape,
+        calculate_r2,
+        calculate_bias,
+        evaluate_forecast_accuracy,
+        compare_forecasts,
+        ForecastEvaluator,
+    )
+    from .validation_utils import (
+        validate_dataframe,
+        ValidationCategory,
+        ValidationOutcome,
+        DataFrameValidator,
+    )
+    from .decorators import (
+        timing_decorator,
+        retry,
+        validate_input,
+        validate_output,
+        log_exceptions,
+        fallback_on_exception,
+        memoize,
+        PerformanceMonitor
+    )
+
+# Mapping of exported names to the utility module that defines them
+_LAZY_IMPORTS = {
+    # Date and Time Utilities
+    "get_current_time_cst": ".date_utils",
+    "localize_to_cst": ".date_utils",
+    "convert_to_utc": ".date_utils",
+    "get_next_execution_time": ".date_utils",
+    "get_forecast_start_date": ".date_utils",
+    "generate_forecast_datetimes": ".date_utils",
+    "generate_forecast_date_range": ".date_utils",
+    "format_timestamp": ".date_utils",
+    "parse_timestamp": ".date_utils",
+    "shift_timestamps": ".date_utils",
+    "get_previous_day_date": ".date_utils",
+    "calculate_date_difference": ".date_utils",
+    # File System Utilities
+    "ensure_directory_exists": ".file_utils",
+    "get_forecast_directory": ".file_utils",
+    "get_forecast_file_path": ".file_utils",
+    "save_dataframe": ".file_utils",
+    "load_dataframe": ".file_utils",
+    "list_forecast_files": ".file_utils",
+    "get_latest_forecast_file": ".file_utils",
+    "update_latest_link": ".file_utils",
+    "clean_old_forecasts": ".file_utils",
+    # Logging Utilities
+    "get_logger": ".logging_utils",
+    "log_execution_time": ".logging_utils",
+    "log_method_execution_time": ".logging_utils",
+    "format_exception": ".logging_utils",
+    "format_dict_for_logging": ".logging_utils",
+    "configure_component_logger": ".logging_utils",
+    "ContextAdapter": ".logging_utils",
+    "ComponentLogger": ".logging_utils",
+    # Metrics Utilities
+    "calculate_rmse": ".metrics_utils",
+    "calculate_mae": ".metrics_utils",
+    "calculate_mape": ".metrics_utils",
+    "calculate_r2": ".metrics_utils",
+    "calculate_bias": ".metrics_utils",
+    "evaluate_forecast_accuracy": ".metrics_utils",
+    "compare_forecasts": ".metrics_utils",
+    "ForecastEvaluator": ".metrics_utils",
+    # Validation Utilities
+    "validate_dataframe": ".validation_utils",
+    "ValidationCategory": ".validation_utils",
+    "ValidationOutcome": ".validation_utils",
+    "DataFrameValidator": ".validation_utils",
+    # Decorators
+    "timing_decorator": ".decorators",
+    "retry": ".decorators",
+    "validate_input": ".decorators",
+    "validate_output": ".decorators",
+    "log_exceptions": ".decorators",
+    "fallback_on_exception": ".decorators",
+    "memoize": ".decorators",
+    "PerformanceMonitor": ".decorators",
+}
 
-# File System Utilities
-from .file_utils import (  # version: N/A
-    ensure_directory_exists,
-    get_forecast_directory,
-    get_forecast_file_path,
-    save_dataframe,
-    load_dataframe,
-    list_forecast_files,
-    get_latest_forecast_file,
-    update_latest_link,
-    clean_old_forecasts,
-)
+__all__ = list(_LAZY_IMPORTS)
 
-# Logging Utilities
-from .logging_utils import (  # version: N/A
-    get_logger,
-    log_execution_time,
-    log_method_execution_time,
-    format_exception,
-    format_dict_for_logging,
-    configure_component_logger,
-    ContextAdapter,
-    ComponentLogger,
-)
 
-# Metrics Utilities
-from .metrics_utils import (  # version: N/A
-    calculate_rmse,
-    calculate_mae,
-    calculate_mape,
-    calculate_r2,
-    calculate_bias,
-    evaluate_forecast_accuracy,
-    compare_forecasts,
-    ForecastEvaluator,
-)
+def __getattr__(name: str) -> typing.Any:
+    """
+    Imports the utility module defining an exported name on first access and caches the attribute.
+    
+    Args:
+        name: Attribute name being looked up on the package
+        
+    Returns:
+        The exported object
+        
+    Raises:
+        AttributeError: If the name is not exported by the package
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Validation Utilities
-from .validation_utils import (  # version: N/A
-    validate_dataframe,
-    ValidationCategory,
-    ValidationOutcome,
-    DataFrameValidator,
-)
 
-# Decorators
-from .decorators import (  # version: N/A
-    timing_decorator,
-    retry,
-    validate_input,
-    validate_output,
-    log_exceptions,
-    fallback_on_exception,
-    memoize,
-    PerformanceMonitor
-)
\ No newline at end of file
+def __dir__() -> typing.List[str]:
+    """
+    Lists module attributes including lazily exported names.
+    
+    Returns:
+        List of attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
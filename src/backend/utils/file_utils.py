@@ -175,7 +175,8 @@ def save_dataframe(
 @log_exceptions
 def load_dataframe(
     file_path: Union[str, pathlib.Path],
-    format: str = DEFAULT_FORMAT
+    format: str = DEFAULT_FORMAT,
+    columns: Optional[List[str]] = None
 ) -> Optional[pd.DataFrame]:
     """
     Loads a pandas DataFrame from a file.
@@ -183,6 +184,7 @@ def load_dataframe(
     Args:
         file_path: Path to the file to load
         format: File format (default: 'parquet')
+        columns: Optional columns to load; parquet files only read these columns from disk
         
     Returns:
         Loaded DataFrame or None if file doesn't exist or format is invalid
@@ -201,9 +203,9 @@ def load_dataframe(
     try:
         # Load in the appropriate format
         if format.lower() == 'parquet':
-            df = pd.read_parquet(path)
+            df = pd.read_parquet(path, columns=columns)
         elif format.lower() == 'csv':
-            df = pd.read_csv(path)
+            df = pd.read_csv(path, usecols=columns)
         else:
             logger.error(f"Unsupported file format: {format}")
             return None
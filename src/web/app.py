@@ -21,6 +21,7 @@ from .layouts.error_page import create_error_layout  # src/web/layouts/error_pag
 from .layouts.loading import create_loading_layout  # src/web/layouts/loading.py
 from .callbacks import register_all_callbacks  # src/web/callbacks/__init__.py
 from .data.forecast_loader import load_latest_forecast  # src/web/data/forecast_loader.py
+from .utils.caching import start_cache_sweeper  # src/web/utils/caching.py
 from .middleware.auth_middleware import AuthMiddleware  # src/web/middleware/auth_middleware.py
 from .middleware.error_middleware import ErrorMiddleware  # src/web/middleware/error_middleware.py
 from .middleware.logging_middleware import LoggingMiddleware  # src/web/middleware/logging_middleware.py
@@ -69,6 +70,10 @@ def initialize_app() -> dash.Dash:
     app.server.config["SERVER_NAME"] = f"{settings.SERVER_HOST}:{settings.SERVER_PORT}"
     app.server.config["ALLOWED_HOSTS"] = settings.ALLOWED_HOSTS
 
+    # Remove expired entries from the in-memory caches in the background
+    if settings.CACHE_ENABLED:
+        start_cache_sweeper()
+
     return app
 
 def load_initial_data() -> dict:
@@ -44,6 +44,7 @@ from ..components.export_panel import (  # src/web/components/export_panel.py
     update_export_panel
 )
 from ..data.forecast_loader import forecast_loader  # src/web/data/forecast_loader.py
+from ..data.data_processor import get_downsample_point_count  # src/web/data/data_processor.py
 from ..config.product_config import DEFAULT_PRODUCT, PRODUCTS  # src/web/config/product_config.py
 from ..utils.date_helpers import (  # src/web/utils/date_helpers.py
     get_default_date_range,
@@ -132,7 +133,8 @@ def register_control_callbacks(app: dash.Dash) -> None:
             forecast_df=forecast_df,
             product_id=selected_product,
             show_uncertainty=show_uncertainty,
-            viewport_size=viewport_data['size']
+            viewport_size=viewport_data['size'],
+            max_points=get_downsample_point_count(viewport_data.get('width'))
         ).figure
         
         # Update probability distribution visualization with new data
@@ -230,7 +232,8 @@ def register_control_callbacks(app: dash.Dash) -> None:
             forecast_df=forecast_df,
             product_id=selected_product,
             show_uncertainty=show_uncertainty,
-            viewport_size=viewport_data['size']
+            viewport_size=viewport_data['size'],
+            max_points=get_downsample_point_count(viewport_data.get('width'))
         ).figure
         
         # Update probability distribution visualization with new data
@@ -316,7 +319,8 @@ def register_control_callbacks(app: dash.Dash) -> None:
             forecast_df=forecast_df,
             product_id=selected_product,
             show_uncertainty=show_uncertainty,
-            viewport_size=viewport_data['size']
+            viewport_size=viewport_data['size'],
+            max_points=get_downsample_point_count(viewport_data.get('width'))
         ).figure
         
         return time_series_figure
@@ -392,7 +396,8 @@ def register_control_callbacks(app: dash.Dash) -> None:
             forecast_df=forecast_df,
             product_id=selected_product,
             show_uncertainty=show_uncertainty,
-            viewport_size=viewport_data['size']
+            viewport_size=viewport_data['size'],
+            max_points=get_downsample_point_count(viewport_data.get('width'))
         ).figure
         
         distribution_figure = update_distribution(
@@ -16,6 +16,7 @@ from ..components.product_comparison import (
     create_product_comparison,
     update_product_comparison,
     load_comparison_data,
+    create_viewport_patch,
     PRODUCT_COMPARISON_GRAPH_ID,
     PRODUCT_SELECTOR_ID,
     ADD_PRODUCT_BUTTON_ID,
@@ -322,25 +323,24 @@ def register_product_comparison_callbacks(app: dash.Dash) -> None:
     @app.callback(
         Output(PRODUCT_COMPARISON_GRAPH_ID, 'figure'),
         Input(VIEWPORT_STORE_ID, 'data'),
-        State('product-comparison-products', 'data'),
-        State('date-range-store', 'data'),
-        State(PRODUCT_COMPARISON_GRAPH_ID, 'figure')
+        State('product-comparison-products', 'data')
     )
-    def update_comparison_on_viewport_change(viewport_size, current_products, date_range, current_figure):
+    def update_comparison_on_viewport_change(viewport_size, current_products):
         """
         Callback to update the comparison when viewport size changes.
         
+        Only the figure layout depends on the viewport, so a layout patch is returned
+        instead of rebuilding and resending the full figure.
+        
         Args:
             viewport_size: New viewport size category
             current_products: List of currently displayed products
-            date_range: Current date range
-            current_figure: Current figure object
             
         Returns:
-            Updated figure with responsive adjustments
+            Layout patch with responsive adjustments
         """
         # Check if we have the needed data
-        if not viewport_size or not current_products or not current_figure:
+        if not viewport_size or not current_products:
             raise PreventUpdate
         
         # Check if this is an actual change in viewport size
@@ -351,44 +351,7 @@ def register_product_comparison_callbacks(app: dash.Dash) -> None:
         logger.info(f"Updating comparison for viewport size: {viewport_size}")
         
         try:
-            # If we just need to adjust layout for the new viewport size
-            from ..utils.plot_helpers import apply_responsive_layout
-            
-            # Apply responsive layout to current figure
-            updated_figure = apply_responsive_layout(current_figure, viewport_size)
-            
-            # If substantial viewport change, we might want to reload data and rebuild figure
-            if current_figure is None:
-                # Extract date range
-                start_date = date_range.get('start_date')
-                end_date = date_range.get('end_date')
-                
-                if not start_date or not end_date:
-                    logger.warning("Invalid date range for viewport update")
-                    start_date = "2023-06-01"  # Default start date
-                    end_date = "2023-06-03"    # Default end date
-                
-                # Load data for all products
-                forecast_dfs = load_comparison_data(
-                    current_products,
-                    start_date,
-                    end_date
-                )
-                
-                # Create updated figure
-                from ..utils.plot_helpers import create_product_comparison_plot
-                
-                # Create the plot figure with new viewport size
-                updated_figure = create_product_comparison_plot(
-                    forecast_dfs=forecast_dfs,
-                    product_ids=current_products,
-                    title="Product Comparison"
-                )
-                
-                # Apply responsive layout
-                updated_figure = apply_responsive_layout(updated_figure, viewport_size)
-            
-            return updated_figure
+            return create_viewport_patch(viewport_size)
         
         except Exception as e:
             logger.error(f"Error updating comparison on viewport change: {str(e)}")
@@ -4,10 +4,13 @@ This module registers callbacks that handle interactions with the time series pl
 """
 import json
 import logging
+from typing import Optional, Tuple
 
 import dash  # version 2.9.0+
 from dash.dependencies import Input, Output, State, ClientsideFunction  # version 2.9.0+
 from dash.exceptions import PreventUpdate  # version 2.9.0+
+from dash import Patch  # version 2.9.0+
+import dash_core_components as dcc  # version 2.0.0+
 import pandas  # version 2.0.0+
 
 from ..components.time_series import TIME_SERIES_GRAPH_ID, UNCERTAINTY_TOGGLE_ID, update_time_series, handle_viewport_change  # src/web/components/time_series.py
@@ -15,8 +18,12 @@ from ..components.probability_distribution import DISTRIBUTION_GRAPH_ID, update_
 from ..layouts.responsive import VIEWPORT_STORE_ID  # src/web/layouts/responsive.py
 from ..utils.plot_helpers import extract_timestamp_from_click  # src/web/utils/plot_helpers.py
 from ..data.forecast_loader import forecast_loader  # src/web/data/forecast_loader.py
+from ..data.data_processor import get_downsample_point_count  # src/web/data/data_processor.py
 from ..config.logging_config import get_logger  # src/web/config/logging_config.py
 from ..callbacks.visualization_callbacks import DASHBOARD_STATE_STORE_ID  # src/web/callbacks/visualization_callbacks.py
+from ..components.control_panel import PRODUCT_DROPDOWN_ID, DATE_RANGE_PICKER_ID, VISUALIZATION_OPTIONS_ID  # src/web/components/control_panel.py
+from ..config.product_config import DEFAULT_PRODUCT  # src/web/config/product_config.py
+from ..utils.date_helpers import parse_date, get_default_date_range  # src/web/utils/date_helpers.py
 
 # Initialize logger
 logger = get_logger('time_series_callbacks')
@@ -67,12 +74,69 @@ def register_time_series_callbacks(app: dash.Dash):
             forecast_df=forecast_df,
             product_id=product_id,
             show_uncertainty=show_uncertainty,
-            viewport_size=viewport_size['size'] if viewport_size else 'desktop'
+            viewport_size=viewport_size['size'] if viewport_size else 'desktop',
+            max_points=get_downsample_point_count(viewport_size.get('width') if viewport_size else None)
         )
 
         # Return the updated time series figure
         return updated_time_series.figure
 
+    # Register callback for loading higher resolution data when zooming the time series
+    @dash.callback(
+        Output(TIME_SERIES_GRAPH_ID, 'figure', allow_duplicate=True),
+        Input(TIME_SERIES_GRAPH_ID, 'relayoutData'),
+        State(PRODUCT_DROPDOWN_ID, 'value'),
+        State(DATE_RANGE_PICKER_ID, 'value'),
+        State(VISUALIZATION_OPTIONS_ID, 'value'),
+        State(VIEWPORT_STORE_ID, 'data'),
+        prevent_initial_call=True
+    )
+    def handle_time_series_zoom(relayout_data, product_id, date_range, visualization_options, viewport_size):
+        """
+        Callback function that re-renders the time series for the zoomed time window
+
+        The initial plot is downsampled to the viewport width, so zooming in re-selects the
+        points inside the new x-axis range at the same point budget, reaching full resolution
+        once the window is small enough. Resetting the zoom restores the downsampled full range.
+        Only the control values are sent with the event; the forecast is reloaded server-side.
+
+        Args:
+            relayout_data (dict): Relayout event data from the time series plot
+            product_id (str): The selected product
+            date_range (list): The selected [start, end] date range
+            visualization_options (list): The selected visualization options
+            viewport_size (dict): The current viewport size information
+
+        Returns:
+            Patch: Partial figure update replacing the traces
+        """
+        zoom_range = extract_zoom_range(relayout_data)
+        if zoom_range is None:
+            raise PreventUpdate
+
+        product_id = product_id or DEFAULT_PRODUCT
+        forecast_df = load_zoom_window(product_id, date_range, zoom_range)
+        if forecast_df is None:
+            raise PreventUpdate
+
+        start, end = zoom_range
+        if start is not None and end is not None:
+            logger.info(f"Time series zoomed to {start} - {end}")
+
+        updated_time_series = update_time_series(
+            graph_component=dcc.Graph(id=TIME_SERIES_GRAPH_ID),
+            forecast_df=forecast_df,
+            product_id=product_id,
+            show_uncertainty='uncertainty' in (visualization_options or []),
+            viewport_size=viewport_size['size'] if viewport_size else 'desktop',
+            max_points=get_downsample_point_count(viewport_size.get('width') if viewport_size else None)
+        )
+
+        # Replace only the traces; the user's zoom is kept in the layout
+        patch = Patch()
+        patch['data'] = updated_time_series.figure.to_dict()['data']
+        return patch
+
     # Register callback for handling time series click events
     @dash.callback(
         Output(DISTRIBUTION_GRAPH_ID, 'figure'),
@@ -187,6 +251,77 @@ def register_clientside_callbacks(app: dash.Dash):
     logger.info("Registered client-side callbacks")
 
 
+def load_zoom_window(
+    product_id: str,
+    date_range: Optional[list],
+    zoom_range: Tuple[Optional[pandas.Timestamp], Optional[pandas.Timestamp]]
+) -> Optional[pandas.DataFrame]:
+    """
+    Loads the forecast of the selected date range and selects the zoomed time window
+
+    The forecast is loaded through forecast_loader, whose cached day segments already hold
+    the selected range, so zooming does not require the browser to send the forecast data.
+
+    Args:
+        product_id (str): The selected product
+        date_range (list): The selected [start, end] date range, None for the default range
+        zoom_range (Tuple): (start, end) timestamps of the zoom, (None, None) for the full range
+
+    Returns:
+        Optional[pandas.DataFrame]: Forecast points inside the window, or None if there are none
+    """
+    # Resolve the date range as the dashboard state does
+    if date_range is None or any(d is None for d in date_range):
+        start_date, end_date = get_default_date_range()
+    else:
+        start_date, end_date = parse_date(date_range[0]), parse_date(date_range[1])
+
+    forecast_df = forecast_loader.load_forecast_by_date_range(product_id, start_date, end_date)
+    if forecast_df is None or forecast_df.empty:
+        return None
+
+    start, end = zoom_range
+    if start is not None and end is not None:
+        timestamps = pandas.to_datetime(forecast_df['timestamp'])
+        if timestamps.dt.tz is not None:
+            # Plotly reports the zoom as wall times of the plotted timestamps
+            start, end = start.tz_localize(timestamps.dt.tz), end.tz_localize(timestamps.dt.tz)
+        forecast_df = forecast_df[(timestamps >= start) & (timestamps <= end)]
+
+    return None if forecast_df.empty else forecast_df
+
+
+def extract_zoom_range(relayout_data: dict) -> Optional[Tuple[Optional[pandas.Timestamp], Optional[pandas.Timestamp]]]:
+    """
+    Extracts the x-axis range from a Plotly relayout event
+
+    Args:
+        relayout_data (dict): Relayout event data from the time series plot
+
+    Returns:
+        Optional[Tuple]: (start, end) timestamps for a zoom, (None, None) when the zoom is
+            reset, or None if the event does not change the x-axis range
+    """
+    if not relayout_data:
+        return None
+
+    if relayout_data.get('xaxis.autorange'):
+        return None, None
+
+    if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
+        x_range = [relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]']]
+    elif 'xaxis.range' in relayout_data:
+        x_range = relayout_data['xaxis.range']
+    else:
+        return None
+
+    try:
+        return pandas.Timestamp(x_range[0]), pandas.Timestamp(x_range[1])
+    except (ValueError, TypeError, IndexError):
+        logger.warning(f"Invalid zoom range in relayout data: {relayout_data}")
+        return None
+
+
 def sync_hover_data(hover_data: dict) -> dict:
     """
     Client-side callback function that synchronizes hover data between visualizations
@@ -14,10 +14,10 @@ import dash_core_components as dcc  # version 2.0.0+
 import dash_html_components as html  # version 2.0.0+
 import pandas  # version 2.0.0+
 
-from ..components.time_series import TIME_SERIES_GRAPH_ID, handle_viewport_change as handle_time_series_viewport_change  # src/web/components/time_series.py
-from ..components.probability_distribution import DISTRIBUTION_GRAPH_ID, handle_viewport_change as handle_distribution_viewport_change  # src/web/components/probability_distribution.py
+from ..components.time_series import TIME_SERIES_GRAPH_ID, create_viewport_patch as create_time_series_viewport_patch  # src/web/components/time_series.py
+from ..components.probability_distribution import DISTRIBUTION_GRAPH_ID, create_viewport_patch as create_distribution_viewport_patch  # src/web/components/probability_distribution.py
 from ..components.forecast_table import FORECAST_TABLE_ID, handle_viewport_change as handle_table_viewport_change  # src/web/components/forecast_table.py
-from ..components.product_comparison import PRODUCT_COMPARISON_GRAPH_ID, handle_viewport_change as handle_comparison_viewport_change  # src/web/components/product_comparison.py
+from ..components.product_comparison import PRODUCT_COMPARISON_GRAPH_ID, create_viewport_patch as create_comparison_viewport_patch  # src/web/components/product_comparison.py
 from ..layouts.responsive import VIEWPORT_STORE_ID  # src/web/layouts/responsive.py
 from ..components.control_panel import PRODUCT_DROPDOWN_ID, DATE_RANGE_PICKER_ID, VISUALIZATION_OPTIONS_ID  # src/web/components/control_panel.py
 from ..data.forecast_loader import forecast_loader  # src/web/data/forecast_loader.py
@@ -141,28 +141,20 @@ def register_coordinated_viewport_callback(app: dash.Dash):
         Output(FORECAST_TABLE_ID, 'style'),
         Output(PRODUCT_COMPARISON_GRAPH_ID, 'figure'),
         Input(VIEWPORT_STORE_ID, 'data'),
-        State(TIME_SERIES_GRAPH_ID, 'figure'),
-        State(DISTRIBUTION_GRAPH_ID, 'figure'),
-        State(FORECAST_TABLE_ID, 'style'),
-        State(PRODUCT_COMPARISON_GRAPH_ID, 'figure')
+        State(FORECAST_TABLE_ID, 'style')
     )
-    def handle_coordinated_viewport_change(viewport_size, time_series_figure, distribution_figure, forecast_table_style, comparison_figure):
+    def handle_coordinated_viewport_change(viewport_size, forecast_table_style):
         """
         Callback function that coordinates viewport changes across all visualization components
+
+        Figures are updated with layout-only patches, so the browser keeps its traces and only
+        the changed layout properties are serialized and sent.
         """
         logger.info(f"Viewport size changed: {viewport_size}")
 
-        # Update time series visualization for new viewport
-        updated_time_series = handle_time_series_viewport_change(
-            graph_component=dcc.Graph(id=TIME_SERIES_GRAPH_ID, figure=time_series_figure),
-            new_viewport_size=viewport_size['size']
-        )
-
-        # Update distribution visualization for new viewport
-        updated_distribution = handle_distribution_viewport_change(
-            graph_component=dcc.Graph(id=DISTRIBUTION_GRAPH_ID, figure=distribution_figure),
-            new_viewport_size=viewport_size['size']
-        )
+        # Resize time series and distribution visualizations for new viewport
+        time_series_patch = create_time_series_viewport_patch(viewport_size['size'])
+        distribution_patch = create_distribution_viewport_patch(viewport_size['size'])
 
         # Update forecast table styles for new viewport
         updated_table_style = handle_table_viewport_change(
@@ -170,17 +162,14 @@ def register_coordinated_viewport_callback(app: dash.Dash):
             new_viewport_size=viewport_size['size']
         )
 
-        # Update product comparison visualization for new viewport
-        updated_comparison = handle_comparison_viewport_change(
-            graph_component=dcc.Graph(id=PRODUCT_COMPARISON_GRAPH_ID, figure=comparison_figure),
-            new_viewport_size=viewport_size['size']
-        )
+        # Resize product comparison visualization for new viewport
+        comparison_patch = create_comparison_viewport_patch(viewport_size['size'])
 
         return (
-            updated_time_series.figure,
-            updated_distribution.figure,
+            time_series_patch,
+            distribution_patch,
             updated_table_style.style,
-            updated_comparison.figure
+            comparison_patch
         )
 
 
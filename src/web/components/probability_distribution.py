@@ -11,12 +11,14 @@ import dash_core_components as dcc  # version: 2.9.0+
 import dash_html_components as html  # version: 2.9.0+
 import pandas as pd  # version: 2.0.0+
 import plotly.graph_objects as go  # version: 5.14.0+
+from dash import Patch  # version: 2.9.0+
 import logging  # standard library
 
 from ..utils.plot_helpers import (
     create_probability_distribution_plot,
     apply_responsive_layout,
-    add_fallback_indicator
+    add_fallback_indicator,
+    create_layout_patch
 )
 from ..config.dashboard_config import get_distribution_config
 from ..config.themes import DEFAULT_THEME, CHART_CONFIG
@@ -330,6 +332,20 @@ def handle_viewport_change(
         return graph_component
 
 
+def create_viewport_patch(new_viewport_size: str) -> Patch:
+    """
+    Creates a layout-only update of the displayed distribution for a new viewport size.
+    
+    Args:
+        new_viewport_size: New viewport size category
+        
+    Returns:
+        Dash Patch resizing the figure without resending its traces
+    """
+    config = get_distribution_config(new_viewport_size)
+    return create_layout_patch(new_viewport_size, config['height'])
+
+
 def create_empty_distribution(
     message: str,
     viewport_size: Optional[str] = None
@@ -7,6 +7,7 @@ with appropriate styling and interactive features.
 import dash_core_components as dcc
 import dash_html_components as html
 import dash_bootstrap_components as dbc
+from dash import Patch
 import pandas as pd
 import logging
 from typing import Dict, List, Optional, Union
@@ -14,7 +15,8 @@ from typing import Dict, List, Optional, Union
 from ..utils.plot_helpers import (
     create_product_comparison_plot,
     add_fallback_indicator,
-    apply_responsive_layout
+    apply_responsive_layout,
+    create_layout_patch
 )
 from ..config.product_config import (
     PRODUCT_COMPARISON_DEFAULTS,
@@ -23,7 +25,7 @@ from ..config.product_config import (
     get_product_color,
     get_product_line_style
 )
-from ..data.forecast_loader import load_forecast_by_date_range
+from ..data.forecast_loader import load_forecasts_for_products
 from ..utils.error_handlers import is_fallback_data, handle_data_loading_error
 
 # Set up logger for this component
@@ -187,6 +189,19 @@ def create_product_comparison_graph(
         }
     )
 
+def create_viewport_patch(viewport_size: str) -> Patch:
+    """
+    Creates a layout-only update of the displayed comparison for a new viewport size.
+    
+    Args:
+        viewport_size: New viewport size category
+        
+    Returns:
+        Dash Patch resizing the figure without resending its traces
+    """
+    return create_layout_patch(viewport_size, DEFAULT_GRAPH_HEIGHT)
+
+
 def update_product_comparison(
     graph_component: dcc.Graph,
     forecast_dfs: Dict[str, pd.DataFrame],
@@ -293,23 +308,12 @@ def load_comparison_data(
     """
     logger.info(f"Loading comparison data for products: {', '.join(product_ids)}")
     
-    # Initialize dictionary to store dataframes
-    forecast_dfs = {}
-    
-    # Load data for each product
-    for product_id in product_ids:
-        try:
-            df = load_forecast_by_date_range(
-                product=product_id,
-                start_date=start_date,
-                end_date=end_date
-            )
-            forecast_dfs[product_id] = df
-        except Exception as e:
-            logger.error(f"Error loading data for product {product_id}: {str(e)}")
-            handle_data_loading_error(e, f"loading forecast data for {product_id}")
-    
-    return forecast_dfs
+    # Load all products concurrently, aligned on a shared time axis
+    return load_forecasts_for_products(
+        products=product_ids,
+        start_date=start_date,
+        end_date=end_date
+    )
 
 def check_any_fallback_data(forecast_dfs: Dict[str, pd.DataFrame]) -> bool:
     """
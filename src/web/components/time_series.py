@@ -12,18 +12,21 @@ import dash_core_components as dcc
 import dash_html_components as html
 import plotly.graph_objects as go
 import pandas as pd
+from dash import Patch
 
 from ..utils.plot_helpers import (
     create_time_series_plot,
     add_uncertainty_bands,
     apply_responsive_layout,
-    add_fallback_indicator
+    add_fallback_indicator,
+    create_layout_patch
 )
 from ..utils.error_handlers import is_fallback_data
 from ..config.dashboard_config import get_time_series_config
 from ..config.themes import DEFAULT_THEME, CHART_CONFIG
 from ..config.product_config import get_product_display_name, DEFAULT_PRODUCT
 from ..data.forecast_loader import extract_forecast_percentiles
+from ..data.data_processor import downsample_time_series
 
 # Global constants
 TIME_SERIES_GRAPH_ID = "time-series-graph"
@@ -39,7 +42,8 @@ def create_time_series_component(
     product_id: str = None,
     viewport_size: Optional[str] = None,
     show_uncertainty: Optional[bool] = None,
-    theme: Optional[str] = None
+    theme: Optional[str] = None,
+    max_points: Optional[int] = None
 ) -> dcc.Graph:
     """
     Creates a Dash component containing the time series visualization.
@@ -50,6 +54,8 @@ def create_time_series_component(
         viewport_size: Viewport size category (mobile, tablet, desktop)
         show_uncertainty: Whether to show uncertainty bands
         theme: Theme name for styling
+        max_points: Maximum number of points to plot (see get_downsample_point_count);
+            None plots every point
         
     Returns:
         Dash Graph component with time series visualization
@@ -76,6 +82,9 @@ def create_time_series_component(
         # Create title using product display name
         title = f"{get_product_display_name(product_id)} Price Forecast"
         
+        # Reduce long ranges to the resolution the plot can display
+        forecast_df = downsample_time_series(forecast_df, max_points)
+        
         # Create time series plot
         fig = create_time_series_plot(forecast_df, product_id, title, theme)
         
@@ -108,7 +117,8 @@ def update_time_series(
     product_id: str,
     show_uncertainty: Optional[bool] = None,
     viewport_size: Optional[str] = None,
-    theme: Optional[str] = None
+    theme: Optional[str] = None,
+    max_points: Optional[int] = None
 ) -> dcc.Graph:
     """
     Updates an existing time series visualization with new data or options.
@@ -120,6 +130,7 @@ def update_time_series(
         show_uncertainty: Whether to show uncertainty bands
         viewport_size: Viewport size category
         theme: Theme name for styling
+        max_points: Maximum number of points to plot, or None to plot every point
         
     Returns:
         Updated Graph component
@@ -154,6 +165,9 @@ def update_time_series(
         # Create title using product display name
         title = f"{get_product_display_name(product_id)} Price Forecast"
         
+        # Reduce long ranges to the resolution the plot can display
+        forecast_df = downsample_time_series(forecast_df, max_points)
+        
         # Create new time series plot
         fig = create_time_series_plot(forecast_df, product_id, title, theme)
         
@@ -320,6 +334,20 @@ def handle_viewport_change(
         return graph_component
 
 
+def create_viewport_patch(new_viewport_size: str) -> Patch:
+    """
+    Creates a layout-only update of the displayed time series for a new viewport size.
+    
+    Args:
+        new_viewport_size: New viewport size category
+        
+    Returns:
+        Dash Patch resizing the figure without resending its traces
+    """
+    config = get_time_series_config(new_viewport_size)
+    return create_layout_patch(new_viewport_size, config['height'])
+
+
 def create_empty_time_series(
     message: str,
     viewport_size: Optional[str] = None
@@ -55,6 +55,23 @@ ENABLE_RESPONSIVE_UI = os.getenv('ENABLE_RESPONSIVE_UI', 'True').lower() in ('tr
 CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'True').lower() in ('true', '1', 't')
 CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', 300))
 CACHE_DIR = os.path.join(BASE_DIR, 'cache')
+# Per-cache bounds for the in-memory caches (entries and estimated memory in megabytes)
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 1024))
+CACHE_MAX_MEMORY_MB = int(os.getenv('CACHE_MAX_MEMORY_MB', 256))
+# Interval in seconds between background sweeps of expired cache entries
+CACHE_SWEEP_INTERVAL_SECONDS = int(os.getenv('CACHE_SWEEP_INTERVAL_SECONDS', 60))
+
+# Shared cache tier read by all dashboard workers on a host (Arrow IPC files, RAM-backed when /dev/shm exists)
+SHARED_CACHE_ENABLED = os.getenv('SHARED_CACHE_ENABLED', 'True').lower() in ('true', '1', 't')
+SHARED_CACHE_DIR = os.getenv(
+    'SHARED_CACHE_DIR',
+    '/dev/shm/forecast-dashboard-cache' if os.path.isdir('/dev/shm') else os.path.join(CACHE_DIR, 'shared')
+)
+# Maximum seconds a worker waits for another worker's in-flight fetch of the same key
+SHARED_CACHE_LOCK_TIMEOUT_SECONDS = int(os.getenv('SHARED_CACHE_LOCK_TIMEOUT_SECONDS', 60))
+
+# Maximum number of products loaded concurrently for the product comparison view
+COMPARISON_MAX_WORKERS = int(os.getenv('COMPARISON_MAX_WORKERS', 4))
 
 # Server configuration
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
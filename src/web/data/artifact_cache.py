@@ -0,0 +1,165 @@
+"""
+Derived-artifact cache for visualization-ready forecast data.
+
+Preparing forecasts for display (percentile bands from the sample columns, formatted
+time series, distribution and table payloads) is repeated on every dashboard update even
+when the underlying forecast is unchanged. This module memoizes those transformations keyed
+by (transformation, source data version, parameters). The data version is derived from the
+forecast's generation timestamps, so a newly generated forecast produces new keys and
+previously prepared artifacts are never served for it; superseded artifacts age out of the
+bounded cache.
+"""
+
+import functools
+import hashlib
+import logging
+from typing import Any, Callable, Dict, TypeVar, Union, cast
+
+import pandas as pd  # version 2.0.0+
+
+from ..config.settings import CACHE_ENABLED
+from ..utils.caching import BoundedCache
+
+# Set up module logger
+logger = logging.getLogger(__name__)
+
+# Type variable for function return values
+T = TypeVar('T')
+
+# Prepared artifacts are immutable for a given data version, so entries have no timeout
+_artifact_cache = BoundedCache(name='artifacts', default_timeout=None)
+
+
+def get_data_version(df: pd.DataFrame) -> str:
+    """
+    Computes the version of a forecast dataframe used in artifact cache keys.
+
+    Forecasts with a generation_timestamp column are versioned by their products, generation
+    timestamps and covered hours, so the version changes whenever a forecast is regenerated.
+    Dataframes without it (e.g. frames already prepared for visualization) are versioned by
+    a hash of their contents.
+
+    Args:
+        df: Forecast dataframe
+
+    Returns:
+        Version string
+    """
+    if df.empty:
+        return f"empty:{','.join(map(str, df.columns))}"
+
+    if 'generation_timestamp' in df.columns and 'timestamp' in df.columns:
+        generation = pd.to_datetime(df['generation_timestamp'])
+        products = sorted(df['product'].astype(str).unique()) if 'product' in df.columns else []
+        components = [
+            ','.join(products),
+            generation.min().isoformat(),
+            generation.max().isoformat(),
+            pd.Timestamp(df['timestamp'].min()).isoformat(),
+            pd.Timestamp(df['timestamp'].max()).isoformat(),
+            str(len(df)),
+            str(len(df.columns)),
+        ]
+        return 'gen:' + '|'.join(components)
+
+    content_hash = pd.util.hash_pandas_object(df, index=True).sum()
+    return f"hash:{len(df)}:{len(df.columns)}:{int(content_hash)}"
+
+
+def _make_hashable(value: Any) -> Any:
+    """
+    Converts list arguments (e.g. percentiles) to tuples so they can be part of a key.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(item) for item in value)
+    return value
+
+
+def generate_artifact_key(transformation: str, df: pd.DataFrame, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """
+    Generates the cache key for a derived artifact.
+
+    Args:
+        transformation: Name of the transformation producing the artifact
+        df: Source forecast dataframe
+        args: Additional positional arguments of the transformation
+        kwargs: Keyword arguments of the transformation
+
+    Returns:
+        Cache key
+    """
+    params = (
+        tuple(_make_hashable(arg) for arg in args),
+        tuple(sorted((name, _make_hashable(value)) for name, value in kwargs.items())),
+    )
+    key_string = f"{transformation}:{get_data_version(df)}:{params!r}"
+    return hashlib.md5(key_string.encode()).hexdigest()
+
+
+def _copy_artifact(value: T) -> T:
+    """
+    Returns a copy of a dataframe artifact so callers cannot mutate the cached one.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return cast(T, value.copy())
+    return value
+
+
+def cache_derived_artifact(transformation: str) -> Callable:
+    """
+    Decorator that memoizes a transformation of a forecast dataframe.
+
+    The decorated function must take the source dataframe as its first argument. Results
+    are cached per (transformation, data version, remaining arguments) and returned as
+    copies, so callers may modify them freely.
+
+    Args:
+        transformation: Name identifying the transformation in cache keys
+
+    Returns:
+        Decorator adding artifact caching to the function
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(df: pd.DataFrame, *args: Any, **kwargs: Any) -> T:
+            if not CACHE_ENABLED or not isinstance(df, pd.DataFrame):
+                return func(df, *args, **kwargs)
+
+            try:
+                key = generate_artifact_key(transformation, df, args, kwargs)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Not caching {transformation} artifact: {e}")
+                return func(df, *args, **kwargs)
+
+            cached = _artifact_cache.get(key)
+            if cached is not None:
+                logger.debug(f"Artifact cache hit for {transformation}")
+                return _copy_artifact(cached)
+
+            result = func(df, *args, **kwargs)
+            _artifact_cache.set(key, _copy_artifact(result))
+            return result
+        return wrapper
+    return decorator
+
+
+def clear_artifact_cache() -> int:
+    """
+    Clears all cached artifacts.
+
+    Returns:
+        Number of artifacts cleared
+    """
+    count = _artifact_cache.clear()
+    logger.info(f"Cleared {count} cached artifacts")
+    return count
+
+
+def get_artifact_cache_stats() -> Dict[str, Union[int, float]]:
+    """
+    Returns statistics about the artifact cache usage.
+
+    Returns:
+        Dictionary containing hit, miss and eviction counts and memory use
+    """
+    return _artifact_cache.get_stats()
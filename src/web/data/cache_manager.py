@@ -10,20 +10,28 @@ import datetime
 import logging
 import hashlib
 import functools
-from typing import Dict, Optional, Any, Union, List, Tuple
+from typing import Callable, Dict, Optional, Any, Union, List, Tuple
 
 from ..config.settings import CACHE_ENABLED, CACHE_TIMEOUT
 from .schema import validate_forecast_dataframe
-from ..utils.caching import CacheManager
+from ..utils.caching import BoundedCache, CacheManager
 
 # Set up module logger
 logger = logging.getLogger(__name__)
 
-# Global cache storage for forecasts
-_forecast_cache = {}
-_forecast_cache_metadata = {}
-_cache_hits = 0
-_cache_misses = 0
+
+def _now() -> float:
+    """
+    Returns the current time used for forecast cache expiry, as a POSIX timestamp.
+    """
+    return datetime.datetime.now().timestamp()
+
+
+# Global cache storage for forecasts (bounded, LRU + TTL eviction)
+_forecast_cache = BoundedCache(name='forecast', clock=_now)
+
+# Column used to assign forecast rows to day segments in the range cache (the target time)
+SEGMENT_DAY_COLUMN = 'timestamp'
 
 def generate_forecast_cache_key(product: str, 
                                 date: Optional[Union[str, datetime.date, datetime.datetime]] = None,
@@ -83,8 +91,6 @@ def cache_forecast(key: str, forecast_df: pd.DataFrame, timeout: Optional[int] =
     Returns:
         True if caching was successful, False otherwise
     """
-    global _forecast_cache, _forecast_cache_metadata
-    
     # Check if caching is enabled
     if not CACHE_ENABLED:
         logger.debug("Caching is disabled, not storing forecast")
@@ -96,17 +102,16 @@ def cache_forecast(key: str, forecast_df: pd.DataFrame, timeout: Optional[int] =
         logger.error(f"Invalid forecast dataframe: {errors}")
         return False
     
-    # Store the dataframe in the cache
-    _forecast_cache[key] = forecast_df
-    
-    # Create metadata with timestamp and other info
-    _forecast_cache_metadata[key] = {
-        'timestamp': datetime.datetime.now(),
-        'timeout': timeout,
+    # Metadata used for per-product clearing and stats
+    metadata = {
         'product': forecast_df['product'].iloc[0] if 'product' in forecast_df.columns and len(forecast_df) > 0 else 'unknown',
         'rows': len(forecast_df)
     }
     
+    # Store the dataframe in the cache, evicting least recently used forecasts if needed
+    if not _forecast_cache.set(key, forecast_df, timeout, metadata):
+        return False
+    
     logger.info(f"Cached forecast with key {key}: {len(forecast_df)} rows")
     return True
 
@@ -120,34 +125,18 @@ def get_cached_forecast(key: str) -> Optional[pd.DataFrame]:
     Returns:
         Cached forecast dataframe or None if not found or expired
     """
-    global _forecast_cache, _forecast_cache_metadata, _cache_hits, _cache_misses
-    
     # Check if caching is enabled
     if not CACHE_ENABLED:
         logger.debug("Caching is disabled, not retrieving from cache")
         return None
     
-    # Check if the key exists in the cache
-    if key not in _forecast_cache:
-        _cache_misses += 1
+    forecast_df = _forecast_cache.get(key)
+    if forecast_df is None:
         logger.debug(f"Cache miss for key {key}")
-        return None
-    
-    # Check if the cache entry is still valid
-    if not is_forecast_cache_valid(key):
-        _cache_misses += 1
-        logger.debug(f"Cache expired for key {key}")
-        
-        # Remove expired cache entry
-        del _forecast_cache[key]
-        del _forecast_cache_metadata[key]
-        return None
-    
-    # We have a valid cache hit
-    _cache_hits += 1
-    logger.debug(f"Cache hit for key {key}")
+    else:
+        logger.debug(f"Cache hit for key {key}")
     
-    return _forecast_cache[key]
+    return forecast_df
 
 def clear_forecast_cache(product: Optional[str] = None) -> int:
     """
@@ -159,34 +148,17 @@ def clear_forecast_cache(product: Optional[str] = None) -> int:
     Returns:
         Number of cache entries cleared
     """
-    global _forecast_cache, _forecast_cache_metadata, _cache_hits, _cache_misses
-    
     count = 0
     
     if product is None:
         # Clear all cache
-        count = len(_forecast_cache)
-        _forecast_cache = {}
-        _forecast_cache_metadata = {}
-        _cache_hits = 0
-        _cache_misses = 0
+        count = _forecast_cache.clear()
         logger.info(f"Cleared all forecast cache entries ({count} items)")
     else:
         # Clear only the entries for the specified product
-        keys_to_remove = []
-        
-        # Find all keys for the specified product
-        for key, metadata in _forecast_cache_metadata.items():
-            if metadata.get('product') == product:
-                keys_to_remove.append(key)
-        
-        # Remove the keys
-        for key in keys_to_remove:
-            if key in _forecast_cache:
-                del _forecast_cache[key]
-            if key in _forecast_cache_metadata:
-                del _forecast_cache_metadata[key]
-            count += 1
+        for key, metadata in _forecast_cache.get_metadata().items():
+            if metadata.get('product') == product and _forecast_cache.invalidate(key):
+                count += 1
         
         logger.info(f"Cleared forecast cache for product {product} ({count} items)")
     
@@ -199,34 +171,17 @@ def get_forecast_cache_stats() -> dict:
     Returns:
         Dictionary containing cache statistics
     """
-    global _forecast_cache, _forecast_cache_metadata, _cache_hits, _cache_misses
-    
-    # Count the number of entries in the cache
-    entry_count = len(_forecast_cache)
-    
-    # Calculate the total size of cached forecasts (approximate)
-    total_rows = sum(metadata.get('rows', 0) for metadata in _forecast_cache_metadata.values())
-    
-    # Count the number of expired entries
-    expired_count = sum(1 for key in _forecast_cache_metadata if not is_forecast_cache_valid(key))
-    
-    # Calculate hit rate
-    total_requests = _cache_hits + _cache_misses
-    hit_rate = (_cache_hits / total_requests * 100) if total_requests > 0 else 0
+    metadata_by_key = _forecast_cache.get_metadata()
     
     # Count entries by product
     products = {}
-    for metadata in _forecast_cache_metadata.values():
+    for metadata in metadata_by_key.values():
         product = metadata.get('product', 'unknown')
         products[product] = products.get(product, 0) + 1
     
     return {
-        'entry_count': entry_count,
-        'total_rows': total_rows,
-        'expired_count': expired_count,
-        'hit_count': _cache_hits,
-        'miss_count': _cache_misses,
-        'hit_rate': hit_rate,
+        **_forecast_cache.get_stats(),
+        'total_rows': sum(metadata.get('rows', 0) for metadata in metadata_by_key.values()),
         'products': products
     }
 
@@ -240,33 +195,11 @@ def is_forecast_cache_valid(key: str) -> bool:
     Returns:
         True if cache is valid, False otherwise
     """
-    global _forecast_cache_metadata
-    
     # Check if caching is enabled
     if not CACHE_ENABLED:
         return False
     
-    # Check if the key exists in the metadata
-    if key not in _forecast_cache_metadata:
-        return False
-    
-    # Get the timestamp and timeout from metadata
-    metadata = _forecast_cache_metadata[key]
-    timestamp = metadata.get('timestamp')
-    timeout = metadata.get('timeout')
-    
-    if timestamp is None:
-        return False
-    
-    # Calculate the age of the cache entry
-    now = datetime.datetime.now()
-    age = (now - timestamp).total_seconds()
-    
-    # Use the specified timeout or the default
-    cache_timeout = timeout if timeout is not None else CACHE_TIMEOUT
-    
-    # Return True if the entry is still valid (age < timeout)
-    return age < cache_timeout
+    return _forecast_cache.is_valid(key)
 
 def cache_forecast_decorator(timeout: Optional[int] = None):
     """
@@ -312,6 +245,288 @@ def cache_forecast_decorator(timeout: Optional[int] = None):
         return wrapper
     return decorator
 
+def to_forecast_day(value: Union[str, datetime.date, datetime.datetime]) -> datetime.date:
+    """
+    Normalizes a date-like value to the calendar day used as a segment key.
+    
+    Args:
+        value: Date string, date or datetime
+        
+    Returns:
+        Calendar day of the value
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return pd.Timestamp(value).date()
+
+def iter_forecast_days(start_date: datetime.date, end_date: datetime.date) -> List[datetime.date]:
+    """
+    Lists the calendar days from start_date to end_date inclusive.
+    
+    Args:
+        start_date: First day of the range
+        end_date: Last day of the range
+        
+    Returns:
+        List of days in ascending order
+    """
+    day_count = (end_date - start_date).days + 1
+    return [start_date + datetime.timedelta(days=offset) for offset in range(max(day_count, 0))]
+
+def get_forecast_target_days(forecast_df: pd.DataFrame) -> pd.Series:
+    """
+    Assigns each row the target day of the forecast it belongs to.
+    
+    A range response concatenates whole forecasts, each a run of increasing timestamps that
+    starts on the forecast's target day and may extend into the following days. A new
+    forecast starts where the timestamp stops increasing or the generation time changes.
+    
+    Args:
+        forecast_df: Forecast dataframe returned for a range
+        
+    Returns:
+        Series of target days aligned with the rows of forecast_df
+    """
+    timestamps = pd.to_datetime(forecast_df[SEGMENT_DAY_COLUMN]).reset_index(drop=True)
+    starts = timestamps.diff() <= pd.Timedelta(0)
+    if 'generation_timestamp' in forecast_df.columns:
+        generation_timestamps = pd.to_datetime(forecast_df['generation_timestamp']).reset_index(drop=True)
+        starts |= generation_timestamps.ne(generation_timestamps.shift())
+    if len(starts):
+        starts.iloc[0] = True
+    
+    target_days = timestamps.groupby(starts.cumsum()).transform('min').dt.date
+    target_days.index = forecast_df.index
+    return target_days
+
+class ForecastSegmentCache:
+    """
+    Range-aware forecast cache that stores forecasts per (product, target day).
+    
+    Requested date ranges are assembled from cached day segments, so overlapping or
+    shifted ranges only need the days that are not cached yet. Forecasts for past days
+    are immutable and never expire; segments for today onwards, and days for which the
+    API returned no forecast, expire after the latest-day timeout. Segments are held in a
+    bounded cache, so the least recently used days are evicted under memory pressure.
+    """
+    
+    def __init__(self, latest_timeout: int = CACHE_TIMEOUT):
+        """
+        Initializes an empty segment cache.
+        
+        Args:
+            latest_timeout: Timeout in seconds for segments that may still change
+        """
+        self._segments = BoundedCache(name='forecast_segments', default_timeout=None, clock=_now)
+        self._latest_timeout = latest_timeout
+        self._hits = 0
+        self._misses = 0
+        self._fetches = 0
+        self._logger = logging.getLogger(__name__ + '.ForecastSegmentCache')
+    
+    def _get_timeout(self, day: datetime.date, is_empty: bool) -> Optional[int]:
+        """
+        Determines the timeout of a segment for the given day.
+        
+        Args:
+            day: Forecast day of the segment
+            is_empty: Whether the API returned no forecast for the day
+            
+        Returns:
+            Timeout in seconds, or None for immutable past-day segments
+        """
+        if day < datetime.date.today() and not is_empty:
+            return None
+        return self._latest_timeout
+    
+    def get_missing_days(self, product: str,
+                         start_date: Union[str, datetime.date, datetime.datetime],
+                         end_date: Union[str, datetime.date, datetime.datetime]) -> List[datetime.date]:
+        """
+        Lists the days in a range that are not cached for a product.
+        
+        Args:
+            product: The forecast product
+            start_date: Start of the range (inclusive)
+            end_date: End of the range (inclusive)
+            
+        Returns:
+            Missing days in ascending order
+        """
+        days = iter_forecast_days(to_forecast_day(start_date), to_forecast_day(end_date))
+        return [day for day in days if not self._segments.is_valid((product, day))]
+    
+    def store_range(self, product: str, forecast_df: pd.DataFrame,
+                    start_date: Union[str, datetime.date, datetime.datetime],
+                    end_date: Union[str, datetime.date, datetime.datetime]) -> int:
+        """
+        Splits a forecast dataframe covering a date range into day segments and caches them.
+        
+        Rows are assigned to the target day of their forecast. Every day of the range gets a
+        segment, including days without forecasts, so a complete fetch is never repeated for
+        the same range.
+        
+        Args:
+            product: The forecast product
+            forecast_df: Forecast dataframe returned for the range
+            start_date: Start of the fetched range (inclusive)
+            end_date: End of the fetched range (inclusive)
+            
+        Returns:
+            Number of segments stored
+        """
+        if not CACHE_ENABLED:
+            return 0
+        
+        if SEGMENT_DAY_COLUMN not in forecast_df.columns:
+            self._logger.debug(f"Forecast for {product} has no {SEGMENT_DAY_COLUMN} column, not segmenting")
+            return 0
+        
+        if not forecast_df.empty:
+            is_valid, errors = validate_forecast_dataframe(forecast_df)
+            if not is_valid:
+                self._logger.error(f"Invalid forecast dataframe: {errors}")
+                return 0
+        
+        row_days = get_forecast_target_days(forecast_df)
+        days = iter_forecast_days(to_forecast_day(start_date), to_forecast_day(end_date))
+        
+        # Rows targeting days outside the range mean the response does not line up with the
+        # requested days, so days without rows are not recorded as empty
+        has_unassigned_rows = bool((~row_days.isin(days)).any())
+        if has_unassigned_rows:
+            self._logger.warning(f"Forecast for {product} has rows outside {start_date} to {end_date}, not caching empty days")
+        
+        stored = 0
+        for day in days:
+            segment = forecast_df[row_days == day]
+            if segment.empty and has_unassigned_rows:
+                continue
+            self._segments.set((product, day), segment, self._get_timeout(day, segment.empty))
+            stored += 1
+        
+        self._logger.debug(f"Stored {stored} day segments for {product}")
+        return stored
+    
+    def get_range(self, product: str,
+                  start_date: Union[str, datetime.date, datetime.datetime],
+                  end_date: Union[str, datetime.date, datetime.datetime]) -> Optional[pd.DataFrame]:
+        """
+        Assembles a forecast range from cached day segments.
+        
+        Args:
+            product: The forecast product
+            start_date: Start of the range (inclusive)
+            end_date: End of the range (inclusive)
+            
+        Returns:
+            Forecast dataframe for the range, or None if any day is not cached
+        """
+        if not CACHE_ENABLED:
+            return None
+        
+        segments = []
+        for day in iter_forecast_days(to_forecast_day(start_date), to_forecast_day(end_date)):
+            segment = self._segments.get((product, day))
+            if segment is None:
+                return None
+            segments.append(segment)
+        
+        return pd.concat(segments, ignore_index=True) if segments else pd.DataFrame()
+    
+    def get_forecast_range(self, product: str,
+                           start_date: Union[str, datetime.date, datetime.datetime],
+                           end_date: Union[str, datetime.date, datetime.datetime],
+                           fetch_func: Callable[[str, datetime.date, datetime.date], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Returns forecasts for a date range, fetching only the days that are not cached.
+        
+        Missing days are fetched with a single call covering the first to the last
+        missing day, then the full range is assembled from the cached segments.
+        
+        Args:
+            product: The forecast product
+            start_date: Start of the range (inclusive)
+            end_date: End of the range (inclusive)
+            fetch_func: Callable taking (product, start_date, end_date) and returning
+                the forecast dataframe for that range
+            
+        Returns:
+            Forecast dataframe for the range
+        """
+        start_day, end_day = to_forecast_day(start_date), to_forecast_day(end_date)
+        if not CACHE_ENABLED:
+            return fetch_func(product, start_day, end_day)
+        
+        missing_days = self.get_missing_days(product, start_day, end_day)
+        if not missing_days:
+            cached_df = self.get_range(product, start_day, end_day)
+            if cached_df is not None:
+                self._hits += 1
+                self._logger.debug(f"Segment cache hit for {product} from {start_day} to {end_day}")
+                return cached_df
+            # Segments were evicted between the checks; refetch what is gone
+            missing_days = self.get_missing_days(product, start_day, end_day) or iter_forecast_days(start_day, end_day)
+        
+        self._misses += 1
+        fetch_start, fetch_end = missing_days[0], missing_days[-1]
+        self._logger.info(f"Fetching {len(missing_days)} missing days for {product} from {fetch_start} to {fetch_end}")
+        
+        fetched_df = fetch_func(product, fetch_start, fetch_end)
+        self._fetches += 1
+        
+        self.store_range(product, fetched_df, fetch_start, fetch_end)
+        assembled_df = self.get_range(product, start_day, end_day)
+        if assembled_df is not None:
+            return assembled_df
+        
+        # The response could not be segmented or cached days were evicted meanwhile,
+        # so only a full-range fetch is usable as is
+        if (fetch_start, fetch_end) == (start_day, end_day):
+            return fetched_df
+        return fetch_func(product, start_day, end_day)
+    
+    def clear(self, product: Optional[str] = None) -> int:
+        """
+        Clears all segments or those of a single product.
+        
+        Args:
+            product: If provided, only clears segments for this product
+            
+        Returns:
+            Number of segments cleared
+        """
+        if product is None:
+            return self._segments.clear(reset_stats=False)
+        
+        keys = [key for key in self._segments.keys() if key[0] == product]
+        return sum(1 for key in keys if self._segments.invalidate(key))
+    
+    def get_stats(self) -> dict:
+        """
+        Returns statistics about segment cache usage.
+        
+        Returns:
+            Dictionary containing segment counts, range hits/misses, fetch count and
+            segment evictions
+        """
+        products: Dict[str, int] = {}
+        for product, _ in self._segments.keys():
+            products[product] = products.get(product, 0) + 1
+        
+        segment_stats = self._segments.get_stats()
+        return {
+            'segment_count': segment_stats['entry_count'],
+            'segment_products': products,
+            'segment_eviction_count': segment_stats['eviction_count'],
+            'segment_size_bytes': segment_stats['estimated_size_bytes'],
+            'range_hit_count': self._hits,
+            'range_miss_count': self._misses,
+            'range_fetch_count': self._fetches
+        }
+
 class ForecastCacheManager:
     """
     Class that provides centralized management of forecast data caching.
@@ -326,6 +541,7 @@ class ForecastCacheManager:
         """
         self._cache_manager = CacheManager()
         self._product_keys = {}  # Track keys by product
+        self._segment_cache = ForecastSegmentCache()
         self._logger = logging.getLogger(__name__ + '.ForecastCacheManager')
     
     def cache_forecast(self, product: str, forecast_df: pd.DataFrame, 
@@ -360,8 +576,8 @@ class ForecastCacheManager:
         if success:
             # Track this key for the product
             if product not in self._product_keys:
-                self._product_keys[product] = []
-            self._product_keys[product].append(key)
+                self._product_keys[product] = set()
+            self._product_keys[product].add(key)
             
             self._logger.info(f"Cached forecast for {product}: {len(forecast_df)} rows")
         
@@ -394,6 +610,27 @@ class ForecastCacheManager:
         
         return result
     
+    def get_forecast_range(self, product: str,
+                           start_date: Union[str, datetime.date, datetime.datetime],
+                           end_date: Union[str, datetime.date, datetime.datetime],
+                           fetch_func: Callable[[str, datetime.date, datetime.date], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Retrieves forecasts for a date range from the day-segmented cache.
+        
+        Only days that are not cached are fetched, with a single call to fetch_func.
+        
+        Args:
+            product: The forecast product
+            start_date: Start date of the range (inclusive)
+            end_date: End date of the range (inclusive)
+            fetch_func: Callable taking (product, start_date, end_date) and returning
+                the forecast dataframe for that range
+            
+        Returns:
+            Forecast dataframe for the range
+        """
+        return self._segment_cache.get_forecast_range(product, start_date, end_date, fetch_func)
+    
     def clear_cache(self, product: Optional[str] = None) -> int:
         """
         Clears all cache or specific product cache entries.
@@ -422,6 +659,9 @@ class ForecastCacheManager:
                 del self._product_keys[product]
                 self._logger.info(f"Cleared forecast cache for product {product} ({count} items)")
         
+        # Day segments of range requests
+        count += self._segment_cache.clear(product)
+        
         return count
     
     def get_stats(self) -> dict:
@@ -441,7 +681,7 @@ class ForecastCacheManager:
         }
         
         # Combine the stats
-        stats = {**basic_stats, **forecast_stats}
+        stats = {**basic_stats, **forecast_stats, **self._segment_cache.get_stats()}
         
         return stats
 
@@ -26,6 +26,7 @@ from ..config.product_config import (
     can_be_negative
 )
 from ..config.dashboard_config import DISTRIBUTION_CONFIG
+from .artifact_cache import cache_derived_artifact
 from ..utils.formatting import (
     format_price,
     format_datetime,
@@ -42,6 +43,17 @@ logger = logging.getLogger(__name__)
 # Default percentiles for uncertainty bands
 DEFAULT_PERCENTILES = [10, 90]
 
+# Time series downsampling: points kept per pixel of plot width, and the bounds and rounding
+# step of the point budget (rounding keeps the number of cached variants small)
+DOWNSAMPLE_POINTS_PER_PIXEL = 0.5
+DEFAULT_VIEWPORT_WIDTH = 1200
+MIN_DOWNSAMPLE_POINTS = 100
+DOWNSAMPLE_POINT_STEP = 100
+
+# Uncertainty band columns, aggregated as envelopes when downsampling
+LOWER_BAND_COLUMNS = ['lower_bound']
+UPPER_BAND_COLUMNS = ['upper_bound']
+
 
 def filter_forecast_by_product(df: pd.DataFrame, product: str) -> pd.DataFrame:
     """
@@ -118,13 +130,146 @@ def filter_forecast_by_date_range(
     return filtered_df
 
 
-def prepare_time_series_data(df: pd.DataFrame, product: str) -> pd.DataFrame:
+def get_downsample_point_count(viewport_width: Optional[int] = None) -> int:
+    """
+    Returns the number of points worth sending to a time series plot of the given width.
+    
+    Args:
+        viewport_width: Viewport width in pixels from the viewport store (default width if None)
+        
+    Returns:
+        Maximum number of points per series
+    """
+    width = viewport_width or DEFAULT_VIEWPORT_WIDTH
+    points = int(width * DOWNSAMPLE_POINTS_PER_PIXEL)
+    
+    # Round up to the step so nearby widths share cached artifacts
+    points = int(np.ceil(points / DOWNSAMPLE_POINT_STEP)) * DOWNSAMPLE_POINT_STEP
+    return max(points, MIN_DOWNSAMPLE_POINTS)
+
+
+def _get_bucket_edges(n_points: int, n_buckets: int) -> np.ndarray:
+    """
+    Splits n_points into n_buckets contiguous buckets for downsampling.
+    
+    The first and last points are buckets of their own and the points between them are
+    divided evenly over the remaining buckets.
+    
+    Args:
+        n_points: Number of input points
+        n_buckets: Number of buckets (at least 3 and at most n_points)
+        
+    Returns:
+        Array of n_buckets + 1 bucket start positions, ending with n_points
+    """
+    inner_edges = np.floor(np.linspace(1, n_points - 1, n_buckets - 1)).astype(int)
+    return np.concatenate(([0], inner_edges, [n_points]))
+
+
+def lttb_downsample_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Selects points with the Largest-Triangle-Three-Buckets algorithm.
+    
+    LTTB keeps the first and last points and, from each bucket in between, the point that
+    forms the largest triangle with the previously selected point and the average of the
+    next bucket, which preserves peaks and troughs of the series.
+    
+    Args:
+        x: Numeric x values in ascending order
+        y: Numeric y values
+        n_out: Number of points to select
+        
+    Returns:
+        Sorted positions of the selected points
+    """
+    n_points = len(x)
+    if n_out >= n_points or n_out < 3:
+        return np.arange(n_points)
+    
+    edges = _get_bucket_edges(n_points, n_out)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n_points - 1
+    
+    previous = 0
+    for bucket in range(1, n_out - 1):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2]
+        
+        # Average of the next bucket is the third vertex of the triangle
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket] = previous
+    
+    return selected
+
+
+def downsample_time_series(df: pd.DataFrame, max_points: int) -> pd.DataFrame:
+    """
+    Reduces a time series dataframe to at most max_points rows per product.
+    
+    The point forecast is downsampled with LTTB; uncertainty bands are replaced by min/max
+    envelopes over each bucket so the displayed band still covers every hidden point.
+    Dataframes that are already small enough are returned unchanged.
+    
+    Args:
+        df: Time series dataframe with timestamp and point_forecast columns
+        max_points: Maximum number of rows per product
+        
+    Returns:
+        Downsampled dataframe sorted by timestamp
+    """
+    if df is None or df.empty or max_points is None:
+        return df
+    
+    if 'product' in df.columns and df['product'].nunique() > 1:
+        return pd.concat(
+            [downsample_time_series(product_df, max_points) for _, product_df in df.groupby('product', sort=False)],
+            ignore_index=True
+        )
+    
+    if len(df) <= max_points or max_points < 3:
+        return df
+    
+    sorted_df = df.sort_values('timestamp').reset_index(drop=True)
+    x = sorted_df['timestamp'].to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(float)
+    y = sorted_df['point_forecast'].to_numpy(dtype=float)
+    
+    indices = lttb_downsample_indices(x, y, max_points)
+    bucket_starts = _get_bucket_edges(len(sorted_df), max_points)[:-1]
+    
+    result = sorted_df.iloc[indices].reset_index(drop=True)
+    for column in LOWER_BAND_COLUMNS:
+        if column in result.columns:
+            result[column] = np.minimum.reduceat(sorted_df[column].to_numpy(dtype=float), bucket_starts)
+    for column in UPPER_BAND_COLUMNS:
+        if column in result.columns:
+            result[column] = np.maximum.reduceat(sorted_df[column].to_numpy(dtype=float), bucket_starts)
+    
+    logger.debug(f"Downsampled time series from {len(sorted_df)} to {len(result)} points")
+    return result
+
+
+@cache_derived_artifact('time_series')
+def prepare_time_series_data(
+    df: pd.DataFrame,
+    product: str,
+    max_points: Optional[int] = None
+) -> pd.DataFrame:
     """
     Prepares forecast data for time series visualization.
     
     Args:
         df: Forecast dataframe
         product: Product identifier
+        max_points: Maximum number of points to keep (see get_downsample_point_count);
+            None keeps full resolution
         
     Returns:
         Processed dataframe ready for time series visualization
@@ -149,6 +294,10 @@ def prepare_time_series_data(df: pd.DataFrame, product: str) -> pd.DataFrame:
         # Sort by timestamp
         filtered_df = filtered_df.sort_values('timestamp')
         
+        # Downsample before formatting so the formatting cost is bounded as well
+        if max_points is not None:
+            filtered_df = downsample_time_series(filtered_df, max_points)
+        
         # Format timestamps for x-axis labels
         filtered_df['x_label'] = filtered_df['timestamp'].apply(get_date_hour_label)
         
@@ -177,6 +326,7 @@ def prepare_time_series_data(df: pd.DataFrame, product: str) -> pd.DataFrame:
         raise
 
 
+@cache_derived_artifact('distribution')
 def prepare_distribution_data(
     df: pd.DataFrame, 
     product: str, 
@@ -247,6 +397,7 @@ def prepare_distribution_data(
         raise
 
 
+@cache_derived_artifact('hourly_table')
 def prepare_hourly_table_data(
     df: pd.DataFrame, 
     product: str,
@@ -693,18 +844,24 @@ class ForecastDataProcessor:
         """
         return filter_forecast_by_date_range(df, start_date, end_date)
     
-    def prepare_time_series_data(self, df: pd.DataFrame, product: str) -> pd.DataFrame:
+    def prepare_time_series_data(
+        self,
+        df: pd.DataFrame,
+        product: str,
+        max_points: Optional[int] = None
+    ) -> pd.DataFrame:
         """
         Prepares forecast data for time series visualization.
         
         Args:
             df: Forecast dataframe
             product: Product identifier
+            max_points: Maximum number of points to keep, or None for full resolution
             
         Returns:
             Processed dataframe ready for time series visualization
         """
-        return prepare_time_series_data(df, product)
+        return prepare_time_series_data(df, product, max_points)
     
     def prepare_distribution_data(
         self,
@@ -7,23 +7,38 @@ import logging
 import requests  # version ^2.28.0
 import pandas as pd  # version 2.0.0+
 from datetime import date, datetime
-from typing import Union, Dict, Any, Optional
+from typing import Union, Optional
 import io  # standard library
 
+try:
+    import pyarrow as pa  # version 12.0.0+
+    import pyarrow.ipc  # noqa: F401
+except ImportError:
+    pa = None
+
 from ..config.settings import API_BASE_URL, FORECAST_API_TIMEOUT
 from ..config.product_config import PRODUCTS
-from ..utils.url_helpers import build_api_url, build_forecast_api_url
+from ..utils.caching import BoundedCache
+from ..utils.url_helpers import build_api_url, build_forecast_api_url, add_query_params
 from ..utils.error_handlers import handle_data_loading_error
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
-# Default response format
-DEFAULT_FORMAT = "json"
+# MIME type of the Arrow IPC streaming format served by the backend API
+ARROW_STREAM_MIME_TYPE = "application/vnd.apache.arrow.stream"
+
+# Default response format: Arrow IPC when pyarrow is installed, since it is deserialized
+# without parsing per-row JSON records, otherwise JSON
+DEFAULT_FORMAT = "arrow" if pa is not None else "json"
 
 # Default number of retries for API requests
 DEFAULT_RETRIES = 3
 
+# Bounds of the responses kept for conditional revalidation (least recently used are evicted)
+MAX_CONDITIONAL_CACHE_ENTRIES = 256
+MAX_CONDITIONAL_CACHE_BYTES = 64 * 1024 * 1024
+
 
 class ForecastClient:
     """
@@ -41,11 +56,21 @@ class ForecastClient:
         self.base_url = base_url or API_BASE_URL
         self.timeout = timeout or FORECAST_API_TIMEOUT
         self.session = requests.Session()
+        # requests adds Accept-Encoding (gzip, and zstd when zstandard is installed) and
+        # decompresses responses transparently
         self.session.headers.update({
-            'Accept': 'application/json',
+            'Accept': f'{ARROW_STREAM_MIME_TYPE}, application/json;q=0.9' if pa is not None else 'application/json',
             'User-Agent': 'ElectricityMarketForecastClient/1.0'
         })
         self.logger = logging.getLogger(__name__ + '.ForecastClient')
+        # Responses with ETag/Last-Modified validators, keyed by URL, reused on 304 Not Modified;
+        # the body is kept in the entry so it counts towards the memory budget
+        self._conditional_cache = BoundedCache(
+            name='conditional_responses',
+            max_entries=MAX_CONDITIONAL_CACHE_ENTRIES,
+            max_bytes=MAX_CONDITIONAL_CACHE_BYTES,
+            default_timeout=None
+        )
         self.logger.info(f"Initialized ForecastClient with base URL: {self.base_url}")
     
     def get_forecast_by_date(
@@ -60,7 +85,7 @@ class ForecastClient:
         Args:
             product: The price product (e.g., 'DALMP', 'RTLMP')
             date: The date to retrieve the forecast for
-            format: Response format (json, csv, excel, parquet)
+            format: Response format (arrow, json, csv, excel, parquet)
             
         Returns:
             Forecast dataframe for the specified product and date
@@ -74,11 +99,11 @@ class ForecastClient:
                 date = date.strftime("%Y-%m-%d")
             
             # Build the API URL
-            url = build_forecast_api_url(product, start_date=date, end_date=date)
+            url = build_forecast_api_url(product, start_date=date, end_date=date, additional_params={'format': format})
             
             # Make the API request
             self.logger.info(f"Retrieving forecast for product: {product}, date: {date}")
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.conditional_get(url)
             
             # Parse and return the response
             return self.parse_response(response, format)
@@ -93,7 +118,7 @@ class ForecastClient:
         
         Args:
             product: The price product (e.g., 'DALMP', 'RTLMP')
-            format: Response format (json, csv, excel, parquet)
+            format: Response format (arrow, json, csv, excel, parquet)
             
         Returns:
             Latest forecast dataframe for the specified product
@@ -103,11 +128,11 @@ class ForecastClient:
             validate_product(product)
             
             # Build the API URL for latest forecast
-            url = build_api_url(f"forecasts/{product}/latest")
+            url = add_query_params(build_api_url(f"forecasts/{product}/latest"), {'format': format})
             
             # Make the API request
             self.logger.info(f"Retrieving latest forecast for product: {product}")
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.conditional_get(url)
             
             # Parse and return the response
             return self.parse_response(response, format)
@@ -130,7 +155,7 @@ class ForecastClient:
             product: The price product (e.g., 'DALMP', 'RTLMP')
             start_date: The start date for the forecast range
             end_date: The end date for the forecast range
-            format: Response format (json, csv, excel, parquet)
+            format: Response format (arrow, json, csv, excel, parquet)
             
         Returns:
             Combined forecast dataframe for the specified product and date range
@@ -146,11 +171,11 @@ class ForecastClient:
                 end_date = end_date.strftime("%Y-%m-%d")
             
             # Build the API URL
-            url = build_forecast_api_url(product, start_date=start_date, end_date=end_date)
+            url = build_forecast_api_url(product, start_date=start_date, end_date=end_date, additional_params={'format': format})
             
             # Make the API request
             self.logger.info(f"Retrieving forecasts for product: {product}, date range: {start_date} to {end_date}")
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.conditional_get(url)
             
             # Parse and return the response
             return self.parse_response(response, format)
@@ -159,13 +184,61 @@ class ForecastClient:
             self.logger.error(f"Error retrieving forecasts for {product} from {start_date} to {end_date}: {e}")
             raise
     
+    def conditional_get(self, url: str) -> requests.Response:
+        """
+        Performs a GET request, revalidating a previously cached response when possible.
+        
+        If an earlier response for the URL carried an ETag or Last-Modified header, the
+        request sends If-None-Match / If-Modified-Since and a 304 Not Modified answer is
+        served from the cached response instead of transferring the body again.
+        
+        Args:
+            url: URL to request
+            
+        Returns:
+            The fresh response, or the cached response if the server reported 304
+        """
+        cached = self._conditional_cache.get(url)
+        if cached is None:
+            response = self.session.get(url, timeout=self.timeout)
+        else:
+            response = self.session.get(url, headers=cached["validators"], timeout=self.timeout)
+        
+        if response.status_code == 304 and cached is not None:
+            self.logger.debug(f"Not modified, reusing cached response for: {url}")
+            return cached["response"]
+        
+        if response.status_code == 200:
+            validators = {}
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag:
+                validators["If-None-Match"] = etag
+            if last_modified:
+                validators["If-Modified-Since"] = last_modified
+            
+            if validators:
+                self._conditional_cache.set(
+                    url, {"validators": validators, "response": response, "content": response.content}
+                )
+            else:
+                self._conditional_cache.invalidate(url)
+        
+        return response
+    
+    def clear_conditional_cache(self) -> None:
+        """
+        Drops all responses kept for conditional revalidation.
+        """
+        self._conditional_cache.clear()
+    
     def parse_response(self, response: requests.Response, format: str = DEFAULT_FORMAT) -> pd.DataFrame:
         """
         Parses API response based on the requested format.
         
         Args:
             response: API response object
-            format: Format of the response (json, csv, excel, parquet)
+            format: Format of the response (arrow, json, csv, excel, parquet)
             
         Returns:
             Parsed response as a pandas DataFrame
@@ -199,6 +272,7 @@ class ForecastClient:
         Closes the client session.
         """
         self.session.close()
+        self.clear_conditional_cache()
         self.logger.info("Closed ForecastClient session")
 
 
@@ -224,7 +298,7 @@ def parse_response(response: requests.Response, format: str = DEFAULT_FORMAT) ->
     
     Args:
         response: API response object
-        format: Format of the response (json, csv, excel, parquet)
+        format: Format of the response (arrow, json, csv, excel, parquet)
         
     Returns:
         Parsed response as a pandas DataFrame
@@ -246,6 +320,10 @@ def parse_response(response: requests.Response, format: str = DEFAULT_FORMAT) ->
         elif format.lower() == "parquet":
             return pd.read_parquet(io.BytesIO(response.content))
         
+        elif format.lower() == "arrow":
+            # Read the record batches straight from the response buffer
+            return pa.ipc.open_stream(pa.py_buffer(response.content)).read_all().to_pandas()
+        
         else:
             logger.warning(f"Unsupported format: {format}, using default parser")
             return pd.DataFrame(response.json())
@@ -267,16 +345,13 @@ def get_forecast_by_date(
     Args:
         product: The price product (e.g., 'DALMP', 'RTLMP')
         date: The date to retrieve the forecast for
-        format: Response format (json, csv, excel, parquet)
+        format: Response format (arrow, json, csv, excel, parquet)
         
     Returns:
         Forecast dataframe for the specified product and date
     """
-    client = ForecastClient()
-    try:
-        return client.get_forecast_by_date(product, date, format)
-    finally:
-        client.close()
+    # Use the shared client so repeated requests revalidate its cached responses
+    return forecast_client.get_forecast_by_date(product, date, format)
 
 
 def get_latest_forecast(product: str, format: str = DEFAULT_FORMAT) -> pd.DataFrame:
@@ -285,16 +360,13 @@ def get_latest_forecast(product: str, format: str = DEFAULT_FORMAT) -> pd.DataFr
     
     Args:
         product: The price product (e.g., 'DALMP', 'RTLMP')
-        format: Response format (json, csv, excel, parquet)
+        format: Response format (arrow, json, csv, excel, parquet)
         
     Returns:
         Latest forecast dataframe for the specified product
     """
-    client = ForecastClient()
-    try:
-        return client.get_latest_forecast(product, format)
-    finally:
-        client.close()
+    # Use the shared client so repeated requests revalidate its cached responses
+    return forecast_client.get_latest_forecast(product, format)
 
 
 def get_forecasts_by_date_range(
@@ -310,16 +382,13 @@ def get_forecasts_by_date_range(
         product: The price product (e.g., 'DALMP', 'RTLMP')
         start_date: The start date for the forecast range
         end_date: The end date for the forecast range
-        format: Response format (json, csv, excel, parquet)
+        format: Response format (arrow, json, csv, excel, parquet)
         
     Returns:
         Combined forecast dataframe for the specified product and date range
     """
-    client = ForecastClient()
-    try:
-        return client.get_forecasts_by_date_range(product, start_date, end_date, format)
-    finally:
-        client.close()
+    # Use the shared client so repeated requests revalidate its cached responses
+    return forecast_client.get_forecasts_by_date_range(product, start_date, end_date, format)
 
 
 # Create a singleton instance for application-wide use
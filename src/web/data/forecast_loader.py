@@ -9,13 +9,15 @@ import datetime
 import logging
 from typing import List, Dict, Optional, Union, Any, Tuple
 import functools  # standard library
+from concurrent.futures import ThreadPoolExecutor  # standard library
 
 from .forecast_client import get_forecast_by_date, get_latest_forecast, get_forecasts_by_date_range
-from .cache_manager import forecast_cache_manager
+from .cache_manager import forecast_cache_manager, generate_forecast_cache_key
 from .schema import prepare_dataframe_for_visualization, extract_samples_from_dataframe, validate_forecast_dataframe
 from ..config.product_config import PRODUCTS, DEFAULT_PRODUCT
-from ..config.settings import CACHE_ENABLED
+from ..config.settings import CACHE_ENABLED, COMPARISON_MAX_WORKERS
 from ..utils.error_handlers import handle_data_loading_error
+from ..utils.shared_cache import shared_forecast_cache
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -67,9 +69,12 @@ def load_forecast_by_date(
                 logger.info(f"Using cached forecast for {product} on {date}")
                 return prepare_dataframe_for_visualization(cached_forecast, percentiles or DEFAULT_PERCENTILES)
         
-        # Not in cache, fetch from API
+        # Not in cache, fetch from the shared tier or the API
         logger.info(f"Fetching forecast from API for {product} on {date}")
-        forecast_df = get_forecast_by_date(product, date)
+        forecast_df = shared_forecast_cache.get_or_fetch(
+            generate_forecast_cache_key(product, date),
+            lambda: get_forecast_by_date(product, date)
+        )
         
         # Transform for visualization
         viz_df = prepare_dataframe_for_visualization(forecast_df, percentiles or DEFAULT_PERCENTILES)
@@ -112,9 +117,12 @@ def load_latest_forecast(
                 logger.info(f"Using cached latest forecast for {product}")
                 return prepare_dataframe_for_visualization(cached_forecast, percentiles or DEFAULT_PERCENTILES)
         
-        # Not in cache, fetch from API
+        # Not in cache, fetch from the shared tier or the API
         logger.info(f"Fetching latest forecast from API for {product}")
-        forecast_df = get_latest_forecast(product)
+        forecast_df = shared_forecast_cache.get_or_fetch(
+            generate_forecast_cache_key(product, "latest"),
+            lambda: get_latest_forecast(product)
+        )
         
         # Transform for visualization
         viz_df = prepare_dataframe_for_visualization(forecast_df, percentiles or DEFAULT_PERCENTILES)
@@ -131,6 +139,29 @@ def load_latest_forecast(
         return handle_data_loading_error(e, f"loading latest forecast for {product}")
 
 
+def fetch_forecast_range_shared(
+    product: str,
+    start_date: Union[str, datetime.date, datetime.datetime],
+    end_date: Union[str, datetime.date, datetime.datetime]
+) -> pd.DataFrame:
+    """
+    Fetches a forecast range through the shared cache tier, so workers requesting the
+    same range reuse one API call.
+    
+    Args:
+        product: The price product (e.g., 'DALMP', 'RTLMP')
+        start_date: The start date for the forecast range
+        end_date: The end date for the forecast range
+        
+    Returns:
+        Forecast dataframe for the range
+    """
+    return shared_forecast_cache.get_or_fetch(
+        generate_forecast_cache_key(product, start_date, end_date),
+        lambda: get_forecasts_by_date_range(product, start_date, end_date)
+    )
+
+
 def load_forecast_by_date_range(
     product: str,
     start_date: Union[str, datetime.date, datetime.datetime],
@@ -153,32 +184,108 @@ def load_forecast_by_date_range(
         # Validate the product
         validate_product(product)
         
-        # Check cache first if enabled
         if CACHE_ENABLED:
-            cached_forecast = forecast_cache_manager.get_forecast(product, start_date, end_date)
-            if cached_forecast is not None:
-                logger.info(f"Using cached forecast for {product} from {start_date} to {end_date}")
-                return prepare_dataframe_for_visualization(cached_forecast, percentiles or DEFAULT_PERCENTILES)
-        
-        # Not in cache, fetch from API
-        logger.info(f"Fetching forecast from API for {product} from {start_date} to {end_date}")
-        forecast_df = get_forecasts_by_date_range(product, start_date, end_date)
+            # Assemble the range from cached day segments, fetching only the missing days
+            forecast_df = forecast_cache_manager.get_forecast_range(
+                product, start_date, end_date, fetch_forecast_range_shared
+            )
+        else:
+            logger.info(f"Fetching forecast from API for {product} from {start_date} to {end_date}")
+            forecast_df = get_forecasts_by_date_range(product, start_date, end_date)
         
         # Transform for visualization
-        viz_df = prepare_dataframe_for_visualization(forecast_df, percentiles or DEFAULT_PERCENTILES)
-        
-        # Cache the raw forecast
-        if CACHE_ENABLED:
-            forecast_cache_manager.cache_forecast(product, forecast_df, start_date, end_date)
-            logger.debug(f"Cached forecast for {product} from {start_date} to {end_date}")
-        
-        return viz_df
+        return prepare_dataframe_for_visualization(forecast_df, percentiles or DEFAULT_PERCENTILES)
         
     except Exception as e:
         logger.error(f"Error loading forecast for {product} from {start_date} to {end_date}: {str(e)}")
         return handle_data_loading_error(e, f"loading forecast for {product} from {start_date} to {end_date}")
 
 
+def align_forecast_frames(forecast_dfs: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Aligns forecast dataframes of several products on a shared set of timestamps.
+    
+    Timestamps present for some products only are added as rows without forecast values to
+    the others, so all products cover the same time axis and gaps show as breaks in the plot.
+    
+    Args:
+        forecast_dfs: Dictionary mapping product IDs to forecast dataframes
+        
+    Returns:
+        Dictionary mapping product IDs to aligned forecast dataframes sorted by timestamp
+    """
+    if len(forecast_dfs) < 2:
+        return forecast_dfs
+    
+    shared_timestamps = pd.DatetimeIndex(
+        pd.concat([df['timestamp'] for df in forecast_dfs.values()], ignore_index=True).unique()
+    ).sort_values()
+    
+    aligned_dfs = {}
+    for product, df in forecast_dfs.items():
+        missing_timestamps = shared_timestamps.difference(pd.DatetimeIndex(df['timestamp']))
+        if len(missing_timestamps) > 0:
+            padding = pd.DataFrame({'timestamp': missing_timestamps, 'product': product})
+            if 'is_fallback' in df.columns:
+                padding['is_fallback'] = False
+            df = pd.concat([df, padding], ignore_index=True)
+        aligned_dfs[product] = df.sort_values('timestamp', kind='stable').reset_index(drop=True)
+    
+    return aligned_dfs
+
+
+def load_forecasts_for_products(
+    products: List[str],
+    start_date: Union[str, datetime.date, datetime.datetime],
+    end_date: Union[str, datetime.date, datetime.datetime],
+    percentiles: Optional[List[int]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Loads forecast data for several products concurrently.
+    
+    Each product is loaded through load_forecast_by_date_range on a worker thread, so the
+    latency of the comparison view is that of the slowest product rather than the sum over
+    all products. Products that fail to load are omitted from the result.
+    
+    Args:
+        products: List of price products to load
+        start_date: The start date for the forecast range
+        end_date: The end date for the forecast range
+        percentiles: Optional list of percentiles to extract (default: [10, 90])
+        
+    Returns:
+        Dictionary mapping products to forecast dataframes aligned on shared timestamps
+    """
+    products = list(dict.fromkeys(products))
+    if not products:
+        return {}
+    
+    logger.info(f"Loading forecasts for {len(products)} products from {start_date} to {end_date}")
+    
+    max_workers = max(1, min(len(products), COMPARISON_MAX_WORKERS))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='forecast-loader') as executor:
+        futures = {
+            product: executor.submit(load_forecast_by_date_range, product, start_date, end_date, percentiles)
+            for product in products
+        }
+    
+    forecast_dfs = {}
+    for product, future in futures.items():
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Error loading forecast for {product}: {str(e)}")
+            continue
+        
+        # Failed loads return an error component instead of a dataframe
+        if isinstance(result, pd.DataFrame) and not result.empty:
+            forecast_dfs[product] = result
+        else:
+            logger.warning(f"No forecast data loaded for {product} from {start_date} to {end_date}")
+    
+    return align_forecast_frames(forecast_dfs)
+
+
 def extract_forecast_percentiles(
     df: pd.DataFrame,
     percentiles: Optional[List[int]] = None
@@ -383,6 +490,27 @@ class ForecastLoader:
         """
         return load_forecast_by_date_range(product, start_date, end_date, percentiles)
     
+    def load_forecasts_for_products(
+        self,
+        products: List[str],
+        start_date: Union[str, datetime.date, datetime.datetime],
+        end_date: Union[str, datetime.date, datetime.datetime],
+        percentiles: Optional[List[int]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Loads forecast data for several products concurrently.
+        
+        Args:
+            products: List of price products to load
+            start_date: The start date for the forecast range
+            end_date: The end date for the forecast range
+            percentiles: Optional list of percentiles to extract
+            
+        Returns:
+            Dictionary mapping products to aligned forecast dataframes
+        """
+        return load_forecasts_for_products(products, start_date, end_date, percentiles)
+    
     def extract_forecast_percentiles(
         self,
         df: pd.DataFrame,
@@ -13,7 +13,8 @@ from typing import Dict, List, Tuple, Optional, Any, Union  # standard library
 
 from ..config.product_config import PRODUCTS, get_product_unit, can_be_negative
 from ..config.dashboard_config import DISTRIBUTION_CONFIG
-from ...backend.models.data_models import PriceForecast, SAMPLE_COLUMN_PREFIX
+from ...backend.models.data_models import PriceForecast, SAMPLE_COLUMN_PREFIX, SAMPLE_COLUMN_PATTERN
+from .artifact_cache import cache_derived_artifact
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -78,6 +79,7 @@ def validate_forecast_dataframe(df: pd.DataFrame) -> Tuple[bool, Dict[str, Any]]
     logger.info("Dataframe has sample columns but not visualization format. Needs transformation.")
     return True, {"needs_transformation": True}
 
+@cache_derived_artifact('visualization')
 def prepare_dataframe_for_visualization(df: pd.DataFrame, percentiles: List[int] = None) -> pd.DataFrame:
     """
     Transforms a backend forecast dataframe into the format needed for visualization.
@@ -182,13 +184,20 @@ def get_sample_columns(df: pd.DataFrame) -> List[str]:
     """
     Identifies sample columns in a forecast dataframe.
     
+    The sample count is a per-run parameter, so any number of 'sample_NNN' columns is
+    accepted; metadata columns such as 'num_samples' are not treated as samples.
+    
     Args:
         df: The forecast dataframe
         
     Returns:
-        List of sample column names
+        List of sample column names, ordered by sample number
     """
-    return [col for col in df.columns if col.startswith(SAMPLE_COLUMN_PREFIX)]
+    sample_columns = [
+        col for col in df.columns
+        if isinstance(col, str) and SAMPLE_COLUMN_PATTERN.match(col)
+    ]
+    return sorted(sample_columns, key=lambda col: int(col[len(SAMPLE_COLUMN_PREFIX):]))
 
 def convert_to_price_forecast_models(df: pd.DataFrame) -> List[PriceForecast]:
     """
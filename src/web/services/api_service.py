@@ -19,6 +19,7 @@ from ..config.settings import (
 )
 from ..data.forecast_client import ForecastClient
 from ..data.cache_manager import forecast_cache_manager
+from ..data.artifact_cache import cache_derived_artifact, clear_artifact_cache, get_artifact_cache_stats
 from ..data.schema import (
     prepare_dataframe_for_visualization,
     validate_forecast_dataframe,
@@ -231,6 +232,8 @@ def clear_cache(product: Optional[str] = None) -> int:
         Number of cache entries cleared
     """
     count = forecast_cache_manager.clear_cache(product)
+    if product is None:
+        count += clear_artifact_cache()
     if product:
         logger.info(f"Cleared forecast cache for product {product}: {count} entries removed")
     else:
@@ -243,11 +246,14 @@ def get_cache_stats() -> Dict[str, Any]:
     Returns statistics about the forecast cache usage.
     
     Returns:
-        Dictionary containing cache statistics
+        Dictionary containing cache statistics, including the prepared-artifact cache
     """
-    return forecast_cache_manager.get_stats()
+    stats = forecast_cache_manager.get_stats()
+    stats['artifacts'] = get_artifact_cache_stats()
+    return stats
 
 
+@cache_derived_artifact('service_visualization')
 def process_forecast_data(df: pd.DataFrame, percentiles: Optional[List[int]] = None) -> pd.DataFrame:
     """
     Processes raw forecast data into visualization-ready format.
@@ -506,6 +512,8 @@ class ForecastService:
             Number of cache entries cleared
         """
         count = forecast_cache_manager.clear_cache(product)
+        if product is None:
+            count += clear_artifact_cache()
         if product:
             self.logger.info(f"Cleared forecast cache for product {product}: {count} entries removed")
         else:
@@ -5,7 +5,7 @@ including adding/removing products, updating the visualization when date ranges
 """
 import pytest  # pytest: 7.0.0+
 import unittest.mock  # standard library
-from dash import Dash  # dash: 2.9.0+
+from dash import Dash, Patch  # dash: 2.9.0+
 from dash.dependencies import Input, Output, State  # dash: 2.9.0+
 from dash.exceptions import PreventUpdate  # dash: 2.9.0+
 
@@ -421,39 +421,26 @@ def test_update_comparison_on_viewport_change():
     # Create mock inputs with viewport_size='sm'
     inputs = create_mock_callback_inputs({"viewport-store.data": 'sm'})
 
-    # Create mock states with current_products=['DALMP', 'RTLMP'], date_range, and current_figure
+    # Create mock states with current_products=['DALMP', 'RTLMP']
     states = create_mock_callback_states({
-        "product-comparison-products.data": ['DALMP', 'RTLMP'],
-        "date-range-store.data": {"start_date": "2023-06-01", "end_date": "2023-06-03"},
-        "product-comparison-graph.figure": "mocked figure"
+        "product-comparison-products.data": ['DALMP', 'RTLMP']
     })
 
-    # Mock the load_comparison_data function to return sample data
-    with unittest.mock.patch('src.web.callbacks.product_comparison_callbacks.load_comparison_data') as mock_load_comparison_data:
-        mock_load_comparison_data.return_value = "mocked data"
-
-        # Mock the update_product_comparison function
-        with unittest.mock.patch('src.web.callbacks.product_comparison_callbacks.update_product_comparison') as mock_update_product_comparison:
-            mock_update_product_comparison.return_value = "mocked figure"
-
-            # Call update_comparison_on_viewport_change with mock inputs and states
-            figure = update_comparison_on_viewport_change(
-                viewport_size=inputs["viewport-store.data"],
-                current_products=states["product-comparison-products.data"],
-                date_range=states["date-range-store.data"],
-                current_figure=states["product-comparison-graph.figure"]
-            )
+    # Mock the callback context so the viewport store is the trigger
+    with unittest.mock.patch('src.web.callbacks.product_comparison_callbacks.dash.callback_context') as mock_ctx:
+        mock_ctx.triggered = [{'prop_id': 'viewport-store.data'}]
 
-            # Verify that update_product_comparison was called with the correct parameters
-            # mock_update_product_comparison.assert_called_with(
-            #     "mocked figure",
-            #     "mocked data",
-            #     ['DALMP', 'RTLMP'],
-            #     "sm"
-            # )
+        # Call update_comparison_on_viewport_change with mock inputs and states
+        patch = update_comparison_on_viewport_change(
+            viewport_size=inputs["viewport-store.data"],
+            current_products=states["product-comparison-products.data"]
+        )
 
-            # Verify that the returned figure is correct
-            assert figure == "mocked figure"
+    # Verify that only the layout is updated instead of resending the figure
+    assert isinstance(patch, Patch)
+    operations = patch.to_plotly_json()['operations']
+    assert operations
+    assert all(operation['location'][0] == 'layout' for operation in operations)
 
 
 def test_update_comparison_on_viewport_change_no_data():
@@ -461,20 +448,16 @@ def test_update_comparison_on_viewport_change_no_data():
     # Create mock inputs with viewport_size=None
     inputs = create_mock_callback_inputs({"viewport-store.data": None})
 
-    # Create mock states with current_products=None, current_figure=None
+    # Create mock states with current_products=None
     states = create_mock_callback_states({
-        "product-comparison-products.data": None,
-        "date-range-store.data": {"start_date": "2023-06-01", "end_date": "2023-06-03"},
-        "product-comparison-graph.figure": None
+        "product-comparison-products.data": None
     })
 
     # Call update_comparison_on_viewport_change with mock inputs and states
     with pytest.raises(PreventUpdate):
         update_comparison_on_viewport_change(
             viewport_size=inputs["viewport-store.data"],
-            current_products=states["product-comparison-products.data"],
-            date_range=states["date-range-store.data"],
-            current_figure=states["product-comparison-graph.figure"]
+            current_products=states["product-comparison-products.data"]
         )
 
 
@@ -11,7 +11,7 @@ from dash.exceptions import PreventUpdate  # dash: 2.9.0+
 import pandas  # pandas: 2.0.0+
 import datetime  # standard library
 
-from src.web.callbacks.time_series_callbacks import register_time_series_callbacks, handle_uncertainty_toggle, handle_time_series_click, handle_viewport_change  # src/web/callbacks/time_series_callbacks.py
+from src.web.callbacks.time_series_callbacks import register_time_series_callbacks, handle_uncertainty_toggle, handle_time_series_click, handle_viewport_change, load_zoom_window  # src/web/callbacks/time_series_callbacks.py
 from src.web.components.time_series import TIME_SERIES_GRAPH_ID, UNCERTAINTY_TOGGLE_ID  # src/web/components/time_series.py
 from src.web.components.probability_distribution import DISTRIBUTION_GRAPH_ID  # src/web/components/probability_distribution.py
 from src.web.layouts.responsive import VIEWPORT_STORE_ID  # src/web/layouts/responsive.py
@@ -192,4 +192,34 @@ def test_extract_timestamp_from_click():
     timestamp_str = "2023-02-28 14:30:00"
     click_data = {'points': [{'x': timestamp_str}]}
     extracted_timestamp = extract_timestamp_from_click(click_data)
-    assert extracted_timestamp == timestamp_str
\ No newline at end of file
+    assert extracted_timestamp == timestamp_str
+
+
+@pytest.mark.callback
+def test_load_zoom_window_reloads_selected_range():
+    """Tests that zooming reloads the selected range server-side and selects the zoomed window"""
+    # Create a forecast for the selected two days
+    forecast_df = pandas.DataFrame({
+        'timestamp': pandas.date_range('2023-01-01', periods=48, freq='h'),
+        'product': 'DALMP',
+        'point_forecast': [float(i) for i in range(48)]
+    })
+
+    with mock.patch('src.web.callbacks.time_series_callbacks.forecast_loader') as mock_loader:
+        mock_loader.load_forecast_by_date_range.return_value = forecast_df
+
+        # Zoom into six hours of the first day
+        zoom = (pandas.Timestamp('2023-01-01 06:00'), pandas.Timestamp('2023-01-01 12:00'))
+        window_df = load_zoom_window('DALMP', ['2023-01-01', '2023-01-02'], zoom)
+
+        # Verify that the selected range was loaded through the forecast loader
+        mock_loader.load_forecast_by_date_range.assert_called_once_with(
+            'DALMP', datetime.date(2023, 1, 1), datetime.date(2023, 1, 2))
+        assert window_df['point_forecast'].tolist() == [6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0]
+
+        # Resetting the zoom returns the full range
+        assert len(load_zoom_window('DALMP', ['2023-01-01', '2023-01-02'], (None, None))) == 48
+
+        # A window without forecast points returns None
+        outside = (pandas.Timestamp('2023-02-01'), pandas.Timestamp('2023-02-02'))
+        assert load_zoom_window('DALMP', ['2023-01-01', '2023-01-02'], outside) is None
@@ -24,6 +24,13 @@ from src.web.tests.fixtures.component_fixtures import mock_time_series, mock_dis
 from src.web.utils.date_helpers import get_default_date_range  # src/web/utils/date_helpers.py
 
 
+def get_patched_layout_keys(patch: dash.Patch) -> set:
+    """Returns the layout properties assigned by a figure patch, asserting it touches only the layout"""
+    operations = patch.to_plotly_json()['operations']
+    assert all(operation['location'][0] == 'layout' for operation in operations)
+    return {operation['location'][1] for operation in operations}
+
+
 def test_create_dashboard_state_store():
     # Call create_dashboard_state_store function
     store = create_dashboard_state_store()
@@ -196,14 +203,11 @@ def test_handle_coordinated_viewport_change():
     # Create mock viewport data with different sizes (sm, md, lg, xl)
     mock_viewport_data = {'size': 'md'}
 
-    # Create mock visualization components
-    mock_time_series_component = mock_time_series()
-    mock_distribution_component = mock_distribution_plot()
+    # Create mock forecast table component (figures are patched without their current state)
     mock_forecast_table_component = mock_forecast_table()
-    mock_comparison_component = mock_product_comparison()
 
     # Call handle_coordinated_viewport_change with the mock data
-    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_time_series_component.figure, mock_distribution_component.figure, mock_forecast_table_component.style, mock_comparison_component.figure)
+    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_forecast_table_component.style)
 
     # Assert that all returned components are updated for the new viewport
     assert updated_time_series is not None
@@ -211,31 +215,32 @@ def test_handle_coordinated_viewport_change():
     assert updated_table_style is not None
     assert updated_comparison is not None
 
+    # Assert that figures are updated with layout-only patches
+    assert isinstance(updated_time_series, dash.Patch)
+    assert isinstance(updated_comparison, dash.Patch)
+
     # Assert that time series figure layout is adjusted for viewport
-    assert 'height' in updated_time_series['layout']
+    assert 'height' in get_patched_layout_keys(updated_time_series)
 
     # Assert that distribution figure layout is adjusted for viewport
-    assert 'height' in updated_distribution['layout']
+    assert 'height' in get_patched_layout_keys(updated_distribution)
 
     # Assert that table style is adjusted for viewport
     assert 'style_table' in updated_table_style
 
     # Assert that comparison figure layout is adjusted for viewport
-    assert 'height' in updated_comparison['layout']
+    assert 'height' in get_patched_layout_keys(updated_comparison)
 
 
 def test_handle_coordinated_viewport_change_mobile():
     # Create mock viewport data with 'sm' size
     mock_viewport_data = {'size': 'sm'}
 
-    # Create mock visualization components
-    mock_time_series_component = mock_time_series()
-    mock_distribution_component = mock_distribution_plot()
+    # Create mock forecast table component (figures are patched without their current state)
     mock_forecast_table_component = mock_forecast_table()
-    mock_comparison_component = mock_product_comparison()
 
     # Call handle_coordinated_viewport_change with the mock data
-    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_time_series_component.figure, mock_distribution_component.figure, mock_forecast_table_component.style, mock_comparison_component.figure)
+    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_forecast_table_component.style)
 
     # Assert that components are adjusted for mobile layout
     assert updated_time_series is not None
@@ -244,8 +249,8 @@ def test_handle_coordinated_viewport_change_mobile():
     assert updated_comparison is not None
 
     # Check for specific mobile-specific adjustments (reduced margins, font sizes, etc.)
-    assert 'height' in updated_time_series['layout']
-    assert 'height' in updated_distribution['layout']
+    assert 'height' in get_patched_layout_keys(updated_time_series)
+    assert 'height' in get_patched_layout_keys(updated_distribution)
     assert 'style_table' in updated_table_style
 
 
@@ -253,14 +258,11 @@ def test_handle_coordinated_viewport_change_tablet():
     # Create mock viewport data with 'md' size
     mock_viewport_data = {'size': 'md'}
 
-    # Create mock visualization components
-    mock_time_series_component = mock_time_series()
-    mock_distribution_component = mock_distribution_plot()
+    # Create mock forecast table component (figures are patched without their current state)
     mock_forecast_table_component = mock_forecast_table()
-    mock_comparison_component = mock_product_comparison()
 
     # Call handle_coordinated_viewport_change with the mock data
-    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_time_series_component.figure, mock_distribution_component.figure, mock_forecast_table_component.style, mock_comparison_component.figure)
+    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_forecast_table_component.style)
 
     # Assert that components are adjusted for tablet layout
     assert updated_time_series is not None
@@ -269,8 +271,8 @@ def test_handle_coordinated_viewport_change_tablet():
     assert updated_comparison is not None
 
     # Check for specific tablet-specific adjustments
-    assert 'height' in updated_time_series['layout']
-    assert 'height' in updated_distribution['layout']
+    assert 'height' in get_patched_layout_keys(updated_time_series)
+    assert 'height' in get_patched_layout_keys(updated_distribution)
     assert 'style_table' in updated_table_style
 
 
@@ -278,14 +280,11 @@ def test_handle_coordinated_viewport_change_desktop():
     # Create mock viewport data with 'lg' size
     mock_viewport_data = {'size': 'lg'}
 
-    # Create mock visualization components
-    mock_time_series_component = mock_time_series()
-    mock_distribution_component = mock_distribution_plot()
+    # Create mock forecast table component (figures are patched without their current state)
     mock_forecast_table_component = mock_forecast_table()
-    mock_comparison_component = mock_product_comparison()
 
     # Call handle_coordinated_viewport_change with the mock data
-    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_time_series_component.figure, mock_distribution_component.figure, mock_forecast_table_component.style, mock_comparison_component.figure)
+    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_forecast_table_component.style)
 
     # Assert that components are adjusted for desktop layout
     assert updated_time_series is not None
@@ -294,8 +293,8 @@ def test_handle_coordinated_viewport_change_desktop():
     assert updated_comparison is not None
 
     # Check for specific desktop-specific adjustments
-    assert 'height' in updated_time_series['layout']
-    assert 'height' in updated_distribution['layout']
+    assert 'height' in get_patched_layout_keys(updated_time_series)
+    assert 'height' in get_patched_layout_keys(updated_distribution)
     assert 'style_table' in updated_table_style
 
 
@@ -303,14 +302,11 @@ def test_handle_coordinated_viewport_change_large_desktop():
     # Create mock viewport data with 'xl' size
     mock_viewport_data = {'size': 'xl'}
 
-    # Create mock visualization components
-    mock_time_series_component = mock_time_series()
-    mock_distribution_component = mock_distribution_plot()
+    # Create mock forecast table component (figures are patched without their current state)
     mock_forecast_table_component = mock_forecast_table()
-    mock_comparison_component = mock_product_comparison()
 
     # Call handle_coordinated_viewport_change with the mock data
-    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_time_series_component.figure, mock_distribution_component.figure, mock_forecast_table_component.style, mock_comparison_component.figure)
+    updated_time_series, updated_distribution, updated_table_style, updated_comparison = handle_coordinated_viewport_change(mock_viewport_data, mock_forecast_table_component.style)
 
     # Assert that components are adjusted for large desktop layout
     assert updated_time_series is not None
@@ -319,8 +315,8 @@ def test_handle_coordinated_viewport_change_large_desktop():
     assert updated_comparison is not None
 
     # Check for specific large desktop-specific adjustments
-    assert 'height' in updated_time_series['layout']
-    assert 'height' in updated_distribution['layout']
+    assert 'height' in get_patched_layout_keys(updated_time_series)
+    assert 'height' in get_patched_layout_keys(updated_distribution)
     assert 'style_table' in updated_table_style
 
 
@@ -15,6 +15,7 @@ from src.web.components.product_comparison import REMOVE_PRODUCT_BUTTON_ID  # Co
 from src.web.tests.fixtures.component_fixtures import mock_product_comparison  # Test fixture for product comparison component
 from src.web.tests.fixtures.forecast_fixtures import create_multi_product_forecast_dataframe  # Test fixture for multi-product forecast data
 from src.web.tests.fixtures.forecast_fixtures import create_sample_fallback_dataframe  # Test fixture for fallback forecast data
+from src.web.tests.fixtures.forecast_fixtures import create_sample_visualization_dataframe  # Test fixture for single-product forecast data
 from src.web.config.product_config import PRODUCTS  # List of valid electricity market products
 from src.web.config.product_config import PRODUCT_COMPARISON_DEFAULTS  # Default products to show in comparison view
 from src.web.config.product_config import MAX_COMPARISON_PRODUCTS  # Maximum number of products that can be compared
@@ -107,14 +108,17 @@ def test_load_comparison_data(products):
     # Define start and end dates for the test
     start_date = '2023-01-01'
     end_date = '2023-01-03'
-    # Mock the load_forecast_by_date_range function
-    with mock.patch('src.web.components.product_comparison.load_forecast_by_date_range') as mock_load_forecast:
+    # Mock the per-product load_forecast_by_date_range function used by the concurrent loader
+    def load_forecast(product, start_date, end_date, percentiles=None):
+        return create_sample_visualization_dataframe(product=product)
+
+    with mock.patch('src.web.data.forecast_loader.load_forecast_by_date_range', side_effect=load_forecast) as mock_load_forecast:
         # Call load_comparison_data with the test parameters
         data = load_comparison_data(products, start_date, end_date)
         # Assert that load_forecast_by_date_range was called for each product
         assert mock_load_forecast.call_count == len(products)
         for product in products:
-            mock_load_forecast.assert_any_call(product=product, start_date=start_date, end_date=end_date)
+            mock_load_forecast.assert_any_call(product, start_date, end_date, None)
         # Assert that the returned dictionary contains entries for each product
         assert len(data) == len(products)
         for product in products:
@@ -0,0 +1,83 @@
+import pytest  # version 7.0.0+
+from unittest import mock  # standard library
+import pandas as pd  # version 2.0.0+
+import datetime  # standard library
+
+from src.web.data.artifact_cache import cache_derived_artifact  # Decorator memoizing derived artifacts
+from src.web.data.artifact_cache import clear_artifact_cache  # Clear cached artifacts
+from src.web.data.artifact_cache import get_artifact_cache_stats  # Artifact cache statistics
+from src.web.data.artifact_cache import get_data_version  # Source data version used in keys
+from src.web.tests.fixtures.forecast_fixtures import create_sample_forecast_dataframe  # Create sample forecast dataframe for testing
+
+
+@pytest.fixture(autouse=True)
+def empty_artifact_cache():
+    """Clears the artifact cache before and after each test"""
+    clear_artifact_cache()
+    yield
+    clear_artifact_cache()
+
+
+def make_counting_transformation():
+    """Creates a memoized transformation that records how often it really runs"""
+    calls = mock.Mock()
+
+    @cache_derived_artifact('test_transformation')
+    def transform(df, percentiles=None):
+        calls(percentiles)
+        return df[['timestamp', 'point_forecast']].assign(percentiles=str(percentiles))
+
+    return transform, calls
+
+
+def test_artifact_memoized_for_same_forecast():
+    """Tests that a transformation runs once for repeated calls on the same forecast"""
+    transform, calls = make_counting_transformation()
+    forecast_df = create_sample_forecast_dataframe()
+
+    first = transform(forecast_df, percentiles=[10, 90])
+    second = transform(forecast_df.copy(), percentiles=[10, 90])
+
+    assert calls.call_count == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert get_artifact_cache_stats()['hit_count'] == 1
+
+
+def test_artifact_keyed_by_parameters():
+    """Tests that different parameters produce different artifacts"""
+    transform, calls = make_counting_transformation()
+    forecast_df = create_sample_forecast_dataframe()
+
+    transform(forecast_df, percentiles=[10, 90])
+    transform(forecast_df, percentiles=[5, 95])
+
+    assert calls.call_count == 2
+
+
+def test_new_generation_timestamp_invalidates_artifact():
+    """Tests that a regenerated forecast is not served a previously prepared artifact"""
+    transform, calls = make_counting_transformation()
+    forecast_df = create_sample_forecast_dataframe()
+    regenerated_df = forecast_df.copy()
+    regenerated_df['generation_timestamp'] = regenerated_df['generation_timestamp'] + datetime.timedelta(hours=1)
+
+    assert get_data_version(forecast_df) != get_data_version(regenerated_df)
+
+    transform(forecast_df)
+    transform(regenerated_df)
+
+    assert calls.call_count == 2
+
+
+def test_cached_artifact_is_not_mutated_by_callers():
+    """Tests that modifying a returned artifact does not change the cached copy"""
+    transform, _ = make_counting_transformation()
+    forecast_df = create_sample_forecast_dataframe()
+
+    first = transform(forecast_df)
+    first['point_forecast'] = 0.0
+
+    second = transform(forecast_df)
+    pd.testing.assert_series_equal(
+        second['point_forecast'], forecast_df['point_forecast'], check_names=False
+    )
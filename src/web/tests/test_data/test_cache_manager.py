@@ -10,9 +10,13 @@ from src.web.data.cache_manager import clear_forecast_cache  # Clear forecast ca
 from src.web.data.cache_manager import get_forecast_cache_stats  # Get statistics about forecast cache usage
 from src.web.data.cache_manager import is_forecast_cache_valid  # Check if a forecast cache entry is valid
 from src.web.data.cache_manager import ForecastCacheManager  # Class for managing forecast data caching
+from src.web.data.cache_manager import ForecastSegmentCache  # Day-segmented range cache
+from src.web.data.cache_manager import iter_forecast_days  # List the days of a date range
+from src.web.data.cache_manager import get_forecast_target_days  # Assign rows to their forecast's target day
 from src.web.config.settings import CACHE_ENABLED  # Flag indicating if caching is enabled
 from src.web.config.settings import CACHE_TIMEOUT  # Timeout in seconds for cached data
 from src.web.tests.fixtures.forecast_fixtures import create_sample_visualization_dataframe  # Create sample forecast dataframe for testing
+from src.web.tests.fixtures.forecast_fixtures import create_sample_forecast_dataframe  # Create sample backend forecast dataframe
 from src.web.data.schema import validate_forecast_dataframe  # Validate forecast data against schema
 
 
@@ -386,4 +390,111 @@ def test_cache_forecast_decorator():
     result3 = cached_get_forecast_data(product="RTLMP", date="2023-11-21")
     # Verify that new result is calculated, not from cache
     assert isinstance(result3, pd.DataFrame)
-    assert id(result1) != id(result3)
\ No newline at end of file
+    assert id(result1) != id(result3)
+
+def create_daily_forecast_dataframe(days, generated_on=None, hours=24):
+    """Creates a forecast dataframe with one forecast for each of the given days, generated that day or on generated_on (a minute apart)"""
+    frames = []
+    for i, day in enumerate(days):
+        generated_at = datetime.datetime.combine(generated_on or day, datetime.time(7, i))
+        df = create_sample_forecast_dataframe(start_time=datetime.datetime.combine(day, datetime.time(0)), hours=hours)
+        df["generation_timestamp"] = pd.Timestamp(generated_at)
+        frames.append(df)
+    return pd.concat(frames, ignore_index=True)
+
+
+class TestForecastSegmentCache:
+    """Test class for the day-segmented range cache"""
+
+    def setup_method(self, method):
+        """Set up a segment cache and a fetch function that records requested ranges"""
+        self.segment_cache = ForecastSegmentCache(latest_timeout=60)
+        self.fetched_ranges = []
+
+        def fetch(product, start_date, end_date):
+            self.fetched_ranges.append((start_date, end_date))
+            return create_daily_forecast_dataframe(iter_forecast_days(start_date, end_date))
+
+        self.fetch = fetch
+
+    def test_overlapping_range_fetches_only_missing_days(self):
+        """Tests that a shifted range is assembled from cached days plus one fetch for the rest"""
+        first = self.segment_cache.get_forecast_range("DALMP", "2023-11-01", "2023-11-03", self.fetch)
+        second = self.segment_cache.get_forecast_range("DALMP", "2023-11-02", "2023-11-05", self.fetch)
+
+        assert self.fetched_ranges == [
+            (datetime.date(2023, 11, 1), datetime.date(2023, 11, 3)),
+            (datetime.date(2023, 11, 4), datetime.date(2023, 11, 5)),
+        ]
+        assert first["generation_timestamp"].dt.date.nunique() == 3
+        assert sorted(second["generation_timestamp"].dt.date.unique()) == iter_forecast_days(
+            datetime.date(2023, 11, 2), datetime.date(2023, 11, 5)
+        )
+
+        # A range inside the cached days needs no fetch at all
+        self.segment_cache.get_forecast_range("DALMP", "2023-11-03", "2023-11-04", self.fetch)
+        assert len(self.fetched_ranges) == 2
+        stats = self.segment_cache.get_stats()
+        assert stats["range_hit_count"] == 1
+        assert stats["range_miss_count"] == 2
+        assert stats["segment_count"] == 5
+
+    def test_only_latest_day_expires(self):
+        """Tests that past-day segments never expire while today's segment is time-limited"""
+        today = datetime.date.today()
+        yesterday = today - datetime.timedelta(days=1)
+        self.segment_cache.get_forecast_range("DALMP", yesterday, today, self.fetch)
+
+        class FutureDatetime(datetime.datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.datetime.now(tz) + datetime.timedelta(days=30)
+
+        with mock.patch("src.web.data.cache_manager.datetime") as mock_datetime:
+            mock_datetime.date = datetime.date
+            mock_datetime.timedelta = datetime.timedelta
+            mock_datetime.datetime = FutureDatetime
+            assert self.segment_cache.get_missing_days("DALMP", yesterday, today) == [today]
+
+    def test_clear_by_product(self):
+        """Tests that clearing a product only drops that product's segments"""
+        self.segment_cache.get_forecast_range("DALMP", "2023-11-01", "2023-11-02", self.fetch)
+        self.segment_cache.get_forecast_range("RTLMP", "2023-11-01", "2023-11-02", self.fetch)
+
+        assert self.segment_cache.clear("DALMP") == 2
+        assert self.segment_cache.get_range("DALMP", "2023-11-01", "2023-11-02") is None
+        assert self.segment_cache.get_range("RTLMP", "2023-11-01", "2023-11-02") is not None
+
+    def test_forecast_generated_on_another_day(self):
+        """Tests that forecasts are segmented by target day, not by the day they were generated"""
+        backfilled = create_daily_forecast_dataframe(
+            iter_forecast_days(datetime.date(2023, 11, 1), datetime.date(2023, 11, 2)), generated_on=datetime.date(2023, 12, 1)
+        )
+
+        result = self.segment_cache.get_forecast_range("DALMP", "2023-11-01", "2023-11-02", lambda *args: backfilled)
+
+        assert len(result) == 48
+        assert len(self.segment_cache.get_range("DALMP", "2023-11-02", "2023-11-02")) == 24
+
+    def test_multi_day_forecasts_stay_whole(self):
+        """Tests that a forecast extending past its target day is kept in its target day's segment"""
+        forecasts = create_daily_forecast_dataframe(
+            iter_forecast_days(datetime.date(2023, 11, 1), datetime.date(2023, 11, 2)), hours=72
+        )
+
+        target_days = get_forecast_target_days(forecasts)
+        assert target_days.value_counts().to_dict() == {datetime.date(2023, 11, 1): 72, datetime.date(2023, 11, 2): 72}
+
+        self.segment_cache.get_forecast_range("DALMP", "2023-11-01", "2023-11-02", lambda *args: forecasts)
+        assert len(self.segment_cache.get_range("DALMP", "2023-11-02", "2023-11-02")) == 72
+
+    def test_days_with_unassigned_rows_are_not_cached_as_empty(self):
+        """Tests that a response with rows outside the requested days does not cache empty days"""
+        shifted = create_daily_forecast_dataframe([datetime.date(2023, 11, 3)])
+
+        result = self.segment_cache.get_forecast_range("DALMP", "2023-11-01", "2023-11-02", lambda *args: shifted)
+
+        assert len(result) == 24
+        assert self.segment_cache.get_missing_days("DALMP", "2023-11-01", "2023-11-02") == [
+            datetime.date(2023, 11, 1), datetime.date(2023, 11, 2)
+        ]
@@ -19,7 +19,10 @@ from src.web.data.data_processor import (  # Class for processing forecast data
     identify_price_spikes,  # Identify potential price spikes in forecast data
     resample_forecast_data,  # Resample forecast data to different time frequency
     get_forecast_summary,  # Generate summary of forecast data for display
+    downsample_time_series,  # Downsample long time series for display
+    get_downsample_point_count,  # Point budget for a viewport width
     DEFAULT_PERCENTILES,  # Default percentiles for uncertainty bands
+    MIN_DOWNSAMPLE_POINTS,  # Minimum point budget
 )
 from src.web.tests.fixtures.forecast_fixtures import (  # Create sample forecast dataframe in visualization format
     create_sample_visualization_dataframe,
@@ -243,6 +246,62 @@ class TestAnalysisFunctions:
         assert isinstance(summary['avg_price_formatted'], str)
 
 
+class TestDownsampling:
+    """Test class for time series downsampling functions in the data_processor module"""
+
+    def test_get_downsample_point_count(self):
+        """Tests that the point budget scales with the viewport width in rounded steps"""
+        # Assert that narrow viewports are bounded by the minimum budget
+        assert get_downsample_point_count(100) == MIN_DOWNSAMPLE_POINTS
+        # Assert that nearby widths share the same budget
+        assert get_downsample_point_count(1190) == get_downsample_point_count(1200)
+        # Assert that wider viewports get more points and a missing width uses the default
+        assert get_downsample_point_count(2400) > get_downsample_point_count(1200)
+        assert get_downsample_point_count(None) == get_downsample_point_count(1200)
+
+    def test_downsample_time_series_keeps_short_series(self):
+        """Tests that series within the point budget are returned unchanged"""
+        df = create_sample_visualization_dataframe(product='DALMP', hours=72)
+        assert downsample_time_series(df, 100) is df
+
+    def test_downsample_time_series_preserves_extremes(self):
+        """Tests that downsampling keeps peaks, range endpoints and band envelopes"""
+        # Create four weeks of hourly data with a single price spike
+        df = create_sample_visualization_dataframe(product='DALMP', hours=24 * 28).reset_index(drop=True)
+        df.loc[300, 'point_forecast'] = df['point_forecast'].max() * 10
+        df.loc[300, 'upper_bound'] = df.loc[300, 'point_forecast'] + 1
+
+        downsampled = downsample_time_series(df, 100)
+
+        # Assert that the result respects the budget and spans the full range
+        assert len(downsampled) == 100
+        assert downsampled['timestamp'].iloc[0] == df['timestamp'].min()
+        assert downsampled['timestamp'].iloc[-1] == df['timestamp'].max()
+        # Assert that the spike survives downsampling
+        assert downsampled['point_forecast'].max() == df['point_forecast'].max()
+        # Assert that the bands are envelopes covering every hidden point
+        assert downsampled['lower_bound'].min() == df['lower_bound'].min()
+        assert downsampled['upper_bound'].max() == df['upper_bound'].max()
+        assert (downsampled['lower_bound'] <= downsampled['point_forecast']).all()
+        assert (downsampled['upper_bound'] >= downsampled['point_forecast']).all()
+
+    def test_downsample_time_series_per_product(self):
+        """Tests that each product is downsampled to the point budget separately"""
+        df = create_multi_product_forecast_dataframe(products=['DALMP', 'RTLMP'], hours=24 * 14)
+        df = prepare_dataframe_for_visualization(df)
+
+        downsampled = downsample_time_series(df, 100)
+
+        assert downsampled.groupby('product').size().to_dict() == {'DALMP': 100, 'RTLMP': 100}
+
+    def test_prepare_time_series_data_with_max_points(self):
+        """Tests that prepare_time_series_data downsamples before formatting"""
+        df = create_sample_visualization_dataframe(product='DALMP', hours=24 * 28)
+        result = prepare_time_series_data(df, 'DALMP', max_points=200)
+        assert len(result) == 200
+        assert result['point_forecast_formatted'].notna().all()
+
+
 class TestForecastDataProcessor:
     """Test class for the ForecastDataProcessor class"""
 
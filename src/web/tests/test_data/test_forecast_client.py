@@ -6,6 +6,7 @@ import requests  # version ^2.28.0
 import pandas as pd  # version 2.0.0+
 from datetime import date, datetime  # standard library
 import io  # standard library
+import concurrent.futures  # standard library
 
 from src.web.data.forecast_client import ForecastClient, get_forecast_by_date, get_latest_forecast, get_forecasts_by_date_range, validate_product, parse_response  # Client for retrieving forecast data from the backend API
 from src.web.config.settings import API_BASE_URL, FORECAST_API_TIMEOUT  # Base URL for the forecast API
@@ -283,6 +284,41 @@ def test_parse_response_csv():
         assert len(forecast_df) == len(sample_df)
 
 
+def test_parse_response_arrow():
+    """Tests that parse_response reads Arrow IPC stream responses"""
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.ipc  # noqa: F401
+
+    sample_df = create_sample_forecast_dataframe()
+    table = pa.Table.from_pandas(sample_df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    with unittest.mock.patch("requests.Response") as MockResponse:
+        mock_response = MockResponse()
+        mock_response.status_code = 200
+        mock_response.content = sink.getvalue().to_pybytes()
+
+        forecast_df = parse_response(mock_response, format='arrow')
+
+        pd.testing.assert_frame_equal(forecast_df, sample_df.reset_index(drop=True))
+
+
+def test_client_requests_arrow_by_default():
+    """Tests that the client asks the API for Arrow responses when pyarrow is installed"""
+    pytest.importorskip('pyarrow')
+    client = ForecastClient(base_url=TEST_API_URL, timeout=TEST_TIMEOUT)
+
+    assert client.session.headers['Accept'].startswith('application/vnd.apache.arrow.stream')
+    with unittest.mock.patch.object(client, 'conditional_get') as mock_get, \
+            unittest.mock.patch.object(client, 'parse_response') as mock_parse:
+        client.get_latest_forecast("DALMP")
+
+    assert 'format=arrow' in mock_get.call_args[0][0]
+    assert mock_parse.call_args[0][1] == 'arrow'
+
+
 def test_parse_response_error():
     """Tests that parse_response correctly handles error responses"""
     with unittest.mock.patch("requests.Response") as MockResponse:
@@ -336,6 +372,87 @@ def test_client_close():
         mock_close.assert_called_once()
 
 
+def test_conditional_get_reuses_cached_response():
+    """Tests that ForecastClient revalidates with ETag/Last-Modified and reuses the cached body on 304"""
+    client = ForecastClient(base_url=TEST_API_URL, timeout=TEST_TIMEOUT)
+    url = f"{TEST_API_URL}/forecasts/latest/DALMP"
+
+    first_response = unittest.mock.Mock(status_code=200, headers={"ETag": '"abc123"', "Last-Modified": "Thu, 01 Jun 2023 12:00:00 GMT"})
+    not_modified_response = unittest.mock.Mock(status_code=304, headers={"ETag": '"abc123"'})
+
+    with unittest.mock.patch.object(client.session, "get", side_effect=[first_response, not_modified_response]) as mock_get:
+        assert client.conditional_get(url) is first_response
+        mock_get.assert_called_with(url, timeout=TEST_TIMEOUT)
+
+        # The second request carries the validators and a 304 returns the cached response
+        assert client.conditional_get(url) is first_response
+        mock_get.assert_called_with(
+            url,
+            headers={"If-None-Match": '"abc123"', "If-Modified-Since": "Thu, 01 Jun 2023 12:00:00 GMT"},
+            timeout=TEST_TIMEOUT
+        )
+
+    # Closing the client drops the cached responses
+    client.close()
+    with unittest.mock.patch.object(client.session, "get", return_value=first_response) as mock_get:
+        client.conditional_get(url)
+        mock_get.assert_called_once_with(url, timeout=TEST_TIMEOUT)
+
+
+def test_conditional_get_entry_evicted_during_request():
+    """Tests that a 304 for an entry another thread evicted meanwhile still returns the cached response"""
+    client = ForecastClient(base_url=TEST_API_URL, timeout=TEST_TIMEOUT)
+    url = f"{TEST_API_URL}/forecasts/latest/DALMP"
+    first_response = unittest.mock.Mock(status_code=200, headers={"ETag": '"abc123"'})
+
+    def get(url, headers=None, timeout=None):
+        if headers is None:
+            return first_response
+        # Another worker thread fills the cache and evicts the entry while this request is in flight
+        client.clear_conditional_cache()
+        return unittest.mock.Mock(status_code=304, headers={"ETag": '"abc123"'})
+
+    with unittest.mock.patch.object(client.session, "get", side_effect=get):
+        client.conditional_get(url)
+        assert client.conditional_get(url) is first_response
+
+
+def test_conditional_get_shared_across_threads():
+    """Tests that worker threads sharing a client can revalidate and evict concurrently"""
+    with unittest.mock.patch("src.web.data.forecast_client.MAX_CONDITIONAL_CACHE_ENTRIES", 2):
+        client = ForecastClient(base_url=TEST_API_URL, timeout=TEST_TIMEOUT)
+    urls = [f"{TEST_API_URL}/forecasts/latest/{product}" for product in PRODUCTS] * 50
+
+    def get(url, headers=None, timeout=None):
+        if headers:
+            return unittest.mock.Mock(status_code=304, headers={})
+        return unittest.mock.Mock(status_code=200, headers={"ETag": f'"{url}"'})
+
+    with unittest.mock.patch.object(client.session, "get", side_effect=get), \
+         concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(client.conditional_get, urls))
+
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_conditional_get_cache_bounded_by_size():
+    """Tests that large response bodies are evicted once the conditional cache exceeds its memory budget"""
+    body = b"x" * 4096
+    with unittest.mock.patch("src.web.data.forecast_client.MAX_CONDITIONAL_CACHE_BYTES", 3 * len(body)):
+        client = ForecastClient(base_url=TEST_API_URL, timeout=TEST_TIMEOUT)
+    urls = [f"{TEST_API_URL}/forecasts/latest/{product}" for product in PRODUCTS[:4]]
+
+    def get(url, headers=None, timeout=None):
+        return unittest.mock.Mock(status_code=200, headers={"ETag": f'"{url}"'}, content=body)
+
+    with unittest.mock.patch.object(client.session, "get", side_effect=get):
+        for url in urls:
+            client.conditional_get(url)
+
+    # Only the most recently fetched bodies fit in the budget
+    assert client._conditional_cache.keys() == urls[-2:]
+
+
 def test_error_handling_connection_error():
     """Tests that the client correctly handles connection errors"""
     # Create a ForecastClient instance
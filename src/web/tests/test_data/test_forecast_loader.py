@@ -6,6 +6,7 @@ behavior.
 """
 
 import pytest  # pytest: 7.0.0+
+import threading  # standard library
 import unittest.mock  # standard library
 import pandas as pd  # pandas: 2.0.0+
 from datetime import datetime  # standard library
@@ -13,6 +14,7 @@ from typing import Dict
 
 from src.web.data.forecast_loader import ForecastLoader, load_forecast_by_date, load_latest_forecast, load_forecast_by_date_range, validate_product
 from src.web.data.forecast_loader import DEFAULT_PERCENTILES
+from src.web.data.forecast_loader import load_forecasts_for_products, align_forecast_frames
 from src.web.data.forecast_client import ForecastClient  # ForecastClient: 
 from src.web.data.cache_manager import ForecastCacheManager  # ForecastCacheManager: 
 from src.web.config.product_config import PRODUCTS, DEFAULT_PRODUCT  # PRODUCTS: 
@@ -43,7 +45,7 @@ class MockForecastClient:
             return self.mock_data[product]
         return pd.DataFrame()
 
-    def get_forecasts_by_date_range(self, product: str, start_date: str, end_date: str, format: str):
+    def get_forecasts_by_date_range(self, product: str, start_date: str, end_date: str, format: str = "json"):
         """Mock implementation of get_forecasts_by_date_range"""
         if self.should_fail:
             raise Exception("Mock client failure")
@@ -75,6 +77,15 @@ class MockForecastCacheManager:
         self.cache_data[key] = forecast_df
         return True
 
+    def get_forecast_range(self, product: str, start_date: str, end_date: str, fetch_func):
+        """Mock implementation of get_forecast_range"""
+        cached = self.get_forecast(product, start_date, end_date)
+        if cached is not None:
+            return cached
+        forecast_df = fetch_func(product, start_date, end_date)
+        self.cache_forecast(product, forecast_df, start_date, end_date)
+        return forecast_df
+
     def clear_cache(self, product: str = None):
         """Mock implementation of clear_cache"""
         if product is None:
@@ -380,4 +391,34 @@ def test_fallback_handling():
 
             # Verify that metadata indicates fallback status
             metadata = forecast_loader.get_forecast_metadata(df)
-            assert metadata["is_fallback"] == True
\ No newline at end of file
+            assert metadata["is_fallback"] == True
+
+
+def test_load_forecasts_for_products_concurrently():
+    """Test that products are loaded on separate worker threads and failures are omitted"""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def load_forecast(product, start_date, end_date, percentiles=None):
+        if product == 'RTLMP':
+            raise ValueError("API unavailable")
+        # Both successful loads must be in flight at the same time to pass the barrier
+        barrier.wait()
+        return create_sample_visualization_dataframe(product=product)
+
+    with unittest.mock.patch("src.web.data.forecast_loader.load_forecast_by_date_range", side_effect=load_forecast):
+        forecast_dfs = load_forecasts_for_products(['DALMP', 'RTLMP', 'RegUp'], "2023-01-01", "2023-01-03")
+
+    assert list(forecast_dfs) == ['DALMP', 'RegUp']
+
+
+def test_align_forecast_frames():
+    """Test that product frames are aligned on the union of their timestamps"""
+    start = datetime(2023, 1, 1)
+    dalmp_df = create_sample_visualization_dataframe(product='DALMP', start_time=start, hours=24)
+    rtlmp_df = create_sample_visualization_dataframe(product='RTLMP', start_time=start, hours=12)
+
+    aligned = align_forecast_frames({'DALMP': dalmp_df, 'RTLMP': rtlmp_df})
+
+    assert list(aligned['RTLMP']['timestamp']) == list(aligned['DALMP']['timestamp'])
+    assert aligned['RTLMP']['point_forecast'].isna().sum() == 12
+    assert (aligned['RTLMP']['product'] == 'RTLMP').all()
@@ -188,6 +188,25 @@ def test_get_sample_columns():
     assert "other_column" not in sample_columns
 
 
+def test_get_sample_columns_with_run_specific_sample_count():
+    """Tests that sample columns are found for any per-run sample count and ordered numerically"""
+    data = {'timestamp': [datetime(2023, 1, 1)],
+            'product': ['DALMP'],
+            'point_forecast': [50.0],
+            'num_samples': [1000]}
+    for i in range(1000, 0, -1):
+        data[f'sample_{i:03d}'] = [np.float32(i)]
+    sample_df = pd.DataFrame(data)
+
+    sample_columns = get_sample_columns(sample_df)
+
+    # Assert that all 1000 samples are found in sample order and metadata is excluded
+    assert len(sample_columns) == 1000
+    assert sample_columns[0] == "sample_001"
+    assert sample_columns[-1] == "sample_1000"
+    assert "num_samples" not in sample_columns
+
+
 def test_convert_to_price_forecast_models():
     """Tests the conversion of a dataframe to PriceForecast models"""
     # Create a sample forecast dataframe
@@ -14,6 +14,8 @@ from src.web.utils.caching import clear_disk_cache  # Function to test
 from src.web.utils.caching import get_cache_stats  # Function to test
 from src.web.utils.caching import invalidate_cache_entry  # Function to test
 from src.web.utils.caching import CacheManager  # Class to test
+from src.web.utils.caching import BoundedCache  # Class to test
+from src.web.utils.caching import estimate_size  # Function to test
 from src.web.config.settings import CACHE_ENABLED  # Flag indicating if caching is enabled
 from src.web.config.settings import CACHE_TIMEOUT  # Timeout in seconds for cached data
 from src.web.config.settings import CACHE_DIR  # Directory for storing cached data
@@ -435,4 +437,63 @@ def test_cache_disabled():
         retrieved_value = get_from_cache(TEST_CACHE_KEY)
 
         # Verify that values are not cached when caching is disabled
-        assert retrieved_value is None
\ No newline at end of file
+        assert retrieved_value is None
+
+def test_bounded_cache_lru_eviction():
+    """Tests that the least recently used entry is evicted when the entry cap is reached"""
+    bounded = BoundedCache(max_entries=2)
+    bounded.set('key1', 'value1')
+    bounded.set('key2', 'value2')
+
+    # Touch key1 so key2 becomes the least recently used entry
+    assert bounded.get('key1') == 'value1'
+    bounded.set('key3', 'value3')
+
+    assert bounded.get('key2') is None
+    assert bounded.get('key1') == 'value1'
+    assert bounded.get('key3') == 'value3'
+    assert bounded.get_stats()['eviction_count'] == 1
+
+
+def test_bounded_cache_memory_budget():
+    """Tests that DataFrames are evicted to stay within the byte budget"""
+    sample_df = create_sample_visualization_dataframe()
+    df_size = estimate_size(sample_df)
+    assert df_size == sample_df.memory_usage(deep=True).sum()
+
+    bounded = BoundedCache(max_bytes=int(df_size * 2.5))
+    for i in range(4):
+        assert bounded.set(f'df{i}', sample_df.copy()) is True
+
+    stats = bounded.get_stats()
+    assert stats['entry_count'] == 2
+    assert stats['eviction_count'] == 2
+    assert stats['estimated_size_bytes'] <= stats['max_bytes']
+
+    # A single value larger than the whole budget is rejected
+    assert BoundedCache(max_bytes=df_size - 1).set('too_big', sample_df) is False
+
+
+def test_bounded_cache_sweep_expired():
+    """Tests that expired entries are removed by a sweep without being accessed"""
+    now = [1000.0]
+    bounded = BoundedCache(default_timeout=10, clock=lambda: now[0])
+    bounded.set('short', 'value', timeout=1)
+    bounded.set('default', 'value')
+
+    now[0] += 5
+    assert bounded.sweep_expired() == 1
+    assert len(bounded) == 1
+    assert bounded.get_stats()['expiration_count'] == 1
+
+
+def test_get_cache_stats_reports_evictions():
+    """Tests that evictions from the module-level memory cache are reported"""
+    clear_cache()
+    with unittest.mock.patch('src.web.utils.caching._memory_cache', BoundedCache(max_entries=1)):
+        store_in_cache('key1', 'value1')
+        store_in_cache('key2', 'value2')
+        stats = get_cache_stats()
+
+    assert stats['entry_count'] == 1
+    assert stats['eviction_count'] == 1
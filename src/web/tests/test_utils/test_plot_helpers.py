@@ -13,6 +13,7 @@ from src.web.utils.plot_helpers import create_forecast_accuracy_plot  # Create v
 from src.web.utils.plot_helpers import configure_axes  # Configure plot axes with appropriate formatting
 from src.web.utils.plot_helpers import create_hover_template  # Create template for hover information
 from src.web.utils.plot_helpers import apply_responsive_layout  # Apply responsive adjustments to plot layout
+from src.web.utils.plot_helpers import create_layout_patch  # Create layout-only figure updates
 from src.web.utils.plot_helpers import format_axis_date  # Format date axis with appropriate tick formatting
 from src.web.utils.plot_helpers import add_fallback_indicator  # Add indicator when using fallback forecast data
 from src.web.utils.plot_helpers import DEFAULT_PLOT_HEIGHT  # Default height for plots
@@ -28,6 +29,8 @@ from src.web.config.product_config import PRODUCTS  # List of valid electricity
 from src.web.config.product_config import DEFAULT_PRODUCT  # Default product for testing
 from src.web.config.themes import get_theme_colors  # Get color palette for current theme
 from src.web.config.themes import DEFAULT_THEME  # Default theme for visualizations
+from src.web.utils.figure_cache import clear_figure_cache  # Clear cached figures
+from src.web.utils.figure_cache import get_figure_cache_stats  # Figure cache statistics
 
 
 def test_create_time_series_plot_with_valid_data():
@@ -353,4 +356,37 @@ def test_create_time_series_plot_with_empty_data():
     # Verify the function handles empty data gracefully
     assert isinstance(fig, go.Figure)
     # Verify an appropriate message or empty plot is returned
-    assert len(fig.data) == 0
\ No newline at end of file
+    assert len(fig.data) == 0
+
+
+def test_create_time_series_plot_uses_figure_cache():
+    # Start from an empty figure cache
+    clear_figure_cache()
+    sample_df = create_sample_visualization_dataframe()
+    # Build the same figure twice
+    first = create_time_series_plot(sample_df, DEFAULT_PRODUCT, "Cached")
+    second = create_time_series_plot(sample_df.copy(), DEFAULT_PRODUCT, "Cached")
+    # Verify the second figure is served from the cache and matches the first
+    assert get_figure_cache_stats()['hit_count'] == 1
+    assert second.to_dict() == first.to_dict()
+    # Verify styling a returned figure does not change the cached figure
+    second.update_layout(title="Changed")
+    third = create_time_series_plot(sample_df, DEFAULT_PRODUCT, "Cached")
+    assert third.layout.title.text == "Cached"
+    # Verify different options produce a different figure
+    other = create_time_series_plot(sample_df, DEFAULT_PRODUCT, "Other title")
+    assert other.layout.title.text == "Other title"
+
+
+@pytest.mark.parametrize('viewport_size', ['mobile', 'tablet', 'desktop'])
+def test_create_layout_patch_matches_responsive_layout(viewport_size):
+    # Build the responsive layout the full way
+    fig = apply_responsive_layout(go.Figure(), viewport_size, DEFAULT_PLOT_HEIGHT)
+    # Create the equivalent layout patch
+    patch = create_layout_patch(viewport_size, DEFAULT_PLOT_HEIGHT)
+    operations = patch.to_plotly_json()['operations']
+    # Verify the patch only assigns layout properties
+    assert all(operation['location'][0] == 'layout' for operation in operations)
+    # Verify the patched height matches the fully rebuilt figure
+    assigned = {operation['location'][1]: operation['params']['value'] for operation in operations}
+    assert assigned['height'] == fig.layout.height
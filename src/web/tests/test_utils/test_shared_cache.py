@@ -0,0 +1,132 @@
+import multiprocessing  # standard library
+import os  # standard library
+import time  # standard library
+import unittest.mock  # standard library
+
+import pandas  # pandas: 2.0.0+
+import pytest  # pytest: 7.0.0+
+
+pytest.importorskip('pyarrow')
+
+from src.web.utils.shared_cache import SharedForecastCache  # Class to test
+from src.web.tests.fixtures.forecast_fixtures import create_sample_visualization_dataframe  # Create sample forecast dataframe for testing caching
+
+TEST_CACHE_KEY = 'DALMP:latest'
+
+
+@pytest.fixture
+def shared_cache(tmp_path):
+    """Creates a shared cache in a temporary directory with the shared tier enabled"""
+    with unittest.mock.patch('src.web.utils.shared_cache.SHARED_CACHE_ENABLED', True):
+        yield SharedForecastCache(cache_dir=str(tmp_path), default_timeout=60, lock_timeout=10)
+
+
+def _fetch_in_worker(cache_dir: str, counter_dir: str) -> None:
+    """Worker process body: fetch the test key through its own SharedForecastCache instance"""
+    def fetch():
+        # Record the fetch and make it slow enough for the other workers to miss as well
+        open(os.path.join(counter_dir, str(os.getpid())), 'w').close()
+        time.sleep(0.5)
+        return pandas.DataFrame({'product': ['DALMP'], 'point_forecast': [42.0]})
+
+    with unittest.mock.patch('src.web.utils.shared_cache.SHARED_CACHE_ENABLED', True):
+        result = SharedForecastCache(cache_dir=cache_dir, lock_timeout=10).get_or_fetch(TEST_CACHE_KEY, fetch)
+    assert result['point_forecast'].iloc[0] == 42.0
+
+
+def test_put_and_get_roundtrip(shared_cache):
+    """Tests that a dataframe written by one instance is read back by another"""
+    sample_df = create_sample_visualization_dataframe()
+    assert shared_cache.put(TEST_CACHE_KEY, sample_df) is True
+
+    reader = SharedForecastCache(cache_dir=shared_cache.cache_dir)
+    pandas.testing.assert_frame_equal(reader.get(TEST_CACHE_KEY), sample_df.reset_index(drop=True))
+    assert reader.get('missing_key') is None
+
+
+def test_expired_entry_is_ignored(shared_cache):
+    """Tests that entries are not served after their timeout"""
+    shared_cache.put(TEST_CACHE_KEY, create_sample_visualization_dataframe(), timeout=1)
+
+    with unittest.mock.patch('src.web.utils.shared_cache.time.time', return_value=time.time() + 2):
+        assert shared_cache.get(TEST_CACHE_KEY) is None
+
+    # The expired file is deleted when it is read
+    assert os.listdir(shared_cache.cache_dir) == []
+
+
+def test_sweep_removes_expired_entries_and_stale_files(shared_cache):
+    """Tests that a sweep deletes expired entries, unused lock files and abandoned temporary files"""
+    fresh_df = create_sample_visualization_dataframe()
+    shared_cache.get_or_fetch('fresh', lambda: fresh_df)
+    shared_cache.get_or_fetch('expiring', lambda: fresh_df, timeout=1)
+    abandoned_tmp = os.path.join(shared_cache.cache_dir, 'abandoned.tmp')
+    open(abandoned_tmp, 'w').close()
+    os.utime(abandoned_tmp, (time.time() - 3600, time.time() - 3600))
+
+    with unittest.mock.patch('src.web.utils.shared_cache.time.time', return_value=time.time() + 2):
+        assert shared_cache.sweep_expired() == 1
+
+    remaining = sorted(os.listdir(shared_cache.cache_dir))
+    assert remaining == sorted([
+        os.path.basename(shared_cache._get_path('fresh', '.arrow')),
+        os.path.basename(shared_cache._get_path('fresh', '.lock'))
+    ])
+    assert shared_cache.get('fresh') is not None
+
+
+def test_put_sweeps_periodically(tmp_path):
+    """Tests that writes sweep the directory once the sweep interval has passed"""
+    with unittest.mock.patch('src.web.utils.shared_cache.SHARED_CACHE_ENABLED', True):
+        cache = SharedForecastCache(cache_dir=str(tmp_path), sweep_interval=0)
+        cache.put('expiring', create_sample_visualization_dataframe(), timeout=0)
+        cache.put(TEST_CACHE_KEY, create_sample_visualization_dataframe())
+
+    assert os.listdir(tmp_path) == [os.path.basename(cache._get_path(TEST_CACHE_KEY, '.arrow'))]
+
+
+def test_get_or_fetch_caches_result(shared_cache):
+    """Tests that a fetched dataframe is stored and reused"""
+    fetch = unittest.mock.Mock(return_value=create_sample_visualization_dataframe())
+
+    shared_cache.get_or_fetch(TEST_CACHE_KEY, fetch)
+    shared_cache.get_or_fetch(TEST_CACHE_KEY, fetch)
+
+    assert fetch.call_count == 1
+    stats = shared_cache.get_stats()
+    assert stats['shared_hit_count'] == 1
+    assert stats['shared_fetch_count'] == 1
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork and file locks')
+def test_single_flight_across_processes(tmp_path):
+    """Tests that concurrent misses from several processes result in a single fetch"""
+    cache_dir = tmp_path / 'cache'
+    counter_dir = tmp_path / 'fetches'
+    counter_dir.mkdir()
+
+    context = multiprocessing.get_context('fork')
+    workers = [
+        context.Process(target=_fetch_in_worker, args=(str(cache_dir), str(counter_dir)))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert len(os.listdir(counter_dir)) == 1
+
+
+def test_disabled_falls_through_to_fetch(tmp_path):
+    """Tests that a disabled shared tier always calls the fetch function"""
+    with unittest.mock.patch('src.web.utils.shared_cache.SHARED_CACHE_ENABLED', False):
+        cache = SharedForecastCache(cache_dir=str(tmp_path))
+        fetch = unittest.mock.Mock(return_value=create_sample_visualization_dataframe())
+
+        cache.get_or_fetch(TEST_CACHE_KEY, fetch)
+        cache.get_or_fetch(TEST_CACHE_KEY, fetch)
+
+    assert fetch.call_count == 2
+    assert os.listdir(tmp_path) == []
@@ -48,8 +48,8 @@ __all__ = [
     'create_time_series_plot', 'add_uncertainty_bands', 
     'create_probability_distribution_plot', 'create_product_comparison_plot', 
     'create_heatmap_plot', 'create_forecast_accuracy_plot', 'configure_axes', 
-    'create_hover_template', 'apply_responsive_layout', 'format_axis_date', 
-    'add_fallback_indicator',
+    'create_hover_template', 'apply_responsive_layout', 'get_responsive_layout_updates',
+    'create_layout_patch', 'format_axis_date', 'add_fallback_indicator',
     
     # From error_handlers
     'handle_callback_error', 'create_error_message', 'format_exception',
@@ -4,6 +4,9 @@ Price Forecasting System's web visualization interface.
 
 This module implements memory-based and disk-based caching with timeout capabilities to
 improve dashboard responsiveness and reduce redundant data processing operations.
+In-memory caches are bounded: entries are evicted least-recently-used first once a cache
+exceeds its entry cap or its memory budget, where DataFrames are measured with
+memory_usage(deep=True). Expired entries are also removed by a background sweeper.
 """
 
 import datetime
@@ -12,11 +15,21 @@ import hashlib
 import logging
 import os
 import pickle
-from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union, cast
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar, Union, cast
+
+import pandas as pd  # version 2.0.0+
 
 from ..config.settings import (
     CACHE_DIR,
     CACHE_ENABLED,
+    CACHE_MAX_ENTRIES,
+    CACHE_MAX_MEMORY_MB,
+    CACHE_SWEEP_INTERVAL_SECONDS,
     CACHE_TIMEOUT,
     is_development,
 )
@@ -24,15 +37,387 @@ from ..config.settings import (
 # Set up module logger
 logger = logging.getLogger(__name__)
 
-# Global cache storage
-_memory_cache: Dict[str, Any] = {}
-_cache_metadata: Dict[str, Dict[str, Any]] = {}
-_cache_hits: int = 0
-_cache_misses: int = 0
-
 # Type variable for function return values
 T = TypeVar('T')
 
+# Caches swept by the background sweeper, held weakly so unused caches can be collected
+_registered_caches: "weakref.WeakSet[BoundedCache]" = weakref.WeakSet()
+_sweeper_lock = threading.Lock()
+_sweeper_thread: Optional[threading.Thread] = None
+_sweeper_stop = threading.Event()
+_sweeper_pid: Optional[int] = None
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimates the memory used by a cached value in bytes.
+    
+    DataFrames and Series are measured with memory_usage(deep=True) so object columns
+    and all sample columns are counted; dictionaries and lists (e.g. Plotly figure dicts)
+    are measured recursively; other values use sys.getsizeof.
+    
+    Args:
+        value: Value to measure
+        
+    Returns:
+        Estimated size in bytes
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(key) + estimate_size(item) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    try:
+        return sys.getsizeof(value)
+    except TypeError:
+        return 0
+
+
+class BoundedCache:
+    """
+    Thread-safe in-memory cache with LRU and TTL eviction and a memory budget.
+    
+    Entries expire after their timeout and are evicted least-recently-used first when
+    the cache holds more than max_entries entries or more than max_bytes of estimated
+    memory. Hit, miss, eviction and expiration counts are tracked for get_stats.
+    """
+    
+    def __init__(
+        self,
+        name: str = 'cache',
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_MEMORY_MB * 1024 * 1024,
+        default_timeout: Optional[int] = CACHE_TIMEOUT,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initializes an empty bounded cache and registers it with the background sweeper.
+        
+        Args:
+            name: Name used in logs and stats
+            max_entries: Maximum number of entries held
+            max_bytes: Maximum estimated memory of all entries in bytes
+            default_timeout: Timeout in seconds for entries stored without one,
+                or None for entries that never expire
+            clock: Callable returning the current time in seconds
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_timeout = default_timeout
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.RLock()
+        self._logger = logging.getLogger(__name__ + '.BoundedCache')
+        _registered_caches.add(self)
+    
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        """Returns True if the entry's expiry time has passed."""
+        return entry['expires_at'] is not None and now >= entry['expires_at']
+    
+    def _remove(self, key: Hashable) -> None:
+        """Removes an entry and releases its memory budget. Caller holds the lock."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry['size']
+    
+    def _evict_to_budget(self, keep: Hashable) -> None:
+        """
+        Evicts entries until the cache is within its bounds. Caller holds the lock.
+        
+        Expired entries are dropped first, then least-recently-used entries, never
+        evicting the entry that was just stored.
+        
+        Args:
+            keep: Key of the entry that was just stored
+        """
+        if len(self._entries) <= self.max_entries and self._total_bytes <= self.max_bytes:
+            return
+        
+        self._sweep_locked()
+        
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            self._remove(oldest)
+            self._evictions += 1
+            self._logger.debug(f"Evicted least recently used entry from {self.name} cache: {oldest}")
+    
+    def _sweep_locked(self) -> int:
+        """Removes all expired entries. Caller holds the lock."""
+        now = self._clock()
+        expired = [key for key, entry in self._entries.items() if self._is_expired(entry, now)]
+        for key in expired:
+            self._remove(key)
+        self._expirations += len(expired)
+        return len(expired)
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Retrieves a value and marks it as recently used.
+        
+        Args:
+            key: Cache key to retrieve
+            
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            if self._is_expired(entry, self._clock()):
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry['value']
+    
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        timeout: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Stores a value, evicting other entries if the cache exceeds its bounds.
+        
+        Args:
+            key: Cache key to store the value under
+            value: Value to cache
+            timeout: Timeout in seconds, or None to use the cache's default timeout
+            metadata: Optional metadata kept alongside the value
+            
+        Returns:
+            True if the value was stored, False if it alone exceeds the memory budget
+        """
+        size = estimate_size(value)
+        
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            
+            if size > self.max_bytes:
+                self._logger.warning(
+                    f"Not caching {key} in {self.name} cache: {size} bytes exceeds budget of {self.max_bytes}"
+                )
+                return False
+            
+            timeout_value = timeout if timeout is not None else self.default_timeout
+            now = self._clock()
+            self._entries[key] = {
+                'value': value,
+                'size': size,
+                'stored_at': now,
+                'expires_at': now + timeout_value if timeout_value is not None else None,
+                'metadata': metadata or {}
+            }
+            self._total_bytes += size
+            self._evict_to_budget(keep=key)
+        
+        return True
+    
+    def is_valid(self, key: Hashable) -> bool:
+        """
+        Checks whether a key holds an unexpired entry, without affecting LRU order or stats.
+        
+        Args:
+            key: Cache key to check
+            
+        Returns:
+            True if the entry exists and has not expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry, self._clock())
+    
+    def get_metadata(self) -> Dict[Hashable, Dict[str, Any]]:
+        """
+        Returns the metadata of all unexpired entries.
+        
+        Returns:
+            Dictionary mapping keys to their metadata
+        """
+        with self._lock:
+            now = self._clock()
+            return {
+                key: entry['metadata'] for key, entry in self._entries.items()
+                if not self._is_expired(entry, now)
+            }
+    
+    def keys(self) -> List[Hashable]:
+        """
+        Returns the keys of all entries, including expired ones not yet swept.
+        
+        Returns:
+            List of keys from least to most recently used
+        """
+        with self._lock:
+            return list(self._entries)
+    
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Removes a single entry.
+        
+        Args:
+            key: Cache key to remove
+            
+        Returns:
+            True if the entry was found and removed
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+    
+    def clear(self, reset_stats: bool = True) -> int:
+        """
+        Removes all entries.
+        
+        Args:
+            reset_stats: Whether to also reset the hit, miss and eviction counters
+            
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+            if reset_stats:
+                self._hits = 0
+                self._misses = 0
+                self._evictions = 0
+                self._expirations = 0
+            return count
+    
+    def sweep_expired(self) -> int:
+        """
+        Removes all expired entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._sweep_locked()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Returns statistics about the cache usage.
+        
+        Returns:
+            Dictionary containing hit, miss, eviction and expiration counts, hit rate,
+            entry count and estimated memory use
+        """
+        with self._lock:
+            total_requests = self._hits + self._misses
+            now = self._clock()
+            return {
+                'hit_count': self._hits,
+                'miss_count': self._misses,
+                'hit_rate': (self._hits / total_requests) * 100 if total_requests > 0 else 0,
+                'entry_count': len(self._entries),
+                'expired_count': sum(1 for entry in self._entries.values() if self._is_expired(entry, now)),
+                'eviction_count': self._evictions,
+                'expiration_count': self._expirations,
+                'estimated_size_bytes': self._total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
+            }
+
+
+def sweep_all_caches() -> int:
+    """
+    Removes expired entries from every registered in-memory cache.
+    
+    Returns:
+        Total number of entries removed
+    """
+    return sum(cache_instance.sweep_expired() for cache_instance in list(_registered_caches))
+
+
+def _run_sweeper(interval: float) -> None:
+    """
+    Sweeps all registered caches every interval seconds until stopped.
+    
+    Args:
+        interval: Seconds between sweeps
+    """
+    while not _sweeper_stop.wait(interval):
+        try:
+            removed = sweep_all_caches()
+            if removed:
+                logger.debug(f"Swept {removed} expired cache entries")
+        except Exception as e:
+            logger.warning(f"Cache sweep failed: {e}")
+
+
+def start_cache_sweeper(interval: float = CACHE_SWEEP_INTERVAL_SECONDS) -> bool:
+    """
+    Starts the background thread that removes expired cache entries.
+    
+    Safe to call repeatedly and after a fork: a sweeper is only started if none is
+    running in the current process.
+    
+    Args:
+        interval: Seconds between sweeps
+        
+    Returns:
+        True if a new sweeper thread was started
+    """
+    global _sweeper_thread, _sweeper_pid
+    
+    with _sweeper_lock:
+        if _sweeper_thread is not None and _sweeper_pid == os.getpid() and _sweeper_thread.is_alive():
+            return False
+        
+        _sweeper_stop.clear()
+        _sweeper_thread = threading.Thread(
+            target=_run_sweeper, args=(interval,), name='cache-sweeper', daemon=True
+        )
+        _sweeper_thread.start()
+        _sweeper_pid = os.getpid()
+    
+    logger.info(f"Started cache sweeper with {interval}s interval")
+    return True
+
+
+def stop_cache_sweeper() -> None:
+    """
+    Stops the background cache sweeper if it is running.
+    """
+    global _sweeper_thread
+    
+    with _sweeper_lock:
+        _sweeper_stop.set()
+        if _sweeper_thread is not None and _sweeper_thread.is_alive():
+            _sweeper_thread.join(timeout=5)
+        _sweeper_thread = None
+
+
+# Global cache storage
+_memory_cache = BoundedCache(name='memory')
+
 
 def generate_cache_key(func_name: str, args: Tuple, kwargs: Dict) -> str:
     """
@@ -74,8 +459,6 @@ def cache(timeout: Optional[int] = None) -> Callable:
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            global _cache_hits, _cache_misses
-            
             # Skip caching if disabled
             if not CACHE_ENABLED:
                 return func(*args, **kwargs)
@@ -86,12 +469,10 @@ def cache(timeout: Optional[int] = None) -> Callable:
             # Check if result is in cache and still valid
             cached_result = get_from_cache(key)
             if cached_result is not None:
-                _cache_hits += 1
                 logger.debug(f"Cache hit for {func.__name__}")
                 return cast(T, cached_result)
             
             # Not in cache or expired, call the function
-            _cache_misses += 1
             result = func(*args, **kwargs)
             
             # Store the result in cache
@@ -116,25 +497,7 @@ def is_cache_valid(key: str) -> bool:
     if not CACHE_ENABLED:
         return False
     
-    if key not in _cache_metadata:
-        return False
-    
-    # Get the timestamp and timeout from metadata
-    timestamp = _cache_metadata[key].get('timestamp')
-    custom_timeout = _cache_metadata[key].get('timeout')
-    
-    if timestamp is None:
-        return False
-    
-    # Calculate how old the cache entry is
-    now = datetime.datetime.now()
-    age = (now - timestamp).total_seconds()
-    
-    # Use custom timeout if provided, otherwise use the global setting
-    timeout_value = custom_timeout if custom_timeout is not None else CACHE_TIMEOUT
-    
-    # Return True if the entry is still valid (age < timeout)
-    return age < timeout_value
+    return _memory_cache.is_valid(key)
 
 
 def get_from_cache(key: str) -> Optional[Any]:
@@ -147,29 +510,18 @@ def get_from_cache(key: str) -> Optional[Any]:
     Returns:
         Cached value if found and valid, None otherwise
     """
-    global _cache_hits
-    
     if not CACHE_ENABLED:
         return None
     
-    if key not in _memory_cache:
-        return None
-    
-    # Check if cache entry is still valid
-    if not is_cache_valid(key):
-        # Entry expired, remove it
-        del _memory_cache[key]
-        del _cache_metadata[key]
-        return None
-    
-    # Valid cache hit
-    logger.debug(f"Cache hit for key: {key}")
-    return _memory_cache[key]
+    value = _memory_cache.get(key)
+    if value is not None:
+        logger.debug(f"Cache hit for key: {key}")
+    return value
 
 
 def store_in_cache(key: str, value: Any, timeout: Optional[int] = None) -> bool:
     """
-    Stores a value in the cache with metadata.
+    Stores a value in the cache, evicting least recently used entries if needed.
     
     Args:
         key: Cache key to store the value under
@@ -182,17 +534,10 @@ def store_in_cache(key: str, value: Any, timeout: Optional[int] = None) -> bool:
     if not CACHE_ENABLED:
         return False
     
-    # Store the value
-    _memory_cache[key] = value
-    
-    # Store metadata (timestamp and optional custom timeout)
-    _cache_metadata[key] = {
-        'timestamp': datetime.datetime.now(),
-        'timeout': timeout
-    }
-    
-    logger.debug(f"Stored in cache with key: {key}")
-    return True
+    stored = _memory_cache.set(key, value, timeout)
+    if stored:
+        logger.debug(f"Stored in cache with key: {key}")
+    return stored
 
 
 def clear_cache(key: Optional[str] = None) -> None:
@@ -202,21 +547,13 @@ def clear_cache(key: Optional[str] = None) -> None:
     Args:
         key: Optional specific key to clear. If None, clears all cache.
     """
-    global _cache_hits, _cache_misses, _memory_cache, _cache_metadata
-    
     if key is None:
         # Clear all cache
-        _memory_cache = {}
-        _cache_metadata = {}
-        _cache_hits = 0
-        _cache_misses = 0
+        _memory_cache.clear()
         logger.info("Cleared all cache entries")
     else:
         # Clear specific entry
-        if key in _memory_cache:
-            del _memory_cache[key]
-        if key in _cache_metadata:
-            del _cache_metadata[key]
+        _memory_cache.invalidate(key)
         logger.info(f"Cleared cache entry for key: {key}")
 
 
@@ -226,30 +563,9 @@ def get_cache_stats() -> Dict[str, Union[int, float]]:
     
     Returns:
         Dictionary containing cache statistics including hit count, miss count,
-        hit rate, and entry count.
+        hit rate, entry count, eviction count and estimated memory use.
     """
-    # Calculate hit rate
-    total_requests = _cache_hits + _cache_misses
-    hit_rate = (_cache_hits / total_requests) * 100 if total_requests > 0 else 0
-    
-    # Count expired entries
-    expired_count = sum(1 for key in _cache_metadata if not is_cache_valid(key))
-    
-    # Estimate size (this is approximate)
-    try:
-        import sys
-        total_size = sum(sys.getsizeof(_memory_cache.get(key, 0)) for key in _memory_cache)
-    except:
-        total_size = -1
-    
-    return {
-        'hit_count': _cache_hits,
-        'miss_count': _cache_misses,
-        'hit_rate': hit_rate,
-        'entry_count': len(_memory_cache),
-        'expired_count': expired_count,
-        'estimated_size_bytes': total_size
-    }
+    return _memory_cache.get_stats()
 
 
 def disk_cache(timeout: Optional[int] = None) -> Callable:
@@ -355,16 +671,8 @@ def invalidate_cache_entry(key: str) -> bool:
     Returns:
         True if entry was found and invalidated, False otherwise
     """
-    found = False
-    
     # Check memory cache
-    if key in _memory_cache:
-        del _memory_cache[key]
-        found = True
-    
-    if key in _cache_metadata:
-        del _cache_metadata[key]
-        found = True
+    found = _memory_cache.invalidate(key)
     
     # Check disk cache
     disk_path = os.path.join(CACHE_DIR, f"{key}.pkl")
@@ -389,14 +697,19 @@ class CacheManager:
     with methods for retrieving, storing, and invalidating cached data.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_MEMORY_MB * 1024 * 1024
+    ):
         """
-        Initializes the CacheManager with empty cache.
+        Initializes the CacheManager with an empty bounded cache.
+        
+        Args:
+            max_entries: Maximum number of entries held
+            max_bytes: Maximum estimated memory of all entries in bytes
         """
-        self._cache: Dict[str, Any] = {}
-        self._metadata: Dict[str, Dict[str, Any]] = {}
-        self._hits: int = 0
-        self._misses: int = 0
+        self._cache = BoundedCache(name='manager', max_entries=max_entries, max_bytes=max_bytes)
         self._logger = logging.getLogger(__name__ + '.CacheManager')
     
     def get(self, key: str) -> Optional[Any]:
@@ -412,24 +725,14 @@ class CacheManager:
         if not CACHE_ENABLED:
             return None
         
-        if key not in self._cache:
-            return None
-        
-        # Check if cache entry is still valid
-        if not self.is_valid(key):
-            # Entry expired, remove it
-            del self._cache[key]
-            del self._metadata[key]
-            return None
-        
-        # Valid cache hit
-        self._hits += 1
-        self._logger.debug(f"Cache hit for key: {key}")
-        return self._cache[key]
+        value = self._cache.get(key)
+        if value is not None:
+            self._logger.debug(f"Cache hit for key: {key}")
+        return value
     
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         """
-        Stores a value in the cache with metadata.
+        Stores a value in the cache, evicting least recently used entries if needed.
         
         Args:
             key: Cache key to store the value under
@@ -442,17 +745,10 @@ class CacheManager:
         if not CACHE_ENABLED:
             return False
         
-        # Store the value
-        self._cache[key] = value
-        
-        # Store metadata
-        self._metadata[key] = {
-            'timestamp': datetime.datetime.now(),
-            'timeout': timeout
-        }
-        
-        self._logger.debug(f"Stored in cache with key: {key}")
-        return True
+        stored = self._cache.set(key, value, timeout)
+        if stored:
+            self._logger.debug(f"Stored in cache with key: {key}")
+        return stored
     
     def clear(self, key: Optional[str] = None) -> None:
         """
@@ -463,17 +759,11 @@ class CacheManager:
         """
         if key is None:
             # Clear all cache
-            self._cache = {}
-            self._metadata = {}
-            self._hits = 0
-            self._misses = 0
+            self._cache.clear()
             self._logger.info("Cleared all cache entries")
         else:
             # Clear specific entry
-            if key in self._cache:
-                del self._cache[key]
-            if key in self._metadata:
-                del self._metadata[key]
+            self._cache.invalidate(key)
             self._logger.info(f"Cleared cache entry for key: {key}")
     
     def invalidate(self, key: str) -> bool:
@@ -486,15 +776,7 @@ class CacheManager:
         Returns:
             True if entry was found and invalidated, False otherwise
         """
-        found = False
-        
-        if key in self._cache:
-            del self._cache[key]
-            found = True
-        
-        if key in self._metadata:
-            del self._metadata[key]
-            found = True
+        found = self._cache.invalidate(key)
         
         if found:
             self._logger.info(f"Invalidated cache entry for key: {key}")
@@ -514,25 +796,7 @@ class CacheManager:
         if not CACHE_ENABLED:
             return False
         
-        if key not in self._metadata:
-            return False
-        
-        # Get the timestamp and timeout from metadata
-        timestamp = self._metadata[key].get('timestamp')
-        custom_timeout = self._metadata[key].get('timeout')
-        
-        if timestamp is None:
-            return False
-        
-        # Calculate how old the cache entry is
-        now = datetime.datetime.now()
-        age = (now - timestamp).total_seconds()
-        
-        # Use custom timeout if provided, otherwise use the global setting
-        timeout_value = custom_timeout if custom_timeout is not None else CACHE_TIMEOUT
-        
-        # Return True if the entry is still valid (age < timeout)
-        return age < timeout_value
+        return self._cache.is_valid(key)
     
     def get_stats(self) -> Dict[str, Union[int, float]]:
         """
@@ -541,28 +805,7 @@ class CacheManager:
         Returns:
             Dictionary containing cache statistics
         """
-        # Calculate hit rate
-        total_requests = self._hits + self._misses
-        hit_rate = (self._hits / total_requests) * 100 if total_requests > 0 else 0
-        
-        # Count expired entries
-        expired_count = sum(1 for key in self._metadata if not self.is_valid(key))
-        
-        # Estimate size (this is approximate)
-        try:
-            import sys
-            total_size = sum(sys.getsizeof(self._cache.get(key, 0)) for key in self._cache)
-        except:
-            total_size = -1
-        
-        return {
-            'hit_count': self._hits,
-            'miss_count': self._misses,
-            'hit_rate': hit_rate,
-            'entry_count': len(self._cache),
-            'expired_count': expired_count,
-            'estimated_size_bytes': total_size
-        }
+        return self._cache.get_stats()
 
 
 # Create a singleton instance of CacheManager
@@ -0,0 +1,123 @@
+"""
+Server-side figure cache for the Electricity Market Price Forecasting Dashboard.
+
+Plotly figures are rebuilt on every callback even when the forecast, the selected products
+and the plot options are unchanged. This module memoizes the figure builders in plot_helpers,
+keyed by (plot, source data version, products, options). Figures are stored as validated
+figure dicts and rebuilt without re-validation on a hit, so callers receive an independent
+figure they can continue to style. Viewport and theme changes do not go through this cache:
+they are sent to the browser as layout-only Dash Patch updates (see
+plot_helpers.create_layout_patch).
+"""
+
+import functools
+import hashlib
+import logging
+from typing import Any, Callable, Dict, Union
+
+import pandas as pd  # version 2.0.0+
+import plotly.graph_objects as go  # version 5.14.0+
+
+from ..config.settings import CACHE_ENABLED
+from ..data.artifact_cache import get_data_version
+from .caching import BoundedCache
+
+# Set up module logger
+logger = logging.getLogger(__name__)
+
+# Figures are immutable for a given data version, so entries have no timeout
+_figure_cache = BoundedCache(name='figures', default_timeout=None)
+
+
+def _key_component(value: Any) -> Any:
+    """
+    Converts a plot argument into a hashable key component.
+
+    Dataframes are represented by their data version, dictionaries of dataframes (product
+    comparison) by the versions of their values, and lists by tuples.
+    """
+    if isinstance(value, pd.DataFrame):
+        return ('df', get_data_version(value))
+    if isinstance(value, dict):
+        return tuple(sorted((str(name), _key_component(item)) for name, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_key_component(item) for item in value)
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+
+def generate_figure_key(plot_name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """
+    Generates the cache key for a figure.
+
+    Args:
+        plot_name: Name of the figure builder
+        args: Positional arguments of the figure builder
+        kwargs: Keyword arguments of the figure builder
+
+    Returns:
+        Cache key
+    """
+    params = (
+        tuple(_key_component(arg) for arg in args),
+        tuple(sorted((name, _key_component(value)) for name, value in kwargs.items())),
+    )
+    return hashlib.md5(f"{plot_name}:{params!r}".encode()).hexdigest()
+
+
+def cache_figure(plot_name: str) -> Callable:
+    """
+    Decorator that memoizes a Plotly figure builder.
+
+    Args:
+        plot_name: Name identifying the figure builder in cache keys
+
+    Returns:
+        Decorator adding figure caching to the function
+    """
+    def decorator(func: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> go.Figure:
+            if not CACHE_ENABLED:
+                return func(*args, **kwargs)
+
+            try:
+                key = generate_figure_key(plot_name, args, kwargs)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Not caching {plot_name} figure: {e}")
+                return func(*args, **kwargs)
+
+            figure_dict = _figure_cache.get(key)
+            if figure_dict is not None:
+                logger.debug(f"Figure cache hit for {plot_name}")
+                # The cached dict was validated when the figure was first built
+                return go.Figure(figure_dict, _validate=False)
+
+            fig = func(*args, **kwargs)
+            _figure_cache.set(key, fig.to_dict())
+            return fig
+        return wrapper
+    return decorator
+
+
+def clear_figure_cache() -> int:
+    """
+    Clears all cached figures.
+
+    Returns:
+        Number of figures cleared
+    """
+    count = _figure_cache.clear()
+    logger.info(f"Cleared {count} cached figures")
+    return count
+
+
+def get_figure_cache_stats() -> Dict[str, Union[int, float]]:
+    """
+    Returns statistics about the figure cache usage.
+
+    Returns:
+        Dictionary containing hit, miss and eviction counts and memory use
+    """
+    return _figure_cache.get_stats()
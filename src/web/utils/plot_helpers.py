@@ -12,6 +12,7 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.colors
 from plotly.subplots import make_subplots
+from dash import Patch
 
 from ..config.themes import (
     get_theme_colors,
@@ -34,6 +35,7 @@ from ..utils.formatting import (
 from ..utils.date_helpers import get_date_hour_label
 from ..utils.responsive_helpers import get_responsive_dimension
 from ..utils.error_handlers import is_fallback_data
+from ..utils.figure_cache import cache_figure
 
 # Default values for plots
 DEFAULT_PLOT_HEIGHT = 500
@@ -43,6 +45,7 @@ DEFAULT_PERCENTILE_UPPER = 90
 FALLBACK_INDICATOR_TEXT = "Using fallback forecast (previous day's data)"
 
 
+@cache_figure('time_series')
 def create_time_series_plot(
     forecast_df: pd.DataFrame,
     product_id: str,
@@ -167,6 +170,7 @@ def add_uncertainty_bands(
     return fig
 
 
+@cache_figure('probability_distribution')
 def create_probability_distribution_plot(
     distribution_df: pd.DataFrame,
     product_id: str,
@@ -297,6 +301,7 @@ def create_probability_distribution_plot(
     return fig
 
 
+@cache_figure('product_comparison')
 def create_product_comparison_plot(
     forecast_dfs: Dict[str, pd.DataFrame],
     product_ids: List[str],
@@ -388,6 +393,7 @@ def create_product_comparison_plot(
     return fig
 
 
+@cache_figure('heatmap')
 def create_heatmap_plot(
     forecast_df: pd.DataFrame,
     product_id: str,
@@ -720,39 +726,90 @@ def apply_responsive_layout(
     Returns:
         Figure with responsive layout
     """
+    fig.update_layout(**get_responsive_layout_updates(viewport_size, base_height))
+    
+    return fig
+
+
+def get_responsive_layout_updates(viewport_size: str, base_height: int = None) -> Dict:
+    """
+    Returns the layout properties that depend on the viewport size.
+    
+    Args:
+        viewport_size: Viewport size category (mobile, tablet, desktop)
+        base_height: Base height for desktop viewport
+        
+    Returns:
+        Dictionary of layout properties (height, and margin, font and legend where adjusted)
+    """
     # Use default height if not provided
     if base_height is None:
         base_height = DEFAULT_PLOT_HEIGHT
     
     # Calculate responsive height
-    height = get_responsive_dimension(viewport_size, base_height, 'height')
-    
-    # Update figure layout with responsive height
-    fig.update_layout(height=height)
+    updates = {'height': get_responsive_dimension(viewport_size, base_height, 'height')}
     
     # Adjust margins based on viewport size
     if viewport_size == 'mobile':
-        fig.update_layout(margin=dict(l=30, r=30, t=40, b=40))
+        updates['margin'] = dict(l=30, r=30, t=40, b=40)
     elif viewport_size == 'tablet':
-        fig.update_layout(margin=dict(l=40, r=40, t=45, b=45))
+        updates['margin'] = dict(l=40, r=40, t=45, b=45)
     
     # Adjust font sizes based on viewport size
     if viewport_size == 'mobile':
-        fig.update_layout(font=dict(size=10))
+        updates['font'] = dict(size=10)
     elif viewport_size == 'tablet':
-        fig.update_layout(font=dict(size=11))
+        updates['font'] = dict(size=11)
     
     # Adjust legend position based on viewport size
     if viewport_size == 'mobile':
-        fig.update_layout(legend=dict(
+        updates['legend'] = dict(
             orientation="h",
             yanchor="bottom",
             y=1.02,
             xanchor="center",
             x=0.5
-        ))
+        )
     
-    return fig
+    return updates
+
+
+def create_layout_patch(
+    viewport_size: Optional[str] = None,
+    base_height: int = None,
+    theme: Optional[str] = None
+) -> Patch:
+    """
+    Creates a layout-only partial update for a figure already displayed in the browser.
+    
+    Viewport and theme changes only affect the figure layout, so callbacks can return this
+    Patch instead of regenerating and re-serializing the full figure with all its traces.
+    
+    Args:
+        viewport_size: New viewport size category, or None to leave size properties unchanged
+        base_height: Base height for desktop viewport
+        theme: New theme name, or None to leave theme properties unchanged
+        
+    Returns:
+        Dash Patch updating the figure layout
+    """
+    patch = Patch()
+    updates = []
+    if theme is not None:
+        updates.append(get_plot_layout(theme))
+    if viewport_size is not None:
+        updates.append(get_responsive_layout_updates(viewport_size, base_height))
+    
+    for layout_updates in updates:
+        for key, value in layout_updates.items():
+            if isinstance(value, dict):
+                # Assign nested properties individually so they merge like update_layout
+                for sub_key, sub_value in value.items():
+                    patch['layout'][key][sub_key] = sub_value
+            else:
+                patch['layout'][key] = value
+    
+    return patch
 
 
 def format_axis_date(fig: go.Figure, axis: str = 'xaxis', date_format: str = None) -> go.Figure:
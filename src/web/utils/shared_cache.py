@@ -0,0 +1,459 @@
+"""
+Shared cross-process cache tier for the Electricity Market Price Forecasting System's web
+visualization interface.
+
+Forecast dataframes are stored as Arrow IPC files in a directory shared by all dashboard
+workers on a host (RAM-backed under /dev/shm by default). Readers memory-map the files, so a
+hit maps the Arrow buffers without unpickling, and writers replace files atomically so
+readers never see partial data. Fetches are coordinated with per-key file locks: when several
+workers miss the same key (for example right after the 7 AM forecast refresh), one worker
+calls the backend API and the others wait for its result. Expired entries are deleted when
+they are read, and each worker periodically sweeps the directory for expired entries and stale
+lock and temporary files, so the RAM-backed directory does not grow without bound.
+
+The tier is disabled when pyarrow is not installed or SHARED_CACHE_ENABLED is false, in which
+case every call falls through to the fetch function.
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Iterator, Optional
+
+import pandas as pd  # version 2.0.0+
+
+try:
+    import pyarrow as pa  # version 12.0.0+
+    import pyarrow.ipc  # noqa: F401
+except ImportError:
+    pa = None
+
+try:
+    import fcntl
+except ImportError:
+    # File locking is unavailable on Windows; fetches are then not coordinated across workers
+    fcntl = None
+
+from ..config.settings import (
+    CACHE_ENABLED,
+    CACHE_SWEEP_INTERVAL_SECONDS,
+    CACHE_TIMEOUT,
+    SHARED_CACHE_DIR,
+    SHARED_CACHE_ENABLED,
+    SHARED_CACHE_LOCK_TIMEOUT_SECONDS,
+)
+
+# Set up module logger
+logger = logging.getLogger(__name__)
+
+# File extensions for cached Arrow data, per-key lock files and files being written
+DATA_EXTENSION = '.arrow'
+LOCK_EXTENSION = '.lock'
+TEMP_EXTENSION = '.tmp'
+
+# Schema metadata key holding the entry's expiry time (POSIX timestamp)
+EXPIRES_AT_METADATA_KEY = b'expires_at'
+
+# Seconds between attempts to acquire a key lock held by another worker
+LOCK_POLL_INTERVAL = 0.05
+
+
+class SharedForecastCache:
+    """
+    Cache of forecast dataframes shared by all worker processes on a host.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = SHARED_CACHE_DIR,
+        default_timeout: int = CACHE_TIMEOUT,
+        lock_timeout: float = SHARED_CACHE_LOCK_TIMEOUT_SECONDS,
+        sweep_interval: float = CACHE_SWEEP_INTERVAL_SECONDS
+    ):
+        """
+        Initializes the shared cache.
+
+        Args:
+            cache_dir: Directory shared by all workers
+            default_timeout: Timeout in seconds for entries stored without one
+            lock_timeout: Maximum seconds to wait for another worker's fetch of the same key
+            sweep_interval: Minimum seconds between sweeps of the directory by this instance
+        """
+        self.cache_dir = cache_dir
+        self.default_timeout = default_timeout
+        self.lock_timeout = lock_timeout
+        self.sweep_interval = sweep_interval
+        self._stats_lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+        self._hits = 0
+        self._misses = 0
+        self._fetches = 0
+        self._coalesced = 0
+        self._logger = logging.getLogger(__name__ + '.SharedForecastCache')
+
+    @property
+    def available(self) -> bool:
+        """
+        Whether the shared tier can be used in this process.
+        """
+        return CACHE_ENABLED and SHARED_CACHE_ENABLED and pa is not None
+
+    def _get_path(self, key: str, extension: str) -> str:
+        """
+        Returns the file path for a cache key.
+
+        Args:
+            key: Cache key
+            extension: File extension (data or lock)
+
+        Returns:
+            Absolute file path inside the shared cache directory
+        """
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"{digest}{extension}")
+
+    def _count(self, counter: str) -> None:
+        """Increments a statistics counter."""
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Reads a dataframe from the shared cache by memory-mapping its Arrow file.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached dataframe, or None if missing, expired or unreadable
+        """
+        if not self.available:
+            return None
+
+        self._maybe_sweep()
+
+        path = self._get_path(key, DATA_EXTENSION)
+        try:
+            file_stat = os.stat(path)
+            with pa.memory_map(path, 'r') as source:
+                table = pa.ipc.open_file(source).read_all()
+        except FileNotFoundError:
+            return None
+        except (pa.ArrowInvalid, OSError) as e:
+            self._logger.warning(f"Unreadable shared cache entry for {key}: {e}")
+            return None
+
+        if self._is_expired(table.schema):
+            self._remove_if_unchanged(path, file_stat)
+            return None
+
+        return table.to_pandas()
+
+    @staticmethod
+    def _is_expired(schema: "pa.Schema") -> bool:
+        """
+        Checks the expiry time stored in an entry's schema metadata.
+        """
+        expires_at = (schema.metadata or {}).get(EXPIRES_AT_METADATA_KEY)
+        return expires_at is not None and time.time() >= float(expires_at)
+
+    def _remove_if_unchanged(self, path: str, file_stat: os.stat_result) -> bool:
+        """
+        Removes an expired file unless another worker has replaced it since it was read.
+
+        Args:
+            path: File path
+            file_stat: Status of the file when it was read
+
+        Returns:
+            True if the file was removed
+        """
+        try:
+            if os.stat(path).st_ino != file_stat.st_ino:
+                return False
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            self._logger.warning(f"Error removing shared cache file {path}: {e}")
+            return False
+
+    def put(self, key: str, df: pd.DataFrame, timeout: Optional[int] = None) -> bool:
+        """
+        Writes a dataframe to the shared cache, atomically replacing any previous entry.
+
+        Args:
+            key: Cache key
+            df: Dataframe to store
+            timeout: Timeout in seconds, or None to use the default timeout
+
+        Returns:
+            True if the entry was written, False otherwise
+        """
+        if not self.available:
+            return False
+
+        self._maybe_sweep()
+
+        timeout_value = timeout if timeout is not None else self.default_timeout
+        tmp_path = None
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[EXPIRES_AT_METADATA_KEY] = str(time.time() + timeout_value).encode()
+            table = table.replace_schema_metadata(metadata)
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=TEMP_EXTENSION)
+            os.close(fd)
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, self._get_path(key, DATA_EXTENSION))
+            return True
+        except (pa.ArrowException, OSError) as e:
+            self._logger.warning(f"Error writing shared cache entry for {key}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    @contextlib.contextmanager
+    def _single_flight(self, key: str) -> Iterator[bool]:
+        """
+        Holds the key's lock so only one worker fetches it at a time.
+
+        Waits up to lock_timeout for a worker that already holds the lock; after that the
+        caller proceeds without it rather than blocking the dashboard.
+
+        Args:
+            key: Cache key
+
+        Yields:
+            True if the lock is held, False otherwise
+        """
+        if fcntl is None:
+            yield False
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._get_path(key, LOCK_EXTENSION), 'a') as lock_file:
+            deadline = time.monotonic() + self.lock_timeout
+            acquired = False
+            while True:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    acquired = True
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        self._logger.warning(f"Timed out waiting for in-flight fetch of {key}")
+                        break
+                    time.sleep(LOCK_POLL_INTERVAL)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch_func: Callable[[], pd.DataFrame],
+        timeout: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Returns the shared entry for a key, fetching and storing it on a miss.
+
+        Concurrent misses for the same key across workers are coalesced: the worker holding
+        the key's lock calls fetch_func, the others wait and then read its result.
+
+        Args:
+            key: Cache key
+            fetch_func: Callable fetching the dataframe from the backend API
+            timeout: Timeout in seconds for the stored entry
+
+        Returns:
+            Cached or freshly fetched dataframe
+        """
+        if not self.available:
+            return fetch_func()
+
+        cached_df = self.get(key)
+        if cached_df is not None:
+            self._count('_hits')
+            return cached_df
+
+        self._count('_misses')
+        with self._single_flight(key):
+            # Another worker may have stored the entry while we waited for the lock
+            cached_df = self.get(key)
+            if cached_df is not None:
+                self._count('_coalesced')
+                self._logger.debug(f"Shared cache filled by another worker for {key}")
+                return cached_df
+
+            df = fetch_func()
+            self._count('_fetches')
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                self.put(key, df, timeout)
+            return df
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Removes a single entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed
+        """
+        try:
+            os.remove(self._get_path(key, DATA_EXTENSION))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def clear(self) -> int:
+        """
+        Removes all entries from the shared cache directory.
+
+        Returns:
+            Number of entries removed
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        removed_count = 0
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(DATA_EXTENSION):
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                    removed_count += 1
+                except OSError as e:
+                    self._logger.warning(f"Error removing shared cache file {filename}: {e}")
+
+        self._logger.info(f"Cleared {removed_count} shared cache entries")
+        return removed_count
+
+    def _maybe_sweep(self) -> None:
+        """
+        Sweeps the cache directory if sweep_interval has passed since this instance last did.
+        """
+        now = time.monotonic()
+        with self._stats_lock:
+            if now - self._last_sweep < self.sweep_interval:
+                return
+            self._last_sweep = now
+        self.sweep_expired()
+
+    def _remove_stale_lock(self, path: str) -> bool:
+        """
+        Removes a lock file that no worker holds.
+
+        The lock is taken (without waiting) before the file is removed, so a worker fetching
+        the key keeps its lock; a worker that opened the file just before removal at worst
+        fetches the key alongside another one.
+
+        Args:
+            path: Lock file path
+
+        Returns:
+            True if the file was removed
+        """
+        if fcntl is None:
+            return False
+        try:
+            with open(path, 'a') as lock_file:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return False
+                try:
+                    os.remove(path)
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            self._logger.warning(f"Error removing shared cache lock {path}: {e}")
+            return False
+
+    def sweep_expired(self) -> int:
+        """
+        Removes expired entries, and lock and temporary files left behind, from the cache directory.
+
+        Lock files are removed once their entry is gone and no worker holds them; temporary
+        files are removed when older than lock_timeout (a writer that crashed mid-write).
+
+        Returns:
+            Number of expired entries removed
+        """
+        if pa is None or not os.path.isdir(self.cache_dir):
+            return 0
+
+        try:
+            filenames = os.listdir(self.cache_dir)
+        except OSError as e:
+            self._logger.warning(f"Error listing shared cache directory {self.cache_dir}: {e}")
+            return 0
+
+        removed_count = 0
+        for filename in filenames:
+            if not filename.endswith(DATA_EXTENSION):
+                continue
+            path = os.path.join(self.cache_dir, filename)
+            try:
+                file_stat = os.stat(path)
+                with pa.memory_map(path, 'r') as source:
+                    schema = pa.ipc.open_file(source).schema
+            except FileNotFoundError:
+                continue
+            except (pa.ArrowInvalid, OSError):
+                # Unreadable entries are never served; remove them as well
+                schema = None
+            if (schema is None or self._is_expired(schema)) and self._remove_if_unchanged(path, file_stat):
+                removed_count += 1
+
+        stale_before = time.time() - self.lock_timeout
+        for filename in filenames:
+            path = os.path.join(self.cache_dir, filename)
+            if filename.endswith(LOCK_EXTENSION):
+                data_path = path[:-len(LOCK_EXTENSION)] + DATA_EXTENSION
+                if not os.path.exists(data_path):
+                    self._remove_stale_lock(path)
+            elif filename.endswith(TEMP_EXTENSION):
+                try:
+                    if os.stat(path).st_mtime < stale_before:
+                        os.remove(path)
+                except OSError:
+                    continue
+
+        if removed_count:
+            self._logger.debug(f"Swept {removed_count} expired shared cache entries")
+        return removed_count
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns this process's statistics for the shared cache.
+
+        Returns:
+            Dictionary with hit, miss, fetch and coalesced counts
+        """
+        with self._stats_lock:
+            return {
+                'shared_hit_count': self._hits,
+                'shared_miss_count': self._misses,
+                'shared_fetch_count': self._fetches,
+                'shared_coalesced_count': self._coalesced,
+            }
+
+
+# Singleton instance shared by the data loaders
+shared_forecast_cache = SharedForecastCache()